@@ -17,8 +17,7 @@ import logging
 import warnings
 from collections import OrderedDict
 import numpy as np
-from scipy.stats import chi2, norm
-from scipy.optimize import bisect
+from scipy.stats import norm
 
 from qiskit import QuantumCircuit, ClassicalRegister
 from qiskit.circuit.library import QFT
@@ -30,6 +29,7 @@ from qiskit.aqua.circuits import PhaseEstimationCircuit
 from qiskit.aqua.utils.validation import validate_min
 from .ae_algorithm import AmplitudeEstimationAlgorithm, AmplitudeEstimationAlgorithmResult
 from .ae_utils import pdf_a, derivative_log_pdf_a, bisect_max
+from .ae_likelihood import qae_likelihood_ratio_confint
 
 logger = logging.getLogger(__name__)
 
@@ -295,47 +295,11 @@ class AmplitudeEstimation(AmplitudeEstimationAlgorithm):
             right_of_qae = np.sin(np.pi * (y + 1) / M)**2
             bubbles = [left_of_qae, qae, right_of_qae]
 
-        # likelihood function
-        a_i = np.asarray(self._ret['values'])
-        p_i = np.asarray(self._ret['probabilities'])
-        m = self._m
-        shots = self._ret['shots']
-
-        def loglikelihood(a):
-            return np.sum(shots * p_i * np.log(pdf_a(a_i, a, m)))
-
-        # The threshold above which the likelihoods are in the
-        # confidence interval
-        loglik_mle = loglikelihood(self._ret['ml_value'])
-        thres = loglik_mle - chi2.ppf(1 - alpha, df=1) / 2
-
-        def cut(x):
-            return loglikelihood(x) - thres
-
-        # Store the boundaries of the confidence interval
-        # It's valid to start off with the zero-width confidence interval, since the maximum
-        # of the likelihood function is guaranteed to be over the threshold, and if alpha = 0
-        # that's the valid interval
-        lower = upper = self._ret['ml_value']
-
-        # Check the two intervals/bubbles: check if they surpass the
-        # threshold and if yes add the part that does to the CI
-        for a, b in zip(bubbles[:-1], bubbles[1:]):
-            # Compute local maximum and perform a bisect search between
-            # the local maximum and the bubble boundaries
-            locmax, val = bisect_max(loglikelihood, a, b, retval=True)
-            if val >= thres:
-                # Bisect pre-condition is that the function has different
-                # signs at the boundaries of the interval we search in
-                if cut(a) * cut(locmax) < 0:
-                    left = bisect(cut, a, locmax)
-                    lower = np.minimum(lower, left)
-                if cut(locmax) * cut(b) < 0:
-                    right = bisect(cut, locmax, b)
-                    upper = np.maximum(upper, right)
-
-        # Put together CI
-        confint = [lower, upper]
+        # evaluate the likelihood on a grid over the bubbles and find the outermost points
+        # above the likelihood ratio threshold
+        confint = qae_likelihood_ratio_confint(self._ret['values'], self._ret['probabilities'],
+                                               self._ret['shots'], self._m, self._ret['ml_value'],
+                                               (bubbles[0], bubbles[-1]), alpha)
         return [self.post_processing(bound) for bound in confint]
 
     def confidence_interval(self, alpha: float, kind: str = 'likelihood_ratio') -> List[float]:
@@ -12,11 +12,12 @@
 
 """The Amplitude Estimation Algorithm."""
 
-from typing import Optional, Union, List, Callable, Dict
+from typing import Optional, Union, List, Callable, Dict, Tuple
 import logging
 import warnings
 from abc import abstractmethod
 
+from qiskit import compiler
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.library import GroverOperator
 from qiskit.providers import BaseBackend
@@ -121,6 +122,12 @@ class AmplitudeEstimationAlgorithm(QuantumAlgorithm):
         self._grover_operator = grover_operator
         self._post_processing = (lambda x: x) if post_processing is None else post_processing
 
+        # the Grover operator built from the state preparation, and the cached powers of the
+        # Grover operator (unrolled to the basis gates in ``_grover_powers_basis``)
+        self._default_grover_operator = None  # type: Optional[QuantumCircuit]
+        self._grover_powers = {}  # type: Dict[int, QuantumCircuit]
+        self._grover_powers_basis = None  # type: Optional[Tuple[str, ...]]
+
         super().__init__(quantum_instance)
 
     @property
@@ -140,6 +147,7 @@ class AmplitudeEstimationAlgorithm(QuantumAlgorithm):
             state_preparation: The new :math:`\mathcal{A}` operator.
         """
         self._state_preparation = state_preparation
+        self._reset_grover_cache()
 
     @property
     def grover_operator(self) -> Optional[QuantumCircuit]:
@@ -155,6 +163,9 @@ class AmplitudeEstimationAlgorithm(QuantumAlgorithm):
         if self._grover_operator is not None:
             return self._grover_operator
 
+        if self._default_grover_operator is not None:
+            return self._default_grover_operator
+
         if self.state_preparation is not None and isinstance(self.objective_qubits, list):
             # build the reflection about the bad state
             num_state_qubits = self.state_preparation.num_qubits \
@@ -171,7 +182,8 @@ class AmplitudeEstimationAlgorithm(QuantumAlgorithm):
             oracle.x(self.objective_qubits)
 
             # construct the grover operator
-            return GroverOperator(oracle, self.state_preparation)
+            self._default_grover_operator = GroverOperator(oracle, self.state_preparation)
+            return self._default_grover_operator
 
         return None
 
@@ -183,6 +195,64 @@ class AmplitudeEstimationAlgorithm(QuantumAlgorithm):
             grover_operator: The new :math:`\mathcal{Q}` operator.
         """
         self._grover_operator = grover_operator
+        self._reset_grover_cache()
+
+    def _reset_grover_cache(self) -> None:
+        """Discard the cached Grover operator and its powers."""
+        self._default_grover_operator = None
+        self._grover_powers = {}
+
+    def _grover_power(self, power: int) -> QuantumCircuit:
+        r"""Get the circuit implementing :math:`\mathcal{Q}^k`.
+
+        The powers are cached across rounds and runs. A new power is composed from the largest
+        cached powers fitting into it, e.g. :math:`\mathcal{Q}^8` is built from two copies of
+        :math:`\mathcal{Q}^4`, and only falls back to ``grover_operator.power(k)`` if no smaller
+        power is cached. If a quantum instance is set, newly built powers are unrolled to its
+        basis gates once, such that the transpiler does not decompose them again in every
+        circuit they are used in.
+
+        Args:
+            power: The power :math:`k` of the Grover operator.
+
+        Returns:
+            The circuit implementing :math:`\mathcal{Q}^k`.
+        """
+        basis_gates = None
+        if self._quantum_instance is not None:
+            basis_gates = self._quantum_instance.backend_config.get('basis_gates')
+
+        basis = tuple(basis_gates) if basis_gates is not None else None
+        if basis != self._grover_powers_basis:
+            self._grover_powers = {}
+            self._grover_powers_basis = basis
+
+        if power in self._grover_powers:
+            return self._grover_powers[power]
+
+        circuit = None
+        remaining = power
+        while remaining > 0:
+            cached = [k for k in self._grover_powers if k <= remaining]
+            if len(cached) > 0:
+                step = max(cached)
+                piece = self._grover_powers[step]
+            else:
+                step = remaining
+                piece = self.grover_operator.power(step)
+                if basis_gates is not None:
+                    piece = compiler.transpile(piece, basis_gates=basis_gates,
+                                               optimization_level=0)
+                self._grover_powers[step] = piece
+
+            if circuit is None:
+                circuit = piece.copy()
+            else:
+                circuit.compose(piece, inplace=True)
+            remaining -= step
+
+        self._grover_powers[power] = circuit
+        return circuit
 
     @property
     def objective_qubits(self) -> Optional[List[int]]:
@@ -218,6 +288,7 @@ class AmplitudeEstimationAlgorithm(QuantumAlgorithm):
             objective_qubits: The criterion as callable of list of qubit indices.
         """
         self._objective_qubits = objective_qubits
+        self._reset_grover_cache()
 
     def is_good_state(self, measurement: str) -> bool:
         """Determine whether a given state is a good state.
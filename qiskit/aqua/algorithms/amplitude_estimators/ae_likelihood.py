@@ -0,0 +1,351 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Vectorized likelihood functions shared by the amplitude estimators.
+
+The log-likelihood functions are evaluated on a full grid of parameters as a single array
+operation (over all grid points and all measured powers of the Grover operator). The maximum and
+the likelihood ratio confidence bounds are first located on the grid and then refined with a
+bracketed root search between the neighbouring grid points.
+Since the grids only depend on the measurement results and the evaluation schedule, they are
+cached per (counts, schedule), such that computing several confidence intervals for the same
+run does not evaluate the likelihood again.
+"""
+
+from typing import Callable, List, Sequence, Tuple
+import functools
+import logging
+import numpy as np
+from scipy.optimize import brentq
+from scipy.special import xlogy
+from scipy.stats import chi2
+
+logger = logging.getLogger(__name__)
+
+# pylint: disable=invalid-name
+
+# the maximal number of grid entries (grid points times circuits) evaluated at once, limits the
+# memory of the intermediate arrays
+_MAX_BLOCK_SIZE = 2 ** 22
+
+# the number of cached grids
+_CACHE_SIZE = 32
+
+
+def mlae_loglikelihood(thetas: np.ndarray, evaluation_schedule: Sequence[int],
+                       one_hits: Sequence[float], all_hits: Sequence[float]) -> np.ndarray:
+    r"""Evaluate the MLAE log-likelihood for an array of angles.
+
+    The log-likelihood of the angle :math:`\theta` is
+
+    .. math::
+
+        \sum_k h_k \log(\sin^2((2 m_k + 1)\theta)) + (N_k - h_k) \log(\cos^2((2 m_k + 1)\theta))
+
+    where :math:`m_k` are the powers of the Grover operator, :math:`h_k` the good counts and
+    :math:`N_k` the total counts.
+
+    Args:
+        thetas: The angles.
+        evaluation_schedule: The powers of the Grover operator.
+        one_hits: The good counts (or probabilities) per power.
+        all_hits: The total counts (or ones) per power.
+
+    Returns:
+        The log-likelihood for each angle.
+    """
+    thetas = np.atleast_1d(np.asarray(thetas, dtype=float))
+    factors = 2 * np.asarray(evaluation_schedule, dtype=float) + 1
+    one_hits = np.asarray(one_hits, dtype=float)
+    zero_hits = np.asarray(all_hits, dtype=float) - one_hits
+
+    block = max(1, _MAX_BLOCK_SIZE // len(factors))
+    values = np.empty(len(thetas))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for start in range(0, len(thetas), block):
+            angles = np.outer(thetas[start:start + block], factors)
+            values[start:start + block] = (xlogy(one_hits, np.sin(angles) ** 2)
+                                           + xlogy(zero_hits, np.cos(angles) ** 2)).sum(axis=1)
+
+    return values
+
+
+def mlae_derivative_loglikelihood(thetas: np.ndarray, evaluation_schedule: Sequence[int],
+                                  one_hits: Sequence[float], all_hits: Sequence[float]
+                                  ) -> np.ndarray:
+    """Evaluate the derivative of the MLAE log-likelihood for an array of angles.
+
+    Args:
+        thetas: The angles.
+        evaluation_schedule: The powers of the Grover operator.
+        one_hits: The good counts (or probabilities) per power.
+        all_hits: The total counts (or ones) per power.
+
+    Returns:
+        The derivative of the log-likelihood with respect to the angle, for each angle.
+    """
+    thetas = np.atleast_1d(np.asarray(thetas, dtype=float))
+    factors = 2 * np.asarray(evaluation_schedule, dtype=float) + 1
+    one_hits = np.asarray(one_hits, dtype=float)
+    zero_hits = np.asarray(all_hits, dtype=float) - one_hits
+
+    angles = np.outer(thetas, factors)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (2 * factors * one_hits / np.tan(angles)).sum(axis=1) \
+            - (2 * factors * zero_hits * np.tan(angles)).sum(axis=1)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _mlae_grid(evaluation_schedule: Tuple[int, ...], one_hits: Tuple[float, ...],
+               all_hits: Tuple[float, ...], nevals: int) -> Tuple[np.ndarray, np.ndarray]:
+    eps = 1e-15  # to avoid invalid value in log
+    thetas = np.linspace(0 + eps, np.pi / 2 - eps, nevals)
+    values = mlae_loglikelihood(thetas, evaluation_schedule, one_hits, all_hits)
+
+    # the cached arrays are shared between all callers
+    thetas.flags.writeable = False
+    values.flags.writeable = False
+    return thetas, values
+
+
+def mlae_grid(evaluation_schedule: Sequence[int], one_hits: Sequence[float],
+              all_hits: Sequence[float], nevals: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the MLAE log-likelihood on an equidistant grid of angles in (0, pi/2).
+
+    The grid is cached per (counts, schedule, nevals).
+
+    Args:
+        evaluation_schedule: The powers of the Grover operator.
+        one_hits: The good counts (or probabilities) per power.
+        all_hits: The total counts (or ones) per power.
+        nevals: The number of grid points.
+
+    Returns:
+        The read-only arrays of the grid points and the log-likelihood values.
+    """
+    return _mlae_grid(tuple(int(k) for k in evaluation_schedule),
+                      tuple(float(h) for h in one_hits),
+                      tuple(float(n) for n in all_hits),
+                      int(nevals))
+
+
+def mlae_mle(evaluation_schedule: Sequence[int], one_hits: Sequence[float],
+             all_hits: Sequence[float], nevals: int) -> float:
+    """Compute the maximum likelihood estimate of the MLAE angle.
+
+    The maximum is located on the grid, and refined by a bracketed root search of the
+    derivative of the log-likelihood between the neighbours of the best grid point.
+
+    Args:
+        evaluation_schedule: The powers of the Grover operator.
+        one_hits: The good counts (or probabilities) per power.
+        all_hits: The total counts (or ones) per power.
+        nevals: The number of grid points.
+
+    Returns:
+        The maximum likelihood estimate of the angle.
+    """
+    thetas, values = mlae_grid(evaluation_schedule, one_hits, all_hits, nevals)
+
+    def derivative(theta):
+        return mlae_derivative_loglikelihood(theta, evaluation_schedule, one_hits, all_hits)[0]
+
+    return grid_maximum(thetas, values, derivative)
+
+
+def mlae_likelihood_ratio_confint(evaluation_schedule: Sequence[int], one_hits: Sequence[float],
+                                  all_hits: Sequence[float], theta_mle: float, alpha: float,
+                                  nevals: int) -> List[float]:
+    """Compute the likelihood ratio confidence interval for the MLAE angle.
+
+    Args:
+        evaluation_schedule: The powers of the Grover operator.
+        one_hits: The good counts (or probabilities) per power.
+        all_hits: The total counts (or ones) per power.
+        theta_mle: The maximum likelihood estimate of the angle.
+        alpha: The confidence level, the interval has a (1 - alpha) confidence.
+        nevals: The number of grid points.
+
+    Returns:
+        The (outer) confidence interval for the angle.
+    """
+    thetas, values = mlae_grid(evaluation_schedule, one_hits, all_hits, nevals)
+
+    def loglikelihood(theta):
+        return mlae_loglikelihood(theta, evaluation_schedule, one_hits, all_hits)[0]
+
+    threshold = loglikelihood(theta_mle) - chi2.ppf(1 - alpha, df=1) / 2
+    return likelihood_ratio_bounds(thetas, values, loglikelihood, threshold,
+                                   default=(0, np.pi / 2))
+
+
+def qae_pdf(values: np.ndarray, amplitudes: np.ndarray, m: int) -> np.ndarray:
+    """Compute the PDF of the canonical QAE for a grid of amplitudes.
+
+    This is a vectorized version of :func:`~.ae_utils.pdf_a`, evaluating all pairs of
+    measured values and amplitudes at once.
+
+    Args:
+        values: The measured values in [0, 1], of shape (S,).
+        amplitudes: The amplitudes in [0, 1], of shape (N,).
+        m: The number of evaluation qubits.
+
+    Returns:
+        The PDF(value | amplitude), of shape (N, S).
+    """
+    M = 2 ** m
+    omega_x = np.arcsin(np.sqrt(np.asarray(values, dtype=float))) / np.pi
+    omega_p = np.arcsin(np.sqrt(np.asarray(amplitudes, dtype=float))) / np.pi
+
+    def single_angle(x):
+        # pi times the circumferential distance between x and omega(p)
+        t = np.subtract.outer(omega_p, x)
+        d = np.pi * np.minimum(np.minimum(np.abs(t - 1), np.abs(t)), np.abs(t + 1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pdf = np.sin(M * d) ** 2 / (M * np.sin(d)) ** 2
+        return np.where(d != 0, pdf, 1)
+
+    # add up both angles that produce the given value, except for the values 0 and 1 which
+    # stem from the unique angles 0 and 0.5
+    unique = np.isin(np.asarray(values, dtype=float), [0, 1])
+    return single_angle(omega_x) + np.where(unique, 0, single_angle(1 - omega_x))
+
+
+def qae_loglikelihood(amplitudes: np.ndarray, values: Sequence[float],
+                      probabilities: Sequence[float], shots: int, m: int) -> np.ndarray:
+    """Evaluate the canonical QAE log-likelihood for an array of amplitudes.
+
+    Args:
+        amplitudes: The amplitudes.
+        values: The measured values in [0, 1].
+        probabilities: The probabilities of the measured values.
+        shots: The number of shots.
+        m: The number of evaluation qubits.
+
+    Returns:
+        The log-likelihood for each amplitude.
+    """
+    amplitudes = np.atleast_1d(np.asarray(amplitudes, dtype=float))
+    weights = shots * np.asarray(probabilities, dtype=float)
+
+    block = max(1, _MAX_BLOCK_SIZE // max(1, len(weights)))
+    loglik = np.empty(len(amplitudes))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for start in range(0, len(amplitudes), block):
+            pdf = qae_pdf(values, amplitudes[start:start + block], m)
+            loglik[start:start + block] = xlogy(weights, pdf).sum(axis=1)
+
+    return loglik
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _qae_grid(values: Tuple[float, ...], probabilities: Tuple[float, ...], shots: int, m: int,
+              bounds: Tuple[float, float], nevals: int) -> Tuple[np.ndarray, np.ndarray]:
+    amplitudes = np.linspace(bounds[0], bounds[1], nevals)
+    loglik = qae_loglikelihood(amplitudes, values, probabilities, shots, m)
+
+    # the cached arrays are shared between all callers
+    amplitudes.flags.writeable = False
+    loglik.flags.writeable = False
+    return amplitudes, loglik
+
+
+def qae_likelihood_ratio_confint(values: Sequence[float], probabilities: Sequence[float],
+                                 shots: int, m: int, ml_value: float,
+                                 bounds: Tuple[float, float], alpha: float,
+                                 nevals: int = 10000) -> List[float]:
+    """Compute the likelihood ratio confidence interval of the canonical QAE.
+
+    Args:
+        values: The measured values in [0, 1].
+        probabilities: The probabilities of the measured values.
+        shots: The number of shots.
+        m: The number of evaluation qubits.
+        ml_value: The maximum likelihood estimate of the amplitude.
+        bounds: The interval of amplitudes searched for the confidence interval.
+        alpha: The confidence level, the interval has a (1 - alpha) confidence.
+        nevals: The number of grid points in ``bounds``.
+
+    Returns:
+        The (outer) confidence interval for the amplitude.
+    """
+    values = tuple(float(x) for x in values)
+    probabilities = tuple(float(p) for p in probabilities)
+    amplitudes, loglik = _qae_grid(values, probabilities, int(shots), int(m),
+                                   (float(bounds[0]), float(bounds[1])), int(nevals))
+
+    def loglikelihood(amplitude):
+        return qae_loglikelihood(amplitude, values, probabilities, shots, m)[0]
+
+    threshold = loglikelihood(ml_value) - chi2.ppf(1 - alpha, df=1) / 2
+    lower, upper = likelihood_ratio_bounds(amplitudes, loglik, loglikelihood, threshold,
+                                           default=(ml_value, ml_value))
+
+    # the maximum is guaranteed to be above the threshold
+    return [min(lower, ml_value), max(upper, ml_value)]
+
+
+def grid_maximum(grid: np.ndarray, values: np.ndarray,
+                 derivative: Callable[[float], float]) -> float:
+    """Locate the maximum of a function on a grid and refine it with a bracketed root search.
+
+    Args:
+        grid: The sorted grid points.
+        values: The function values on the grid.
+        derivative: The derivative of the function.
+
+    Returns:
+        The location of the maximum.
+    """
+    index = int(np.nanargmax(values))
+    left, right = grid[max(index - 1, 0)], grid[min(index + 1, len(grid) - 1)]
+
+    d_left, d_right = derivative(left), derivative(right)
+    if np.isfinite(d_left) and np.isfinite(d_right) and d_left > 0 > d_right:
+        return brentq(derivative, left, right)
+
+    return grid[index]
+
+
+def likelihood_ratio_bounds(grid: np.ndarray, values: np.ndarray,
+                            function: Callable[[float], float], threshold: float,
+                            default: Tuple[float, float]) -> List[float]:
+    """Find the outermost points where a function crosses a threshold.
+
+    The crossings are located on the grid, and refined by a bracketed root search between the
+    last grid point below and the first grid point above the threshold.
+
+    Args:
+        grid: The sorted grid points.
+        values: The function values on the grid.
+        function: The function.
+        threshold: The threshold.
+        default: The bounds returned if no grid point is above the threshold.
+
+    Returns:
+        The smallest and largest point where the function is above the threshold.
+    """
+    above = np.flatnonzero(values >= threshold)
+    if len(above) == 0:
+        return list(default)
+
+    def cut(x):
+        return function(x) - threshold
+
+    first, last = above[0], above[-1]
+    lower, upper = grid[first], grid[last]
+    if first > 0 and np.isfinite(values[first - 1]):
+        lower = brentq(cut, grid[first - 1], grid[first])
+    if last < len(grid) - 1 and np.isfinite(values[last + 1]):
+        upper = brentq(cut, grid[last], grid[last + 1])
+
+    return [lower, upper]
@@ -15,6 +15,8 @@
 import logging
 import numpy as np
 
+from .ae_likelihood import qae_pdf
+
 logger = logging.getLogger(__name__)
 
 # pylint: disable=invalid-name
@@ -188,19 +190,10 @@ def pdf_a(x, p, m):
     Returns:
         float: PDF(x|p)
     """
-    # We'll use list comprehension, so the input should be a list
-    scalar = False
-    if not hasattr(x, "__len__"):
-        scalar = True
-        x = np.asarray([x])
-
-    # Compute the probabilities: Add up both angles that produce the given
-    # value, except for the angles 0 and 0.5, which map to the unique a-values,
-    # 0 and 1, respectively
-    pr = np.array([pdf_a_single_angle(xi, p, m, alpha) + pdf_a_single_angle(xi, p, m, beta)
-                   if (xi not in [0, 1]) else pdf_a_single_angle(xi, p, m, alpha)
-                   for xi in x
-                   ]).flatten()
+    scalar = not hasattr(x, "__len__")
+
+    # evaluate all grid points at once
+    pr = qae_pdf(np.atleast_1d(x), np.asarray([p]), m)[0]
 
     # If is was a scalar return scalar otherwise the array
     return pr[0] if scalar else pr
@@ -23,7 +23,7 @@ from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
 from qiskit.aqua import QuantumInstance, AquaError
 from qiskit.aqua.utils.circuit_factory import CircuitFactory
-from qiskit.aqua.utils.validation import validate_range, validate_in_set
+from qiskit.aqua.utils.validation import validate_range, validate_in_set, validate_min
 
 from .ae_algorithm import AmplitudeEstimationAlgorithm, AmplitudeEstimationAlgorithmResult
 
@@ -64,7 +64,8 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
                  i_objective: Optional[int] = None,
                  initial_state: Optional[QuantumCircuit] = None,
                  quantum_instance: Optional[
-                     Union[QuantumInstance, BaseBackend, Backend]] = None) -> None:
+                     Union[QuantumInstance, BaseBackend, Backend]] = None,
+                 num_speculative_powers: int = 0) -> None:
         r"""
         The output of the algorithm is an estimate for the amplitude `a`, that with at least
         probability 1 - alpha has an error of epsilon. The number of A operator calls scales
@@ -92,6 +93,14 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
             i_objective: Index of the objective qubit, that marks the 'good/bad' states
             initial_state: A state to prepend to the constructed circuits.
             quantum_instance: Quantum Instance or Backend
+            num_speculative_powers: The number of additional powers of Q that are executed in
+                the same job as the circuit of the current round. These powers are the most
+                likely candidates for the next rounds, predicted from the current confidence
+                interval. If a later round selects one of them, the stored counts are used
+                instead of submitting a new job. Since the counts are sampled independently of
+                the selection, the statistics of the algorithm are not affected, but the number of
+                sequential jobs is reduced at the cost of executing some unused circuits.
+                Defaults to 0, i.e. one job per round.
 
         Raises:
             AquaError: if the method to compute the confidence intervals is not supported
@@ -100,6 +109,7 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
         validate_range('epsilon', epsilon, 0, 0.5)
         validate_range('alpha', alpha, 0, 1)
         validate_in_set('confint_method', confint_method, {'chernoff', 'beta'})
+        validate_min('num_speculative_powers', num_speculative_powers, 0)
 
         # support legacy input if passed as positional arguments
         if isinstance(state_preparation, CircuitFactory):
@@ -129,6 +139,7 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
         self._min_ratio = min_ratio
         self._confint_method = confint_method
         self._initial_state = initial_state
+        self._num_speculative_powers = num_speculative_powers
 
         # results dictionary
         self._ret = {}  # type: Dict[str, Any]
@@ -233,7 +244,7 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
 
             # add Q^k
             if k != 0:
-                circuit.compose(self.grover_operator.power(k), inplace=True)
+                circuit.compose(self._grover_power(k), inplace=True)
         else:  # deprecated CircuitFactory
             q = QuantumRegister(self.a_factory.num_target_qubits, 'q')
             circuit = QuantumCircuit(q, name='circuit')
@@ -350,6 +361,87 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
 
         return lower, upper
 
+    def _compute_theta_interval(self, k: int, upper_half_circle: bool,
+                                theta_interval: Tuple[float, float], prob: float,
+                                one_counts: int, shots: int, max_rounds: int
+                                ) -> Tuple[float, float]:
+        """Compute the confidence interval for theta / 2 / pi after measuring Q^k A|0>.
+
+        Args:
+            k: The power of the Q operator that has been measured.
+            upper_half_circle: Boolean flag of whether the scaled interval lies in the upper
+                half-circle [0, pi] or in the lower one [pi, 2pi].
+            theta_interval: The confidence interval for theta / 2 / pi of the previous round.
+            prob: The probability to measure a good state, used for the Chernoff interval.
+            one_counts: The number of good counts, used for the Clopper-Pearson interval.
+            shots: The number of shots.
+            max_rounds: The maximum number of rounds, used to compute the confidence level.
+
+        Returns:
+            The new confidence interval (theta_lower, theta_upper).
+        """
+        # compute a_min_i, a_max_i
+        if self._confint_method == 'chernoff':
+            a_i_min, a_i_max = self._chernoff_confint(prob, shots, max_rounds, self._alpha)
+        else:  # 'beta'
+            a_i_min, a_i_max = self._clopper_pearson_confint(one_counts, shots,
+                                                             self._alpha / max_rounds)
+
+        # compute theta_min_i, theta_max_i
+        if upper_half_circle:
+            theta_min_i = np.arccos(1 - 2 * a_i_min) / 2 / np.pi
+            theta_max_i = np.arccos(1 - 2 * a_i_max) / 2 / np.pi
+        else:
+            theta_min_i = 1 - np.arccos(1 - 2 * a_i_max) / 2 / np.pi
+            theta_max_i = 1 - np.arccos(1 - 2 * a_i_min) / 2 / np.pi
+
+        # compute theta_u, theta_l of this iteration
+        scaling = 4 * k + 2  # current K_i factor
+        theta_u = (int(scaling * theta_interval[1]) + theta_max_i) / scaling
+        theta_l = (int(scaling * theta_interval[0]) + theta_min_i) / scaling
+        return theta_l, theta_u
+
+    def _speculate_next_powers(self, k: int, upper_half_circle: bool,
+                               theta_interval: Tuple[float, float], shots: int,
+                               max_rounds: int) -> List[int]:
+        """Predict the most likely powers of Q chosen in the round after measuring Q^k A|0>.
+
+        For a grid of angles in the current confidence interval, the noiseless outcome of the
+        measurement of Q^k A|0> is used to compute the next confidence interval and power.
+        The powers are ranked by how many grid points lead to them.
+
+        Args:
+            k: The power of the Q operator measured in the current round.
+            upper_half_circle: Boolean flag of whether the current interval lies in the upper
+                half-circle.
+            theta_interval: The current confidence interval for theta / 2 / pi.
+            shots: The number of shots per round.
+            max_rounds: The maximum number of rounds.
+
+        Returns:
+            At most ``num_speculative_powers`` powers of Q, the most likely first.
+        """
+        if self._num_speculative_powers == 0:
+            return []
+
+        scaling = 4 * k + 2
+        votes = {}  # type: Dict[int, int]
+        for theta in np.linspace(theta_interval[0], theta_interval[1],
+                                 4 * self._num_speculative_powers + 1):
+            one_counts = int(np.round(shots * np.sin(np.pi * scaling * theta) ** 2))
+            next_interval = self._compute_theta_interval(k, upper_half_circle, theta_interval,
+                                                         one_counts / shots, one_counts, shots,
+                                                         max_rounds)
+            if next_interval[1] - next_interval[0] <= self._epsilon / np.pi:
+                continue  # the algorithm would terminate after this round
+
+            next_k, _ = self._find_next_k(k, upper_half_circle, next_interval,
+                                          min_ratio=self._min_ratio)
+            votes[next_k] = votes.get(next_k, 0) + 1
+
+        ranked = sorted(votes, key=lambda power: (-votes[power], power))
+        return ranked[:self._num_speculative_powers]
+
     def _run(self) -> 'IterativeAmplitudeEstimationResult':
         # check if A factory or state_preparation has been set
         if self.state_preparation is None:
@@ -396,6 +488,9 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
             num_iterations = 0  # keep track of the number of iterations
             shots = self._quantum_instance._run_config.shots  # number of shots per iteration
 
+            # counts of the circuits executed speculatively, stored per power of Q
+            speculative_counts = {}  # type: Dict[int, List[Dict[str, int]]]
+
             # do while loop, keep in mind that we scaled theta mod 2pi such that it lies in [0,1]
             while theta_intervals[-1][1] - theta_intervals[-1][0] > self._epsilon / np.pi:
                 num_iterations += 1
@@ -409,20 +504,31 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
                 powers.append(k)
                 ratios.append((2 * powers[-1] + 1) / (2 * powers[-2] + 1))
 
-                # run measurements for Q^k A|0> circuit
-                circuit = self.construct_circuit(k, measurement=True)
-                ret = self._quantum_instance.execute(circuit)
-
-                # get the counts and store them
-                counts = ret.get_counts(circuit)
+                if len(speculative_counts.get(k, [])) > 0:
+                    # Q^k A|0> has already been measured along with a previous round
+                    counts = speculative_counts[k].pop(0)
+                else:
+                    # run measurements for Q^k A|0> circuit, together with the circuits for the
+                    # most likely powers of the next rounds
+                    candidates = [k] + self._speculate_next_powers(k, upper_half_circle,
+                                                                   theta_intervals[-1], shots,
+                                                                   max_rounds)
+                    circuits = [self.construct_circuit(k_i, measurement=True)
+                                for k_i in candidates]
+                    ret = self._quantum_instance.execute(circuits)
+
+                    # get the counts and store them
+                    counts = ret.get_counts(0)
+                    for i, k_i in enumerate(candidates[1:], start=1):
+                        speculative_counts.setdefault(k_i, []).append(ret.get_counts(i))
+
+                    # track number of Q-oracle calls, including the speculative circuits
+                    num_oracle_queries += shots * sum(candidates)
 
                 # calculate the probability of measuring '1', 'prob' is a_i in the paper
                 one_counts, prob = self._probability_to_measure_one(counts)  # type: ignore
                 num_one_shots.append(one_counts)
 
-                # track number of Q-oracle calls
-                num_oracle_queries += shots * k
-
                 # if on the previous iterations we have K_{i-1} == K_i, we sum these samples up
                 j = 1  # number of times we stayed fixed at the same K
                 round_shots = shots
@@ -434,26 +540,11 @@ class IterativeAmplitudeEstimation(AmplitudeEstimationAlgorithm):
                         round_shots += shots
                         round_one_counts += num_one_shots[-j]
 
-                # compute a_min_i, a_max_i
-                if self._confint_method == 'chernoff':
-                    a_i_min, a_i_max = self._chernoff_confint(prob, round_shots, max_rounds,
-                                                              self._alpha)
-                else:  # 'beta'
-                    a_i_min, a_i_max = self._clopper_pearson_confint(round_one_counts, round_shots,
-                                                                     self._alpha / max_rounds)
-
-                # compute theta_min_i, theta_max_i
-                if upper_half_circle:
-                    theta_min_i = np.arccos(1 - 2 * a_i_min) / 2 / np.pi
-                    theta_max_i = np.arccos(1 - 2 * a_i_max) / 2 / np.pi
-                else:
-                    theta_min_i = 1 - np.arccos(1 - 2 * a_i_max) / 2 / np.pi
-                    theta_max_i = 1 - np.arccos(1 - 2 * a_i_min) / 2 / np.pi
-
                 # compute theta_u, theta_l of this iteration
-                scaling = 4 * k + 2  # current K_i factor
-                theta_u = (int(scaling * theta_intervals[-1][1]) + theta_max_i) / scaling
-                theta_l = (int(scaling * theta_intervals[-1][0]) + theta_min_i) / scaling
+                theta_l, theta_u = self._compute_theta_interval(k, upper_half_circle,
+                                                                theta_intervals[-1], prob,
+                                                                round_one_counts, round_shots,
+                                                                max_rounds)
                 theta_intervals.append([theta_l, theta_u])
 
                 # compute a_u_i, a_l_i
@@ -16,8 +16,7 @@ from typing import Optional, List, Union, Tuple, Callable, Dict, Any
 import warnings
 import logging
 import numpy as np
-from scipy.optimize import brute
-from scipy.stats import norm, chi2
+from scipy.stats import norm
 
 from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
@@ -26,6 +25,7 @@ from qiskit.aqua import QuantumInstance, AquaError
 from qiskit.aqua.utils.circuit_factory import CircuitFactory
 from qiskit.aqua.utils.validation import validate_min
 from .ae_algorithm import AmplitudeEstimationAlgorithm, AmplitudeEstimationAlgorithmResult
+from .ae_likelihood import mlae_mle, mlae_likelihood_ratio_confint
 
 logger = logging.getLogger(__name__)
 
@@ -151,7 +151,8 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
                 qc_k = qc_0.copy(name='qc_a_q_%s' % k)
 
                 if k != 0:
-                    qc_k.compose(self.grover_operator.power(k), inplace=True)
+                    # Q^k is composed from the cached lower powers of the schedule
+                    qc_k.compose(self._grover_power(k), inplace=True)
 
                 if measurement:
                     # real hardware can currently not handle operations after measurements,
@@ -259,16 +260,6 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
 
         return one_hits, all_hits
 
-    def _safe_min(self, array, default=0):
-        if len(array) == 0:
-            return default
-        return np.min(array)
-
-    def _safe_max(self, array, default=(np.pi / 2)):
-        if len(array) == 0:
-            return default
-        return np.max(array)
-
     def _compute_fisher_information(self, a: Optional[float] = None,
                                     num_sum_terms: Optional[int] = None,
                                     observed: bool = False) -> float:
@@ -371,33 +362,9 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
         if nevals is None:
             nevals = self._likelihood_evals
 
-        def loglikelihood(theta, one_counts, all_counts):
-            loglik = 0
-            for i, k in enumerate(self._evaluation_schedule):
-                loglik += np.log(np.sin((2 * k + 1) * theta) ** 2) * one_counts[i]
-                loglik += np.log(np.cos((2 * k + 1) * theta) ** 2) * (all_counts[i] - one_counts[i])
-            return loglik
-
         one_counts, all_counts = self._get_hits()
-
-        eps = 1e-15  # to avoid invalid value in log
-        thetas = np.linspace(0 + eps, np.pi / 2 - eps, nevals)
-        values = np.zeros(len(thetas))
-        for i, theta in enumerate(thetas):
-            values[i] = loglikelihood(theta, one_counts, all_counts)
-
-        loglik_mle = loglikelihood(self._ret['theta'], one_counts, all_counts)
-        chi2_quantile = chi2.ppf(1 - alpha, df=1)
-        thres = loglik_mle - chi2_quantile / 2
-
-        # the (outer) LR confidence interval
-        above_thres = thetas[values >= thres]
-
-        # it might happen that the `above_thres` array is empty,
-        # to still provide a valid result use safe_min/max which
-        # then yield [0, pi/2]
-        confint = [self._safe_min(above_thres, default=0),
-                   self._safe_max(above_thres, default=np.pi / 2)]
+        confint = mlae_likelihood_ratio_confint(self._evaluation_schedule, one_counts,
+                                                all_counts, self._ret['theta'], alpha, nevals)
         mapped_confint = [self.post_processing(np.sin(bound) ** 2) for bound in confint]
 
         return mapped_confint
@@ -444,24 +411,12 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimationAlgorithm):
     def _compute_mle_safe(self):
         """Compute the MLE via a grid-search.
 
-        This is a stable approach if sufficient gridpoints are used.
+        This is a stable approach if sufficient gridpoints are used. The log-likelihood is
+        evaluated on all gridpoints at once and the best gridpoint is refined with a bracketed
+        root search of the derivative of the log-likelihood.
         """
         one_hits, all_hits = self._get_hits()
-
-        # search range
-        eps = 1e-15  # to avoid invalid value in log
-        search_range = [0 + eps, np.pi / 2 - eps]
-
-        def loglikelihood(theta):
-            # loglik contains the first `it` terms of the full loglikelihood
-            loglik = 0
-            for i, k in enumerate(self._evaluation_schedule):
-                loglik += np.log(np.sin((2 * k + 1) * theta) ** 2) * one_hits[i]
-                loglik += np.log(np.cos((2 * k + 1) * theta) ** 2) * (all_hits[i] - one_hits[i])
-            return -loglik
-
-        est_theta = brute(loglikelihood, [search_range], Ns=self._likelihood_evals)[0]
-        return est_theta
+        return mlae_mle(self._evaluation_schedule, one_hits, all_hits, self._likelihood_evals)
 
     def _run_mle(self) -> float:
         """Compute the maximum likelihood estimator (MLE) for the angle theta.
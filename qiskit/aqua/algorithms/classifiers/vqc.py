@@ -389,6 +389,11 @@ class VQC(VQAlgorithm):
         logger.debug('Intermediate batch cost: %s', sum(total_cost))
         return total_cost if len(total_cost) > 1 else total_cost[0]
 
+    def _count_replayed_evals(self, num_evals: int) -> None:
+        self._eval_count += num_evals
+        if not self.is_gradient_really_supported():
+            self._batch_index += 1
+
     def test(self, data, labels, quantum_instance=None, minibatch_size=-1, params=None):
         """Predict the labels for the data, and test against with ground truth labels.
 
@@ -71,7 +71,8 @@ class QGAN(QuantumAlgorithm):
                  generator: Optional[GenerativeNetwork] = None,
                  tol_rel_ent: Optional[float] = None, snapshot_dir: Optional[str] = None,
                  quantum_instance: Optional[
-                     Union[QuantumInstance, BaseBackend, Backend]] = None) -> None:
+                     Union[QuantumInstance, BaseBackend, Backend]] = None,
+                 batched_sampling: bool = False) -> None:
         """
 
         Args:
@@ -91,6 +92,11 @@ class QGAN(QuantumAlgorithm):
             snapshot_dir: Directory in to which to store cvs file with parameters,
                 if None (default) then no cvs file is created.
             quantum_instance: Quantum Instance or Backend
+            batched_sampling: If True, the generated data samples for all batches of an epoch
+                are drawn in a single execution of the generator with the parameters at the
+                beginning of the epoch, and the relative entropy is computed from the same
+                samples. With a statevector backend the generator is run once per epoch.
+                If False (default), the generator is sampled anew for every batch.
         Raises:
             AquaError: invalid input
         """
@@ -135,6 +141,7 @@ class QGAN(QuantumAlgorithm):
         self._d_loss = []  # type: List[float]
         self._rel_entr = []  # type: List[float]
         self._tol_rel_ent = tol_rel_ent
+        self._batched_sampling = batched_sampling
 
         self._random_seed = seed
 
@@ -186,6 +193,21 @@ class QGAN(QuantumAlgorithm):
         """
         self._tol_rel_ent = t
 
+    @property
+    def batched_sampling(self) -> bool:
+        """ Returns whether the generated samples of an epoch are drawn in one execution """
+        return self._batched_sampling
+
+    @batched_sampling.setter
+    def batched_sampling(self, batched_sampling: bool) -> None:
+        """
+        Set whether the generated samples of an epoch are drawn in one execution
+
+        Args:
+            batched_sampling: If True, sample all batches of an epoch in a single execution.
+        """
+        self._batched_sampling = batched_sampling
+
     @property
     def generator(self):
         """ Returns generator """
@@ -247,16 +269,51 @@ class QGAN(QuantumAlgorithm):
     def get_rel_entr(self) -> float:
         """ Get relative entropy between target and trained distribution """
         samples_gen, prob_gen = self._generator.get_output(self._quantum_instance)
+        return self._compute_rel_entr(samples_gen, prob_gen)
+
+    def _compute_rel_entr(self, samples_gen, prob_gen) -> float:
+        """ Compute the relative entropy between the target and the given generated samples """
+        grid_index = {tuple(np.ravel(element)): i
+                      for i, element in enumerate(self._grid_elements)}
         temp = np.zeros(len(self._grid_elements))
-        for j, sample in enumerate(samples_gen):
-            for i, element in enumerate(self._grid_elements):
-                if sample == element:
-                    temp[i] += prob_gen[j]
-        prob_gen = temp
-        prob_gen = [1e-8 if x == 0 else x for x in prob_gen]
+        for sample, prob in zip(samples_gen, prob_gen):
+            i = grid_index.get(tuple(np.ravel(sample)))
+            if i is not None:
+                temp[i] += prob
+        prob_gen = np.where(temp == 0, 1e-8, temp)
         rel_entr = entropy(prob_gen, self._prob_data)
         return rel_entr
 
+    def _sample_batches(self, num_batches):
+        """
+        Sample generated data for all batches of an epoch in a single execution.
+
+        Args:
+            num_batches (int): number of batches
+
+        Returns:
+            tuple(list, float): the generated samples and their weights per batch,
+                and the relative entropy of all generated samples
+        """
+        shots = num_batches * self._batch_size
+        samples_gen, prob_gen = self._generator.get_output(self._quantum_instance, shots=shots)
+        rel_entr = self._compute_rel_entr(samples_gen, prob_gen)
+        if self._quantum_instance.is_statevector:
+            # the exact distribution is the same for every batch
+            return [(samples_gen, prob_gen)] * num_batches, rel_entr
+
+        # split the pooled measurement outcomes randomly into batches of equal size
+        counts = np.rint(np.asarray(prob_gen) * shots).astype(int)
+        outcomes = np.repeat(np.arange(len(samples_gen)), counts)
+        aqua_globals.random.shuffle(outcomes)
+        batches = []
+        for outcome in np.array_split(outcomes, num_batches):
+            batch_counts = np.bincount(outcome, minlength=len(samples_gen))
+            indices = np.flatnonzero(batch_counts)
+            batches.append(([samples_gen[i] for i in indices],
+                            list(batch_counts[indices] / len(outcome))))
+        return batches, rel_entr
+
     def _store_params(self, e, d_loss, g_loss, rel_entr):
         with open(os.path.join(self._snapshot_dir, 'output.csv'), mode='a') as csv_file:
             fieldnames = ['epoch', 'loss_discriminator',
@@ -286,14 +343,22 @@ class QGAN(QuantumAlgorithm):
                 'The batch size needs to be less than the '
                 'truncated data size of {}'.format(len(self._data)))
 
+        num_batches = len(self._data) // self._batch_size
+        if self._batched_sampling:
+            generated_batches, rel_entr = self._sample_batches(num_batches)
+
         for e in range(self._num_epochs):
             aqua_globals.random.shuffle(self._data)
             index = 0
             while (index + self._batch_size) <= len(self._data):
                 real_batch = self._data[index: index + self._batch_size]
+                if self._batched_sampling:
+                    generated_batch, generated_prob = \
+                        generated_batches[index // self._batch_size]
+                else:
+                    generated_batch, generated_prob = self._generator.get_output(
+                        self._quantum_instance, shots=self._batch_size)
                 index += self._batch_size
-                generated_batch, generated_prob = self._generator.get_output(self._quantum_instance,
-                                                                             shots=self._batch_size)
 
                 # 1. Train Discriminator
                 ret_d = self._discriminator.train([real_batch, generated_batch],
@@ -309,7 +374,11 @@ class QGAN(QuantumAlgorithm):
             self._d_loss.append(np.around(float(d_loss_min), 4))
             self._g_loss.append(np.around(g_loss_min, 4))
 
-            rel_entr = self.get_rel_entr()
+            if self._batched_sampling:
+                # the samples for the next epoch are drawn with the updated parameters
+                generated_batches, rel_entr = self._sample_batches(num_batches)
+            else:
+                rel_entr = self.get_rel_entr()
             self._rel_entr.append(np.around(rel_entr, 4))
             self._ret['params_d'] = ret_d['params']
             self._ret['params_g'] = ret_g['params']
@@ -0,0 +1,218 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A matrix-free linear operator for sums of Pauli operators."""
+
+from typing import Optional, List, Tuple
+import numbers
+import numpy as np
+from scipy import sparse as scisparse
+from scipy.sparse.linalg import LinearOperator
+
+from qiskit.aqua.operators import OperatorBase, PauliOp, SummedOp
+
+# number of non-zero elements up to which the operator is stored as a sparse matrix
+_MAX_SPARSE_ELEMENTS = 2 ** 25
+# number of elements of a temporary block of a diagonal computed on the fly
+_MAX_BLOCK_ELEMENTS = 2 ** 20
+
+
+def _parity(values: np.ndarray) -> np.ndarray:
+    """ The parity of the number of set bits of each (at most 32 bit) value """
+    values = values.copy()
+    for shift in (16, 8, 4, 2, 1):
+        values ^= values >> shift
+    return values & 1
+
+
+def _flatten(operator: OperatorBase, coeff: complex,
+             terms: List[Tuple[np.ndarray, np.ndarray, complex]]) -> bool:
+    """ Collect the (x, z, coeff) terms of a (nested) sum of Paulis, False if not a Pauli sum """
+    if not isinstance(operator.coeff, numbers.Number):
+        return False
+    coeff = coeff * operator.coeff
+    if isinstance(operator, PauliOp):
+        terms.append((operator.primitive.x, operator.primitive.z, coeff))
+        return True
+    if isinstance(operator, SummedOp):
+        return all(_flatten(op, coeff, terms) for op in operator.oplist)
+    return False
+
+
+class PauliSumLinearOperator(LinearOperator):
+    r"""A matrix-free representation of a sum of Pauli operators.
+
+    A Pauli operator with the bit masks :math:`x` and :math:`z` acts on a computational basis
+    state as :math:`P|j\rangle = i^{|x \wedge z|} (-1)^{|j \wedge z|} |j \oplus x\rangle`.
+    The terms are grouped by their x-mask, such that every group is a diagonal operator followed
+    by a permutation of the basis states. The qubits are split into a low and a high half, and
+    the sign :math:`(-1)^{|j \wedge z|}` factorizes into the signs of both halves, so the diagonal
+    of a group is a product of two small matrices over the terms of the group.
+
+    If the number of non-zero elements is small enough, the operator is assembled directly into
+    a sparse matrix. Otherwise the diagonals are computed blockwise on the fly for every product,
+    such that the memory footprint is a small multiple of the size of the vectors.
+    """
+
+    def __init__(self, num_qubits: int, x_masks: np.ndarray, z_masks: np.ndarray,
+                 coeffs: np.ndarray) -> None:
+        """
+        Args:
+            num_qubits: The number of qubits.
+            x_masks: The x-masks of the Pauli terms, qubit i corresponds to bit i.
+            z_masks: The z-masks of the Pauli terms, qubit i corresponds to bit i.
+            coeffs: The coefficients of the Pauli terms.
+        """
+        self._num_qubits = num_qubits
+        self._low_bits = num_qubits // 2
+        num_low = 2 ** self._low_bits
+        num_high = 2 ** (num_qubits - self._low_bits)
+
+        coeffs = np.asarray(coeffs, dtype=complex)
+        self._is_hermitian = bool(np.all(np.abs(coeffs.imag) <= 1e-12 * max(1.0, np.max(
+            np.abs(coeffs), initial=0.0))))
+        # fold the phase i^{|x & z|} of the Y's into the coefficients
+        num_y = np.array([bin(int(x & z)).count('1') for x, z in zip(x_masks, z_masks)],
+                         dtype=int)
+        coeffs = coeffs * (1j ** (num_y % 4))
+        dtype = np.float64 if np.all(coeffs.imag == 0) else np.complex128
+        if dtype == np.float64:
+            coeffs = coeffs.real
+
+        low_mask = num_low - 1
+        low = np.arange(num_low, dtype=np.int64)
+        high = np.arange(num_high, dtype=np.int64)
+        self._groups = []
+        unique_x, inverse = np.unique(x_masks, return_inverse=True)
+        for group, x_mask in enumerate(unique_x):
+            terms = np.flatnonzero(inverse == group)
+            z_low = np.asarray(z_masks)[terms] & low_mask
+            z_high = np.asarray(z_masks)[terms] >> self._low_bits
+            sign_low = 1 - 2 * _parity(low[None, :] & z_low[:, None])
+            sign_high = 1 - 2 * _parity(high[None, :] & z_high[:, None])
+            # (terms, num_low) and (num_high, terms) factors of the (num_high, num_low) diagonal
+            self._groups.append((int(x_mask), coeffs[terms, None] * sign_low,
+                                 np.ascontiguousarray(sign_high.T, dtype=dtype)))
+
+        super().__init__(dtype, (2 ** num_qubits, 2 ** num_qubits))
+
+        self._sparse = None
+        if len(self._groups) * self.shape[0] <= _MAX_SPARSE_ELEMENTS:
+            self._sparse = self._to_spmatrix()
+
+    @classmethod
+    def from_operator(cls, operator: OperatorBase) -> Optional['PauliSumLinearOperator']:
+        """Create the linear operator from a (nested) sum of Pauli operators.
+
+        Args:
+            operator: The operator.
+
+        Returns:
+            The linear operator, or None if the operator is not a sum of Paulis with numeric
+            coefficients.
+        """
+        terms = []  # type: List[Tuple[np.ndarray, np.ndarray, complex]]
+        num_qubits = operator.num_qubits
+        if num_qubits > 62 or not _flatten(operator, 1.0, terms) or not terms:
+            return None
+        powers = 1 << np.arange(num_qubits, dtype=np.int64)
+        x_masks = np.array([np.dot(x, powers) for x, _, _ in terms], dtype=np.int64)
+        z_masks = np.array([np.dot(z, powers) for _, z, _ in terms], dtype=np.int64)
+        coeffs = np.array([coeff for _, _, coeff in terms], dtype=complex)
+        return cls(num_qubits, x_masks, z_masks, coeffs)
+
+    @property
+    def is_hermitian(self) -> bool:
+        """ Returns whether all Pauli coefficients are real """
+        return self._is_hermitian
+
+    @property
+    def is_diagonal(self) -> bool:
+        """ Returns whether the operator is diagonal, i.e. all x-masks are zero """
+        return len(self._groups) == 1 and self._groups[0][0] == 0
+
+    def diagonal(self) -> np.ndarray:
+        """ Returns the diagonal of the operator, i.e. the sum of the terms without X or Y """
+        x_mask, low_factor, high_factor = self._groups[0]
+        if x_mask != 0:
+            return np.zeros(self.shape[0], dtype=self.dtype)
+        return (high_factor @ low_factor).ravel()
+
+    def _to_spmatrix(self) -> scisparse.csr_matrix:
+        """ Assemble the operator as sparse matrix, row j holds the entries at columns j ^ x """
+        dim = self.shape[0]
+        num_groups = len(self._groups)
+        index_dtype = np.int32 if dim * num_groups < 2 ** 31 else np.int64
+        rows = np.arange(dim, dtype=index_dtype)
+        indices = np.empty((dim, num_groups), dtype=index_dtype)
+        data = np.empty((dim, num_groups), dtype=self.dtype)
+        for group, (x_mask, low_factor, high_factor) in enumerate(self._groups):
+            np.bitwise_xor(rows, x_mask, out=indices[:, group])
+            data[:, group] = (high_factor @ low_factor).ravel()[indices[:, group]]
+        indptr = np.arange(0, dim * num_groups + 1, num_groups, dtype=index_dtype)
+        return scisparse.csr_matrix((data.ravel(), indices.ravel(), indptr), shape=self.shape)
+
+    def _flip(self, x_mask: int) -> Tuple[Tuple[int, ...], Tuple[slice, ...]]:
+        """ The shape and slices of a view which maps index j to index j ^ x_mask """
+        shape = []  # type: List[int]
+        slices = []  # type: List[slice]
+        for bit in reversed(range(self._num_qubits)):
+            if (x_mask >> bit) & 1:
+                shape.append(2)
+                slices.append(slice(None, None, -1))
+            elif slices and slices[-1] == slice(None):
+                shape[-1] *= 2
+            else:
+                shape.append(2)
+                slices.append(slice(None))
+        return tuple(shape), tuple(slices)
+
+    def _matmat(self, X):
+        if self._sparse is not None:
+            return self._sparse @ np.asarray(X)
+
+        num_low = 2 ** self._low_bits
+        num_high = self.shape[0] // num_low
+        vectors = np.asarray(X).reshape(num_high, num_low, -1)
+        num_vectors = vectors.shape[2]
+        dtype = np.result_type(self.dtype, vectors.dtype)
+        out = np.zeros(vectors.shape, dtype=dtype)
+        temp = np.empty(vectors.shape, dtype=dtype)
+        rows = max(1, _MAX_BLOCK_ELEMENTS // num_low)
+        for x_mask, low_factor, high_factor in self._groups:
+            # temp = diagonal * vectors, computed in blocks of rows
+            for start in range(0, num_high, rows):
+                stop = min(start + rows, num_high)
+                diagonal = high_factor[start:stop] @ low_factor
+                np.multiply(diagonal[:, :, None], vectors[start:stop], out=temp[start:stop])
+            # out[j ^ x] += temp[j], with the bit flips of x as reversed views
+            if x_mask:
+                shape, slices = self._flip(x_mask)
+                flipped = temp.reshape(shape + (num_vectors,))[slices]
+                out.reshape(shape + (num_vectors,))[...] += flipped
+            else:
+                out += temp
+        return out.reshape(self.shape[0], -1)
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1))).ravel()
+
+    def _adjoint(self):
+        if self._is_hermitian:
+            return self
+        return super()._adjoint()
+
+    def to_spmatrix(self) -> scisparse.csr_matrix:
+        """ Returns the operator as sparse matrix """
+        if self._sparse is not None:
+            return self._sparse
+        return self._to_spmatrix()
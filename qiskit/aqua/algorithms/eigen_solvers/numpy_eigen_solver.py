@@ -18,15 +18,20 @@ import pprint
 import warnings
 import numpy as np
 from scipy import sparse as scisparse
+from scipy.sparse import linalg as scilinalg
 
-from qiskit.aqua import AquaError
+from qiskit.aqua import AquaError, aqua_globals
 from qiskit.aqua.algorithms import ClassicalAlgorithm
 from qiskit.aqua.operators import OperatorBase, LegacyBaseOperator, I, StateFn, ListOp
 from qiskit.aqua.utils.validation import validate_min
 from .eigen_solver import Eigensolver, EigensolverResult
+from ._pauli_sum_linear_operator import PauliSumLinearOperator
 
 logger = logging.getLogger(__name__)
 
+# dimension from which Hermitian operators are solved with LOBPCG, which needs fewer vectors
+_LOBPCG_MIN_DIM = 2 ** 20
+
 
 # pylint: disable=invalid-name
 
@@ -39,9 +44,11 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
     matrix of dimension :math:`n \times n`, with :math:`k \leq n`.
 
     Note:
-        Operators are automatically converted to :class:`~qiskit.aqua.operators.MatrixOperator`
-        as needed and this conversion can be costly in terms of memory and performance as the
-        operator size, mostly in terms of number of qubits it represents, gets larger.
+        Sums of Pauli operators are solved matrix-free, by applying the Paulis directly to
+        vectors in a Hermitian sparse eigensolver. Other operators are automatically converted
+        to :class:`~qiskit.aqua.operators.MatrixOperator` as needed and this conversion can be
+        costly in terms of memory and performance as the operator size, mostly in terms of number
+        of qubits it represents, gets larger.
     """
 
     def __init__(self,
@@ -50,7 +57,8 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                  aux_operators: Optional[List[Optional[Union[OperatorBase,
                                                              LegacyBaseOperator]]]] = None,
                  filter_criterion: Callable[[Union[List, np.ndarray], float, Optional[List[float]]],
-                                            bool] = None
+                                            bool] = None,
+                 warm_start: bool = False
                  ) -> None:
         """
         Args:
@@ -66,6 +74,9 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                 whether to keep this value in the final returned result or not. If the number of
                 elements that satisfies the criterion is smaller than `k` then the returned list has
                 fewer elements and can even be empty.
+            warm_start: If True, the sparse eigensolver is started from the first eigenstate of
+                the previous run, if the dimensions match, e.g. when solving a sequence of
+                slowly changing operators.
         """
         validate_min('k', k, 1)
         super().__init__()
@@ -79,6 +90,8 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         self.aux_operators = aux_operators
 
         self._filter_criterion = filter_criterion
+        self._warm_start = warm_start
+        self._initial_state = None  # type: Optional[np.ndarray]
 
         self._ret = {}  # type: Dict[str, Any]
 
@@ -131,6 +144,16 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         self._in_k = k
         self._check_set_k()
 
+    @property
+    def warm_start(self) -> bool:
+        """ returns whether the solver is started from the previous eigenstate """
+        return self._warm_start
+
+    @warm_start.setter
+    def warm_start(self, warm_start: bool) -> None:
+        """ set whether the solver is started from the previous eigenstate """
+        self._warm_start = warm_start
+
     def supports_aux_operators(self) -> bool:
         return True
 
@@ -144,30 +167,90 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                 self._k = self._in_k
 
     def _solve(self) -> None:
-
-        sp_mat = self._operator.to_spmatrix()
-        # If matrix is diagonal, the elements on the diagonal are the eigenvalues. Solve by sorting.
-        if scisparse.csr_matrix(sp_mat.diagonal()).nnz == sp_mat.nnz:
-            diag = sp_mat.diagonal()
-            eigval = np.sort(diag)[:self._k]
-            temp = np.argsort(diag)[:self._k]
-            eigvec = np.zeros((sp_mat.shape[0], self._k))
-            for i, idx in enumerate(temp):
-                eigvec[idx, i] = 1.0
+        dim = 2 ** self._operator.num_qubits
+        lin_op = PauliSumLinearOperator.from_operator(self._operator)
+        if lin_op is not None:
+            is_hermitian = lin_op.is_hermitian
+            diag = lin_op.diagonal() if lin_op.is_diagonal else None
         else:
-            if self._k >= 2**(self._operator.num_qubits) - 1:
-                logger.debug("SciPy doesn't support to get all eigenvalues, using NumPy instead.")
+            if hasattr(self._operator, 'to_spmatrix'):
+                lin_op = self._operator.to_spmatrix()
+            else:
+                lin_op = scisparse.csr_matrix(self._operator.to_matrix())
+            is_hermitian = abs(lin_op - lin_op.getH()).max() <= 1e-12
+            # If matrix is diagonal, the elements on the diagonal are the eigenvalues.
+            diag = lin_op.diagonal()
+            if np.count_nonzero(diag) != lin_op.count_nonzero():
+                diag = None
+
+        if diag is not None:
+            # Solve by sorting the diagonal.
+            if self._k < dim:
+                # candidates are all elements up to the k-th smallest one, including all ties
+                kth = np.partition(diag, self._k - 1)[self._k - 1]
+                temp = np.flatnonzero(diag <= kth)
+                temp = temp[np.argsort(diag[temp], kind='stable')][:self._k]
+            else:
+                temp = np.argsort(diag, kind='stable')
+            eigval = diag[temp]
+            eigvec = np.zeros((dim, self._k))
+            eigvec[temp, np.arange(self._k)] = 1.0
+        elif self._k >= dim - 1:
+            logger.debug("SciPy doesn't support to get all eigenvalues, using NumPy instead.")
+            if is_hermitian:
+                eigval, eigvec = np.linalg.eigh(self._operator.to_matrix())
+            else:
                 eigval, eigvec = np.linalg.eig(self._operator.to_matrix())
+        else:
+            v0 = None
+            if self._warm_start and self._initial_state is not None \
+                    and len(self._initial_state) == dim:
+                v0 = self._initial_state
+                if not np.issubdtype(lin_op.dtype, np.complexfloating):
+                    v0 = v0.real
+            if is_hermitian and dim >= max(_LOBPCG_MIN_DIM, 5 * self._k):
+                eigval, eigvec = self._lobpcg(lin_op, v0)
+            elif is_hermitian:
+                eigval, eigvec = scilinalg.eigsh(lin_op, k=self._k, which='SA', v0=v0)
             else:
-                eigval, eigvec = scisparse.linalg.eigs(self._operator.to_spmatrix(),
-                                                       k=self._k, which='SR')
+                eigval, eigvec = scilinalg.eigs(lin_op, k=self._k, which='SR', v0=v0)
         if self._k > 1:
-            idx = eigval.argsort()
+            idx = eigval.argsort(kind='stable')
             eigval = eigval[idx]
             eigvec = eigvec[:, idx]
+        if eigvec.shape[1] > 0:
+            self._initial_state = eigvec[:, 0]
         self._ret['eigvals'] = eigval
         self._ret['eigvecs'] = eigvec.T
 
+    def _lobpcg(self, lin_op: Union[scilinalg.LinearOperator, scisparse.spmatrix],
+                v0: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the smallest eigenvalues of a Hermitian operator with LOBPCG.
+
+        LOBPCG needs a few vectors per eigenvalue, whereas Lanczos keeps at least 20 vectors,
+        which dominates the memory for large operators. The inverse of the shifted diagonal of
+        the operator is used as preconditioner.
+
+        Args:
+            lin_op: The Hermitian operator.
+            v0: An initial guess of the first eigenvector.
+
+        Returns:
+            The eigenvalues and eigenvectors.
+        """
+        dim = lin_op.shape[0]
+        dtype = np.result_type(lin_op.dtype, np.float64)
+        initial = aqua_globals.random.random((dim, self._k)) - 0.5
+        initial = initial.astype(dtype)
+        if v0 is not None:
+            initial[:, 0] = v0
+        diagonal = np.real(lin_op.diagonal())
+        shift = max(1e-2 * (np.max(diagonal) - np.min(diagonal)), 1e-8)
+        preconditioner = scisparse.diags(1 / (diagonal - np.min(diagonal) + shift))
+        eigval, eigvec = scilinalg.lobpcg(lin_op, initial, M=preconditioner, tol=1e-8,
+                                          maxiter=1000, largest=False)
+        return eigval, eigvec
+
     def _get_ground_state_energy(self) -> None:
         if 'eigvals' not in self._ret or 'eigvecs' not in self._ret:
             self._solve()
@@ -200,14 +283,19 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                 continue
             value = 0.0
             if operator.coeff != 0:
-                mat = operator.to_spmatrix()
-                # Terra doesn't support sparse yet, so do the matmul directly if so
-                # This is necessary for the particle_hole and other chemistry tests because the
-                # pauli conversions are 2^12th large and will OOM error if not sparse.
-                if isinstance(mat, scisparse.spmatrix):
-                    value = mat.dot(wavefn).dot(np.conj(wavefn))
+                lin_op = PauliSumLinearOperator.from_operator(operator)
+                if lin_op is not None:
+                    # apply sums of Paulis matrix-free
+                    value = np.vdot(wavefn, lin_op.matvec(wavefn))
                 else:
-                    value = StateFn(operator, is_measurement=True).eval(wavefn)
+                    mat = operator.to_spmatrix()
+                    # Terra doesn't support sparse yet, so do the matmul directly if so
+                    # This is necessary for the particle_hole and other chemistry tests because
+                    # the pauli conversions are 2^12th large and will OOM error if not sparse.
+                    if isinstance(mat, scisparse.spmatrix):
+                        value = mat.dot(wavefn).dot(np.conj(wavefn))
+                    else:
+                        value = StateFn(operator, is_measurement=True).eval(wavefn)
                 value = value.real if abs(value.real) > threshold else 0.0
             values.append((value, 0))
         return np.array(values, dtype=object)
@@ -278,8 +366,9 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         # evaluate ground state after filtering (in case a filter is set)
         self._get_ground_state_energy()
 
-        logger.debug('NumPyEigensolver _run result:\n%s',
-                     pprint.pformat(self._ret, indent=4))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('NumPyEigensolver _run result:\n%s',
+                         pprint.pformat(self._ret, indent=4))
         result = EigensolverResult()
         if 'eigvals' in self._ret:
             result.eigenvalues = self._ret['eigvals']
@@ -288,8 +377,9 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         if 'aux_ops' in self._ret:
             result.aux_operator_eigenvalues = self._ret['aux_ops']
 
-        logger.debug('EigensolverResult dict:\n%s',
-                     pprint.pformat(result.data, indent=4))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('EigensolverResult dict:\n%s',
+                         pprint.pformat(result.data, indent=4))
         return result
 
 
@@ -36,7 +36,8 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
                  aux_operators: Optional[List[Optional[Union[OperatorBase,
                                                              LegacyBaseOperator]]]] = None,
                  filter_criterion: Callable[[Union[List, np.ndarray], float, Optional[List[float]]],
-                                            bool] = None
+                                            bool] = None,
+                 warm_start: bool = False
                  ) -> None:
         """
         Args:
@@ -48,9 +49,11 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
                 `filter(eigenstate, eigenvalue, aux_values)` and must return a boolean to indicate
                 whether to consider this value or not. If there is no
                 feasible element, the result can even be empty.
+            warm_start: If True, the sparse eigensolver is started from the eigenstate of the
+                previous run, if the dimensions match.
         """
         self._ces = NumPyEigensolver(operator=operator, k=1, aux_operators=aux_operators,
-                                     filter_criterion=filter_criterion)
+                                     filter_criterion=filter_criterion, warm_start=warm_start)
         # TODO remove
         self._ret = {}  # type: Dict[str, Any]
 
@@ -72,6 +75,16 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
                                                                   LegacyBaseOperator]]]]) -> None:
         self._ces.aux_operators = aux_operators
 
+    @property
+    def warm_start(self) -> bool:
+        """ returns whether the solver is started from the previous eigenstate """
+        return self._ces.warm_start
+
+    @warm_start.setter
+    def warm_start(self, warm_start: bool) -> None:
+        """ set whether the solver is started from the previous eigenstate """
+        self._ces.warm_start = warm_start
+
     def supports_aux_operators(self) -> bool:
         return self._ces.supports_aux_operators()
 
@@ -100,7 +113,8 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
             if len(result_ces.aux_operator_eigenvalues) > 0:
                 result.aux_operator_eigenvalues = result_ces.aux_operator_eigenvalues[0]
 
-        logger.debug('NumPyMinimumEigensolver dict:\n%s',
-                     pprint.pformat(result.data, indent=4))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('NumPyMinimumEigensolver dict:\n%s',
+                         pprint.pformat(result.data, indent=4))
 
         return result
@@ -524,6 +524,9 @@ class VQE(VQAlgorithm, MinimumEigensolver):
 
         return means if len(means) > 1 else means[0]
 
+    def _count_replayed_evals(self, num_evals: int) -> None:
+        self._eval_count += num_evals
+
     def get_optimal_cost(self) -> float:
         """Get the minimal cost or energy found by the VQE."""
         if 'opt_params' not in self._ret:
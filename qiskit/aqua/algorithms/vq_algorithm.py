@@ -32,7 +32,8 @@ from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
 from qiskit.aqua import QuantumInstance
 from qiskit.aqua.algorithms import AlgorithmResult, QuantumAlgorithm
-from qiskit.aqua.components.optimizers import Optimizer, SLSQP
+from qiskit.aqua.components.optimizers import (Optimizer, SLSQP, OptimizerCheckpoint,
+                                               ObjectiveCache)
 from qiskit.aqua.components.variational_forms import VariationalForm
 
 logger = logging.getLogger(__name__)
@@ -72,6 +73,8 @@ class VQAlgorithm(QuantumAlgorithm):
         self._optimizer = optimizer
         self._cost_fn = cost_fn
         self._initial_point = initial_point
+        self._checkpoint = None
+        self._objective_cache = None
         self._var_form = var_form
         self._var_form_params = None
         if var_form is not None:
@@ -120,6 +123,30 @@ class VQAlgorithm(QuantumAlgorithm):
         """ Sets initial point """
         self._initial_point = initial_point
 
+    @property
+    def checkpoint(self) -> Optional[OptimizerCheckpoint]:
+        """ Returns the checkpoint of the optimization """
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, checkpoint: Optional[OptimizerCheckpoint]):
+        """ Sets the checkpoint of the optimization, which records the optimization in a file
+        and resumes an interrupted one. The evaluations of the cost function which are answered
+        from the file are counted, but not reported to the callback. """
+        self._checkpoint = checkpoint
+
+    @property
+    def objective_cache(self) -> Optional[ObjectiveCache]:
+        """ Returns the cache of the cost function evaluations """
+        return self._objective_cache
+
+    @objective_cache.setter
+    def objective_cache(self, objective_cache: Optional[ObjectiveCache]):
+        """ Sets the cache of the cost function evaluations, which is emptied at the start of
+        every optimization. It requires a cost function which returns the same value for the
+        same parameters, e.g. not one evaluated on changing minibatches of data. """
+        self._objective_cache = objective_cache
+
     def find_minimum(self,
                      initial_point: Optional[np.ndarray] = None,
                      var_form: Optional[Union[QuantumCircuit, VariationalForm]] = None,
@@ -198,12 +225,21 @@ class VQAlgorithm(QuantumAlgorithm):
         if not optimizer.is_gradient_supported:  # ignore the passed gradient function
             gradient_fn = None
 
+        if self._objective_cache is not None:
+            cost_fn = self._objective_cache.wrap(cost_fn, nparms)
+
         logger.info('Starting optimizer.\nbounds=%s\ninitial point=%s', bounds, initial_point)
-        opt_params, opt_val, num_optimizer_evals = optimizer.optimize(nparms,
-                                                                      cost_fn,
-                                                                      variable_bounds=bounds,
-                                                                      initial_point=initial_point,
-                                                                      gradient_function=gradient_fn)
+        if self._checkpoint is not None:
+            opt_params, opt_val, num_optimizer_evals = \
+                self._checkpoint.optimize(optimizer, nparms, cost_fn,
+                                          gradient_function=gradient_fn,
+                                          variable_bounds=bounds,
+                                          initial_point=initial_point,
+                                          replay_callback=self._count_replayed_evals)
+        else:
+            opt_params, opt_val, num_optimizer_evals = \
+                optimizer.optimize(nparms, cost_fn, variable_bounds=bounds,
+                                   initial_point=initial_point, gradient_function=gradient_fn)
         eval_time = time.time() - start
 
         result = VQResult()
@@ -212,6 +248,9 @@ class VQAlgorithm(QuantumAlgorithm):
         result.optimal_value = opt_val
         result.optimal_point = opt_params
         result.optimal_parameters = dict(zip(self._var_form_params, opt_params))
+        if self._objective_cache is not None:
+            result.cache_hits = self._objective_cache.hits
+            result.surrogate_hits = self._objective_cache.surrogate_hits
 
         return result
 
@@ -265,6 +304,16 @@ class VQAlgorithm(QuantumAlgorithm):
         """ returns optimal parameters """
         raise NotImplementedError()
 
+    def _count_replayed_evals(self, num_evals: int) -> None:
+        """ Called with the number of cost function evaluations of an interrupted optimization
+        which are answered from the checkpoint instead of being repeated. Algorithms which count
+        their evaluations override it to add them to their count.
+
+        Args:
+            num_evals: the number of evaluations
+        """
+        pass
+
     def cleanup_parameterized_circuits(self):
         """ set parameterized circuits to None """
         self._parameterized_circuits = None
@@ -323,6 +372,28 @@ class VQResult(AlgorithmResult):
         """ Sets optimal parameters """
         self.data['optimal_parameters'] = value
 
+    @property
+    def cache_hits(self) -> Optional[int]:
+        """ Returns the number of cost function evaluations answered from the cache """
+        return self.get('cache_hits')
+
+    @cache_hits.setter
+    def cache_hits(self, value: int) -> None:
+        """ Sets the number of cost function evaluations answered from the cache """
+        self.data['cache_hits'] = value
+
+    @property
+    def surrogate_hits(self) -> Optional[int]:
+        """ Returns the number of cost function evaluations answered by the surrogate model
+        of the cache """
+        return self.get('surrogate_hits')
+
+    @surrogate_hits.setter
+    def surrogate_hits(self, value: int) -> None:
+        """ Sets the number of cost function evaluations answered by the surrogate model
+        of the cache """
+        self.data['surrogate_hits'] = value
+
     def __getitem__(self, key: object) -> object:
         if key == 'num_optimizer_evals':
             warnings.warn('num_optimizer_evals deprecated, use optimizer_evals property.',
@@ -17,10 +17,11 @@ The neural network is based on a neural network introduced in:
 https://towardsdatascience.com/lets-code-a-neural-network-in-plain-numpy-ae7e74410795
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Union
 import os
 import logging
 import numpy as np
+from scipy.special import expit
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.components.optimizers import ADAM
 from .discriminative_network import DiscriminativeNetwork
@@ -37,25 +38,33 @@ class DiscriminatorNet():
 
     The neural network is based on a neural network introduced in:
     https://towardsdatascience.com/lets-code-a-neural-network-in-plain-numpy-ae7e74410795
+
+    The weights of all layers are stored in one flat array, the layer weights are views into it.
+    The activations and gradients are stored in preallocated buffers which are reused by every
+    forward and backward propagation and only grow if a larger batch is propagated.
+    Samples are stored along the first axis, such that all batch dimensions are vectorized.
     """
 
-    def __init__(self, n_features=1, n_out=1):
+    _SLOPE = 0.2  # slope of the leaky ReLU for negative inputs
+
+    def __init__(self, n_features=1, n_out=1, dtype=np.float64):
         """
         Initialize the discriminator network.
 
         Args:
             n_features (int): Dimension of input data samples.
             n_out (int): output dimension
+            dtype (numpy.dtype): floating point type of the weights and activations,
+                e.g. float32 to halve the memory footprint.
         """
         self.architecture = [
             {"input_dim": n_features, "output_dim": 50, "activation": "leaky_relu"},
             {"input_dim": 50, "output_dim": 20, "activation": "leaky_relu"},
             {"input_dim": 20, "output_dim": n_out, "activation": "sigmoid"},
         ]
+        self._dtype = np.dtype(dtype)
 
-        self.parameters = []
-        self.memory = {}
-
+        parameters = []
         for _, layer in enumerate(self.architecture):
             activ_function_curr = layer["activation"]
             layer_input_size = layer["input_dim"]
@@ -67,143 +76,207 @@ class DiscriminatorNet():
                 params_layer = (params_layer * 2 - np.ones(np.shape(params_layer))) * 0.2
             else:
                 params_layer = params_layer * 2 - np.ones(np.shape(params_layer))
-            self.parameters = np.append(self.parameters, params_layer)
-            self.parameters.flatten()
+            parameters = np.append(parameters, params_layer)
 
-    def forward(self, x):
+        self._parameters = np.asarray(parameters, dtype=self._dtype)
+        self._gradient = np.zeros_like(self._parameters)
+        self._weights = self._layer_views(self._parameters)
+        self._weight_gradients = self._layer_views(self._gradient)
+
+        self._capacity = 0
+        self._num_samples = 0
+        self._activations = []  # type: List[np.ndarray]
+        self._pre_activations = []  # type: List[np.ndarray]
+        self._deltas = []  # type: List[np.ndarray]
+        self._mask = np.zeros(0, dtype=bool)
+        self.memory = {}  # type: Dict[str, np.ndarray]
+
+    @property
+    def dtype(self):
+        """ Returns the floating point type of the weights and activations """
+        return self._dtype
+
+    @property
+    def parameters(self):
+        """ Returns the flat weight buffer of the network """
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, parameters):
+        """ Copy the given weights into the weight buffer of the network """
+        self._parameters[:] = np.ravel(parameters)
+
+    def _layer_views(self, flat):
+        """ Split a flat weight array into reshaped per-layer views """
+        views = []
+        pointer = 0
+        for layer in self.architecture:
+            pointer_next = pointer + layer["output_dim"] * layer["input_dim"]
+            shape = (layer["output_dim"], layer["input_dim"])
+            views.append(flat[pointer:pointer_next].reshape(shape))
+            pointer = pointer_next
+        return views
+
+    def _reserve(self, num_samples):
+        """ Make sure the activation buffers can hold the given number of samples """
+        if num_samples > self._capacity:
+            capacity = max(num_samples, 2 * self._capacity)
+            dims = [self.architecture[0]["input_dim"]] + \
+                [layer["output_dim"] for layer in self.architecture]
+            self._activations = [np.empty((capacity, dim), dtype=self._dtype) for dim in dims]
+            self._pre_activations = [np.empty((capacity, dim), dtype=self._dtype)
+                                     for dim in dims[1:]]
+            self._deltas = [np.empty((capacity, dim), dtype=self._dtype) for dim in dims[1:]]
+            self._mask = np.empty((capacity, max(dims)), dtype=bool)
+            self._capacity = capacity
+
+    def _forward(self, *batches):
         """
-        Forward propagation.
+        Forward propagation of the concatenation of the given batches into the buffers.
 
         Args:
-            x (numpy.ndarray): , Discriminator input, i.e. data sample.
+            batches (numpy.ndarray): data samples
 
         Returns:
-            list: Discriminator output, i.e. data label.
+            numpy.ndarray: view of the output buffer, of shape (samples, n_out)
         """
+        n_features = self.architecture[0]["input_dim"]
+        num_samples = sum(len(batch) for batch in batches)
+        self._reserve(num_samples)
+        self._num_samples = num_samples
 
-        def sigmoid(z):
-            sig = 1 / (1 + np.exp(-z))
-            return sig
-
-        def leaky_relu(z, slope=0.2):
-            return np.maximum(
-                np.zeros(np.shape(z)), z) + slope * np.minimum(np.zeros(np.shape(z)), z)
-
-        def single_layer_forward_propagation(x_old, w_new, activation="leaky_relu"):
-            z_curr = np.dot(w_new, x_old)
-
-            if activation == "leaky_relu":
-                activation_func = leaky_relu
-            elif activation == "sigmoid":
-                activation_func = sigmoid
-            else:
-                raise Exception('Non-supported activation function')
-
-            return activation_func(z_curr), z_curr
+        index = 0
+        for batch in batches:
+            self._activations[0][index:index + len(batch)] = \
+                np.reshape(batch, (len(batch), n_features))
+            index += len(batch)
 
-        x_new = x
-        pointer = 0
         for idx, layer in enumerate(self.architecture):
-            layer_idx = idx + 1
-            activ_function_curr = layer["activation"]
-            layer_input_size = layer["input_dim"]
-            layer_output_size = layer["output_dim"]
-            if idx == 0:
-                x_old = np.reshape(x_new, (layer_input_size, len(x_new)))
+            a_prev = self._activations[idx][:num_samples]
+            z_curr = self._pre_activations[idx][:num_samples]
+            a_curr = self._activations[idx + 1][:num_samples]
+            np.dot(a_prev, self._weights[idx].T, out=z_curr)
+            if layer["activation"] == "leaky_relu":
+                # for a slope below one, leaky_relu(z) = max(z, slope * z)
+                np.multiply(z_curr, self._SLOPE, out=a_curr)
+                np.maximum(a_curr, z_curr, out=a_curr)
+            elif layer["activation"] == "sigmoid":
+                expit(z_curr, out=a_curr)
             else:
-                x_old = x_new
-            pointer_next = pointer + (layer_output_size * layer_input_size)
-            w_curr = self.parameters[pointer:pointer_next]
-            w_curr = np.reshape(w_curr, (layer_output_size, layer_input_size))
-            pointer = pointer_next
-            x_new, z_curr = single_layer_forward_propagation(x_old, w_curr, activ_function_curr)
+                raise Exception('Non-supported activation function')
 
-            self.memory["a" + str(idx)] = x_old
-            self.memory["z" + str(layer_idx)] = z_curr
+            self.memory["a" + str(idx)] = a_prev.T
+            self.memory["z" + str(idx + 1)] = z_curr.T
 
-        return x_new
+        return self._activations[-1][:num_samples]
 
-    def backward(self, x, y, weights=None):
+    def _backward(self, y, weights=None, x=None):
         """
-        Backward propagation.
+        Backward propagation of the last forward propagation into the gradient buffer.
 
         Args:
-           x (numpy.ndarray): sample label (equivalent to discriminator output)
-           y (numpy.ndarray): array, target label
+           y (numpy.ndarray): target label per sample
            weights (numpy.ndarray): customized scaling for each sample (optional)
+           x (numpy.ndarray): sample label, if None the output of the last forward propagation
 
         Returns:
-            tuple(numpy.ndarray, numpy.ndarray): parameter gradients
+            numpy.ndarray: view of the gradient buffer
         """
+        num_samples = self._num_samples
+        if x is None:
+            x = self._activations[-1][:num_samples]
+        else:
+            x = np.reshape(np.transpose(x), (num_samples, -1))
+        y = np.reshape(np.transpose(y), (num_samples, -1))
 
-        def sigmoid_backward(da, z):
-            sig = 1 / (1 + np.exp(-z))
-            return da * sig * (1 - sig)
-
-        def leaky_relu_backward(da, z, slope=0.2):
-            dz = np.array(da, copy=True)
-            for i, line in enumerate(z):
-                for j, element in enumerate(line):
-                    if element < 0:
-                        dz[i, j] = dz[i, j] * slope
-            return dz
-
-        def single_layer_backward_propagation(da_curr,
-                                              w_curr, z_curr, a_prev, activation="leaky_relu"):
-            # m = a_prev.shape[1]
-            if activation == "leaky_relu":
-                backward_activation_func = leaky_relu_backward
-            elif activation == "sigmoid":
-                backward_activation_func = sigmoid_backward
+        # derivative of the binary cross entropy w.r.t. the output
+        da = self._deltas[-1][:num_samples]
+        np.subtract(y / np.maximum(x, 1e-4), (1 - y) / np.maximum(1 - x, 1e-4), out=da)
+        if weights is not None:
+            da *= -np.reshape(weights, (num_samples, -1))
+        else:
+            da *= -1. / num_samples
+
+        for idx in reversed(range(len(self.architecture))):
+            layer = self.architecture[idx]
+            dz = self._deltas[idx][:num_samples]
+            z_curr = self._pre_activations[idx][:num_samples]
+            if layer["activation"] == "leaky_relu":
+                mask = self._mask[:num_samples, :z_curr.shape[1]]
+                np.less(z_curr, 0, out=mask)
+                np.multiply(dz, self._SLOPE, out=dz, where=mask)
+            elif layer["activation"] == "sigmoid":
+                sig = self._activations[idx + 1][:num_samples]
+                dz *= sig
+                dz *= 1 - sig
             else:
                 raise Exception('Non-supported activation function')
 
-            dz_curr = backward_activation_func(da_curr, z_curr)
-            dw_curr = np.dot(dz_curr, a_prev.T)
-            da_prev = np.dot(w_curr.T, dz_curr)
+            np.dot(dz.T, self._activations[idx][:num_samples], out=self._weight_gradients[idx])
+            if idx > 0:
+                np.dot(dz, self._weights[idx], out=self._deltas[idx - 1][:num_samples])
 
-            return da_prev, dw_curr
+        return self._gradient
 
-        grads_values = np.array([])
-        m = y.shape[1]
-        y = y.reshape(np.shape(x))
-        if weights is not None:
-            da_prev = - np.multiply(
-                weights,
-                np.divide(y, np.maximum(np.ones(np.shape(x)) * 1e-4, x))
-                - np.divide(1 - y, np.maximum(np.ones(np.shape(x)) * 1e-4, 1 - x)))
-        else:
-            da_prev = - (np.divide(y, np.maximum(np.ones(np.shape(x)) * 1e-4, x))
-                         - np.divide(1 - y, np.maximum(np.ones(np.shape(x)) * 1e-4, 1 - x))) / m
+    def forward(self, x):
+        """
+        Forward propagation.
 
-        pointer = 0
+        Args:
+            x (numpy.ndarray): , Discriminator input, i.e. data sample.
 
-        for layer_idx_prev, layer in reversed(list(enumerate(self.architecture))):
-            layer_idx_curr = layer_idx_prev + 1
-            activ_function_curr = layer["activation"]
+        Returns:
+            list: Discriminator output, i.e. data label.
+        """
+        return self._forward(np.asarray(x)).T.copy()
 
-            da_curr = da_prev
+    def backward(self, x, y, weights=None):
+        """
+        Backward propagation.
 
-            a_prev = self.memory["a" + str(layer_idx_prev)]
-            z_curr = self.memory["z" + str(layer_idx_curr)]
+        Args:
+           x (numpy.ndarray): sample label (equivalent to discriminator output)
+           y (numpy.ndarray): array, target label
+           weights (numpy.ndarray): customized scaling for each sample (optional)
 
-            layer_input_size = layer["input_dim"]
-            layer_output_size = layer["output_dim"]
-            pointer_prev = pointer - (layer_output_size * layer_input_size)
-            if pointer == 0:
-                w_curr = self.parameters[pointer_prev:]
-            else:
-                w_curr = self.parameters[pointer_prev:pointer]
-            w_curr = np.reshape(w_curr, (layer_output_size, layer_input_size))
-            pointer = pointer_prev
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray): parameter gradients
+        """
+        return self._backward(y, weights, x).copy()
 
-            da_prev, dw_curr = single_layer_backward_propagation(da_curr,
-                                                                 np.array(w_curr), z_curr, a_prev,
-                                                                 activ_function_curr)
+    def loss_and_gradient(self, batches, labels, weights, compute_gradient=True):
+        """
+        Fused weighted binary cross entropy and gradient evaluation.
 
-            grads_values = np.append([dw_curr], grads_values)
+        All batches are propagated together in one forward and one backward pass.
 
-        return grads_values
+        Args:
+            batches (list[numpy.ndarray]): data samples per batch
+            labels (list[float]): target label per batch
+            weights (list[numpy.ndarray]): weight per sample, per batch
+            compute_gradient (bool): if False, skip the backward propagation
+
+        Returns:
+            tuple(list[float], numpy.ndarray): the loss per batch and a view of the gradient
+                buffer holding the gradient of the summed losses (None if not computed)
+        """
+        x = self._forward(*batches)
+        y = np.concatenate([np.full(len(batch), label, dtype=self._dtype)
+                            for batch, label in zip(batches, labels)])
+        w = np.concatenate([np.ravel(weight) for weight in weights]).astype(self._dtype)
+        losses = []
+        index = 0
+        for batch, label in zip(batches, labels):
+            x_batch = x[index:index + len(batch), 0]
+            w_batch = w[index:index + len(batch)]
+            if label == 1:
+                losses.append(-np.dot(np.log(np.maximum(x_batch, 1e-4)), w_batch))
+            else:
+                losses.append(-np.dot(np.log(np.maximum(1 - x_batch, 1e-4)), w_batch))
+            index += len(batch)
+        if not compute_gradient:
+            return losses, None
+        return losses, self._backward(y, w)
 
 
 class NumPyDiscriminator(DiscriminativeNetwork):
@@ -211,16 +284,19 @@ class NumPyDiscriminator(DiscriminativeNetwork):
     Discriminator based on NumPy
     """
 
-    def __init__(self, n_features: int = 1, n_out: int = 1) -> None:
+    def __init__(self, n_features: int = 1, n_out: int = 1,
+                 dtype: Union[type, np.dtype] = np.float64) -> None:
         """
         Args:
             n_features: Dimension of input data vector.
             n_out: Dimension of the discriminator's output vector.
+            dtype: Floating point type of the network's weights and activations,
+                e.g. ``numpy.float32`` to halve the memory footprint.
         """
         super().__init__()
         self._n_features = n_features
         self._n_out = n_out
-        self._discriminator = DiscriminatorNet(self._n_features, self._n_out)
+        self._discriminator = DiscriminatorNet(self._n_features, self._n_out, dtype)
         self._optimizer = ADAM(maxiter=1, tol=1e-6, lr=1e-3, beta_1=0.7, beta_2=0.99,
                                noise_factor=1e-4,
                                eps=1e-6, amsgrad=True)
@@ -321,62 +397,6 @@ class NumPyDiscriminator(DiscriminativeNetwork):
                                                 np.log(np.maximum(np.ones(np.shape(x)) * 1e-4,
                                                                   np.ones(np.shape(x)) - x))))
 
-    def _get_objective_function(self, data, weights):
-        """
-        Get the objective function
-
-        Args:
-            data (tuple): training and generated data
-            weights (numpy.ndarray): weights corresponding to training resp. generated data
-
-        Returns:
-            objective_function: objective function for the optimization
-        """
-        real_batch = data[0]
-        real_prob = weights[0]
-        generated_batch = data[1]
-        generated_prob = weights[1]
-
-        def objective_function(params):
-            self._discriminator.parameters = params
-            # Train on Real Data
-            prediction_real = self.get_label(real_batch)
-            loss_real = self.loss(prediction_real, np.ones(np.shape(prediction_real)), real_prob)
-            prediction_fake = self.get_label(generated_batch)
-            loss_fake = self.loss(prediction_fake,
-                                  np.zeros(np.shape(prediction_fake)), generated_prob)
-            return 0.5 * (loss_real[0] + loss_fake[0])
-
-        return objective_function
-
-    def _get_gradient_function(self, data, weights):
-        """
-        Get the gradient function
-
-        Args:
-            data (tuple): training and generated data
-            weights (numpy.ndarray): weights corresponding to training resp. generated data
-
-        Returns:
-            gradient_function: Gradient function for the optimization
-        """
-        real_batch = data[0]
-        real_prob = weights[0]
-        generated_batch = data[1]
-        generated_prob = weights[1]
-
-        def gradient_function(params):
-            self._discriminator.parameters = params
-            prediction_real = self.get_label(real_batch)
-            grad_real = self._discriminator.backward(prediction_real,
-                                                     np.ones(np.shape(prediction_real)), real_prob)
-            prediction_generated = self.get_label(generated_batch)
-            grad_generated = self._discriminator.backward(prediction_generated, np.zeros(
-                np.shape(prediction_generated)), generated_prob)
-            return np.add(grad_real, grad_generated)
-
-        return gradient_function
-
     def train(self, data, weights, penalty=False,
               quantum_instance=None, shots=None) -> Dict[str, Any]:
         """
@@ -396,19 +416,21 @@ class NumPyDiscriminator(DiscriminativeNetwork):
             dict: with Discriminator loss and updated parameters.
         """
 
-        # Train on Generated Data
-        # Force single optimization iteration
-        self._optimizer._maxiter = 1
-        self._optimizer._t = 0
-        objective = self._get_objective_function(data, weights)
-        gradient = self._get_gradient_function(data, weights)
-        self._discriminator.parameters, loss, _ = \
-            self._optimizer.optimize(num_vars=len(self._discriminator.parameters),
-                                     objective_function=objective,
-                                     initial_point=np.array(self._discriminator.parameters),
-                                     gradient_function=gradient)
+        real_batch, generated_batch = data
+        real_prob, generated_prob = weights
+        batches = [np.asarray(real_batch), np.asarray(generated_batch)]
+
+        # one optimization step on the weighted losses of the real and the generated data
+        _, gradient = self._discriminator.loss_and_gradient(batches, [1, 0],
+                                                            [real_prob, generated_prob])
+        # a single iteration of the optimizer, which starts from zero moment estimates
+        self._optimizer.reset()
+        self._optimizer.step(self._discriminator.parameters, gradient)
+        (loss_real, loss_fake), _ = self._discriminator.loss_and_gradient(
+            batches, [1, 0], [real_prob, generated_prob], compute_gradient=False)
+        loss = 0.5 * (loss_real + loss_fake)
 
         self._ret['loss'] = loss
-        self._ret['params'] = self._discriminator.parameters
+        self._ret['params'] = self._discriminator.parameters.copy()
 
         return self._ret
@@ -12,11 +12,12 @@
 
 """Quantum Generator."""
 
-from typing import Optional, List, Union, Dict, Any
-from copy import deepcopy
+from typing import Optional, List, Union, Dict, Any, Tuple
+from copy import copy, deepcopy
 import numpy as np
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import ParameterVector
 from qiskit.circuit.library import TwoLocal
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.components.optimizers import ADAM
@@ -164,6 +165,9 @@ class QuantumGenerator(GenerativeNetwork):
                         temp.append(temp0)
                 self._grid_elements = deepcopy(temp)
         self._data_grid = np.array(self._data_grid)
+        self._grid_samples = None  # type: Optional[List[List[float]]]
+        # transpiled, parameterized generator circuit and the instance it was built for
+        self._template = None  # type: Optional[Tuple[Any, Any, QuantumCircuit, ParameterVector]]
 
         self._shots = None
         self._discriminator = None
@@ -211,6 +215,121 @@ class QuantumGenerator(GenerativeNetwork):
         # return qc.copy(name='qc')
         return qc.to_instruction()
 
+    def _get_template(self, quantum_instance):
+        """
+        Get the transpiled, parameterized generator circuit for the given quantum instance.
+
+        The template is built and transpiled once and reused as long as neither the quantum
+        instance nor the generator circuit are replaced.
+
+        Args:
+            quantum_instance (QuantumInstance): Quantum Instance used to run the generator.
+
+        Returns:
+            tuple(QuantumCircuit, ParameterVector): the transpiled template and its parameters
+        """
+        if self._template is not None:
+            instance, generator_circuit, template, parameters = self._template
+            if instance is quantum_instance and generator_circuit is self.generator_circuit:
+                return template, parameters
+
+        parameters = ParameterVector('θ', len(self.generator_circuit.params))
+        generator_circuit_copy = copy(self.generator_circuit)
+        generator_circuit_copy.params = list(parameters)
+        q = QuantumRegister(sum(self._num_qubits), name='q')
+        qc = QuantumCircuit(q)
+        generator_circuit_copy.build(qc=qc, q=q)
+        if not quantum_instance.is_statevector:
+            c = ClassicalRegister(sum(self._num_qubits), name='c')
+            qc.add_register(c)
+            qc.measure(q, c)
+
+        template = quantum_instance.transpile(qc)[0]
+        self._template = (quantum_instance, self.generator_circuit, template, parameters)
+        return template, parameters
+
+    def _get_grid_samples(self):
+        """
+        Get the data sample represented by each computational basis state.
+
+        Returns:
+            list: the data sample of basis state j at index j
+        """
+        if self._grid_samples is None:
+            num_qubits = int(sum(self._num_qubits))
+            grid_samples = []
+            for j in range(2 ** num_qubits):
+                key = np.binary_repr(j, num_qubits)
+                index = 0
+                temp = []
+                for k, p in enumerate(self._num_qubits):
+                    bin_rep = int(key[index:index + int(p)], 2)
+                    index += int(p)
+                    if len(self._num_qubits) > 1:
+                        temp.append(self._data_grid[k][bin_rep])
+                    else:
+                        temp.append(self._data_grid[bin_rep])
+                grid_samples.append(temp)
+            self._grid_samples = grid_samples
+        return self._grid_samples
+
+    def get_outputs(self, quantum_instance, params_list, shots=None):
+        """
+        Get classical data samples from the generator for several sets of parameters.
+
+        All generator circuits are bound from the same transpiled template and run in a single
+        execution on the quantum instance.
+
+        Args:
+            quantum_instance (QuantumInstance): Quantum Instance, used to run the generator
+                circuit.
+            params_list (list[numpy.ndarray]): parameters which should be used to run the
+                generator, an entry None uses self._params
+            shots (int): if not None use a number of shots that is different from the
+                number set in quantum_instance
+
+        Returns:
+            list: a tuple (generated samples, sample occurrence in percentage) per set of
+                parameters, see :meth:`get_output`
+        """
+        template, parameters = self._get_template(quantum_instance)
+        circuits = []
+        for i, params in enumerate(params_list):
+            if params is None:
+                params = self.generator_circuit.params
+            circuit = template.assign_parameters(dict(zip(parameters, np.real(params))))
+            circuit.name = 'generator_{}'.format(i)
+            circuits.append(circuit)
+
+        instance_shots = quantum_instance.run_config.shots
+        if shots is not None:
+            quantum_instance.set_config(shots=shots)
+        try:
+            result = quantum_instance.execute(circuits, had_transpiled=True)
+        finally:
+            if shots is not None:
+                # Restore the initial quantum_instance configuration
+                quantum_instance.set_config(shots=instance_shots)
+
+        grid_samples = self._get_grid_samples()
+        outputs = []
+        for i, _ in enumerate(circuits):
+            if quantum_instance.is_statevector:
+                statevector = result.get_statevector(i)
+                values = list(np.multiply(statevector, np.conj(statevector)).real)
+                indices = range(len(values))
+            else:
+                counts = result.get_counts(i)
+                indices = [int(key, 2) for key in counts]
+                values = list(counts.values())
+                total = np.sum(values)
+                values = [float(v) / total for v in values]
+            generated_samples = [list(grid_samples[j]) for j in indices]
+            outputs.append((generated_samples, values))
+
+        self.generator_circuit._probabilities = outputs[-1][1]
+        return outputs
+
     def get_output(self, quantum_instance, qc_state_in=None, params=None, shots=None):
         """
         Get classical data samples from the generator.
@@ -231,57 +350,7 @@ class QuantumGenerator(GenerativeNetwork):
         Returns:
             list: generated samples, array: sample occurrence in percentage
         """
-        instance_shots = quantum_instance.run_config.shots
-        q = QuantumRegister(sum(self._num_qubits), name='q')
-        qc = QuantumCircuit(q)
-        qc.append(self.construct_circuit(params), q)
-        if quantum_instance.is_statevector:
-            pass
-        else:
-            c = ClassicalRegister(sum(self._num_qubits), name='c')
-            qc.add_register(c)
-            qc.measure(q, c)
-
-        if shots is not None:
-            quantum_instance.set_config(shots=shots)
-
-        result = quantum_instance.execute(qc)
-
-        generated_samples = []
-        if quantum_instance.is_statevector:
-            result = result.get_statevector(qc)
-            values = np.multiply(result, np.conj(result))
-            values = list(values.real)
-            keys = []
-            for j in range(len(values)):
-                keys.append(np.binary_repr(j, int(sum(self._num_qubits))))
-        else:
-            result = result.get_counts(qc)
-            keys = list(result)
-            values = list(result.values())
-            values = [float(v) / np.sum(values) for v in values]
-        generated_samples_weights = values
-        for i, _ in enumerate(keys):
-            index = 0
-            temp = []
-            for k, p in enumerate(self._num_qubits):
-                bin_rep = 0
-                j = 0
-                while j < p:
-                    bin_rep += int(keys[i][index]) * 2 ** (int(p) - j - 1)
-                    j += 1
-                    index += 1
-                if len(self._num_qubits) > 1:
-                    temp.append(self._data_grid[k][int(bin_rep)])
-                else:
-                    temp.append(self._data_grid[int(bin_rep)])
-            generated_samples.append(temp)
-
-        self.generator_circuit._probabilities = generated_samples_weights
-        if shots is not None:
-            # Restore the initial quantum_instance configuration
-            quantum_instance.set_config(shots=instance_shots)
-        return generated_samples, generated_samples_weights
+        return self.get_outputs(quantum_instance, [params], shots=shots)[0]
 
     def loss(self, x, weights):  # pylint: disable=arguments-differ
         """
@@ -330,6 +399,39 @@ class QuantumGenerator(GenerativeNetwork):
 
         return objective_function
 
+    def _get_gradient_function(self, quantum_instance, discriminator):
+        """
+        Get the forward finite difference gradient of the objective function, evaluating the
+        generator for the central point and all shifted points in a single execution.
+
+        Args:
+            quantum_instance (QuantumInstance): used to run the quantum circuit.
+            discriminator (torch.nn.Module): discriminator network to compute the sample labels.
+
+        Returns:
+            gradient_function: gradient of the objective function
+        """
+
+        def gradient_function(params):
+            """
+            Gradient function
+
+            Args:
+                params (numpy.ndarray): generator parameters
+
+            Returns:
+                numpy.ndarray: the gradient w.r.t. the generator parameters
+            """
+            epsilon = self._optimizer.eps
+            points = [params] + [params + epsilon * unit for unit in np.eye(len(params))]
+            outputs = self.get_outputs(quantum_instance, points, shots=self._shots)
+            losses = [self.loss(discriminator.get_label(generated_data, detach=True),
+                                generated_prob)
+                      for generated_data, generated_prob in outputs]
+            return np.array([(loss - losses[0]) / epsilon for loss in losses[1:]])
+
+        return gradient_function
+
     def train(self, quantum_instance=None, shots=None):
         """
         Perform one training step w.r.t to the generator's parameters
@@ -345,11 +447,12 @@ class QuantumGenerator(GenerativeNetwork):
         self._shots = shots
         # Force single optimization iteration
         self._optimizer._maxiter = 1
-        self._optimizer._t = 0
         objective = self._get_objective_function(quantum_instance, self._discriminator)
+        gradient = self._get_gradient_function(quantum_instance, self._discriminator)
         self.generator_circuit.params, loss, _ = self._optimizer.optimize(
             num_vars=len(self.generator_circuit.params),
             objective_function=objective,
+            gradient_function=gradient,
             initial_point=self.generator_circuit.params
             )
 
@@ -37,6 +37,26 @@ Optimizer Base Class
    OptimizerSupportLevel
    Optimizer
 
+Multi-Start Execution
+=====================
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   MultiStartExecutor
+   MultiStartRun
+
+Checkpoints and Caching
+=======================
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   OptimizerCheckpoint
+   ObjectiveCache
+
 Local Optimizers
 ================
 
@@ -98,6 +118,9 @@ The global optimizers are as follows:
 """
 
 from .optimizer import OptimizerSupportLevel, Optimizer
+from .multistart_executor import MultiStartExecutor, MultiStartRun
+from .optimizer_checkpoint import OptimizerCheckpoint
+from .objective_cache import ObjectiveCache
 from .adam_amsgrad import ADAM
 from .cg import CG
 from .cobyla import COBYLA
@@ -122,6 +145,10 @@ from .imfil import IMFIL
 
 __all__ = ['Optimizer',
            'OptimizerSupportLevel',
+           'MultiStartExecutor',
+           'MultiStartRun',
+           'OptimizerCheckpoint',
+           'ObjectiveCache',
            'ADAM',
            'AQGD',
            'CG',
@@ -107,6 +107,11 @@ class ADAM(Optimizer):
                 writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
                 writer.writeheader()
 
+    @property
+    def eps(self) -> float:
+        """ Returns the epsilon used for finite differences if no analytic gradient is given """
+        return self._eps
+
     def get_support_level(self):
         """ Return support level dictionary """
         return {
@@ -167,6 +172,42 @@ class ADAM(Optimizer):
         t = t[1:-1]
         self._t = np.fromstring(t, dtype=int, sep=' ')
 
+    def reset(self) -> None:
+        """Resets the time step and the moment estimates, as at the start of :meth:`minimize`."""
+        self._t = 0
+        self._m = np.zeros(1)
+        self._v = np.zeros(1)
+        if self._amsgrad:
+            self._v_eff = np.zeros(1)
+
+    def step(self, params: np.ndarray, gradient: np.ndarray) -> np.ndarray:
+        """Performs a single iteration of :meth:`minimize`, continuing from the current time
+        step and moment estimates, e.g. to train a model one batch at a time.
+
+        Args:
+            params: The current parameters, which are updated in place.
+            gradient: The gradient of the objective function at the parameters.
+
+        Returns:
+            The updated parameters.
+        """
+        params -= self._update(gradient)
+        if self._snapshot_dir:
+            self.save_params(self._snapshot_dir)
+        return params
+
+    def _update(self, derivative: np.ndarray) -> np.ndarray:
+        """Advances the time step and the moment estimates with a derivative, and returns the
+        update to subtract from the parameters."""
+        self._t += 1
+        self._m = self._beta_1 * self._m + (1 - self._beta_1) * derivative
+        self._v = self._beta_2 * self._v + (1 - self._beta_2) * derivative * derivative
+        lr_eff = self._lr * np.sqrt(1 - self._beta_2 ** self._t) / (1 - self._beta_1 ** self._t)
+        if not self._amsgrad:
+            return lr_eff * self._m.flatten() / (np.sqrt(self._v.flatten()) + self._noise_factor)
+        self._v_eff = np.maximum(self._v_eff, self._v)
+        return lr_eff * self._m.flatten() / (np.sqrt(self._v_eff.flatten()) + self._noise_factor)
+
     def minimize(self, objective_function: Callable[[np.ndarray], float], initial_point: np.ndarray,
                  gradient_function: Callable[[np.ndarray], float]) -> Tuple[np.ndarray, float, int]:
         """Run the minimization.
@@ -189,17 +230,7 @@ class ADAM(Optimizer):
         params = params_new = initial_point
         while self._t < self._maxiter:
             derivative = gradient_function(params)
-            self._t += 1
-            self._m = self._beta_1 * self._m + (1 - self._beta_1) * derivative
-            self._v = self._beta_2 * self._v + (1 - self._beta_2) * derivative * derivative
-            lr_eff = self._lr * np.sqrt(1 - self._beta_2 ** self._t) / (1 - self._beta_1 ** self._t)
-            if not self._amsgrad:
-                params_new = (params - lr_eff * self._m.flatten()
-                              / (np.sqrt(self._v.flatten()) + self._noise_factor))
-            else:
-                self._v_eff = np.maximum(self._v_eff, self._v)
-                params_new = (params - lr_eff * self._m.flatten()
-                              / (np.sqrt(self._v_eff.flatten()) + self._noise_factor))
+            params_new = params - self._update(derivative)
 
             if self._snapshot_dir:
                 self.save_params(self._snapshot_dir)
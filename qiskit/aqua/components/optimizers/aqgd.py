@@ -14,12 +14,12 @@
 
 import logging
 import warnings
-from typing import Callable, Tuple, List, Dict, Union
+from typing import Callable, Tuple, List, Dict, Union, Optional
 
 import numpy as np
-from qiskit.aqua import AquaError
+from qiskit.aqua import AquaError, aqua_globals
 from qiskit.aqua.components.optimizers import Optimizer, OptimizerSupportLevel
-from qiskit.aqua.utils.validation import validate_range_exclusive_max
+from qiskit.aqua.utils.validation import validate_range_exclusive_max, validate_min
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +41,17 @@ class AQGD(Optimizer):
     for further details on analytic gradients of parametrized quantum gates.
 
     Gradients are computed "analytically" using the quantum circuit when evaluating
-    the objective function.
-
+    the objective function. By default, every parameter is assumed to be the angle of a Pauli
+    rotation, whose generator has the eigenvalues :math:`\\pm 1/2`, and its derivative is
+    computed from the shifts :math:`\\pm \\pi/2`. For a gate :math:`e^{-i\\theta G}` whose
+    generator :math:`G` has the eigenvalues :math:`\\pm r`, the derivative is
+    :math:`r (f(\\theta + s) - f(\\theta - s))` with the shift :math:`s = \\pi / (4r)`,
+    so the eigenvalue :math:`r` of every parameter can be set by ``generator_eigenvalues``.
+
+    To reduce the number of circuits per iteration from :math:`2P + 1` to :math:`2k + 1` for
+    :math:`P` parameters, ``num_coordinates`` sets a number :math:`k` of parameters whose
+    derivatives are computed in each iteration, chosen at random. The derivatives of the other
+    parameters are taken as zero in that iteration, so they only move by their momentum.
     """
     _OPTIONS = ['maxiter', 'eta', 'tol', 'disp', 'momentum', 'param_tol', 'averaging']
 
@@ -53,7 +62,9 @@ class AQGD(Optimizer):
                  disp: bool = False,
                  momentum: Union[float, List[float]] = 0.25,
                  param_tol: float = 1e-6,
-                 averaging: int = 10) -> None:
+                 averaging: int = 10,
+                 generator_eigenvalues: Union[float, List[float]] = 0.5,
+                 num_coordinates: Optional[int] = None) -> None:
         """
         Performs Analytical Quantum Gradient Descent (AQGD) with Epochs.
 
@@ -70,6 +81,12 @@ class AQGD(Optimizer):
             param_tol: Tolerance for change in norm of parameters.
             averaging: Length of window over which to average objective values for objective
                 convergence criterion
+            generator_eigenvalues: The positive eigenvalue of the generator of the gate of
+                each parameter, or of all parameters if a single value is given, which
+                determines the shift of the parameter to compute its derivative.
+                Must be positive.
+            num_coordinates: The number of parameters chosen at random whose derivatives are
+                computed in each iteration, all parameters if None. Has a min. value of 1.
 
         Raises:
             AquaError: If the length of ``maxiter``, `momentum``, and ``eta`` is not the same.
@@ -86,6 +103,10 @@ class AQGD(Optimizer):
                             "and `momentum` must have the same length.")
         for m in momentum:
             validate_range_exclusive_max('momentum', m, 0, 1)
+        if np.any(np.asarray(generator_eigenvalues) <= 0):
+            raise AquaError("AQGD generator eigenvalues must be positive.")
+        if num_coordinates is not None:
+            validate_min('num_coordinates', num_coordinates, 1)
 
         self._eta = eta
         self._maxiter = maxiter
@@ -93,6 +114,8 @@ class AQGD(Optimizer):
         self._param_tol = param_tol
         self._tol = tol
         self._averaging = averaging
+        self._generator_eigenvalues = generator_eigenvalues
+        self._num_coordinates = num_coordinates
         if disp:
             warnings.warn('The disp parameter is deprecated as of '
                           '0.8.0 and will be removed no sooner than 3 months after the release. '
@@ -120,45 +143,88 @@ class AQGD(Optimizer):
             'initial_point': OptimizerSupportLevel.required
         }
 
+    def _shift_rules(self, num_params: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the shift of each parameter and the coefficient of the difference of the
+        objective values at the shifted points in its derivative.
+
+        Args:
+            num_params: The number of parameters
+
+        Returns:
+            Tuple containing the arrays of shifts and coefficients.
+
+        Raises:
+            AquaError: If the number of generator eigenvalues is not the number of parameters.
+        """
+        eigenvalues = np.asarray(self._generator_eigenvalues, dtype=float)
+        if eigenvalues.ndim == 0:
+            eigenvalues = np.full(num_params, eigenvalues)
+        elif len(eigenvalues) != num_params:
+            raise AquaError("AQGD got {} generator eigenvalues for {} parameters.".format(
+                len(eigenvalues), num_params))
+        shifts = np.pi / (4 * eigenvalues)
+        coefficients = eigenvalues / np.sin(2 * eigenvalues * shifts)
+        return shifts, coefficients
+
     def _compute_objective_fn_and_gradient(self, params: List[float],
-                                           obj: Callable) -> Tuple[float, np.array]:
+                                           obj: Callable,
+                                           shifts: Optional[np.ndarray] = None,
+                                           coefficients: Optional[np.ndarray] = None,
+                                           indices: Optional[np.ndarray] = None
+                                           ) -> Tuple[float, np.array]:
         """
         Obtains the objective function value for params and the analytical quantum derivatives of
         the objective function with respect to each parameter. Requires
-        2*(number parameters) + 1 objective evaluations
+        2*(number of derivatives) + 1 objective evaluations
 
         Args:
             params: Current value of the parameters to evaluate the objective function
             obj: Objective function of interest
+            shifts: The shift of each parameter, pi/2 if None
+            coefficients: The coefficient of the difference of the shifted objective values in
+                the derivative of each parameter, 1/2 if None
+            indices: The indices of the parameters whose derivatives are computed, the
+                derivatives of the others are zero. All parameters if None
 
         Returns:
             Tuple containing the objective value and array of gradients for the given parameter set.
         """
         num_params = len(params)
-        param_sets_to_eval = params + np.concatenate(
-            (np.zeros((1, num_params)),  # copy of the parameters as is
-             np.eye(num_params) * np.pi / 2,  # copy of the parameters with the positive shift
-             -np.eye(num_params) * np.pi / 2),  # copy of the parameters with the negative shift
-            axis=0)
+        if shifts is None:
+            shifts, coefficients = np.full(num_params, np.pi / 2), np.full(num_params, 0.5)
+        if indices is None:
+            indices = np.arange(num_params)
+        num_derivs = len(indices)
+
+        # the parameters as is, with the positive and with the negative shifts,
+        # new arrays in each call since the objective function may keep references to them
+        param_sets = np.tile(np.asarray(params, dtype=float), (2 * num_derivs + 1, 1))
+        rows = np.arange(num_derivs)
+        param_sets[1 + rows, indices] += shifts[indices]
+        param_sets[1 + num_derivs + rows, indices] -= shifts[indices]
         # Evaluate,
         # reshaping to flatten, as expected by objective function
-        values = np.array(obj(param_sets_to_eval.reshape(-1)))
+        values = np.array(obj(param_sets.reshape(-1)))
 
         # Update number of objective function evaluations
-        self._eval_count += 2 * num_params + 1
+        self._eval_count += 2 * num_derivs + 1
 
         # return the objective function value
         obj_value = values[0]
 
         # return the gradient values
-        gradient = 0.5 * (values[1:num_params + 1] - values[1 + num_params:])
+        gradient = np.zeros(num_params)
+        gradient[indices] = coefficients[indices] * (values[1:num_derivs + 1] -
+                                                     values[1 + num_derivs:])
         return obj_value, gradient
 
     def _update(self, params: np.array, gradient: np.array, mprev: np.array,
                 step_size: float, momentum_coeff: float) -> Tuple[List[float], List[float]]:
         """
         Updates full parameter array based on a step that is a convex
-        combination of the gradient and previous momentum
+        combination of the gradient and previous momentum. Both the parameters and the
+        momentum are updated in place.
 
         Args:
             params: Current value of the parameters to evaluate the objective function at
@@ -173,9 +239,10 @@ class AQGD(Optimizer):
         """
         # Momentum update:
         # Convex combination of previous momentum and current gradient estimate
-        mnew = (1 - momentum_coeff) * gradient + momentum_coeff * mprev
-        params -= step_size * mnew
-        return params, mnew
+        mprev *= momentum_coeff
+        mprev += (1 - momentum_coeff) * gradient
+        params -= step_size * mprev
+        return params, mprev
 
     def _converged_objective(self, objval: float, tol: float, window_size: int) -> bool:
         """
@@ -283,8 +350,12 @@ class AQGD(Optimizer):
         super().optimize(num_vars, objective_function, gradient_function, variable_bounds,
                          initial_point)
 
-        params = np.array(initial_point)
+        params = np.array(initial_point, dtype=float)
         momentum = np.zeros(shape=(num_vars,))
+        shifts, coefficients = self._shift_rules(num_vars)
+        num_derivs = num_vars if self._num_coordinates is None \
+            else min(self._num_coordinates, num_vars)
+        indices = np.arange(num_vars)
         # empty out history of previous objectives/gradients/parameters
         # (in case this object is re-used)
         self._prev_loss = []
@@ -314,8 +385,12 @@ class AQGD(Optimizer):
                     break
 
                 # Calculate objective function and estimate of analytical gradient
+                if num_derivs < num_vars:
+                    indices = np.sort(aqua_globals.random.choice(num_vars, num_derivs,
+                                                                 replace=False))
                 objval, gradient = \
-                    self._compute_objective_fn_and_gradient(params, objective_function)
+                    self._compute_objective_fn_and_gradient(params, objective_function, shifts,
+                                                            coefficients, indices)
 
                 logger.info(" Iter: %4d | Obj: %11.6f | Grad Norm: %f",
                             iter_count, objval, np.linalg.norm(gradient, ord=np.inf))
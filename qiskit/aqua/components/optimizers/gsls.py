@@ -29,6 +29,11 @@ class GSLS(Optimizer):
     An implementation of the line search algorithm described in
     https://arxiv.org/pdf/1905.01332.pdf, using gradient approximation
     based on Gaussian-smoothed samples on a sphere.
+
+    The sample set of an iteration is evaluated in as few calls of the objective function as
+    allowed by :meth:`~qiskit.aqua.components.optimizers.Optimizer.set_max_evals_grouped`,
+    together with the initial point in the first iteration. The grouping does not change
+    the steps of the optimizer.
     """
 
     _OPTIONS = ['maxiter', 'max_eval', 'disp', 'sampling_radius',
@@ -156,9 +161,9 @@ class GSLS(Optimizer):
         grad_norm = np.inf
         sample_set_size = int(round(self._options['sample_size_factor'] * n))
 
-        # Initial point
+        # Initial point, which is evaluated together with the first sample set
         x = initial_point
-        x_value = obj_fun(x)
+        x_value = None
         n_evals += 1
         while iter_count < self._options['maxiter'] \
                 and n_evals < self._options['max_eval']:
@@ -171,7 +176,13 @@ class GSLS(Optimizer):
                 # another full iteration; we therefore exit now
                 break
 
-            sample_set_y = np.array([obj_fun(point) for point in sample_set_x])
+            if x_value is None:
+                values = self.evaluate_grouped(np.vstack((x, sample_set_x)), obj_fun,
+                                               self._max_evals_grouped)
+                x_value, sample_set_y = values[0], values[1:]
+            else:
+                sample_set_y = self.evaluate_grouped(sample_set_x, obj_fun,
+                                                     self._max_evals_grouped)
             n_evals += len(sample_set_x)
 
             # Expand sample set if we could not improve
@@ -226,6 +237,9 @@ class GSLS(Optimizer):
                     or alpha <= self._options['min_step_size']:
                 break
 
+        if x_value is None:
+            x_value = obj_fun(x)
+
         return x, x_value, n_evals, grad_norm
 
     def sample_points(self, n: int, x: np.ndarray, num_points: int
@@ -269,49 +283,50 @@ class GSLS(Optimizer):
         Raises:
             RuntimeError: If not enough samples could be generated within the bounds.
         """
+        def within_bounds(points):
+            return (points >= var_lb).all(axis=1) & (points <= var_ub).all(axis=1)
+
         # Generate points uniformly on the sphere
         points, directions = self.sample_points(n, x, num_points)
-
-        # Check bounds
-        if (points >= var_lb).all() and (points <= var_ub).all():
-            # If all points are within bounds, return them
-            return directions, (x + self._options['sampling_radius'] * directions)
-        else:
-            # Otherwise we perform rejection sampling until we have
-            # enough points that satisfy the bounds
-            indices = np.where((points >= var_lb).all(axis=1) & (points <= var_ub).all(axis=1))[0]
-            accepted = directions[indices]
-            num_trials = 0
-
-            while len(accepted) < num_points \
-                    and num_trials < self._options['max_failed_rejection_sampling']:
-                # Generate points uniformly on the sphere
-                points, directions = self.sample_points(n, x, num_points)
-                indices = np.where((points >= var_lb).all(axis=1) &
-                                   (points <= var_ub).all(axis=1))[0]
-                accepted = np.vstack((accepted, directions[indices]))
-                num_trials += 1
-
-            # When we are at a corner point, the expected fraction of acceptable points may be
-            # exponential small in the dimension of the problem. Thus, if we keep failing and
-            # do not have enough points by now, we switch to a different method that guarantees
-            # finding enough points, but they may not be uniformly distributed.
-            if len(accepted) < num_points:
-                points, directions = self.sample_points(n, x, num_points)
-                to_be_flipped = (points < var_lb) | (points > var_ub)
-                directions *= np.where(to_be_flipped, -1, 1)
-                points = x + self._options['sampling_radius'] * directions
-                indices = np.where((points >= var_lb).all(axis=1) &
-                                   (points <= var_ub).all(axis=1))[0]
-                accepted = np.vstack((accepted, directions[indices]))
-
-            # If we still do not have enough sampling points, we have failed.
-            if len(accepted) < num_points:
-                raise RuntimeError('Could not generate enough samples '
-                                   'within bounds; try smaller radius.')
-
-            return (accepted[:num_points],
-                    x + self._options['sampling_radius'] * accepted[:num_points])
+        accepted = directions[within_bounds(points)]
+
+        # If some points are out of bounds, we perform rejection sampling in batches, until we
+        # have enough points that satisfy the bounds or have drawn the maximum number of points.
+        # The size of each batch is estimated from the fraction of accepted points so far, or
+        # doubled if none was accepted.
+        remaining = self._options['max_failed_rejection_sampling'] * num_points
+        num_drawn = num_points
+        num_draws = num_points
+        while len(accepted) < num_points and remaining > 0:
+            num_missing = num_points - len(accepted)
+            if len(accepted) > 0:
+                num_draws = int(np.ceil(2 * num_missing * num_drawn / len(accepted)))
+            else:
+                num_draws = 2 * num_draws
+            num_draws = min(remaining, num_draws)
+            points, directions = self.sample_points(n, x, num_draws)
+            accepted = np.vstack((accepted, directions[within_bounds(points)]))
+            num_drawn += num_draws
+            remaining -= num_draws
+
+        # When we are at a corner point, the expected fraction of acceptable points may be
+        # exponential small in the dimension of the problem. Thus, if we keep failing and
+        # do not have enough points by now, we switch to a different method that guarantees
+        # finding enough points, but they may not be uniformly distributed.
+        if len(accepted) < num_points:
+            points, directions = self.sample_points(n, x, num_points)
+            to_be_flipped = (points < var_lb) | (points > var_ub)
+            directions *= np.where(to_be_flipped, -1, 1)
+            points = x + self._options['sampling_radius'] * directions
+            accepted = np.vstack((accepted, directions[within_bounds(points)]))
+
+        # If we still do not have enough sampling points, we have failed.
+        if len(accepted) < num_points:
+            raise RuntimeError('Could not generate enough samples '
+                               'within bounds; try smaller radius.')
+
+        return (accepted[:num_points],
+                x + self._options['sampling_radius'] * accepted[:num_points])
 
     def gradient_approximation(self, n: int, x: np.ndarray, x_value: float, directions: np.ndarray,
                                sample_set_x: np.ndarray, sample_set_y: np.ndarray) -> np.ndarray:
@@ -0,0 +1,359 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A persistent pool of processes running an optimizer from several initial points."""
+
+from typing import Optional, Callable, List, Tuple, Sequence, Dict, Any
+from collections import deque
+import itertools
+import logging
+import os
+import pickle
+import queue
+import weakref
+
+import multiprocessing
+import numpy as np
+
+from qiskit.aqua import AquaError
+from qiskit.aqua.utils.validation import validate_min, validate_in_set
+from .optimizer import Optimizer
+
+logger = logging.getLogger(__name__)
+
+# seconds to wait for a result before checking that the workers are alive
+_POLL_INTERVAL = 1.0
+# seconds to wait for a worker to exit before terminating it
+_JOIN_TIMEOUT = 5.0
+
+
+class _Cancelled(Exception):
+    """Raised in a worker to abort an optimization whose run was cancelled."""
+
+
+class MultiStartExecutor:
+    """A persistent pool of processes that runs an optimizer from several initial points.
+
+    The processes are started with an explicit start method on first use and are kept until
+    :meth:`shutdown` is called, the executor is used as a context manager, or it is garbage
+    collected. An optimization problem, i.e. an optimizer together with the objective function,
+    is sent once to every process by :meth:`register` and can then be run from any number of
+    initial points by :meth:`run`. Its results are returned in the order in which they complete,
+    and the remaining initial points are cancelled once a result reaches a target value.
+
+    Since the processes do not share memory with the calling process, the optimizer and the
+    functions have to be picklable, e.g. module level functions or instances of module level
+    classes, and their state is the one at registration.
+    """
+
+    def __init__(self,
+                 num_processes: Optional[int] = None,
+                 start_method: str = 'spawn') -> None:
+        """
+        Args:
+            num_processes: The number of processes, has a min. value of 1. All local CPUs are
+                used if None.
+            start_method: The start method of the processes, ``'spawn'`` or ``'forkserver'``.
+                Both are safe to use from a multi-threaded process and on every platform on
+                which they are available.
+        """
+        if num_processes is not None:
+            validate_min('num_processes', num_processes, 1)
+        validate_in_set('start_method', start_method, {'spawn', 'forkserver'})
+        self._num_processes = num_processes or multiprocessing.cpu_count()
+        self._start_method = start_method
+        self._workers = []  # type: List[Tuple[Any, Any]]
+        self._result_queue = None
+        self._cancel = None
+        self._keys = itertools.count()
+        self._problems = {}  # type: Dict[int, bytes]
+        self._finalizer = None
+        self._run = None  # type: Optional[MultiStartRun]
+
+    @property
+    def num_processes(self) -> int:
+        """ Returns the number of processes """
+        return self._num_processes
+
+    @property
+    def start_method(self) -> str:
+        """ Returns the start method of the processes """
+        return self._start_method
+
+    def start(self) -> None:
+        """Starts the processes, if they are not running yet."""
+        if self._workers:
+            return
+        context = multiprocessing.get_context(self._start_method)
+        self._result_queue = context.Queue()
+        self._cancel = context.Event()
+        for _ in range(self._num_processes):
+            task_queue = context.Queue()
+            process = context.Process(target=_worker_main,
+                                      args=(task_queue, self._result_queue, self._cancel),
+                                      daemon=True)
+            process.start()
+            # the problems registered before a shutdown
+            for key, payload in self._problems.items():
+                task_queue.put(('register', key, payload))
+            self._workers.append((process, task_queue))
+        self._finalizer = weakref.finalize(self, _shutdown_workers, self._workers)
+        logger.debug('Started %d processes with the %s start method.',
+                     self._num_processes, self._start_method)
+
+    def shutdown(self) -> None:
+        """Stops the processes. They are started again when the executor is used again."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._workers = []
+        self._result_queue = None
+        self._cancel = None
+        self._run = None
+
+    def __enter__(self) -> 'MultiStartExecutor':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def register(self,
+                 optimizer: Optimizer,
+                 num_vars: int,
+                 objective_function: Callable[[np.ndarray], float],
+                 gradient_function: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 variable_bounds: Optional[List[Tuple[float, float]]] = None) -> int:
+        """Sends an optimization problem to every process.
+
+        The arguments are pickled once and are the ones passed to the ``optimize`` method of
+        the optimizer, except for the initial point.
+
+        Args:
+            optimizer: The optimizer run from every initial point.
+            num_vars: The number of variables.
+            objective_function: The objective function.
+            gradient_function: The gradient of the objective function.
+            variable_bounds: The bounds of the variables.
+
+        Returns:
+            The key of the problem, to be passed to :meth:`run` and :meth:`unregister`.
+
+        Raises:
+            pickle.PicklingError: If the problem can not be pickled. Other exceptions
+                raised by pickling, e.g. ``TypeError`` or ``AttributeError``, are propagated.
+        """
+        payload = pickle.dumps((optimizer, num_vars, objective_function,
+                                gradient_function, variable_bounds))
+        self.start()
+        key = next(self._keys)
+        self._problems[key] = payload
+        for _, task_queue in self._workers:
+            task_queue.put(('register', key, payload))
+        return key
+
+    def unregister(self, key: int) -> None:
+        """Removes an optimization problem from the processes.
+
+        Args:
+            key: The key of the problem returned by :meth:`register`.
+        """
+        self._problems.pop(key, None)
+        for _, task_queue in self._workers:
+            task_queue.put(('unregister', key, None))
+
+    def run(self,
+            key: int,
+            initial_points: Sequence[np.ndarray],
+            target_value: Optional[float] = None) -> 'MultiStartRun':
+        """Runs an optimization problem from several initial points in the processes.
+
+        The first initial points are sent to the processes right away. The results are
+        streamed by the returned iterator as they complete, and every process gets the next
+        initial point as soon as it is done. Once an optimal value is at most
+        ``target_value``, or the run is cancelled, the remaining initial points are skipped
+        and the running optimizations are aborted at their next function evaluation.
+        A run which is still in progress is closed when the next one is started.
+
+        Args:
+            key: The key of the problem returned by :meth:`register`.
+            initial_points: The initial points.
+            target_value: The optimal value at which the remaining runs are cancelled.
+
+        Returns:
+            The run, an iterator over the index of the initial point and the result
+            ``(point, value, nfev)`` of every optimization, in the order of completion.
+            The point and the value of an aborted optimization are None.
+        """
+        if self._run is not None:
+            self._run.close()
+        self.start()
+        self._cancel.clear()
+        self._run = MultiStartRun(self, key, initial_points, target_value)
+        return self._run
+
+    def _submit(self, worker: int, key: int, index: int, initial_point: np.ndarray) -> None:
+        """Sends an initial point to a process."""
+        self._workers[worker][1].put(('run', key, (worker, index, np.asarray(initial_point))))
+
+    def _next_result(self) -> Tuple[int, int, Any, Optional[BaseException]]:
+        """Waits for the next result, checking that the processes are alive."""
+        while True:
+            try:
+                return self._result_queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty as ex:
+                if not all(process.is_alive() for process, _ in self._workers):
+                    self.shutdown()
+                    raise AquaError('A process of the multi-start executor terminated '
+                                    'unexpectedly.') from ex
+
+
+# pylint: disable=protected-access
+class MultiStartRun:
+    """The results of an optimization problem run by a :class:`MultiStartExecutor` from
+    several initial points, in the order in which they complete."""
+
+    def __init__(self, executor: MultiStartExecutor, key: int,
+                 initial_points: Sequence[np.ndarray], target_value: Optional[float]) -> None:
+        """
+        Args:
+            executor: The executor.
+            key: The key of the problem.
+            initial_points: The initial points.
+            target_value: The optimal value at which the remaining runs are cancelled.
+        """
+        self._executor = executor
+        self._key = key
+        self._target_value = target_value
+        self._pending = deque(enumerate(initial_points))
+        self._num_busy = 0
+        for worker in range(executor.num_processes):
+            if not self._pending:
+                break
+            index, initial_point = self._pending.popleft()
+            executor._submit(worker, key, index, initial_point)
+            self._num_busy += 1
+
+    def __iter__(self) -> 'MultiStartRun':
+        return self
+
+    def __next__(self) -> Tuple[int, Tuple[Optional[np.ndarray], Optional[float], int]]:
+        """Returns the next result.
+
+        Raises:
+            StopIteration: If all results have been returned.
+            AquaError: If a process terminated unexpectedly.
+        """
+        if not self._num_busy:
+            raise StopIteration
+        worker, index, result, error = self._executor._next_result()
+        self._num_busy -= 1
+        if error is not None:
+            self.close()
+            raise error
+        if self._target_value is not None and result[1] is not None \
+                and result[1] <= self._target_value:
+            logger.debug('Initial point %d reached the target value, cancelling the '
+                         'remaining %d points.', index, self._num_busy + len(self._pending))
+            self.cancel()
+        if self._pending:
+            next_index, initial_point = self._pending.popleft()
+            self._executor._submit(worker, self._key, next_index, initial_point)
+            self._num_busy += 1
+        return index, result
+
+    def cancel(self) -> None:
+        """Skips the remaining initial points and aborts the running optimizations.
+
+        The aborted optimizations are still returned by the iterator, with their number of
+        function evaluations.
+        """
+        self._pending.clear()
+        if self._num_busy:
+            self._executor._cancel.set()
+
+    def close(self) -> None:
+        """Cancels the run and discards its remaining results."""
+        self.cancel()
+        while self._num_busy:
+            self._executor._next_result()
+            self._num_busy -= 1
+
+
+def _shutdown_workers(workers: List[Tuple[Any, Any]]) -> None:
+    """Stops the worker processes, terminating the ones that do not exit in time."""
+    for _, task_queue in workers:
+        try:
+            task_queue.put(None)
+        except (OSError, ValueError):
+            pass
+    for process, task_queue in workers:
+        process.join(_JOIN_TIMEOUT)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+        task_queue.close()
+
+
+def _worker_main(task_queue, result_queue, cancel) -> None:
+    """The loop of a worker process, which runs the optimizations sent through its queue."""
+    # nested parallelism, e.g. of the transpiler, would oversubscribe the CPUs
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+    problems = {}  # type: Dict[int, Tuple]
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        action, key, data = task
+        if action == 'register':
+            problems[key] = pickle.loads(data)
+        elif action == 'unregister':
+            problems.pop(key, None)
+        else:
+            worker, index, initial_point = data
+            try:
+                result = _run_problem(problems[key], initial_point, cancel)
+                result_queue.put((worker, index, result, None))
+            except Exception as ex:  # pylint: disable=broad-except
+                try:
+                    pickle.dumps(ex)
+                except Exception:  # pylint: disable=broad-except
+                    ex = AquaError('{}: {}'.format(type(ex).__name__, ex))
+                result_queue.put((worker, index, None, ex))
+
+
+def _run_problem(problem: Tuple, initial_point: np.ndarray, cancel
+                 ) -> Tuple[Optional[np.ndarray], Optional[float], int]:
+    """Runs the optimizer of a problem, aborting it once the run is cancelled."""
+    optimizer, num_vars, objective_function, gradient_function, variable_bounds = problem
+    nfev = 0
+
+    def objective(x):
+        nonlocal nfev
+        if cancel.is_set():
+            raise _Cancelled()
+        nfev += 1
+        return objective_function(x)
+
+    def gradient(x):
+        if cancel.is_set():
+            raise _Cancelled()
+        return gradient_function(x)
+
+    if cancel.is_set():
+        return None, None, 0
+    try:
+        return optimizer.optimize(num_vars, objective,
+                                  gradient if gradient_function is not None else None,
+                                  variable_bounds, initial_point)
+    except _Cancelled:
+        return None, None, nfev
@@ -18,6 +18,7 @@ import logging
 import numpy as np
 from scipy.optimize import minimize
 from scipy.optimize import OptimizeResult
+from qiskit.aqua.utils.validation import validate_min
 from .optimizer import Optimizer, OptimizerSupportLevel
 
 
@@ -29,16 +30,24 @@ class NFT(Optimizer):
     Nakanishi-Fujii-Todo algorithm.
 
     See https://arxiv.org/abs/1903.12166
+
+    The objective function values needed to fit the sinusoid of a parameter are evaluated in
+    a single call if grouped evaluations are enabled, e.g. with the ``max_evals_grouped``
+    option of :class:`~qiskit.aqua.algorithms.VQE`. With ``block_size`` larger than one,
+    several parameters are updated at once from the :math:`2k+1` evaluations at the current
+    point and at the points where one of the :math:`k` parameters is shifted by
+    :math:`\\pm\\pi/2`.
     """
 
-    _OPTIONS = ['maxiter', 'maxfev', 'disp', 'reset_interval']
+    _OPTIONS = ['maxiter', 'maxfev', 'disp', 'reset_interval', 'block_size']
 
     # pylint: disable=unused-argument
     def __init__(self,
                  maxiter: Optional[int] = None,
                  maxfev: int = 1024,
                  disp: bool = False,
-                 reset_interval: int = 32) -> None:
+                 reset_interval: int = 32,
+                 block_size: int = 1) -> None:
         """
         Built out using scipy framework, for details, please refer to
         https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html.
@@ -49,6 +58,11 @@ class NFT(Optimizer):
             disp: disp
             reset_interval: The minimum estimates directly once
                             in ``reset_interval`` times.
+            block_size: The number of parameters updated simultaneously. Each of them is set
+                to the minimum of its own sinusoid, which is exact only if the objective
+                function is a sum of functions of the single parameters of the block, e.g. for
+                rotations of one layer that act on different qubits and are followed by
+                commuting observables. It has a min. value of 1.
 
         Notes:
             In this optimization method, the optimization function have to satisfy
@@ -59,6 +73,7 @@ class NFT(Optimizer):
                 Sequential minimal optimization for quantum-classical hybrid algorithms.
                 arXiv preprint arXiv:1903.12166.
         """
+        validate_min('block_size', block_size, 1)
         super().__init__()
         for k, v in list(locals().items()):
             if k in self._OPTIONS:
@@ -78,13 +93,15 @@ class NFT(Optimizer):
                          variable_bounds, initial_point)
 
         res = minimize(objective_function, initial_point,
-                       method=nakanishi_fujii_todo, options=self._options)
+                       method=nakanishi_fujii_todo,
+                       options=dict(self._options, max_evals_grouped=self._max_evals_grouped))
         return res.x, res.fun, res.nfev
 
 
 # pylint: disable=invalid-name
 def nakanishi_fujii_todo(fun, x0, args=(), maxiter=None, maxfev=1024,
-                         reset_interval=32, eps=1e-32, callback=None, **_):
+                         reset_interval=32, eps=1e-32, callback=None,
+                         block_size=1, max_evals_grouped=1, **_):
     """
     Find the global minimum of a function using the nakanishi_fujii_todo
     algorithm [1].
@@ -111,6 +128,17 @@ def nakanishi_fujii_todo(fun, x0, args=(), maxiter=None, maxfev=1024,
         **_ : additional options
         callback (callable, optional):
             Called after each iteration.
+        block_size (int):
+            The number of variables updated simultaneously, each to the minimum of its
+            own sinusoid, from the function values at ``x0`` and at the points where one
+            of them is shifted by :math:`\\pm\\pi/2`. The function value at the new ``x0``
+            is estimated for the next iteration only if ``block_size`` is 1.
+            Default: 1.
+        max_evals_grouped (int):
+            The maximum number of points at which ``fun`` is evaluated in a single call,
+            given as the concatenation of the points. If larger than 1, ``fun`` has to
+            return a list of values for more than one point.
+            Default: 1.
     Returns:
         OptimizeResult:
             The optimization result represented as a ``OptimizeResult`` object.
@@ -126,33 +154,38 @@ def nakanishi_fujii_todo(fun, x0, args=(), maxiter=None, maxfev=1024,
     """
 
     x0 = np.asarray(x0)
+    block_size = min(block_size, x0.size)
     recycle_z0 = None
     niter = 0
     funcalls = 0
 
     while True:
 
-        idx = niter % x0.size
+        idx = np.arange(niter * block_size, (niter + 1) * block_size) % x0.size
 
         if reset_interval > 0:
             if niter % reset_interval == 0:
                 recycle_z0 = None
 
+        points = [] if recycle_z0 is not None else [np.copy(x0)]
+        for i in idx:
+            p = np.copy(x0)
+            p[i] = x0[i] + np.pi / 2
+            points.append(p)
+
+            p = np.copy(x0)
+            p[i] = x0[i] - np.pi / 2
+            points.append(p)
+
+        values = Optimizer.evaluate_grouped(points, Optimizer.wrap_function(fun, args),
+                                            max_evals_grouped)
+        funcalls += len(points)
         if recycle_z0 is None:
-            z0 = fun(np.copy(x0), *args)
-            funcalls += 1
+            z0, values = values[0], values[1:]
         else:
             z0 = recycle_z0
-
-        p = np.copy(x0)
-        p[idx] = x0[idx] + np.pi / 2
-        z1 = fun(p, *args)
-        funcalls += 1
-
-        p = np.copy(x0)
-        p[idx] = x0[idx] - np.pi / 2
-        z3 = fun(p, *args)
-        funcalls += 1
+        z1 = values[0::2]
+        z3 = values[1::2]
 
         z2 = z1 + z3 - z0
         c = (z1 + z3) / 2
@@ -161,7 +194,8 @@ def nakanishi_fujii_todo(fun, x0, args=(), maxiter=None, maxfev=1024,
         b += 0.5 * np.pi + 0.5 * np.pi * np.sign((z0 - z2) + eps * (z0 == z2))
 
         x0[idx] = b
-        recycle_z0 = c - a
+        # the minimum of the sinusoid is the value at the new x0 if a single variable changed
+        recycle_z0 = c[0] - a[0] if block_size == 1 else None
 
         niter += 1
 
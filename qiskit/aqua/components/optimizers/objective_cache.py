@@ -0,0 +1,228 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A cache of the evaluations of an objective function."""
+
+from typing import Optional, Callable, Dict, Tuple
+import logging
+
+import numpy as np
+
+from qiskit.aqua.utils.validation import validate_min
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectiveCache:
+    """A cache of the evaluations of an objective function, which avoids repeated evaluations.
+
+    Optimizers such as COBYLA, Nelder-Mead or GSLS evaluate the objective function repeatedly
+    at identical points, which is expensive if every evaluation is a job on a backend. The
+    function returned by :meth:`wrap` answers these evaluations from the cache.
+
+    A point is looked up by the bytes of its parameter values. With ``atol`` > 0, a point
+    whose parameter values all differ by at most ``atol`` from a cached one is answered
+    with the cached value as well. With ``surrogate_radius`` set, a point which is not in the
+    cache is answered by a local quadratic model, if enough cached points lie within this
+    distance to fit the model, and the model reproduces their values within
+    ``surrogate_tolerance``. The answers of the model are approximations, so it should only
+    be used if the optimizer tolerates small errors of the objective function, just like
+    the shot noise of a backend.
+
+    Several points which are evaluated in one call of the objective function, see
+    :meth:`~qiskit.aqua.components.optimizers.Optimizer.set_max_evals_grouped`, are looked up
+    one by one, and the points which are not answered from the cache are evaluated in one call.
+    """
+
+    def __init__(self,
+                 max_size: Optional[int] = None,
+                 atol: float = 0.0,
+                 surrogate_radius: Optional[float] = None,
+                 surrogate_tolerance: float = 1e-3) -> None:
+        """
+        Args:
+            max_size: The maximum number of cached evaluations, the oldest ones are discarded
+                first. All evaluations are cached if None. Has a min. value of 1.
+            atol: The maximum difference of the parameter values of a point from a cached one
+                which is answered with the cached value. Has a min. value of 0.
+            surrogate_radius: The distance of the cached points from a point, which are used to
+                fit a quadratic model of the objective function at the point. No model is used
+                if None. Has a min. value of 0.
+            surrogate_tolerance: The maximum root mean square error of the model on the cached
+                points, for the model to answer an evaluation. Has a min. value of 0.
+        """
+        if max_size is not None:
+            validate_min('max_size', max_size, 1)
+        validate_min('atol', atol, 0.0)
+        if surrogate_radius is not None:
+            validate_min('surrogate_radius', surrogate_radius, 0.0)
+        validate_min('surrogate_tolerance', surrogate_tolerance, 0.0)
+        self._max_size = max_size
+        self._atol = atol
+        self._surrogate_radius = surrogate_radius
+        self._surrogate_tolerance = surrogate_tolerance
+        # the slots of the cached points in the arrays of points and values, which grow by
+        # doubling and are used as a ring buffer once max_size is reached
+        self._cache = {}  # type: Dict[bytes, int]
+        self._points = None  # type: Optional[np.ndarray]
+        self._values = None  # type: Optional[np.ndarray]
+        self._size = 0
+        self._oldest = 0
+        self._hits = 0
+        self._surrogate_hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """ Returns the number of evaluations answered with a cached value """
+        return self._hits
+
+    @property
+    def surrogate_hits(self) -> int:
+        """ Returns the number of evaluations answered by the quadratic model """
+        return self._surrogate_hits
+
+    @property
+    def misses(self) -> int:
+        """ Returns the number of evaluations of the objective function """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Removes all cached evaluations and resets the statistics."""
+        self._cache.clear()
+        self._points = None
+        self._values = None
+        self._size = 0
+        self._oldest = 0
+        self._hits = 0
+        self._surrogate_hits = 0
+        self._misses = 0
+
+    def wrap(self, objective_function: Callable, num_vars: int) -> Callable:
+        """Returns the objective function answered from the cache, starting with an empty cache.
+
+        Args:
+            objective_function: The objective function, which is called with the parameter
+                values of one or several concatenated points, and returns the value of every
+                point.
+            num_vars: The number of variables of a point.
+
+        Returns:
+            The cached objective function.
+        """
+        self.clear()
+
+        def cached(x):
+            points = np.reshape(np.asarray(x, dtype=float), (-1, num_vars))
+            values = np.empty(len(points))
+            missing = []
+            for i, point in enumerate(points):
+                value = self._lookup(point)
+                if value is None:
+                    missing.append(i)
+                else:
+                    values[i] = value
+            if missing:
+                new_values = np.ravel(objective_function(np.ravel(points[missing])))
+                self._misses += len(missing)
+                for i, value in zip(missing, new_values):
+                    values[i] = value
+                    self._insert(points[i], value)
+            if len(points) == 1:
+                return values[0]
+            return values
+
+        return cached
+
+    def _lookup(self, point: np.ndarray) -> Optional[float]:
+        """Returns the cached or modelled value of a point, or None."""
+        key = point.tobytes()
+        if key in self._cache:
+            self._hits += 1
+            return self._values[self._cache[key]]
+        if not self._cache or (self._atol <= 0 and self._surrogate_radius is None):
+            return None
+
+        points, values = self._stacked()
+        if self._atol > 0:
+            distances = np.max(np.abs(points - point), axis=1)
+            nearest = np.argmin(distances)
+            if distances[nearest] <= self._atol:
+                self._hits += 1
+                return values[nearest]
+        if self._surrogate_radius is not None:
+            value = self._surrogate(point, points, values)
+            if value is not None:
+                self._surrogate_hits += 1
+                return value
+        return None
+
+    def _insert(self, point: np.ndarray, value: float) -> None:
+        """Caches the value of a point, replacing the oldest one if the cache is full."""
+        key = point.tobytes()
+        slot = self._cache.get(key)
+        if slot is None:
+            if self._points is None:
+                capacity = min(16, self._max_size or 16)
+                self._points = np.empty((capacity, len(point)))
+                self._values = np.empty(capacity)
+            if self._size == self._max_size:
+                slot = self._oldest
+                self._oldest = (slot + 1) % self._max_size
+                del self._cache[self._points[slot].tobytes()]
+            else:
+                if self._size == len(self._values):
+                    capacity = 2 * self._size
+                    if self._max_size is not None:
+                        capacity = min(capacity, self._max_size)
+                    points, values = self._points, self._values
+                    self._points = np.empty((capacity, len(point)))
+                    self._values = np.empty(capacity)
+                    self._points[:self._size] = points
+                    self._values[:self._size] = values
+                slot = self._size
+                self._size += 1
+            self._cache[key] = slot
+            self._points[slot] = point
+        self._values[slot] = value
+
+    def _stacked(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the cached points and values as arrays."""
+        return self._points[:self._size], self._values[:self._size]
+
+    def _surrogate(self, point: np.ndarray, points: np.ndarray,
+                   values: np.ndarray) -> Optional[float]:
+        """Returns the value of a quadratic model fitted to the cached points around a point,
+        or None if there are too few points or the model does not fit them well enough."""
+        num_vars = len(point)
+        num_coefficients = (num_vars + 1) * (num_vars + 2) // 2
+        near = np.linalg.norm(points - point, axis=1) <= self._surrogate_radius
+        # more points than coefficients, such that the error of the fit is meaningful
+        if np.count_nonzero(near) <= num_coefficients:
+            return None
+        offsets = points[near] - point
+        rows, cols = np.triu_indices(num_vars)
+        design = np.hstack([np.ones((len(offsets), 1)), offsets,
+                            offsets[:, rows] * offsets[:, cols]])
+        coefficients, _, rank, _ = np.linalg.lstsq(design, values[near], rcond=None)
+        if rank < num_coefficients:
+            return None
+        error = np.sqrt(np.mean((design @ coefficients - values[near]) ** 2))
+        if error > self._surrogate_tolerance:
+            return None
+        logger.debug('Answered an evaluation by a quadratic model of %d points with an '
+                     'error of %s.', np.count_nonzero(near), error)
+        # the offsets are relative to the point, so the constant term is the model value
+        return coefficients[0]
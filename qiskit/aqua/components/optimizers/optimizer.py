@@ -67,55 +67,89 @@ class Optimizer(ABC):
 
     # pylint: disable=invalid-name
     @staticmethod
-    def gradient_num_diff(x_center, f, epsilon, max_evals_grouped=1):
+    def gradient_num_diff(x_center, f, epsilon, max_evals_grouped=1, method='forward',
+                          indices=None):
         """
         We compute the gradient with the numeric differentiation in the parallel way,
         around the point x_center.
 
+        All points at which ``f`` is evaluated are built at once, as the rows of a matrix of
+        perturbations of ``x_center``, and are evaluated by :meth:`evaluate_grouped`, so with
+        a large enough ``max_evals_grouped`` the gradient costs a single call of ``f``.
+
         Args:
             x_center (ndarray): point around which we compute the gradient
             f (func): the function of which the gradient is to be computed.
             epsilon (float): the epsilon used in the numeric differentiation.
             max_evals_grouped (int): max evals grouped
+            method (str): the finite difference scheme, ``'forward'`` differences with an
+                error of order ``epsilon`` from ``P + 1`` evaluations for ``P`` variables,
+                ``'central'`` differences with an error of order ``epsilon ** 2`` from ``2P``
+                evaluations, or ``'richardson'``, the Richardson extrapolation of the central
+                differences with the steps ``epsilon`` and ``2 * epsilon``, with an error of
+                order ``epsilon ** 4`` from ``4P`` evaluations.
+            indices (list[int]): the indices of the variables whose partial derivatives are
+                computed, all if None. The other entries of the gradient are zero.
         Returns:
             grad: the gradient computed
-
+        Raises:
+            ValueError: if the method is not supported.
         """
-        forig = f(*((x_center,)))
-        grad = []
-        ei = np.zeros((len(x_center),), float)
-        todos = []
-        for k in range(len(x_center)):
-            ei[k] = 1.0
-            d = epsilon * ei
-            todos.append(x_center + d)
-            ei[k] = 0.0
-
-        counter = 0
-        chunk = []
-        chunks = []
-        length = len(todos)
-        # split all points to chunks, where each chunk has batch_size points
-        for i in range(length):
-            x = todos[i]
-            chunk.append(x)
-            counter += 1
-            # the last one does not have to reach batch_size
-            if counter == max_evals_grouped or i == length - 1:
-                chunks.append(chunk)
-                chunk = []
-                counter = 0
-
-        for chunk in chunks:  # eval the chunks in order
-            parallel_parameters = np.concatenate(chunk)
-            todos_results = f(parallel_parameters)  # eval the points in a chunk (order preserved)
-            if isinstance(todos_results, float):
-                grad.append((todos_results - forig) / epsilon)
+        x_center = np.asarray(x_center)
+        if indices is None:
+            indices = np.arange(len(x_center))
+        indices = np.asarray(indices, dtype=int)
+        num_indices = len(indices)
+        # the i-th row is the step of the i-th variable in indices
+        steps = np.zeros((num_indices, len(x_center)))
+        steps[np.arange(num_indices), indices] = epsilon
+
+        if method == 'forward':
+            points = np.vstack((x_center, x_center + steps))
+        elif method == 'central':
+            points = np.vstack((x_center + steps, x_center - steps))
+        elif method == 'richardson':
+            points = np.vstack((x_center + steps, x_center - steps,
+                                x_center + 2 * steps, x_center - 2 * steps))
+        else:
+            raise ValueError('Unsupported finite difference method {}'.format(method))
+
+        values = Optimizer.evaluate_grouped(points, f, max_evals_grouped)
+        grad = np.zeros(len(x_center), dtype=values.dtype)
+        if method == 'forward':
+            grad[indices] = (values[1:] - values[0]) / epsilon
+        else:
+            values = values.reshape(-1, num_indices)
+            central = values[0] - values[1]
+            if method == 'central':
+                grad[indices] = central / (2 * epsilon)
             else:
-                for todor in todos_results:
-                    grad.append((todor - forig) / epsilon)
+                grad[indices] = (8 * central - (values[2] - values[3])) / (12 * epsilon)
+        return grad
+
+    @staticmethod
+    def evaluate_grouped(points, f, max_evals_grouped=1):
+        """
+        Evaluates the function at several points, passing up to ``max_evals_grouped`` points
+        concatenated to a single call of the function.
 
-        return np.array(grad)
+        Args:
+            points (ndarray): the points, one per row.
+            f (func): the function, which returns a list of values if it is called with
+                more than one point.
+            max_evals_grouped (int): max evals grouped
+        Returns:
+            ndarray: the values of the function at the points.
+        """
+        values = []
+        for start in range(0, len(points), max_evals_grouped):
+            chunk = points[start:start + max_evals_grouped]
+            if len(chunk) == 1:
+                values.append(np.ravel(f(chunk[0])))
+            else:
+                # eval the points in a chunk (order preserved)
+                values.append(np.ravel(f(np.concatenate(chunk))))
+        return np.concatenate(values)
 
     @staticmethod
     def wrap_function(function, args):
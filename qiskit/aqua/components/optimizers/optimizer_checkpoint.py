@@ -0,0 +1,412 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Checkpoints of optimizations, which allow to resume them after an interruption."""
+
+from typing import Optional, Callable, List, Tuple, Dict, Any
+import io
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+from qiskit.aqua import aqua_globals, AquaError
+from qiskit.aqua.utils.validation import validate_min
+from .optimizer import Optimizer
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION = 2
+_OBJECTIVE = 0
+_GRADIENT = 1
+
+
+class OptimizerCheckpoint:
+    """Records an optimization in a file, such that it can be resumed after an interruption.
+
+    Every call of the objective function and of the gradient is recorded, with its input, its
+    output and, if the call changed it, the state of the random number generator
+    :attr:`aqua_globals.random` after the call. The initial point and the state of the random
+    number generator at the start are written to a snapshot file, and the new calls are appended
+    to it by a background thread every ``interval`` calls, so the optimization is not blocked by
+    the file system, and at the end of the optimization, also if it is ended by an exception.
+
+    If the snapshot file exists when the optimization is started, the optimization is resumed:
+    The optimizer is run again from the recorded initial point and state of the random number
+    generator, and the recorded calls are answered from the snapshot instead of evaluating the
+    functions. Since the optimizers are deterministic for given function values and random
+    numbers, the optimizer arrives at exactly the state in which it was interrupted, whatever
+    its internal state is, and the optimization continues with new evaluations from there.
+    If a call does not match the record, e.g. since the optimizer or its settings changed,
+    a warning is logged and the optimization continues with new evaluations from that call.
+
+    A snapshot is a sequence of NumPy ``.npz`` chunks, each stored as a NumPy byte array, so
+    that only the new calls are written. An interruption while appending leaves a truncated
+    last chunk, which is removed when the snapshot is resumed. The file is only rewritten,
+    atomically, when it is created and when the optimization diverges from it.
+    """
+
+    def __init__(self, path: str, interval: int = 1, resume: bool = True) -> None:
+        """
+        Args:
+            path: The path of the snapshot file.
+            interval: The number of function calls after which a snapshot is written,
+                has a min. value of 1.
+            resume: Whether an existing snapshot is resumed. If False, it is overwritten.
+        """
+        validate_min('interval', interval, 1)
+        self._path = path
+        self._interval = interval
+        self._resume = resume
+        self._num_replayed_evals = 0
+
+    @property
+    def path(self) -> str:
+        """ Returns the path of the snapshot file """
+        return self._path
+
+    @property
+    def interval(self) -> int:
+        """ Returns the number of function calls after which a snapshot is written """
+        return self._interval
+
+    @interval.setter
+    def interval(self, interval: int) -> None:
+        """ Sets the number of function calls after which a snapshot is written """
+        validate_min('interval', interval, 1)
+        self._interval = interval
+
+    @property
+    def num_replayed_evals(self) -> int:
+        """ Returns the number of points at which the objective function was evaluated in the
+        interrupted optimization, which were answered from the snapshot by the last run """
+        return self._num_replayed_evals
+
+    def remove(self) -> None:
+        """Removes the snapshot file, such that the next optimization starts anew."""
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+    def optimize(self,
+                 optimizer: Optimizer,
+                 num_vars: int,
+                 objective_function: Callable,
+                 gradient_function: Optional[Callable] = None,
+                 variable_bounds: Optional[List[Tuple[float, float]]] = None,
+                 initial_point: Optional[np.ndarray] = None,
+                 replay_callback: Optional[Callable[[int], None]] = None
+                 ) -> Tuple[np.ndarray, float, int]:
+        """Runs the optimizer, resuming the optimization of the snapshot file if it exists.
+
+        Args:
+            optimizer: The optimizer.
+            num_vars: The number of variables.
+            objective_function: The objective function.
+            gradient_function: The gradient of the objective function.
+            variable_bounds: The bounds of the variables.
+            initial_point: The initial point, which is replaced by the recorded one on resume.
+            replay_callback: A function called with the number of points of every call of the
+                objective function which is answered from the snapshot, e.g. to count them.
+
+        Returns:
+            The result ``(point, value, nfev)`` of the optimizer.
+
+        Raises:
+            AquaError: If the snapshot belongs to a problem with a different number of
+                variables.
+        """
+        record = None
+        if self._resume and os.path.exists(self._path):
+            record = _Record.load(self._path)
+            if record.num_vars != num_vars:
+                raise AquaError('The snapshot {} has {} variables, but the problem has {}.'.format(
+                    self._path, record.num_vars, num_vars))
+            logger.info('Resuming the optimization of %s after %d function calls.',
+                        self._path, len(record))
+            initial_point = record.initial_point
+            aqua_globals.random.bit_generator.state = record.initial_rng_state
+        else:
+            record = _Record(num_vars, initial_point,
+                             aqua_globals.random.bit_generator.state)
+
+        recorder = _Recorder(record, self._path, self._interval, replay_callback)
+        objective = recorder.wrap(_OBJECTIVE, objective_function)
+        gradient = recorder.wrap(_GRADIENT, gradient_function) \
+            if gradient_function is not None else None
+        try:
+            result = optimizer.optimize(num_vars, objective, gradient_function=gradient,
+                                        variable_bounds=variable_bounds,
+                                        initial_point=initial_point)
+        finally:
+            recorder.close()
+            self._num_replayed_evals = recorder.num_replayed_evals
+        return result
+
+
+class _Record:
+    """The recorded function calls of an optimization."""
+
+    def __init__(self, num_vars: int, initial_point: Optional[np.ndarray],
+                 initial_rng_state: Dict[str, Any]) -> None:
+        self.num_vars = num_vars
+        self.initial_point = None if initial_point is None else np.asarray(initial_point)
+        self.initial_rng_state = initial_rng_state
+        self.kinds = []  # type: List[int]
+        self.inputs = []  # type: List[np.ndarray]
+        self.outputs = []  # type: List[np.ndarray]
+        self.scalar = []  # type: List[bool]
+        # the states of the random number generator after the calls which changed it
+        self.rng_states = {}  # type: Dict[int, str]
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def append(self, kind: int, x: np.ndarray, value: Any,
+               rng_state: Optional[Dict[str, Any]] = None) -> None:
+        """Appends a call, which has to happen after the last one was evaluated, with the state
+        of the random number generator after the call if the call changed it."""
+        if rng_state is not None:
+            self.rng_states[len(self.kinds)] = json.dumps(rng_state)
+        self.kinds.append(kind)
+        self.inputs.append(np.array(x, dtype=float).ravel())
+        self.outputs.append(np.array(value, dtype=float).ravel())
+        self.scalar.append(np.ndim(value) == 0)
+
+    def truncate(self, length: int) -> None:
+        """Removes the calls from the given index on."""
+        for values in (self.kinds, self.inputs, self.outputs, self.scalar):
+            del values[length:]
+        for index in [index for index in self.rng_states if index >= length]:
+            del self.rng_states[index]
+
+    def header(self) -> Dict[str, np.ndarray]:
+        """Returns the arrays of the first chunk of a snapshot, which describes the problem."""
+        initial_point = self.initial_point if self.initial_point is not None else np.zeros(0)
+        return {'version': np.array(_FORMAT_VERSION),
+                'num_vars': np.array(self.num_vars),
+                'has_initial_point': np.array(self.initial_point is not None),
+                'initial_point': initial_point,
+                'initial_rng_state': np.array(json.dumps(self.initial_rng_state))}
+
+    def chunk(self, start: int, end: int) -> Dict[str, np.ndarray]:
+        """Returns the arrays of a chunk of a snapshot with the calls from ``start`` to
+        ``end``."""
+        def concatenate(arrays):
+            return np.concatenate(arrays) if arrays else np.zeros(0)
+
+        inputs = self.inputs[start:end]
+        outputs = self.outputs[start:end]
+        rng_indices = [index for index in range(start, end) if index in self.rng_states]
+        return {'kinds': np.array(self.kinds[start:end], dtype=np.int8),
+                'scalar': np.array(self.scalar[start:end], dtype=bool),
+                'input_sizes': np.array([len(x) for x in inputs], dtype=np.int64),
+                'inputs': concatenate(inputs),
+                'output_sizes': np.array([len(y) for y in outputs], dtype=np.int64),
+                'outputs': concatenate(outputs),
+                'rng_indices': np.array(rng_indices, dtype=np.int64),
+                'rng_states': np.array([self.rng_states[index] for index in rng_indices],
+                                       dtype=str)}
+
+    def extend(self, chunk: Dict[str, np.ndarray]) -> None:
+        """Appends the calls of a chunk of a snapshot."""
+        kinds = chunk['kinds'].tolist()
+        if not kinds:
+            return
+        self.kinds.extend(kinds)
+        self.scalar.extend(chunk['scalar'].tolist())
+        self.inputs.extend(np.split(chunk['inputs'], np.cumsum(chunk['input_sizes'])[:-1]))
+        self.outputs.extend(np.split(chunk['outputs'], np.cumsum(chunk['output_sizes'])[:-1]))
+        self.rng_states.update(zip(chunk['rng_indices'].tolist(),
+                                   chunk['rng_states'].tolist()))
+
+    @staticmethod
+    def write(path: str, chunks: List[Dict[str, np.ndarray]], append: bool) -> None:
+        """Appends chunks to a snapshot file, or replaces it atomically by a file with the
+        chunks. Every chunk is an ``.npz`` file stored as a NumPy byte array, such that an
+        interrupted append leaves a truncated last chunk."""
+        data = io.BytesIO()
+        for arrays in chunks:
+            buffer = io.BytesIO()
+            np.savez(buffer, **arrays)
+            np.save(data, np.frombuffer(buffer.getbuffer(), dtype=np.uint8))
+        if append:
+            with open(path, 'ab') as file:
+                file.write(data.getbuffer())
+        else:
+            temp_path = path + '.tmp'
+            with open(temp_path, 'wb') as file:
+                file.write(data.getbuffer())
+            os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> '_Record':
+        """Reads the calls from a file, removing a truncated last chunk from it."""
+        with open(path, 'rb') as file:
+            chunks = []
+            end = 0
+            while True:
+                try:
+                    data = np.load(file)
+                except (ValueError, EOFError):
+                    break
+                with np.load(io.BytesIO(data.tobytes())) as chunk:
+                    chunks.append(dict(chunk))
+                end = file.tell()
+            size = file.seek(0, io.SEEK_END)
+
+        if not chunks or 'version' not in chunks[0]:
+            raise AquaError('The snapshot {} is not valid.'.format(path))
+        header = chunks[0]
+        if int(header['version']) != _FORMAT_VERSION:
+            raise AquaError('Unsupported snapshot version {} of {}.'.format(
+                int(header['version']), path))
+        if end < size:
+            logger.warning('Removing the truncated last chunk of the snapshot %s.', path)
+            os.truncate(path, end)
+        record = cls(int(header['num_vars']),
+                     header['initial_point'] if header['has_initial_point'] else None,
+                     json.loads(str(header['initial_rng_state'])))
+        for chunk in chunks[1:]:
+            record.extend(chunk)
+        return record
+
+
+def _same_state(state: Any, other: Any) -> bool:
+    """Compares two states of a bit generator."""
+    if isinstance(state, dict):
+        return isinstance(other, dict) and state.keys() == other.keys() and \
+            all(_same_state(state[key], other[key]) for key in state)
+    return np.array_equal(state, other)
+
+
+class _Recorder:
+    """Answers the recorded calls of a record and appends the new ones, which are written to
+    the snapshot file by a background thread."""
+
+    def __init__(self, record: _Record, path: str, interval: int,
+                 replay_callback: Optional[Callable[[int], None]]) -> None:
+        self._record = record
+        self._path = path
+        self._interval = interval
+        self._replay_callback = replay_callback
+        self._num_replay = len(record)
+        self._position = 0
+        self._num_unsaved = 0
+        self.num_replayed_evals = 0
+
+        self._condition = threading.Condition()
+        self._requested = None  # type: Optional[int]
+        # the number of calls in the snapshot file, which is rewritten if None
+        self._num_saved = len(record) if record else None  # type: Optional[int]
+        self._closed = False
+        self._thread = threading.Thread(target=self._write_snapshots, daemon=True)
+        self._thread.start()
+        if not record:
+            # overwrites an old snapshot which is not resumed
+            self._request()
+
+    def wrap(self, kind: int, function: Callable) -> Callable:
+        """Returns the recording wrapper of a function."""
+        def wrapper(x):
+            if self._position < self._num_replay and self._matches(kind, x):
+                return self._replay()
+            rng_state = aqua_globals.random.bit_generator.state
+            value = function(x)
+            new_rng_state = aqua_globals.random.bit_generator.state
+            with self._condition:
+                self._record.append(kind, x, value,
+                                    None if _same_state(rng_state, new_rng_state)
+                                    else new_rng_state)
+            self._position += 1
+            self._num_unsaved += 1
+            if self._num_unsaved >= self._interval:
+                self._request()
+            return value
+        return wrapper
+
+    def _matches(self, kind: int, x: np.ndarray) -> bool:
+        """Checks that the next call is the recorded one, and drops the rest of the record
+        otherwise."""
+        record = self._record
+        index = self._position
+        if record.kinds[index] == kind and \
+                np.array_equal(record.inputs[index], np.asarray(x, dtype=float).ravel()):
+            return True
+
+        logger.warning('The optimization diverged from the snapshot %s at call %d of %d, '
+                       'continuing with new evaluations.', self._path, index, self._num_replay)
+        with self._condition:
+            record.truncate(index)
+            self._num_saved = None
+        self._num_replay = index
+        self._request()
+        return False
+
+    def _replay(self) -> Any:
+        """Returns the recorded value of the next call and restores the random state, if the
+        call changed it."""
+        record = self._record
+        index = self._position
+        self._position += 1
+        if index in record.rng_states:
+            aqua_globals.random.bit_generator.state = json.loads(record.rng_states[index])
+        if record.kinds[index] == _OBJECTIVE:
+            num_evals = len(record.inputs[index]) // max(record.num_vars, 1)
+            self.num_replayed_evals += num_evals
+            if self._replay_callback is not None:
+                self._replay_callback(num_evals)
+        output = record.outputs[index]
+        return output[0] if record.scalar[index] else output.copy()
+
+    def _request(self) -> None:
+        """Requests a snapshot of the record."""
+        self._num_unsaved = 0
+        with self._condition:
+            self._requested = len(self._record)
+            self._condition.notify()
+
+    def _write_snapshots(self) -> None:
+        """The loop of the background thread, which appends the calls up to the latest
+        requested snapshot to the file, or rewrites it after the record was truncated."""
+        while True:
+            with self._condition:
+                while not self._closed and self._requested is None:
+                    self._condition.wait()
+                if self._requested is None:
+                    return
+                # later requests while writing are appended in the next chunk
+                end = self._requested
+                append = self._num_saved is not None
+                if append:
+                    chunks = [self._record.chunk(self._num_saved, end)]
+                else:
+                    chunks = [self._record.header(), self._record.chunk(0, end)]
+                self._num_saved = end
+                self._requested = None
+            try:
+                _Record.write(self._path, chunks, append)
+            except OSError as ex:
+                logger.warning('Writing the snapshot %s failed: %s', self._path, ex)
+                with self._condition:
+                    # the file may end with a partial chunk
+                    self._num_saved = None
+
+    def close(self) -> None:
+        """Writes the final snapshot and stops the background thread."""
+        with self._condition:
+            if self._num_unsaved or self._requested is not None or self._num_saved is None:
+                self._requested = len(self._record)
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
@@ -14,8 +14,11 @@
 
 from typing import Optional
 import multiprocessing
-import platform
 import logging
+import os
+import pickle
+import platform
+import sys
 
 import numpy as np
 from scipy import optimize as sciopt
@@ -23,6 +26,8 @@ from scipy import optimize as sciopt
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.utils.validation import validate_min
 from .optimizer import Optimizer, OptimizerSupportLevel
+from .l_bfgs_b import L_BFGS_B
+from .multistart_executor import MultiStartExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,14 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
     machine. This allows the multiple processes to use simulation to potentially reach a minimum
     faster. The parallelization may also help the optimizer avoid getting stuck at local optima.
 
+    The optimization from the initial point runs in the current process, while the
+    optimizations from random points in the bounds run in the processes of a
+    :class:`MultiStartExecutor`. The executor is kept between the calls of :meth:`optimize`,
+    and the objective function and the gradient are sent to its processes in every call, so
+    they have to be picklable. Otherwise, the random points are optimized in forked processes
+    where the fork start method is safe, i.e. not on Windows and not on macOS with Python 3.8
+    or later, or only the initial point is optimized.
+
     Uses scipy.optimize.fmin_l_bfgs_b.
     For further detail, please refer to
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.fmin_l_bfgs_b.html
@@ -48,7 +61,9 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
                  maxfun: int = 1000,
                  factr: float = 10,
                  iprint: int = -1,
-                 max_processes: Optional[int] = None) -> None:
+                 max_processes: Optional[int] = None,
+                 target_value: Optional[float] = None,
+                 executor: Optional[MultiStartExecutor] = None) -> None:
         r"""
         Args:
             maxfun: Maximum number of function evaluations.
@@ -66,6 +81,13 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
                 changes of active set and final x; iprint > 100 print details of
                 every iteration including x and g.
             max_processes: maximum number of processes allowed, has a min. value of 1 if not None.
+            target_value: if an optimization reaches an objective value of at most
+                ``target_value``, the optimizations that are still running in the executor
+                are cancelled.
+            executor: the executor running the optimizations from the random points, such that
+                its processes can be shared with other optimizers. Its number of processes
+                bounds the number of random points. If None, the optimizer creates its own
+                executor with one process less than the number of CPUs.
         """
         if max_processes:
             validate_min('max_processes', max_processes, 1)
@@ -74,6 +96,8 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
             if k in self._OPTIONS:
                 self._options[k] = v
         self._max_processes = max_processes
+        self._target_value = target_value
+        self._executor = executor
 
     def get_support_level(self):
         """ return support level dictionary """
@@ -83,29 +107,25 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
             'initial_point': OptimizerSupportLevel.required
         }
 
+    def __getstate__(self):
+        # the executor belongs to the process which created it
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
     def optimize(self, num_vars, objective_function, gradient_function=None,
                  variable_bounds=None, initial_point=None):
-        num_procs = multiprocessing.cpu_count() - 1
+        if self._executor is not None:
+            num_procs = self._executor.num_processes
+        else:
+            num_procs = multiprocessing.cpu_count() - 1
         num_procs = \
             num_procs if self._max_processes is None else min(num_procs, self._max_processes)
         num_procs = num_procs if num_procs >= 0 else 0
-
-        if platform.system() == 'Darwin':
-            # Changed in version 3.8: On macOS, the spawn start method is now the
-            # default. The fork start method should be considered unsafe as it can
-            # lead to crashes.
-            # However P_BFGS doesn't support spawn, so we revert to single process.
-            major, minor, _ = platform.python_version_tuple()
-            if major > '3' or (major == '3' and minor >= '8'):
-                num_procs = 0
-                logger.warning("For MacOS, python >= 3.8, using only current process. "
-                               "Multiple core use not supported.")
-        elif platform.system() == 'Windows':
+        if num_procs > 0 and os.getenv('QISKIT_IN_PARALLEL', 'FALSE') != 'FALSE':
             num_procs = 0
-            logger.warning("For Windows, using only current process. "
-                           "Multiple core use not supported.")
+            logger.debug('Already running in parallel, using only current process.')
 
-        queue = multiprocessing.Queue()
         # bounds for additional initial points in case bounds has any None values
         threshold = 2 * np.pi
         if variable_bounds is None:
@@ -113,22 +133,86 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
         low = [(l if l is not None else -threshold) for (l, u) in variable_bounds]
         high = [(u if u is not None else threshold) for (l, u) in variable_bounds]
 
+        if num_procs > 0:
+            key = self._register(num_vars, objective_function, gradient_function,
+                                 variable_bounds)
+            if key is None:
+                return self._optimize_forked(num_procs, low, high, num_vars, objective_function,
+                                             gradient_function, variable_bounds, initial_point)
+            try:
+                return self._optimize_executor(key, num_procs, low, high, num_vars,
+                                               objective_function, gradient_function,
+                                               variable_bounds, initial_point)
+            finally:
+                # the functions are sent again in the next call, as their state may change
+                self._executor.unregister(key)
+
+        return self._optimize(num_vars, objective_function, gradient_function,
+                              variable_bounds, initial_point)
+
+    def _register(self, num_vars, objective_function, gradient_function, variable_bounds):
+        """Sends the problem to the processes of the executor.
+
+        Returns:
+            The key of the problem in the executor, or None if it can not be pickled.
+        """
+        if self._executor is None:
+            self._executor = MultiStartExecutor(num_processes=multiprocessing.cpu_count() - 1)
+        try:
+            return self._executor.register(L_BFGS_B(**self._options), num_vars,
+                                           objective_function, gradient_function,
+                                           variable_bounds)
+        except (pickle.PicklingError, AttributeError, TypeError) as ex:
+            logger.warning('The objective function can not be passed to the processes of the '
+                           'executor: %s', ex)
+            return None
+
+    def _optimize_executor(self, key, num_procs, low, high, num_vars, objective_function,
+                           gradient_function, variable_bounds, initial_point):
+        # Another random point in bounds for each process
+        initial_points = [aqua_globals.random.uniform(low, high) for _ in range(num_procs)]
+        results = self._executor.run(key, initial_points, self._target_value)
+
+        # While the one _optimize in this process below runs the other processes will
+        # be running to. This one runs
+        # with the supplied initial point. The process ones have their own random one
+        sol, opt, nfev = self._optimize(num_vars, objective_function,
+                                        gradient_function, variable_bounds, initial_point)
+        if self._target_value is not None and opt <= self._target_value:
+            # cancel the optimizations from the random points
+            results.cancel()
+        # see for each other process, as it finishes, if it has a better result than above
+        for _, (p_sol, p_opt, p_nfev) in results:
+            if p_sol is not None and p_opt < opt:
+                sol, opt = p_sol, p_opt
+            nfev += p_nfev
+
+        return sol, opt, nfev
+
+    def _optimize_forked(self, num_procs, low, high, num_vars, objective_function,
+                         gradient_function, variable_bounds, initial_point):
+        if not _fork_is_safe():
+            logger.warning('Using only current process, since the objective function can not '
+                           'be pickled and the fork start method is not safe on this platform.')
+            return self._optimize(num_vars, objective_function, gradient_function,
+                                  variable_bounds, initial_point)
+        logger.warning('Optimizing the random points in forked processes.')
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+
         def optimize_runner(_queue, _i_pt):  # Multi-process sampling
             _sol, _opt, _nfev = self._optimize(num_vars, objective_function,
                                                gradient_function, variable_bounds, _i_pt)
             _queue.put((_sol, _opt, _nfev))
 
-        # Start off as many other processes running the optimize (can be 0)
+        # Start off as many other processes running the optimize
         processes = []
         for _ in range(num_procs):
             i_pt = aqua_globals.random.uniform(low, high)  # Another random point in bounds
-            proc = multiprocessing.Process(target=optimize_runner, args=(queue, i_pt))
+            proc = context.Process(target=optimize_runner, args=(queue, i_pt))
             processes.append(proc)
             proc.start()
 
-        # While the one _optimize in this process below runs the other processes will
-        # be running to. This one runs
-        # with the supplied initial point. The process ones have their own random one
         sol, opt, nfev = self._optimize(num_vars, objective_function,
                                         gradient_function, variable_bounds, initial_point)
 
@@ -154,3 +238,13 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
                                               fprime=gradient_function,
                                               approx_grad=approx_grad, **self._options)
         return sol, opt, info['funcalls']
+
+
+def _fork_is_safe() -> bool:
+    """Returns whether processes can be forked, which is not possible on Windows, and
+    considered unsafe on macOS since Python 3.8, as it can lead to crashes."""
+    if platform.system() == 'Windows':
+        return False
+    if platform.system() == 'Darwin' and sys.version_info >= (3, 8):
+        return False
+    return 'fork' in multiprocessing.get_all_start_methods()
@@ -13,13 +13,13 @@
 """Simultaneous Perturbation Stochastic Approximation optimizer."""
 
 import warnings
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 import logging
 
 import numpy as np
 
 from qiskit.aqua import aqua_globals
-from qiskit.aqua.utils.validation import validate_min
+from qiskit.aqua.utils.validation import validate_min, validate_range_exclusive_min
 from .optimizer import Optimizer, OptimizerSupportLevel
 
 logger = logging.getLogger(__name__)
@@ -53,6 +53,15 @@ class SPSA(Optimizer):
     The optimization process includes a calibration phase, which requires additional
     functional evaluations.
 
+    The gradient can be estimated from several perturbations per iteration, set by
+    ``resamplings``, which reduces the variance of the estimate. The second-order variant
+    (2-SPSA) additionally estimates the Hessian from two more evaluations per perturbation,
+    averages these estimates over the iterations and uses the result as a preconditioner of
+    the gradient. All evaluations of an iteration, and of the calibration, are independent,
+    so if grouped evaluations are enabled, e.g. with the ``max_evals_grouped`` option of
+    :class:`~qiskit.aqua.algorithms.VQE`, they are submitted in as few objective function
+    calls as possible.
+
     For further details, please refer to https://arxiv.org/pdf/1704.05018v2.pdf#section*.11
     (Supplementary information Section IV.)
     """
@@ -71,7 +80,10 @@ class SPSA(Optimizer):
                  c3: float = 0.101,
                  c4: float = 0,
                  skip_calibration: bool = False,
-                 max_trials: Optional[int] = None) -> None:
+                 max_trials: Optional[int] = None,
+                 resamplings: int = 1,
+                 second_order: bool = False,
+                 regularization: float = 0.01) -> None:
         """
         Args:
             maxiter: Maximum number of iterations to perform.
@@ -85,9 +97,18 @@ class SPSA(Optimizer):
             c4: The parameter used to control a as well.
             skip_calibration: Skip calibration and use provided c(s) as is.
             max_trials: Deprecated, use maxiter.
+            resamplings: The number of random perturbations per iteration, whose gradient
+                estimates are averaged. It has a min. value of 1.
+            second_order: If True, use the second-order variant 2-SPSA, which preconditions
+                the gradient with a smoothed estimate of the Hessian.
+            regularization: The value added to the absolute eigenvalues of the Hessian
+                estimate of 2-SPSA, to keep it positive definite and well conditioned.
+                Larger values are more robust for noisy objective functions. Must be positive.
         """
         validate_min('save_steps', save_steps, 1)
         validate_min('last_avg', last_avg, 1)
+        validate_min('resamplings', resamplings, 1)
+        validate_range_exclusive_min('regularization', regularization, 0, np.inf)
         super().__init__()
         if max_trials is not None:
             warnings.warn('The max_trials parameter is deprecated as of '
@@ -101,6 +122,9 @@ class SPSA(Optimizer):
         self._maxiter = maxiter
         self._parameters = np.array([c0, c1, c2, c3, c4])
         self._skip_calibration = skip_calibration
+        self._resamplings = resamplings
+        self._second_order = second_order
+        self._regularization = regularization
 
     def get_support_level(self):
         """ return support level dictionary """
@@ -119,16 +143,20 @@ class SPSA(Optimizer):
             initial_point = np.asarray(initial_point)
 
         logger.debug('Parameters: %s', self._parameters)
+        hessian, hessian_samples = None, 1
         if not self._skip_calibration:
             # at least one calibration, at most 25 calibrations
             num_steps_calibration = min(25, max(1, self._maxiter // 5))
-            self._calibration(objective_function, initial_point, num_steps_calibration)
+            hessian = self._calibration(objective_function, initial_point, num_steps_calibration)
+            hessian_samples = num_steps_calibration
         else:
             logger.debug('Skipping calibration, parameters used as provided.')
 
         opt, sol, _, _, _, _ = self._optimization(objective_function,
                                                   initial_point,
                                                   maxiter=self._maxiter,
+                                                  initial_hessian=hessian,
+                                                  hessian_samples=hessian_samples,
                                                   **self._options)
         return sol, opt, None
 
@@ -137,7 +165,9 @@ class SPSA(Optimizer):
                       initial_theta: np.ndarray,
                       maxiter: int,
                       save_steps: int = 1,
-                      last_avg: int = 1) -> List:
+                      last_avg: int = 1,
+                      initial_hessian: Optional[np.ndarray] = None,
+                      hessian_samples: int = 1) -> List:
         """Minimizes obj_fun(theta) with a simultaneous perturbation stochastic
         approximation algorithm.
 
@@ -150,19 +180,23 @@ class SPSA(Optimizer):
                 trial steps
             last_avg: number of last updates of the variables to average
                 on for the final obj_fun
+            initial_hessian: the initial value of the smoothed Hessian of 2-SPSA,
+                the identity if None
+            hessian_samples: the number of estimates averaged in initial_hessian, which
+                is its weight in the running average of the Hessian estimates
         Returns:
             a list with the following elements:
                 cost_final : final optimized value for obj_fun
                 theta_best : final values of the variables corresponding to
                     cost_final
                 cost_plus_save : array of stored values for obj_fun along the
-                    optimization in the + direction
+                    optimization in the + direction, averaged over the resamplings
                 cost_minus_save : array of stored values for obj_fun along the
-                    optimization in the - direction
+                    optimization in the - direction, averaged over the resamplings
                 theta_plus_save : array of stored variables of obj_fun along the
-                    optimization in the + direction
+                    optimization in the + direction of the first resampling
                 theta_minus_save : array of stored variables of obj_fun along the
-                    optimization in the - direction
+                    optimization in the - direction of the first resampling
         """
 
         theta_plus_save = []
@@ -171,25 +205,31 @@ class SPSA(Optimizer):
         cost_minus_save = []
         theta = initial_theta
         theta_best = np.zeros(initial_theta.shape)
+        hessian = np.identity(len(initial_theta)) if initial_hessian is None else initial_hessian
         for k in range(maxiter):
             # SPSA Parameters
             a_spsa = float(self._parameters[0]) / np.power(k + 1 + self._parameters[4],
                                                            self._parameters[2])
             c_spsa = float(self._parameters[1]) / np.power(k + 1, self._parameters[3])
-            delta = 2 * aqua_globals.random.integers(2, size=np.shape(initial_theta)[0]) - 1
-            # plus and minus directions
-            theta_plus = theta + c_spsa * delta
-            theta_minus = theta - c_spsa * delta
-            # cost function for the two directions
-            if self._max_evals_grouped > 1:
-                cost_plus, cost_minus = obj_fun(np.concatenate((theta_plus, theta_minus)))
-            else:
-                cost_plus = obj_fun(theta_plus)
-                cost_minus = obj_fun(theta_minus)
+            deltas, deltas2 = self._sample_perturbations(len(initial_theta), self._resamplings)
+            # cost function for the plus and minus directions of all perturbations
+            points = self._perturbation_points(theta, c_spsa, deltas, deltas2)
+            costs = self.evaluate_grouped(points, obj_fun, self._max_evals_grouped)
+            costs = costs.reshape(self._resamplings, -1)
+            cost_plus = np.mean(costs[:, 0])
+            cost_minus = np.mean(costs[:, 1])
             # derivative estimate
-            g_spsa = (cost_plus - cost_minus) * delta / (2.0 * c_spsa)
+            g_spsa = np.dot(costs[:, 0] - costs[:, 1], deltas) / (2.0 * c_spsa * len(deltas))
+            if self._second_order:
+                # running average of the Hessian estimates
+                hessian_estimate = self._hessian_estimate(costs, c_spsa, deltas, deltas2)
+                hessian = (hessian * (k + hessian_samples) + hessian_estimate) \
+                    / (k + hessian_samples + 1)
+                g_spsa = self._precondition(hessian, g_spsa)
             # updated theta
             theta = theta - a_spsa * g_spsa
+            theta_plus = points[0]
+            theta_minus = points[1]
             # saving
             if k % save_steps == 0:
                 logger.debug('Objective function at theta+ for step # %s: %1.7f', k, cost_plus)
@@ -225,26 +265,104 @@ class SPSA(Optimizer):
             obj_fun: the function to minimize.
             initial_theta: initial value for the variables of obj_fun.
             stat: number of random gradient directions to average on in the calibration.
+
+        Returns:
+            The average of the Hessian estimates in the random directions if the second-order
+            variant is used, otherwise None.
         """
 
         target_update = self._parameters[0]
         initial_c = self._parameters[1]
-        delta_obj = 0
         logger.debug("Calibration...")
-        for i in range(stat):
-            if i % 5 == 0:
-                logger.debug('calibration step # %s of %s', str(i), str(stat))
-            delta = 2 * aqua_globals.random.integers(2, size=np.shape(initial_theta)[0]) - 1
-            theta_plus = initial_theta + initial_c * delta
-            theta_minus = initial_theta - initial_c * delta
-            if self._max_evals_grouped > 1:
-                obj_plus, obj_minus = obj_fun(np.concatenate((theta_plus, theta_minus)))
-            else:
-                obj_plus = obj_fun(theta_plus)
-                obj_minus = obj_fun(theta_minus)
-            delta_obj += np.absolute(obj_plus - obj_minus) / stat
-
-        self._parameters[0] = target_update * 2 / delta_obj \
-            * self._parameters[1] * (self._parameters[4] + 1)
+        deltas, deltas2 = self._sample_perturbations(len(initial_theta), stat)
+        points = self._perturbation_points(initial_theta, initial_c, deltas, deltas2)
+        obj = self.evaluate_grouped(points, obj_fun, self._max_evals_grouped)
+        obj = obj.reshape(stat, -1)
+        hessian = None
+        if self._second_order:
+            # aim at the average size of the preconditioned update of a variable instead
+            hessian = self._hessian_estimate(obj, initial_c, deltas, deltas2)
+            gradients = (obj[:, 0] - obj[:, 1])[:, None] * deltas / (2.0 * initial_c)
+            updates = self._precondition(hessian, gradients.T)
+            self._parameters[0] = target_update / np.mean(np.absolute(updates)) \
+                * (self._parameters[4] + 1)
+        else:
+            delta_obj = 0
+            for obj_plus, obj_minus in obj:
+                delta_obj += np.absolute(obj_plus - obj_minus) / stat
+
+            self._parameters[0] = target_update * 2 / delta_obj \
+                * self._parameters[1] * (self._parameters[4] + 1)
 
         logger.debug('Calibrated SPSA parameter c0 is %.7f', self._parameters[0])
+
+        return hessian
+
+    def _sample_perturbations(self, num_vars: int,
+                              num_samples: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Draws the random perturbations of the gradient, and of the Hessian for 2-SPSA.
+
+        Args:
+            num_vars: the number of variables.
+            num_samples: the number of perturbations.
+
+        Returns:
+            The (num_samples, num_vars) arrays of the +-1 perturbations of the gradient
+            and of the Hessian, the latter None if the first-order variant is used.
+        """
+        deltas = []
+        deltas2 = []
+        for _ in range(num_samples):
+            deltas.append(2 * aqua_globals.random.integers(2, size=num_vars) - 1)
+            if self._second_order:
+                deltas2.append(2 * aqua_globals.random.integers(2, size=num_vars) - 1)
+        if not self._second_order:
+            return np.array(deltas), None
+        return np.array(deltas), np.array(deltas2)
+
+    @staticmethod
+    def _perturbation_points(theta: np.ndarray, c_spsa: float, deltas: np.ndarray,
+                             deltas2: Optional[np.ndarray]) -> np.ndarray:
+        """Returns the points at which the objective function is evaluated.
+
+        For every perturbation delta, these are theta + c * delta and theta - c * delta,
+        followed by both points shifted by c * delta2 for 2-SPSA.
+        """
+        plus = theta + c_spsa * deltas
+        minus = theta - c_spsa * deltas
+        if deltas2 is None:
+            points = np.stack((plus, minus), axis=1)
+        else:
+            points = np.stack((plus, minus,
+                               plus + c_spsa * deltas2, minus + c_spsa * deltas2), axis=1)
+        return points.reshape(-1, len(theta))
+
+    @staticmethod
+    def _hessian_estimate(costs: np.ndarray, c_spsa: float, deltas: np.ndarray,
+                          deltas2: np.ndarray) -> np.ndarray:
+        """Returns the symmetrized Hessian estimate of 2-SPSA, averaged over the perturbations.
+
+        Args:
+            costs: the (num_samples, 4) objective values at the points of
+                :meth:`_perturbation_points`.
+            c_spsa: the perturbation step size.
+            deltas: the perturbations of the gradient.
+            deltas2: the perturbations of the Hessian.
+
+        Returns:
+            The Hessian estimate.
+        """
+        diffs = (costs[:, 2] - costs[:, 0]) - (costs[:, 3] - costs[:, 1])
+        estimate = np.einsum('k,ki,kj->ij', diffs, deltas, deltas2)
+        return (estimate + estimate.T) / (4 * c_spsa ** 2 * len(diffs))
+
+    def _precondition(self, hessian: np.ndarray, gradient: np.ndarray) -> np.ndarray:
+        """Solves the system of the regularized absolute value of the Hessian and the gradient,
+        or the columns of gradients.
+
+        Taking the absolute value of the eigenvalues makes the symmetric Hessian estimate
+        positive semi-definite, such that the update is a descent direction.
+        """
+        eigenvalues, eigenvectors = np.linalg.eigh(hessian)
+        eigenvalues = np.absolute(eigenvalues) + self._regularization
+        return np.linalg.solve(np.dot(eigenvectors * eigenvalues, eigenvectors.T), gradient)
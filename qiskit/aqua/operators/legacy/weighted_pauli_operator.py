@@ -12,7 +12,7 @@
 
 """ Weighted Pauli Operator """
 
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from copy import deepcopy
 import itertools
 import logging
@@ -369,20 +369,20 @@ class WeightedPauliOperator(LegacyBaseOperator):
         # pauli and tpb grouped pauli
         # should have a better way to rebuild the basis here.
         new_basis = []
+        new_basis_table = {}  # type: Dict[Tuple[bytes, bytes], int]
         for basis, indices in op.basis:
             new_indices = []
             found = False
-            if new_basis:
-                for b, ind in new_basis:
-                    if b == basis:
-                        new_indices = ind
-                        found = True
-                        break
+            basis_label = (basis.z.tobytes(), basis.x.tobytes())
+            if basis_label in new_basis_table:
+                new_indices = new_basis[new_basis_table[basis_label]][1]
+                found = True
             for idx in indices:
                 new_idx = old_to_new_indices[idx]
                 if new_idx is not None and new_idx not in new_indices:
                     new_indices.append(new_idx)
             if new_indices and not found:
+                new_basis_table[basis_label] = len(new_basis)
                 new_basis.append((basis, new_indices))
         op._basis = new_basis
         op.chop(0.0)
@@ -449,9 +449,11 @@ class WeightedPauliOperator(LegacyBaseOperator):
                 curr_idx += 1
                 paulis.append([new_weight, pauli])
 
+        # the table is only rebuilt if paulis were removed
+        if op._paulis_table is None or len(paulis) < len(op._paulis):
+            op._paulis_table = \
+                {weighted_pauli[1].to_label(): i for i, weighted_pauli in enumerate(paulis)}
         op._paulis = paulis
-        op._paulis_table = \
-            {weighted_pauli[1].to_label(): i for i, weighted_pauli in enumerate(paulis)}
         # update the grouping info, since this method only remove pauli,
         # we can handle it here for both
         # pauli and tpb grouped pauli
@@ -843,6 +845,8 @@ class WeightedPauliOperator(LegacyBaseOperator):
             curr_count += len(sub_paulis)
 
         self._paulis = paulis
+        self._paulis_table = \
+            {weighted_pauli[1].to_label(): i for i, weighted_pauli in enumerate(paulis)}
         self._basis = new_basis
 
         return self._paulis
@@ -16,10 +16,10 @@ Convert portfolio optimization instances into Pauli list
 
 import numpy as np
 from sklearn.datasets import make_spd_matrix
-from qiskit.quantum_info import Pauli
 
 from qiskit.aqua import aqua_globals
-from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.optimization import QuadraticProgram
+from qiskit.optimization.applications.ising.common import ising_to_operator
 
 
 def random_model(n, seed=None):
@@ -51,37 +51,57 @@ def get_operator(mu, sigma, q, budget, penalty):  # pylint: disable=invalid-name
     # pylint: disable=invalid-name
     # get problem dimension
     n = len(mu)
-    e = np.ones(n)
-    E = np.matmul(np.asmatrix(e).T, np.asmatrix(e))
+    mu = np.asarray(mu, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    sigma_e = sigma.sum(axis=1)
 
     # map problem to Ising model
-    offset = -1 * np.dot(mu, e) / 2 + penalty * budget ** 2 - \
-        budget * n * penalty + n ** 2 * penalty / 4 + q / 4 * np.dot(e, np.dot(sigma, e))
-    mu_z = mu / 2 + budget * penalty * e - n * penalty / 2 * e - q / 2 * np.dot(sigma, e)
-    sigma_z = penalty / 4 * E + q / 4 * sigma
-
-    # construct operator
-    pauli_list = []
-    for i in range(n):
-        i_ = i
-        # i_ = n - i - 1
-        if np.abs(mu_z[i_]) > 1e-6:
-            xp = np.zeros(n, dtype=np.bool)
-            zp = np.zeros(n, dtype=np.bool)
-            zp[i_] = True
-            pauli_list.append([mu_z[i_], Pauli(zp, xp)])
-        for j in range(i):
-            j_ = j
-            # j_ = n-j-1
-            if np.abs(sigma_z[i_, j_]) > 1e-6:
-                xp = np.zeros(n, dtype=np.bool)
-                zp = np.zeros(n, dtype=np.bool)
-                zp[i_] = True
-                zp[j_] = True
-                pauli_list.append([2 * sigma_z[i_, j_], Pauli(zp, xp)])
-        offset += sigma_z[i_, i_]
-
-    return WeightedPauliOperator(paulis=pauli_list), offset
+    offset = -1 * np.sum(mu) / 2 + penalty * budget ** 2 - \
+        budget * n * penalty + n ** 2 * penalty / 4 + q / 4 * np.sum(sigma)
+    mu_z = mu / 2 + budget * penalty - n * penalty / 2 - q / 2 * sigma_e
+    sigma_z = penalty / 4 + q / 4 * sigma
+
+    # construct operator, dropping negligible terms
+    linear = np.where(np.abs(mu_z) > 1e-6, mu_z, 0)
+    quadratic = np.tril(sigma_z, k=-1)
+    quadratic[np.abs(quadratic) <= 1e-6] = 0
+    qubit_op, _ = ising_to_operator(linear, 2 * quadratic)
+
+    return qubit_op, offset + np.trace(sigma_z)
+
+
+def get_quadratic_program(mu, sigma, q, budget, penalty=None):  # pylint: disable=invalid-name
+    """Generate the quadratic program of the portfolio optimization problem.
+
+    The program minimizes ``q * x^T sigma x - mu^T x`` over the binary selection ``x`` of
+    the assets, such that ``budget`` assets are selected.
+
+    Args:
+        mu (numpy.ndarray): expected return vector.
+        sigma (numpy.ndarray): covariance matrix.
+        q (float): risk factor.
+        budget (int): number of assets to select.
+        penalty (float or None): if None, the budget is a linear equality constraint.
+            Otherwise, the budget is added to the objective as ``penalty * (sum(x) - budget)^2``,
+            such that the program is the QUBO of :func:`get_operator`.
+
+    Returns:
+        QuadraticProgram: the portfolio optimization problem.
+    """
+    # pylint: disable=invalid-name
+    n = len(mu)
+    mu = np.asarray(mu, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+
+    qp = QuadraticProgram('portfolio')
+    qp.binary_var_list(n)
+    if penalty is None:
+        qp.minimize(linear=-mu, quadratic=q * sigma)
+        qp.linear_constraint(linear=np.ones(n), sense='==', rhs=budget, name='budget')
+    else:
+        qp.minimize(constant=penalty * budget ** 2, linear=-mu - 2 * penalty * budget,
+                    quadratic=q * sigma + penalty)
+    return qp
 
 
 def portfolio_value(x, mu, sigma, q, budget, penalty):  # pylint: disable=invalid-name
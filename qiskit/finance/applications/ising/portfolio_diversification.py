@@ -12,11 +12,15 @@
 
 """ portfolio diversification """
 
+from typing import Tuple
+
 import numpy as np
 from qiskit.quantum_info import Pauli
 
 from qiskit.aqua.algorithms import MinimumEigensolverResult
 from qiskit.aqua.operators import WeightedPauliOperator, StateFn
+from qiskit.optimization import QuadraticProgram
+from qiskit.optimization.applications.ising.common import ising_to_operator
 
 # pylint: disable=invalid-name
 
@@ -34,95 +38,88 @@ def get_operator(rho: np.ndarray, n: int, q: int) -> WeightedPauliOperator:
     """
     # N = (n + 1) * n  # number of qubits
     N = n**2 + n
+    Q, g, c = _get_qubo_matrices(rho, n, q)
 
-    A = np.max(np.abs(rho)) * 1000  # A parameter of cost function
+    # Defining the new matrices in the Z-basis
 
-    # Determine the weights w
-    instance_vec = rho.reshape(n ** 2)
+    Qz = Q / 4
+    gz = -g / 2 - Qz.sum(axis=0) - Qz.sum(axis=1)
+    cz = c + np.sum(g) / 2 + np.sum(Qz)
 
-    # quadratic term Q
-    q0 = np.zeros([N, 1])
-    Q1 = np.zeros([N, N])
-    Q2 = np.zeros([N, N])
-    Q3 = np.zeros([N, N])
-
-    for x in range(n ** 2, n ** 2 + n):
-        q0[x] = 1
-
-    Q0 = A * np.dot(q0, q0.T)
-    for ii in range(0, n):
-        v0 = np.zeros([N, 1])
-        for jj in range(n * ii, n * (ii + 1)):
-            v0[jj] = 1
-        Q1 = Q1 + np.dot(v0, v0.T)
-    Q1 = A * Q1
-
-    for jj in range(0, n):
-        v0 = np.zeros([N, 1])
-        v0[n * jj + jj] = 1
-        v0[n ** 2 + jj] = -1
-        Q2 = Q2 + np.dot(v0, v0.T)
-    Q2 = A * Q2
-
-    for ii in range(0, n):
-        for jj in range(0, n):
-            Q3[ii * n + jj, n ** 2 + jj] = -0.5
-            Q3[n ** 2 + jj, ii * n + jj] = -0.5
-
-    Q3 = A * Q3
-
-    Q = Q0 + Q1 + Q2 + Q3
-
-    # linear term c:
-    c0 = np.zeros(N)
-    c1 = np.zeros(N)
-    c2 = np.zeros(N)
-    c3 = np.zeros(N)
-
-    for x in range(n ** 2):
-        c0[x] = instance_vec[x]
-    for x in range(n ** 2, n ** 2 + n):
-        c1[x] = -2 * A * q
-    for x in range(n ** 2):
-        c2[x] = -2 * A
-    for x in range(n ** 2):
-        c3[x] = A
-
-    g = c0 + c1 + c2 + c3
-
-    # constant term r
-    c = A * (q ** 2 + n)
+    # Getting the Hamiltonian in the form of a list of Pauli terms
+    qubit_op, constant = ising_to_operator(gz, Qz)
+    qubit_op += WeightedPauliOperator(paulis=[[cz + constant, Pauli(np.zeros(N), np.zeros(N))]])
+    return qubit_op
 
-    # Defining the new matrices in the Z-basis
 
-    Iv = np.ones(N)
-    Qz = (Q / 4)
-    gz = (-g / 2 - np.dot(Iv, Q / 4) - np.dot(Q / 4, Iv))
-    cz = (c + np.dot(g / 2, Iv) + np.dot(Iv, np.dot(Q / 4, Iv)))
+def get_quadratic_program(rho: np.ndarray, n: int, q: int) -> QuadraticProgram:
+    """Converts an instance of portfolio diversification into a quadratic program.
 
-    cz = cz + np.trace(Qz)
-    Qz = Qz - np.diag(np.diag(Qz))
+    The binary variable ``x_i_j`` indicates that asset ``i`` is represented by asset ``j``,
+    and ``y_j`` that asset ``j`` is a representative. The constraints are included as
+    penalties, such that the program is the QUBO of :func:`get_operator`.
+
+    Args:
+        rho: an asset-to-asset similarity matrix, such as the covariance matrix.
+        n: the number of assets.
+        q: the number of clusters of assets to output.
+
+    Returns:
+        the quadratic program.
+    """
+    Q, g, c = _get_qubo_matrices(rho, n, q)
+    qp = QuadraticProgram('portfolio_diversification')
+    qp.binary_var_list(['x_{}_{}'.format(i, j) for i in range(n) for j in range(n)], name='')
+    qp.binary_var_list(n, name='y_')
+    qp.minimize(constant=c, linear=g, quadratic=Q)
+    return qp
 
-    # Getting the Hamiltonian in the form of a list of Pauli terms
 
-    pauli_list = []
-    for i in range(N):
-        if gz[i] != 0:
-            wp = np.zeros(N)
-            vp = np.zeros(N)
-            vp[i] = 1
-            pauli_list.append((gz[i], Pauli(vp, wp)))
-    for i in range(N):
-        for j in range(i):
-            if Qz[i, j] != 0:
-                wp = np.zeros(N)
-                vp = np.zeros(N)
-                vp[i] = 1
-                vp[j] = 1
-                pauli_list.append((2 * Qz[i, j], Pauli(vp, wp)))
-
-    pauli_list.append((cz, Pauli(np.zeros(N), np.zeros(N))))
-    return WeightedPauliOperator(paulis=pauli_list)
+def _get_qubo_matrices(rho: np.ndarray, n: int, q: int) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Constructs the quadratic and linear coefficients and the constant of the QUBO.
+
+    Args:
+        rho: an asset-to-asset similarity matrix, such as the covariance matrix.
+        n: the number of assets.
+        q: the number of clusters of assets to output.
+
+    Returns:
+        the quadratic matrix, the linear vector and the constant.
+    """
+    # N = (n + 1) * n  # number of qubits
+    N = n ** 2 + n
+
+    A = np.max(np.abs(rho)) * 1000  # A parameter of cost function
+
+    # the variable x_ij has the index i * n + j, and y_j the index n ** 2 + j
+    x_ij = np.arange(n ** 2)
+    x_jj = np.arange(n) * (n + 1)
+    y_j = n ** 2 + np.arange(n)
+
+    # quadratic term Q
+    Q = np.zeros([N, N])
+    # (sum_j y_j)^2
+    Q[n ** 2:, n ** 2:] = A
+    # sum_i (sum_j x_ij)^2
+    Q[:n ** 2, :n ** 2] = A * np.kron(np.eye(n), np.ones([n, n]))
+    # sum_j (x_jj - y_j)^2
+    Q[x_jj, x_jj] += A
+    Q[y_j, y_j] += A
+    Q[x_jj, y_j] -= A
+    Q[y_j, x_jj] -= A
+    # - sum_ij x_ij y_j
+    Q[x_ij, n ** 2 + x_ij % n] -= 0.5 * A
+    Q[n ** 2 + x_ij % n, x_ij] -= 0.5 * A
+
+    # linear term g
+    g = np.zeros(N)
+    g[:n ** 2] = np.asarray(rho).reshape(n ** 2) - A
+    g[n ** 2:] = -2 * A * q
+
+    # constant term c
+    c = A * (q ** 2 + n)
+
+    return Q, g, c
 
 
 def get_portfoliodiversification_solution(rho: np.ndarray,
@@ -185,66 +182,7 @@ def get_portfoliodiversification_value(rho: np.ndarray,
         cost of the solution.
     """
     # pylint: disable=invalid-name
-    # N = (n + 1) * n  # number of qubits
-    N = n ** 2 + n
-
-    A = np.max(np.abs(rho)) * 1000  # A parameter of cost function
-
-    # Determine the weights w
-    instance_vec = rho.reshape(n ** 2)
-
-    # quadratic term Q
-    q0 = np.zeros([N, 1])
-    Q1 = np.zeros([N, N])
-    Q2 = np.zeros([N, N])
-    Q3 = np.zeros([N, N])
-
-    for x in range(n ** 2, n ** 2 + n):
-        q0[x] = 1
-
-    Q0 = A * np.dot(q0, q0.T)
-    for ii in range(0, n):
-        v0 = np.zeros([N, 1])
-        for jj in range(n * ii, n * (ii + 1)):
-            v0[jj] = 1
-        Q1 = Q1 + np.dot(v0, v0.T)
-    Q1 = A * Q1
-
-    for jj in range(0, n):
-        v0 = np.zeros([N, 1])
-        v0[n * jj + jj] = 1
-        v0[n ** 2 + jj] = -1
-        Q2 = Q2 + np.dot(v0, v0.T)
-    Q2 = A * Q2
-
-    for ii in range(0, n):
-        for jj in range(0, n):
-            Q3[ii * n + jj, n ** 2 + jj] = -0.5
-            Q3[n ** 2 + jj, ii * n + jj] = -0.5
-
-    Q3 = A * Q3
-
-    Q = Q0 + Q1 + Q2 + Q3
-
-    # linear term c:
-    c0 = np.zeros(N)
-    c1 = np.zeros(N)
-    c2 = np.zeros(N)
-    c3 = np.zeros(N)
-
-    for x in range(n ** 2):
-        c0[x] = instance_vec[x]
-    for x in range(n ** 2, n ** 2 + n):
-        c1[x] = -2 * A * q
-    for x in range(n ** 2):
-        c2[x] = -2 * A
-    for x in range(n ** 2):
-        c3[x] = A
-
-    g = c0 + c1 + c2 + c3
-
-    # constant term r
-    c = A * (q ** 2 + n)
+    Q, g, c = _get_qubo_matrices(rho, n, q)
 
     # Evaluates the cost distance from a binary representation
     def fun(x):
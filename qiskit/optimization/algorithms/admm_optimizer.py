@@ -18,12 +18,14 @@ import warnings
 from typing import List, Optional, Tuple
 
 import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix, diags
 from qiskit.aqua.algorithms import NumPyMinimumEigensolver
 
 from .minimum_eigen_optimizer import MinimumEigenOptimizer
 from .optimization_algorithm import (OptimizationResultStatus, OptimizationAlgorithm,
                                      OptimizationResult)
 from .slsqp_optimizer import SlsqpOptimizer
+from ..converters.quadratic_program_converter import QuadraticProgramConverter
 from ..problems.constraint import Constraint
 from ..problems.linear_constraint import LinearConstraint
 from ..problems.quadratic_objective import QuadraticObjective
@@ -146,6 +148,22 @@ class ADMMState:
         # constraints
         self.a0 = None  # type: Optional[np.ndarray]
         self.b0 = None  # type: Optional[np.ndarray]
+        # the objective as upper triangular quadratic, linear and constant part
+        self.quadratic = None  # type: Optional[csr_matrix]
+        self.linear = None  # type: Optional[np.ndarray]
+        self.constant = 0.0
+        # linear constraints as A x - b, equalities and inequalities with A x - b <= 0
+        self.eq_matrix = None  # type: Optional[csr_matrix]
+        self.eq_rhs = None  # type: Optional[np.ndarray]
+        self.ineq_matrix = None  # type: Optional[csr_matrix]
+        self.ineq_rhs = None  # type: Optional[np.ndarray]
+
+        # the sub-problems of step 1 and 2 are created once and their coefficients are updated
+        # in each iteration
+        self.op1 = None  # type: Optional[QuadraticProgram]
+        self.op2 = None  # type: Optional[QuadraticProgram]
+        self.op2_quadratic = None  # type: Optional[csr_matrix]
+        self.op2_linear = None  # type: Optional[np.ndarray]
 
         # These are the parameters that are updated in the ADMM iterations.
         self.u = np.zeros(op.get_num_continuous_vars())
@@ -281,7 +299,8 @@ class ADMMOptimizer(OptimizationAlgorithm):
         self._verify_compatibility(problem)
 
         # debug
-        self._log.debug("Initial problem: %s", problem.export_as_lp_string())
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("Initial problem: %s", problem.export_as_lp_string())
 
         # map integer variables to binary variables
         from ..converters.integer_to_binary import IntegerToBinary
@@ -319,7 +338,8 @@ class ADMMOptimizer(OptimizationAlgorithm):
                 op1 = self._create_step1_problem()
                 self._state.x0 = self._update_x0(op1)
                 # debug
-                self._log.debug("Step 1 sub-problem: %s", op1.export_as_lp_string())
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug("Step 1 sub-problem: %s", op1.export_as_lp_string())
             # else, no binary variables exist, and no update to be done in this case.
             # debug
             self._log.debug("x0=%s", self._state.x0)
@@ -327,16 +347,14 @@ class ADMMOptimizer(OptimizationAlgorithm):
             op2 = self._create_step2_problem()
             self._state.u, self._state.z = self._update_x1(op2)
             # debug
-            self._log.debug("Step 2 sub-problem: %s", op2.export_as_lp_string())
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug("Step 2 sub-problem: %s", op2.export_as_lp_string())
             self._log.debug("u=%s", self._state.u)
             self._log.debug("z=%s", self._state.z)
 
             if self._params.three_block:
                 if self._state.binary_indices:
-                    op3 = self._create_step3_problem()
-                    self._state.y = self._update_y(op3)
-                    # debug
-                    self._log.debug("Step 3 sub-problem: %s", op3.export_as_lp_string())
+                    self._state.y = self._update_y()
                 # debug
                 self._log.debug("y=%s", self._state.y)
 
@@ -460,23 +478,36 @@ class ADMMOptimizer(OptimizationAlgorithm):
 
     def _convert_problem_representation(self) -> None:
         """Converts problem representation into set of matrices and vectors."""
-        binary_var_indices = set(self._state.binary_indices)
+        op = self._state.op
+        self._state.quadratic, self._state.linear, self._state.constant = \
+            op.objective.to_arrays()
+        matrix, rhs = QuadraticProgramConverter._linear_constraints_to_arrays(op)
+
         # separate constraints
-        for l_constraint in self._state.op.linear_constraints:
+        binary_var_mask = np.zeros(op.get_num_vars(), dtype=bool)
+        binary_var_mask[self._state.binary_indices] = True
+        # verify that there are only binary variables in the constraint
+        # this is to build A0, b0 in step 1
+        binary_only = abs(matrix) @ (~binary_var_mask).astype(float) == 0
+        signs = np.zeros(len(rhs))
+        for i, l_constraint in enumerate(op.linear_constraints):
             if l_constraint.sense == Constraint.Sense.EQ:
                 self._state.equality_constraints.append(l_constraint)
-
-                # verify that there are only binary variables in the constraint
-                # this is to build A0, b0 in step 1
-                constraint_var_indices = set(l_constraint.linear.to_dict().keys())
-                if constraint_var_indices.issubset(binary_var_indices):
+                if binary_only[i]:
                     self._state.binary_equality_constraints.append(l_constraint)
-
             elif l_constraint.sense in (Constraint.Sense.LE, Constraint.Sense.GE):
                 self._state.inequality_constraints.append(l_constraint)
+                signs[i] = -1.0 if l_constraint.sense == Constraint.Sense.GE else 1.0
+
+        # linear constraints as arrays for the constraint residual
+        eq_rows = signs == 0
+        self._state.eq_matrix, self._state.eq_rhs = matrix[eq_rows], rhs[eq_rows]
+        self._state.ineq_matrix = csr_matrix(diags(signs[~eq_rows]) @ matrix[~eq_rows])
+        self._state.ineq_rhs = signs[~eq_rows] * rhs[~eq_rows]
+        binary_eq_rows = np.flatnonzero(eq_rows & binary_only)
 
         # separate quadratic constraints into eq and non-eq
-        for q_constraint in self._state.op.quadratic_constraints:
+        for q_constraint in op.quadratic_constraints:
             if q_constraint.sense == Constraint.Sense.EQ:
                 self._state.equality_constraints.append(q_constraint)
             elif q_constraint.sense in (Constraint.Sense.LE, Constraint.Sense.GE):
@@ -484,80 +515,49 @@ class ADMMOptimizer(OptimizationAlgorithm):
 
         # separately keep binary variables that are for step 1 only
         # temp variables are due to limit of 100 chars per line
-        step1_absolute_indices, step1_relative_indices = self._get_step1_indices()
+        step1_absolute_indices, step1_relative_indices = \
+            self._get_step1_indices(matrix[binary_eq_rows])
         self._state.step1_absolute_indices = step1_absolute_indices
         self._state.step1_relative_indices = step1_relative_indices
 
         # objective
         self._state.q0 = self._get_q(self._state.step1_absolute_indices)
-        c0_vec = self._state.op.objective.linear.to_array()[self._state.step1_absolute_indices]
-        self._state.c0 = c0_vec
+        self._state.c0 = self._state.linear[self._state.step1_absolute_indices]
         self._state.q1 = self._get_q(self._state.continuous_indices)
-        self._state.c1 = self._state.op.objective.linear.to_array()[self._state.continuous_indices]
+        self._state.c1 = self._state.linear[self._state.continuous_indices]
         # equality constraints with binary vars only
-        self._state.a0, self._state.b0 = self._get_a0_b0()
+        self._state.a0, self._state.b0 = self._get_a0_b0(matrix[binary_eq_rows],
+                                                         rhs[binary_eq_rows])
 
-    def _get_step1_indices(self) -> Tuple[List[int], List[int]]:
+    def _get_step1_indices(self, binary_eq_matrix: csr_matrix) -> Tuple[List[int], List[int]]:
         """
         Constructs two arrays of absolute (pointing to the original problem) and relative (pointing
         to the list of all binary variables) indices of the variables considered
         to be included in the step1(QUBO) problem.
 
+        Args:
+            binary_eq_matrix: The left-hand sides of the linear equality constraints with binary
+                variables only.
+
         Returns: A tuple of lists with absolute and relative indices
         """
-        # here we keep binary indices from the original problem
-        step1_absolute_indices = []
-
-        # iterate over binary variables and put all binary variables mentioned in the objective
-        # to the array for the step1
-        for binary_index in self._state.binary_indices:
-            # here we check if this binary variable present in the objective
-            # either in the linear or quadratic terms
-            if self._state.op.objective.linear[binary_index] != 0 or np.abs(
-                    self._state.op.objective.quadratic.coefficients[binary_index, :]).sum() != 0:
-                # add the variable if it was not added before
-                if binary_index not in step1_absolute_indices:
-                    step1_absolute_indices.append(binary_index)
-
-        # compute all unverified binary variables (the variables that are present in constraints
-        # but not in objective):
-        #   rest variables := all binary variables - already verified for step 1
-        rest_binary = set(self._state.binary_indices).difference(step1_absolute_indices)
-
-        # verify if an equality contains binary variables
-        for constraint in self._state.binary_equality_constraints:
-            for binary_index in list(rest_binary):
-                if constraint.linear[binary_index] > 0 \
-                        and binary_index not in step1_absolute_indices:
-                    # a binary variable with the binary_index is present in this constraint
-                    step1_absolute_indices.append(binary_index)
-
-        # we want to preserve order of the variables but this order could be broken by adding
-        # a variable in the previous for loop.
-        step1_absolute_indices.sort()
-
-        # compute relative indices, these indices are used when we generate step1 and
-        # update variables on step1.
+        binary_indices = np.asarray(self._state.binary_indices, dtype=int)
+
+        # put all binary variables mentioned in the objective, either in the linear or in the
+        # quadratic terms of their row, to the array for the step1
+        row_sums = np.asarray(abs(self._state.quadratic).sum(axis=1)).ravel()
+        in_step1 = (self._state.linear[binary_indices] != 0) | (row_sums[binary_indices] != 0)
+
+        # add the variables that are present in the equalities with binary variables only
+        if binary_eq_matrix.shape[0] > 0:
+            positive = np.asarray((binary_eq_matrix > 0).sum(axis=0)).ravel()
+            in_step1 |= positive[binary_indices] > 0
+
+        # relative indices are used when we generate step1 and update variables on step1.
         # on step1 we solve for a subset of all binary variables,
         # so we want to operate only these indices
-        step1_relative_indices = []
-        relative_index = 0
-        # for each binary variable that comes from lin.eq/obj and which is denoted by abs_index
-        for abs_index in step1_absolute_indices:
-            found = False
-            # we want to find relative index of a variable the comes from linear constraints
-            # or objective across all binary variables
-            for j in range(relative_index, len(self._state.binary_indices)):
-                if self._state.binary_indices[j] == abs_index:
-                    found = True
-                    relative_index = j
-                    break
-            if found:
-                step1_relative_indices.append(relative_index)
-            else:
-                raise ValueError("No relative index found!")
-
-        return step1_absolute_indices, step1_relative_indices
+        step1_relative_indices = np.flatnonzero(in_step1)
+        return binary_indices[step1_relative_indices].tolist(), step1_relative_indices.tolist()
 
     def _get_q(self, variable_indices: List[int]) -> np.ndarray:
         """Constructs a quadratic matrix for the variables with the specified indices
@@ -569,40 +569,25 @@ class ADMMOptimizer(OptimizationAlgorithm):
         Returns:
             A matrix as a numpy array of the shape(len(variable_indices), len(variable_indices)).
         """
-        size = len(variable_indices)
-        q = np.zeros(shape=(size, size))
-        # fill in the matrix
-        # in fact we use re-indexed variables
-        # we build upper triangular matrix to avoid doubling of the coefficients
-        for i in range(0, size):
-            for j in range(i, size):
-                q[i, j] = \
-                    self._state.op.objective.quadratic[variable_indices[i], variable_indices[j]]
-
-        return q
+        # the indices are sorted, so the sub-matrix is upper triangular as well and the
+        # coefficients are not doubled
+        return self._state.quadratic[variable_indices][:, variable_indices].toarray()
 
-    def _get_a0_b0(self) -> Tuple[np.ndarray, np.ndarray]:
+    def _get_a0_b0(self, matrix: csr_matrix, rhs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """Constructs a matrix and a vector from the constraints in a form of Ax = b, where
         x is a vector of binary variables.
 
+        Args:
+            matrix: The left-hand sides of the linear equality constraints with binary variables
+                only.
+            rhs: The right-hand sides of these constraints.
+
         Returns:
             Corresponding matrix and vector as numpy arrays.
-
-        Raises:
-            ValueError: if the problem is not suitable for this optimizer.
         """
-        matrix = []
-        vector = []
-
-        for constraint in self._state.binary_equality_constraints:
-            row = constraint.linear.to_array().take(self._state.step1_absolute_indices).tolist()
-
-            matrix.append(row)
-            vector.append(constraint.rhs)
-
-        if len(matrix) != 0:
-            np_matrix = np.array(matrix)
-            np_vector = np.array(vector)
+        if matrix.shape[0] != 0:
+            np_matrix = matrix[:, self._state.step1_absolute_indices].toarray()
+            np_vector = rhs
         else:
             np_matrix = np.array([0] * len(self._state.step1_absolute_indices)).reshape((1, -1))
             np_vector = np.zeros(shape=(1,))
@@ -610,85 +595,90 @@ class ADMMOptimizer(OptimizationAlgorithm):
         return np_matrix, np_vector
 
     def _create_step1_problem(self) -> QuadraticProgram:
-        """Creates a step 1 sub-problem.
+        r"""Creates or updates the step 1 sub-problem.
+
+        The problem and its quadratic objective are created in the first iteration. Since
+        :math:`x^2 = x` for binary variables, the term :math:`\rho/2 \|x\|^2` is added to
+        the linear objective, which is the only part updated in later iterations. The same
+        problem instance is passed to the QUBO optimizer in every iteration; since
+        :class:`~qiskit.optimization.algorithms.OptimizationAlgorithm` has no interface to update
+        coefficients of an already prepared problem, the QUBO optimizer solves it from scratch.
 
         Returns:
-            A newly created optimization problem.
+            The step 1 sub-problem.
         """
-        op1 = QuadraticProgram()
-
+        op1 = self._state.op1
         binary_size = len(self._state.step1_absolute_indices)
-        # create the same binary variables.
-        for i in range(binary_size):
-            name = self._state.op.variables[self._state.step1_absolute_indices[i]].name
-            op1.binary_var(name=name)
+        if op1 is None:
+            op1 = QuadraticProgram()
+            # create the same binary variables.
+            op1.binary_var_list([self._state.op.variables[i].name
+                                 for i in self._state.step1_absolute_indices], name='')
 
-        # prepare and set quadratic objective.
-        quadratic_objective = self._state.q0 + \
-            self._params.factor_c / 2 * np.dot(self._state.a0.transpose(), self._state.a0) +\
-            self._state.rho / 2 * np.eye(binary_size)
-        op1.objective.quadratic = quadratic_objective
+            # prepare and set quadratic objective.
+            op1.objective.quadratic = self._state.q0 + \
+                self._params.factor_c / 2 * np.dot(self._state.a0.transpose(), self._state.a0)
+            self._state.op1 = op1
 
         # prepare and set linear objective.
         linear_objective = self._state.c0 - \
             self._params.factor_c * np.dot(self._state.b0, self._state.a0) + \
             self._state.rho * (- self._state.y[self._state.step1_relative_indices] -
                                self._state.z[self._state.step1_relative_indices]) + \
-            self._state.lambda_mult[self._state.step1_relative_indices]
+            self._state.lambda_mult[self._state.step1_relative_indices] + \
+            self._state.rho / 2 * np.ones(binary_size)
 
         op1.objective.linear = linear_objective
         return op1
 
     def _create_step2_problem(self) -> QuadraticProgram:
-        """Creates a step 2 sub-problem.
-
-        Returns:
-            A newly created optimization problem.
-        """
-        op2 = copy.deepcopy(self._state.op)
-        # replace binary variables with the continuous ones bound in [0,1]
-        # x0(bin) -> z(cts)
-        # u (cts) are still there unchanged
-        for i, var_index in enumerate(self._state.binary_indices):
-            variable = op2.variables[var_index]
-            variable.vartype = Variable.Type.CONTINUOUS
-            variable.upperbound = 1.
-            variable.lowerbound = 0.
-            # replacing Q0 objective and take of min/max sense, initially we consider minimization
-            op2.objective.quadratic[var_index, var_index] = self._state.rho / 2
-            # replacing linear objective
-            op2.objective.linear[var_index] = -1 * self._state.lambda_mult[i] - self._state.rho * \
-                (self._state.x0[i] - self._state.y[i])
-
-        # remove A0 x0 = b0 constraints
-        for constraint in self._state.binary_equality_constraints:
-            op2.remove_linear_constraint(constraint.name)
-
-        return op2
+        """Creates or updates the step 2 sub-problem.
 
-    def _create_step3_problem(self) -> QuadraticProgram:
-        """Creates a step 3 sub-problem.
+        The problem is created in the first iteration, later iterations only update the
+        objective terms of the relaxed binary variables.
 
         Returns:
-            A newly created optimization problem.
-        """
-        op3 = QuadraticProgram()
-        # add y variables.
-        binary_size = len(self._state.binary_indices)
-        for i in range(binary_size):
-            name = self._state.op.variables[self._state.binary_indices[i]].name
-            op3.continuous_var(lowerbound=-np.inf, upperbound=np.inf, name=name)
+            The step 2 sub-problem.
+        """
+        op2 = self._state.op2
+        binary_indices = self._state.binary_indices
+        if op2 is None:
+            op2 = copy.deepcopy(self._state.op)
+            # replace binary variables with the continuous ones bound in [0,1]
+            # x0(bin) -> z(cts)
+            # u (cts) are still there unchanged
+            for var_index in binary_indices:
+                variable = op2.variables[var_index]
+                variable.vartype = Variable.Type.CONTINUOUS
+                variable.upperbound = 1.
+                variable.lowerbound = 0.
+
+            # remove A0 x0 = b0 constraints
+            for constraint in self._state.binary_equality_constraints:
+                op2.remove_linear_constraint(constraint.name)
+
+            # the objective without the diagonal terms of the binary variables, which are
+            # replaced in each iteration
+            quadratic = self._state.quadratic.tocoo()
+            keep = (quadratic.row != quadratic.col) | ~np.isin(quadratic.row, binary_indices)
+            self._state.op2_quadratic = coo_matrix(
+                (quadratic.data[keep], (quadratic.row[keep], quadratic.col[keep])),
+                shape=quadratic.shape)
+            self._state.op2_linear = self._state.linear.copy()
+            self._state.op2 = op2
+
+        # replacing Q0 objective and take of min/max sense, initially we consider minimization
+        num_vars = op2.get_num_vars()
+        rho_diagonal = coo_matrix((np.full(len(binary_indices), self._state.rho / 2),
+                                   (binary_indices, binary_indices)), shape=(num_vars, num_vars))
+        op2.objective.quadratic = self._state.op2_quadratic + rho_diagonal
+        # replacing linear objective
+        linear = self._state.op2_linear
+        linear[binary_indices] = -1 * self._state.lambda_mult - self._state.rho * \
+            (self._state.x0 - self._state.y)
+        op2.objective.linear = linear
 
-        # set quadratic objective y
-        quadratic_y = self._params.beta / 2 * np.eye(binary_size) + \
-            self._state.rho / 2 * np.eye(binary_size)
-        op3.objective.quadratic = quadratic_y
-
-        # set linear objective for y
-        linear_y = - self._state.lambda_mult - self._state.rho * (self._state.x0 - self._state.z)
-        op3.objective.linear = linear_y
-
-        return op3
+        return op2
 
     def _update_x0(self, op1: QuadraticProgram) -> np.ndarray:
         """Solves the Step1 QuadraticProgram via the qubo optimizer.
@@ -721,17 +711,17 @@ class ADMMOptimizer(OptimizationAlgorithm):
         vars_z = vars_op2.take(self._state.binary_indices)
         return vars_u, vars_z
 
-    def _update_y(self, op3: QuadraticProgram) -> np.ndarray:
-        """Solves the Step3 QuadraticProgram via the continuous optimizer.
-
-        Args:
-            op3: the Step3 QuadraticProgram
+    def _update_y(self) -> np.ndarray:
+        r"""Solves the Step3 problem, which is the unconstrained and separable quadratic problem
+        :math:`\min_y (\beta/2 + \rho/2) \|y\|^2 - (\lambda + \rho (x_0 - z))^T y`,
+        in closed form.
 
         Returns:
             A solution of the Step3, as a numpy array.
 
         """
-        return np.asarray(self._continuous_optimizer.solve(op3).x)
+        linear_y = - self._state.lambda_mult - self._state.rho * (self._state.x0 - self._state.z)
+        return - linear_y / (self._params.beta + self._state.rho)
 
     def _get_best_merit_solution(self) -> Tuple[np.ndarray, np.ndarray, float]:
         """The ADMM solution is that for which the merit value is the min
@@ -791,17 +781,20 @@ class ADMMOptimizer(OptimizationAlgorithm):
         """
         solution = self._get_current_solution()
         # equality constraints
-        cr_eq = 0
-        for constraint in self._state.equality_constraints:
-            cr_eq += np.abs(constraint.evaluate(solution) - constraint.rhs)
+        cr_eq = np.sum(np.abs(self._state.eq_matrix @ solution - self._state.eq_rhs))
+        for constraint in self._state.op.quadratic_constraints:
+            if constraint.sense == Constraint.Sense.EQ:
+                cr_eq += np.abs(constraint.evaluate(solution) - constraint.rhs)
 
         # inequality constraints
-        cr_ineq = 0.0
-        for constraint in self._state.inequality_constraints:
-            sense = -1.0 if constraint.sense == Constraint.Sense.GE else 1.0
-            cr_ineq += max(sense * (constraint.evaluate(solution) - constraint.rhs), 0.0)
+        cr_ineq = np.sum(np.maximum(self._state.ineq_matrix @ solution - self._state.ineq_rhs,
+                                    0.0))
+        for constraint in self._state.op.quadratic_constraints:
+            if constraint.sense != Constraint.Sense.EQ:
+                sense = -1.0 if constraint.sense == Constraint.Sense.GE else 1.0
+                cr_ineq += max(sense * (constraint.evaluate(solution) - constraint.rhs), 0.0)
 
-        return cr_eq + cr_ineq
+        return float(cr_eq + cr_ineq)
 
     def _get_merit(self, cost_iterate: float, constraint_residual: float) -> float:
         """Compute merit value associated with the current iterate
@@ -821,7 +814,9 @@ class ADMMOptimizer(OptimizationAlgorithm):
         Returns:
             Value of the objective function as a float
         """
-        return self._state.op.objective.evaluate(self._get_current_solution())
+        solution = self._get_current_solution()
+        return float(solution @ (self._state.quadratic @ solution) +
+                     self._state.linear @ solution + self._state.constant)
 
     def _get_solution_residuals(self, iteration: int) -> Tuple[float, float]:
         """Compute primal and dual residual.
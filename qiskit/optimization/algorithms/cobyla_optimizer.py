@@ -12,16 +12,14 @@
 
 """The COBYLA optimizer wrapped to be used within Qiskit's optimization module."""
 
-from typing import Optional, cast, List, Tuple, Any
+from typing import Optional, Tuple, Any
 
 import numpy as np
-from scipy.optimize import fmin_cobyla
+from scipy.optimize import OptimizeResult, minimize as sciminimize
 
-from .multistart_optimizer import MultiStartOptimizer
+from .multistart_optimizer import MultiStartOptimizer, _ProblemArrays
 from .optimization_algorithm import OptimizationResult
-from ..exceptions import QiskitOptimizationError
 from ..infinity import INFINITY
-from ..problems.constraint import Constraint
 from ..problems.quadratic_program import QuadraticProgram
 
 
@@ -44,7 +42,7 @@ class CobylaOptimizer(MultiStartOptimizer):
 
     def __init__(self, rhobeg: float = 1.0, rhoend: float = 1e-4, maxfun: int = 1000,
                  disp: Optional[int] = None, catol: float = 2e-4, trials: int = 1,
-                 clip: float = 100.) -> None:
+                 clip: float = 100., num_processes: Optional[int] = 1) -> None:
         """Initializes the CobylaOptimizer.
 
         This initializer takes the algorithmic parameters of COBYLA and stores them for later use
@@ -67,9 +65,11 @@ class CobylaOptimizer(MultiStartOptimizer):
             clip: Clipping parameter for the initial guesses in the multi-start method.
                 If a variable is unbounded then the lower bound and/or upper bound are replaced
                 with the ``-clip`` or ``clip`` values correspondingly for the initial guesses.
+            num_processes: The number of processes running trials in parallel. All local CPUs
+                are used if None.
         """
 
-        super().__init__(trials, clip)
+        super().__init__(trials, clip, num_processes)
         self._rhobeg = rhobeg
         self._rhoend = rhoend
         self._maxfun = maxfun
@@ -110,50 +110,38 @@ class CobylaOptimizer(MultiStartOptimizer):
         """
         self._verify_compatibility(problem)
 
-        # construct quadratic objective function
-        def objective(x):
-            return problem.objective.sense.value * problem.objective.evaluate(x)
-
-        # initialize constraints list
-        constraints = []
-
-        # add lower/upper bound constraints
-        for i, variable in enumerate(problem.variables):
-            lowerbound = variable.lowerbound
-            upperbound = variable.upperbound
-            if lowerbound > -INFINITY:
-                def lb_constraint(x, l_b=lowerbound, j=i):
-                    return x[j] - l_b
-                constraints += [lb_constraint]
-            if upperbound < INFINITY:
-                def ub_constraint(x, u_b=upperbound, j=i):
-                    return u_b - x[j]
-                constraints += [ub_constraint]
-
-        # pylint: disable=no-member
-        # add linear and quadratic constraints
-        for constraint in cast(List[Constraint], problem.linear_constraints) +\
-                cast(List[Constraint], problem.quadratic_constraints):
-            rhs = constraint.rhs
-            sense = constraint.sense
-
-            if sense == Constraint.Sense.EQ:
-                constraints += [
-                    lambda x, rhs=rhs, c=constraint: rhs - c.evaluate(x),
-                    lambda x, rhs=rhs, c=constraint: c.evaluate(x) - rhs
-                ]
-            elif sense == Constraint.Sense.LE:
-                constraints += [lambda x, rhs=rhs, c=constraint: rhs - c.evaluate(x)]
-            elif sense == Constraint.Sense.GE:
-                constraints += [lambda x, rhs=rhs, c=constraint: c.evaluate(x) - rhs]
-            else:
-                raise QiskitOptimizationError('Unsupported constraint type!')
-
-        # actual minimization function to be called by multi_start_solve
-        def _minimize(x_0: np.array) -> Tuple[np.array, Any]:
-            x = fmin_cobyla(objective, x_0, constraints, rhobeg=self._rhobeg,
-                            rhoend=self._rhoend, maxfun=self._maxfun, disp=self._disp,
-                            catol=self._catol)
-            return x, None
-
-        return self.multi_start_solve(_minimize, problem)
+        minimize = _CobylaMinimize(_ProblemArrays(problem), rhobeg=self._rhobeg,
+                                   tol=self._rhoend, maxiter=self._maxfun, disp=self._disp,
+                                   catol=self._catol)
+        return self.multi_start_solve(minimize, problem, _cobyla_converged)
+
+
+class _CobylaMinimize:
+    """The minimization function of a trial, which can be passed to other processes. All bounds
+    and constraints are evaluated at once as a single constraint function."""
+
+    def __init__(self, problem: _ProblemArrays, **kwargs: Any) -> None:
+        self._problem = problem
+        self._kwargs = kwargs
+        self._lowerbound = np.flatnonzero(problem.lowerbound > -INFINITY)
+        self._upperbound = np.flatnonzero(problem.upperbound < INFINITY)
+
+    def _constraints(self, x: np.ndarray) -> np.ndarray:
+        equalities = self._problem.equalities(x)
+        return np.concatenate((x[self._lowerbound] - self._problem.lowerbound[self._lowerbound],
+                               self._problem.upperbound[self._upperbound] - x[self._upperbound],
+                               self._problem.inequalities(x), equalities, -equalities))
+
+    def __call__(self, x_0: np.ndarray) -> Tuple[np.ndarray, Any]:
+        num_constraints = len(self._lowerbound) + len(self._upperbound) + \
+            self._problem.num_inequalities + 2 * self._problem.num_equalities
+        constraints = [{'type': 'ineq', 'fun': self._constraints}] if num_constraints > 0 else []
+        # the same as fmin_cobyla, which does not tell whether the optimization has converged
+        result = sciminimize(self._problem.objective, x_0, method='COBYLA',
+                             constraints=constraints, options=self._kwargs)
+        return result.x, result
+
+
+def _cobyla_converged(result: OptimizeResult) -> bool:
+    """Whether COBYLA has converged, and not stopped at the maximum number of evaluations."""
+    return result.success
@@ -15,16 +15,16 @@
 import logging
 import math
 from copy import deepcopy
-from typing import Optional, Dict, Union, List
+from typing import Optional, Dict, Union, List, Tuple
 
 import numpy as np
 
-from qiskit import QuantumCircuit, QuantumRegister
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Parameter
 from qiskit.aqua import QuantumInstance, aqua_globals
-from qiskit.aqua.algorithms.amplitude_amplifiers.grover import Grover
 from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
-from qiskit.circuit.library import QuadraticForm
+from qiskit.circuit.library import QuadraticForm, GroverOperator
 from .optimization_algorithm import (OptimizationResultStatus, OptimizationAlgorithm,
                                      OptimizationResult)
 from ..converters.quadratic_program_to_qubo import QuadraticProgramToQubo, QuadraticProgramConverter
@@ -103,10 +103,11 @@ class GroverOptimizer(OptimizationAlgorithm):
         """
         return QuadraticProgramToQubo.get_compatibility_msg(problem)
 
-    def _get_a_operator(self, qr_key_value, problem):
+    def _get_a_operator(self, qr_key_value, problem, offset=None):
         quadratic = problem.objective.quadratic.to_array()
         linear = problem.objective.linear.to_array()
-        offset = problem.objective.constant
+        if offset is None:
+            offset = problem.objective.constant
 
         # Get circuit requirements from input.
         quadratic_form = QuadraticForm(self._num_value_qubits, quadratic, linear, offset,
@@ -194,16 +195,23 @@ class GroverOptimizer(OptimizationAlgorithm):
         qr_key_value = QuantumRegister(self._num_key_qubits + self._num_value_qubits)
         orig_constant = problem_.objective.constant
         measurement = not self.quantum_instance.is_statevector
-        oracle, is_good_state = self._get_oracle(qr_key_value)
+        oracle, _ = self._get_oracle(qr_key_value)
+
+        # The threshold only enters the state preparation A as a constant offset, therefore A
+        # and the Grover operator are built and transpiled once with a parameterized offset,
+        # which is bound to the current threshold before the execution.
+        offset = Parameter('offset')
+        a_operator = self._get_a_operator(qr_key_value, problem_, offset)
+        circuits = _GroverCircuits(self.quantum_instance,
+                                   GroverOperator(oracle, state_preparation=a_operator),
+                                   measurement)
+        # On statevector backends identical circuits have identical outcome probabilities.
+        probs_cache = {}  # type: Dict[Tuple[int, int], Dict[str, float]]
 
         while not optimum_found:
             m = 1
             improvement_found = False
 
-            # Get oracle O and the state preparation operator A for the current threshold.
-            problem_.objective.constant = orig_constant - threshold
-            a_operator = self._get_a_operator(qr_key_value, problem_)
-
             # Iterate until we measure a negative.
             loops_with_no_improvement = 0
             while not improvement_found:
@@ -213,17 +221,17 @@ class GroverOptimizer(OptimizationAlgorithm):
                 rotations += rotation_count
 
                 # Apply Grover's Algorithm to find values below the threshold.
-                if rotation_count > 0:
-                    # TODO: Utilize Grover's incremental feature - requires changes to Grover.
-                    grover = Grover(oracle,
-                                    state_preparation=a_operator,
-                                    good_state=is_good_state)
-                    circuit = grover.construct_circuit(rotation_count, measurement=measurement)
-                else:
-                    circuit = a_operator
+                transpiled, operations = circuits.get(rotation_count)
 
                 # Get the next outcome.
-                outcome = self._measure(circuit)
+                if (rotation_count, threshold) in probs_cache:
+                    probs = probs_cache[rotation_count, threshold]
+                else:
+                    bound = transpiled.bind_parameters({offset: orig_constant - threshold})
+                    probs = self._get_probs(bound, had_transpiled=True)
+                    if not measurement:
+                        probs_cache[rotation_count, threshold] = probs
+                outcome = self._sample(probs)
                 k = int(outcome[0:n_key], 2)
                 v = outcome[n_key:n_key + n_value]
                 int_v = self._bin_to_int(v, n_value) + threshold
@@ -256,7 +264,6 @@ class GroverOptimizer(OptimizationAlgorithm):
                         optimum_found = True
 
                 # Track the operation count.
-                operations = circuit.count_ops()
                 operation_count[iteration] = operations
                 iteration += 1
                 logger.info('Operation Count: %s\n', operations)
@@ -281,9 +288,9 @@ class GroverOptimizer(OptimizationAlgorithm):
                                         threshold=threshold,
                                         status=self._get_feasibility_status(problem, result.x))
 
-    def _measure(self, circuit: QuantumCircuit) -> str:
-        """Get probabilities from the given backend, and picks a random outcome."""
-        probs = self._get_probs(circuit)
+    @staticmethod
+    def _sample(probs: Dict[str, float]) -> str:
+        """Picks a random outcome from the given probabilities."""
         freq = sorted(probs.items(), key=lambda x: x[1], reverse=True)
 
         # Pick a random outcome.
@@ -293,23 +300,24 @@ class GroverOptimizer(OptimizationAlgorithm):
 
         return freq[idx][0]
 
-    def _get_probs(self, qc: QuantumCircuit) -> Dict[str, float]:
+    def _get_probs(self, qc: QuantumCircuit, had_transpiled: bool = False) -> Dict[str, float]:
         """Gets probabilities from a given backend."""
         # Execute job and filter results.
-        result = self.quantum_instance.execute(qc)
+        result = self.quantum_instance.execute(qc, had_transpiled=had_transpiled)
         if self.quantum_instance.is_statevector:
             state = np.round(result.get_statevector(qc), 5)
-            keys = [bin(i)[2::].rjust(int(np.log2(len(state))), '0')[::-1]
-                    for i in range(0, len(state))]
-            probs = [np.round(abs(a) * abs(a), 5) for a in state]
-            hist = dict(zip(keys, probs))
+            probs = np.round(np.abs(state) ** 2, 5)
+            num_qubits = int(np.log2(len(state)))
+            hist = {bin(i)[2:].rjust(num_qubits, '0')[::-1]: probs[i]
+                    for i in np.flatnonzero(probs > 0)}
         else:
             state = result.get_counts(qc)
             shots = self.quantum_instance.run_config.shots
             hist = {}
             for key in state:
-                hist[key] = state[key] / shots
-        hist = dict(filter(lambda p: p[1] > 0, hist.items()))
+                # order the bits as the qubits, as for the statevector
+                hist[key[::-1]] = state[key] / shots
+            hist = dict(filter(lambda p: p[1] > 0, hist.items()))
 
         return hist
 
@@ -338,6 +346,77 @@ class GroverOptimizer(OptimizationAlgorithm):
         return int_v
 
 
+class _GroverCircuits:
+    """The transpiled circuits of the powers of a Grover operator.
+
+    If the backend does not restrict the connectivity of the qubits, the state preparation and
+    the Grover operator are transpiled only once and the circuit of a power is assembled from
+    the circuit of the next lower power that was already built. Otherwise, the circuit of each
+    power is transpiled once.
+    """
+
+    def __init__(self, quantum_instance: QuantumInstance, grover_operator: GroverOperator,
+                 measurement: bool) -> None:
+        """
+        Args:
+            quantum_instance: The quantum instance to transpile the circuits for.
+            grover_operator: The Grover operator.
+            measurement: Whether to measure the reflection qubits.
+        """
+        self._quantum_instance = quantum_instance
+        self._grover_operator = grover_operator
+        self._measurement = measurement
+        self._circuits = {}  # type: Dict[int, Tuple[QuantumCircuit, Dict[str, int]]]
+
+        self._powers = None  # type: Optional[Dict[int, QuantumCircuit]]
+        self._transpiled_operator = None
+        if quantum_instance.backend_config.get('coupling_map') is None and \
+                quantum_instance.compile_config.get('pass_manager') is None:
+            state_preparation, self._transpiled_operator = \
+                quantum_instance.transpile([self._construct_circuit(0), grover_operator])
+            self._powers = {0: state_preparation}
+
+    def _construct_circuit(self, power: int) -> QuantumCircuit:
+        """Constructs the circuit applying the state preparation and ``power`` Grover operators."""
+        circuit = QuantumCircuit(self._grover_operator.num_qubits, name='Grover circuit')
+        circuit.compose(self._grover_operator.state_preparation, inplace=True)
+        if power > 0:
+            circuit.compose(self._grover_operator.power(power), inplace=True)
+        return circuit
+
+    def _add_measurement(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        """Adds the measurement of the reflection qubits, if required."""
+        if self._measurement:
+            circuit = circuit.copy()
+            measurement_cr = ClassicalRegister(len(self._grover_operator.reflection_qubits))
+            circuit.add_register(measurement_cr)
+            circuit.measure(self._grover_operator.reflection_qubits, measurement_cr)
+        return circuit
+
+    def get(self, power: int) -> Tuple[QuantumCircuit, Dict[str, int]]:
+        """Returns the transpiled circuit for the given power and the operations it is built of.
+
+        Args:
+            power: The number of Grover operators.
+
+        Returns:
+            The transpiled circuit and the operation count of the circuit before transpilation.
+        """
+        if power not in self._circuits:
+            circuit = self._add_measurement(self._construct_circuit(power))
+            if self._powers is None:
+                transpiled = self._quantum_instance.transpile(circuit)[0]
+            else:
+                lower = max(p for p in self._powers if p < power) if power > 0 else 0
+                transpiled = self._powers[lower].copy()
+                for _ in range(power - lower):
+                    transpiled.compose(self._transpiled_operator, inplace=True)
+                self._powers[power] = transpiled
+                transpiled = self._add_measurement(transpiled)
+            self._circuits[power] = (transpiled, circuit.count_ops())
+        return self._circuits[power]
+
+
 class GroverOptimizationResult(OptimizationResult):
     """A result object for Grover Optimization methods."""
 
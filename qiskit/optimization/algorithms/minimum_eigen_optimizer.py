@@ -22,6 +22,9 @@ from .optimization_algorithm import (OptimizationResultStatus, OptimizationAlgor
 from ..converters.quadratic_program_to_qubo import QuadraticProgramToQubo, QuadraticProgramConverter
 from ..problems.quadratic_program import QuadraticProgram, Variable
 
+# number of samples which are evaluated at once
+_BATCH_SIZE = 2 ** 16
+
 
 class MinimumEigenOptimizationResult(OptimizationResult):
     """ Minimum Eigen Optimizer Result."""
@@ -56,19 +59,12 @@ class MinimumEigenOptimizationResult(OptimizationResult):
         """Get <Zi x Zj> correlation matrix from samples."""
 
         states = [v[0] for v in self.samples]
-        probs = [v[2] for v in self.samples]
+        probs = np.array([v[2] for v in self.samples])
 
-        n = len(states[0])
-        correlations = np.zeros((n, n))
-        for k, prob in enumerate(probs):
-            b = states[k]
-            for i in range(n):
-                for j in range(i):
-                    if b[i] == b[j]:
-                        correlations[i, j] += prob
-                    else:
-                        correlations[i, j] -= prob
-        return correlations
+        # <Zi x Zj> = sum_k p_k z_ki z_kj with z = 1 - 2 b, i.e. Z^T diag(p) Z
+        spins = 1 - 2 * _bitstrings_to_array(states).astype(float)
+        correlations = (spins.T * probs) @ spins
+        return np.tril(correlations, -1)
 
 
 class MinimumEigenOptimizer(OptimizationAlgorithm):
@@ -246,33 +242,47 @@ def _eigenvector_to_solutions(eigenvector: Union[dict, np.ndarray, StateFn],
     elif isinstance(eigenvector, StateFn):
         eigenvector = eigenvector.to_matrix()
 
-    solutions = []
     if isinstance(eigenvector, dict):
-        all_counts = sum(eigenvector.values())
-        # iterate over all samples
-        for bitstr, count in eigenvector.items():
-            sampling_probability = count / all_counts
-            # add the bitstring, if the sampling probability exceeds the threshold
-            if sampling_probability > 0:
-                if sampling_probability >= min_probability:
-                    value = qubo.objective.evaluate([int(bit) for bit in bitstr])
-                    solutions += [(bitstr, value, sampling_probability)]
+        counts = np.array(list(eigenvector.values()))
+        probabilities = counts / np.sum(counts)
+        # keep the bitstrings, if the sampling probability exceeds the threshold
+        keep = (probabilities > 0) & (probabilities >= min_probability)
+        bitstrs = [bitstr for bitstr, k in zip(eigenvector.keys(), keep) if k]
+        probabilities = probabilities[keep]
+        values = []  # type: List[np.ndarray]
+        for start in range(0, len(bitstrs), _BATCH_SIZE):
+            bits = _bitstrings_to_array(bitstrs[start:start + _BATCH_SIZE])
+            values.append(qubo.objective.evaluate_batch(bits))
 
     elif isinstance(eigenvector, np.ndarray):
         num_qubits = int(np.log2(eigenvector.size))
         probabilities = np.abs(eigenvector * eigenvector.conj())
-
-        # iterate over all states and their sampling probabilities
-        for i, sampling_probability in enumerate(probabilities):
-
-            # add the i-th state if the sampling probability exceeds the threshold
-            if sampling_probability > 0:
-                if sampling_probability >= min_probability:
-                    bitstr = '{:b}'.format(i).rjust(num_qubits, '0')[::-1]
-                    value = qubo.objective.evaluate([int(bit) for bit in bitstr])
-                    solutions += [(bitstr, value, sampling_probability)]
+        # keep the states, if the sampling probability exceeds the threshold
+        indices = np.flatnonzero((probabilities > 0) & (probabilities >= min_probability))
+        probabilities = probabilities[indices]
+        bitstrs = []
+        values = []
+        for start in range(0, len(indices), _BATCH_SIZE):
+            # bit k of the index is the k-th qubit, i.e. the k-th variable
+            bits = (indices[start:start + _BATCH_SIZE, None] >> np.arange(num_qubits)) & 1
+            bitstrs += _array_to_bitstrings(bits)
+            values.append(qubo.objective.evaluate_batch(bits))
 
     else:
         raise TypeError('Unsupported format of eigenvector. Provide a dict or numpy.ndarray.')
 
-    return solutions
+    values = np.concatenate(values).tolist() if values else []
+    return list(zip(bitstrs, values, probabilities.tolist()))
+
+
+def _bitstrings_to_array(bitstrs: List[str]) -> np.ndarray:
+    """Convert bitstrings of equal length to an array with one row of bits per bitstring."""
+    num_bits = len(bitstrs[0]) if bitstrs else 0
+    buffer = np.frombuffer(''.join(bitstrs).encode('ascii'), dtype=np.uint8)
+    return buffer.reshape(len(bitstrs), num_bits) - ord('0')
+
+
+def _array_to_bitstrings(bits: np.ndarray) -> List[str]:
+    """Convert an array with one row of bits per bitstring to a list of bitstrings."""
+    chars = np.ascontiguousarray(bits + ord('0'), dtype=np.uint8)
+    return chars.view('S{}'.format(bits.shape[1])).ravel().astype(str).tolist()
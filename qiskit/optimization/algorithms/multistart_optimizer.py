@@ -15,18 +15,32 @@ that may run minimization algorithm for the several time with different initial
 better results. This implementation is suitable for local optimizers."""
 
 import logging
+import os
+import pickle
+import platform
 import time
 from abc import ABC
-from typing import Optional, Callable, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Callable, Tuple, Any, List
 
 import numpy as np
+from scipy.sparse import csr_matrix, diags
 from scipy.stats import uniform
+from qiskit.tools.parallel import CPU_COUNT
 
 from qiskit.optimization import QuadraticProgram, INFINITY
 from .optimization_algorithm import OptimizationAlgorithm, OptimizationResult
+from ..converters.quadratic_program_converter import QuadraticProgramConverter
+from ..problems.constraint import Constraint
 
 logger = logging.getLogger(__name__)
 
+# number of variables up to which the convexity of a problem is checked
+_MAX_CONVEXITY_CHECK = 2 ** 10
+
+# the minimization function of the trials in a worker process
+_WORKER_MINIMIZE = None  # type: Optional[Callable[[np.ndarray], Tuple[np.ndarray, Any]]]
+
 
 # we disable a warning: "Method 'a method' is abstract in class 'OptimizationAlgorithm' but
 # is not overridden (abstract-method) since this class is not intended for instantiation
@@ -37,7 +51,8 @@ class MultiStartOptimizer(OptimizationAlgorithm, ABC):
     other optimizers.
     """
 
-    def __init__(self, trials: int = 1, clip: float = 100.) -> None:
+    def __init__(self, trials: int = 1, clip: float = 100.,
+                 num_processes: Optional[int] = 1) -> None:
         """
         Constructs an instance of this optimizer.
 
@@ -49,52 +64,107 @@ class MultiStartOptimizer(OptimizationAlgorithm, ABC):
             clip: Clipping parameter for the initial guesses in the multi-start method.
                 If a variable is unbounded then the lower bound and/or upper bound are replaced
                 with the ``-clip`` or ``clip`` values correspondingly for the initial guesses.
+            num_processes: The number of processes running trials in parallel. All local CPUs
+                are used if None.
         """
         super().__init__()
         self._trials = trials
         self._clip = clip
+        self._num_processes = num_processes
 
     def multi_start_solve(self, minimize: Callable[[np.array], Tuple[np.array, Any]],
-                          problem: QuadraticProgram) -> OptimizationResult:
+                          problem: QuadraticProgram,
+                          converged: Optional[Callable[[Any], bool]] = None) \
+            -> OptimizationResult:
         """Applies a multi start method given a local optimizer.
 
+        The random initial guesses are drawn at once and tried in the order of their constraint
+        violation and objective value. If the problem is convex, the first feasible local optimum
+        is a global one and the remaining trials are skipped, provided that ``converged``
+        confirms that the local optimizer has converged. The trials are run in a pool of
+        processes if more than one process is used and ``minimize`` can be pickled; the
+        function is then passed once to every process.
+
         Args:
             minimize: A callable object that minimizes the problem specified
             problem: A problem to solve
+            converged: A callable which tells from the raw results returned by ``minimize``
+                whether the local optimizer has converged. If None, all trials are run.
 
         Returns:
             The result of the multi start algorithm applied to the problem.
         """
-        fval_sol = INFINITY
-        x_sol = None        # type: Optional[np.array]
-        rest_sol = None     # type: Optional[Tuple]
-
-        # Implementation of multi-start optimizer
-        for trial in range(self._trials):
-            x_0 = np.zeros(problem.get_num_vars())
-            if trial > 0:
-                for i, var in enumerate(problem.variables):
-                    lowerbound = var.lowerbound if var.lowerbound > -INFINITY else -self._clip
-                    upperbound = var.upperbound if var.upperbound < INFINITY else self._clip
-                    x_0[i] = uniform.rvs(lowerbound, (upperbound - lowerbound))
-            # run optimization
-            t_0 = time.time()
-            x, rest = minimize(x_0)
-            logger.debug("minimize done in: %s seconds", str(time.time() - t_0))
-
-            # we minimize, to get actual objective value we must multiply by the sense value
-            fval = problem.objective.evaluate(x) * problem.objective.sense.value
-            # we minimize the objective
-            if fval < fval_sol:
-                # here we get back to the original sense of the problem
-                fval_sol = fval * problem.objective.sense.value
-                x_sol = x
-                rest_sol = rest
-
-        return OptimizationResult(x=x_sol, fval=fval_sol, variables=problem.variables,
+        x_0 = self._initial_guesses(problem)
+        stop = converged is not None and len(x_0) > 1 and _is_convex(problem)
+
+        def is_global_optimum(result: Tuple[np.ndarray, Any]) -> bool:
+            return stop and converged(result[1]) and problem.is_feasible(result[0])
+
+        num_processes = CPU_COUNT if self._num_processes is None else self._num_processes
+        num_processes = min(num_processes, len(x_0))
+        if num_processes > 1 and platform.system() != 'Windows' \
+                and os.getenv('QISKIT_IN_PARALLEL', 'FALSE') == 'FALSE':
+            try:
+                pickle.dumps(minimize)
+            except (pickle.PicklingError, AttributeError, TypeError) as ex:
+                logger.warning('The trials are run sequentially, since the minimization can not '
+                               'be passed to other processes: %s', ex)
+                num_processes = 1
+        else:
+            num_processes = 1
+
+        results = [None] * len(x_0)  # type: List[Optional[Tuple[np.ndarray, Any]]]
+        if num_processes > 1:
+            os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+            try:
+                with ProcessPoolExecutor(max_workers=num_processes, initializer=_initialize_worker,
+                                         initargs=(minimize,)) as executor:
+                    futures = {executor.submit(_run_trial, x): trial for trial, x in enumerate(x_0)}
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
+                        if is_global_optimum(results[futures[future]]):
+                            for pending in futures:
+                                pending.cancel()
+                            break
+            finally:
+                os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
+        else:
+            for trial, x in enumerate(x_0):
+                # run optimization
+                t_0 = time.time()
+                results[trial] = minimize(x)
+                logger.debug("minimize done in: %s seconds", str(time.time() - t_0))
+                if is_global_optimum(results[trial]):
+                    break
+
+        results = [result for result in results if result is not None]
+        logger.debug('%d of %d trials have been run.', len(results), len(x_0))
+
+        # we minimize, to get actual objective value we must multiply by the sense value
+        fvals = problem.objective.evaluate_batch(np.array([x for x, _ in results]))
+        best = int(np.argmin(problem.objective.sense.value * fvals))
+        x_sol, rest_sol = results[best]
+
+        return OptimizationResult(x=x_sol, fval=float(fvals[best]), variables=problem.variables,
                                   status=self._get_feasibility_status(problem, x_sol),
                                   raw_results=rest_sol)
 
+    def _initial_guesses(self, problem: QuadraticProgram) -> np.ndarray:
+        """Returns the initial guesses of all trials, one per row. The first one is zero, the
+        others are drawn at once and sorted by their constraint violation and objective value."""
+        x_0 = np.zeros((self._trials, problem.get_num_vars()))
+        if self._trials > 1:
+            lowerbound = np.array([var.lowerbound for var in problem.variables], dtype=float)
+            upperbound = np.array([var.upperbound for var in problem.variables], dtype=float)
+            lowerbound[lowerbound <= -INFINITY] = -self._clip
+            upperbound[upperbound >= INFINITY] = self._clip
+            guesses = uniform.rvs(lowerbound, (upperbound - lowerbound),
+                                  size=(self._trials - 1, problem.get_num_vars()))
+            arrays = _ProblemArrays(problem)
+            order = np.lexsort((arrays.objective_batch(guesses), arrays.violation_batch(guesses)))
+            x_0[1:] = guesses[order]
+        return x_0
+
     @property
     def trials(self) -> int:
         """ Returns the number of trials for this optimizer.
@@ -130,3 +200,159 @@ class MultiStartOptimizer(OptimizationAlgorithm, ABC):
             clip: The clip value to set.
         """
         self._clip = clip
+
+    @property
+    def num_processes(self) -> Optional[int]:
+        """ Returns the number of processes running trials in parallel.
+
+        Returns:
+            The number of processes, None if all local CPUs are used.
+        """
+        return self._num_processes
+
+    @num_processes.setter
+    def num_processes(self, num_processes: Optional[int]) -> None:
+        """Sets the number of processes running trials in parallel.
+
+        Args:
+            num_processes: The number of processes, None to use all local CPUs.
+        """
+        self._num_processes = num_processes
+
+
+class _ProblemArrays:
+    """The objective and the constraints of a continuous problem as sparse arrays in minimization
+    form. An instance evaluates single points and batches of points, and it can be pickled to be
+    passed to worker processes."""
+
+    def __init__(self, problem: QuadraticProgram) -> None:
+        sense = problem.objective.sense.value
+        quadratic, linear, constant = problem.objective.to_arrays()
+        self.quadratic = sense * quadratic
+        self.linear = sense * linear
+        self.constant = sense * constant
+        self.lowerbound = np.array([var.lowerbound for var in problem.variables], dtype=float)
+        self.upperbound = np.array([var.upperbound for var in problem.variables], dtype=float)
+
+        # linear inequalities and equalities as A x - b >= 0 and A x - b == 0
+        matrix, rhs = QuadraticProgramConverter._linear_constraints_to_arrays(problem)
+        senses = [constraint.sense for constraint in problem.linear_constraints]
+        signs = np.array([1.0 if sense == Constraint.Sense.GE else -1.0 for sense in senses])
+        ineq = np.array([sense != Constraint.Sense.EQ for sense in senses], dtype=bool)
+        self.ineq_matrix = csr_matrix(diags(signs[ineq]) @ matrix[ineq])
+        self.ineq_rhs = signs[ineq] * rhs[ineq]
+        self.eq_matrix = -matrix[~ineq]
+        self.eq_rhs = -rhs[~ineq]
+
+        # quadratic constraints as (sign, quadratic, linear, rhs)
+        self.quadratic_ineqs = []  # type: List[Tuple[float, csr_matrix, np.ndarray, float]]
+        self.quadratic_eqs = []  # type: List[Tuple[float, csr_matrix, np.ndarray, float]]
+        for constraint in problem.quadratic_constraints:
+            terms = (constraint.quadratic.coefficients.tocsr(), constraint.linear.to_array(),
+                     constraint.rhs)
+            if constraint.sense == Constraint.Sense.EQ:
+                self.quadratic_eqs.append((-1.0,) + terms)
+            elif constraint.sense == Constraint.Sense.GE:
+                self.quadratic_ineqs.append((1.0,) + terms)
+            else:
+                self.quadratic_ineqs.append((-1.0,) + terms)
+
+    def objective(self, x: np.ndarray) -> float:
+        """The objective to be minimized."""
+        return x @ (self.quadratic @ x) + self.linear @ x + self.constant
+
+    def gradient(self, x: np.ndarray) -> np.ndarray:
+        """The gradient of the objective to be minimized."""
+        return self.quadratic @ x + self.quadratic.T @ x + self.linear
+
+    def inequalities(self, x: np.ndarray) -> np.ndarray:
+        """The values of the inequality constraints, which are feasible if non-negative."""
+        values = self.ineq_matrix @ x - self.ineq_rhs
+        if self.quadratic_ineqs:
+            values = np.concatenate((values, [sign * (x @ (quad @ x) + lin @ x - rhs)
+                                              for sign, quad, lin, rhs in self.quadratic_ineqs]))
+        return values
+
+    def inequalities_jacobian(self, x: np.ndarray) -> np.ndarray:
+        """The Jacobian of the inequality constraints."""
+        rows = [self.ineq_matrix.toarray()]
+        rows += [sign * (quad @ x + quad.T @ x + lin)[None, :]
+                 for sign, quad, lin, _ in self.quadratic_ineqs]
+        return np.concatenate(rows)
+
+    def equalities(self, x: np.ndarray) -> np.ndarray:
+        """The values of the equality constraints, which are feasible if zero."""
+        values = self.eq_matrix @ x - self.eq_rhs
+        if self.quadratic_eqs:
+            values = np.concatenate((values, [sign * (x @ (quad @ x) + lin @ x - rhs)
+                                              for sign, quad, lin, rhs in self.quadratic_eqs]))
+        return values
+
+    def equalities_jacobian(self, x: np.ndarray) -> np.ndarray:
+        """The Jacobian of the equality constraints."""
+        rows = [self.eq_matrix.toarray()]
+        rows += [sign * (quad @ x + quad.T @ x + lin)[None, :]
+                 for sign, quad, lin, _ in self.quadratic_eqs]
+        return np.concatenate(rows)
+
+    @property
+    def num_inequalities(self) -> int:
+        """The number of inequality constraints."""
+        return self.ineq_matrix.shape[0] + len(self.quadratic_ineqs)
+
+    @property
+    def num_equalities(self) -> int:
+        """The number of equality constraints."""
+        return self.eq_matrix.shape[0] + len(self.quadratic_eqs)
+
+    def objective_batch(self, x: np.ndarray) -> np.ndarray:
+        """The objective to be minimized for a batch of points, one per row."""
+        return np.sum((x @ self.quadratic.T) * x, axis=1) + x @ self.linear + self.constant
+
+    def violation_batch(self, x: np.ndarray) -> np.ndarray:
+        """The total violation of the constraints for a batch of points, one per row."""
+        violation = np.sum(np.maximum(self.ineq_rhs - x @ self.ineq_matrix.T, 0), axis=1)
+        violation += np.sum(np.abs(x @ self.eq_matrix.T - self.eq_rhs), axis=1)
+        for sign, quad, lin, rhs in self.quadratic_ineqs:
+            violation += np.maximum(sign * (rhs - np.sum((x @ quad.T) * x, axis=1) - x @ lin), 0)
+        for _, quad, lin, rhs in self.quadratic_eqs:
+            violation += np.abs(np.sum((x @ quad.T) * x, axis=1) + x @ lin - rhs)
+        return violation
+
+
+def _is_psd(matrix: csr_matrix) -> bool:
+    """Whether the symmetric part of a matrix is positive semi-definite."""
+    if matrix.nnz == 0:
+        return True
+    if matrix.shape[0] > _MAX_CONVEXITY_CHECK:
+        return False
+    symmetric = (matrix + matrix.T).toarray() / 2
+    eigenvalues = np.linalg.eigvalsh(symmetric)
+    return eigenvalues[0] >= -1e-10 * max(1.0, np.abs(eigenvalues).max())
+
+
+def _is_convex(problem: QuadraticProgram) -> bool:
+    """Whether a problem is convex, such that every local optimum is a global one. Large
+    quadratic terms are not analyzed and considered to be non-convex."""
+    quadratic, _, _ = problem.objective.to_arrays()
+    if not _is_psd(problem.objective.sense.value * quadratic):
+        return False
+    for constraint in problem.quadratic_constraints:
+        quadratic = constraint.quadratic.coefficients.tocsr()
+        if constraint.sense == Constraint.Sense.EQ:
+            if quadratic.count_nonzero() > 0:
+                return False
+        elif not _is_psd(quadratic if constraint.sense == Constraint.Sense.LE else -quadratic):
+            return False
+    return True
+
+
+def _initialize_worker(minimize: Callable[[np.ndarray], Tuple[np.ndarray, Any]]) -> None:
+    """Stores the minimization function once per worker process."""
+    global _WORKER_MINIMIZE  # pylint: disable=global-statement
+    _WORKER_MINIMIZE = minimize
+
+
+def _run_trial(x_0: np.ndarray) -> Tuple[np.ndarray, Any]:
+    """Runs one trial in a worker process."""
+    return _WORKER_MINIMIZE(x_0)
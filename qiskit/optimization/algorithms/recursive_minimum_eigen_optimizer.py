@@ -12,13 +12,12 @@
 
 """A recursive minimal eigen optimizer in Qiskit's optimization module."""
 
-from copy import deepcopy
 from enum import Enum
 from typing import Optional, Union, List, Tuple, Dict
 import logging
 import numpy as np
 
-from qiskit.aqua.algorithms import NumPyMinimumEigensolver
+from qiskit.aqua.algorithms import NumPyMinimumEigensolver, QAOA
 from qiskit.aqua.utils.validation import validate_min
 
 from .optimization_algorithm import (OptimizationResultStatus, OptimizationAlgorithm,
@@ -27,6 +26,7 @@ from .minimum_eigen_optimizer import MinimumEigenOptimizer, MinimumEigenOptimiza
 from ..converters.quadratic_program_to_qubo import QuadraticProgramToQubo, QuadraticProgramConverter
 from ..exceptions import QiskitOptimizationError
 from ..problems import Variable
+from ..problems.quadratic_objective import QuadraticObjective
 from ..problems.quadratic_program import QuadraticProgram
 
 logger = logging.getLogger(__name__)
@@ -94,6 +94,96 @@ class RecursiveMinimumEigenOptimizationResult(OptimizationResult):
         return self._history
 
 
+class _IncrementalQubo:
+    """A QUBO whose variables are eliminated in place.
+
+    The objective is stored as dense arrays, ``constant + linear @ x + diagonal @ x**2 +
+    x @ coupling @ x / 2`` with a symmetric ``coupling`` with zero diagonal. Substituting
+    ``x_i = x_j`` or ``x_i = 1 - x_j`` folds row and column ``i`` into ``j``, such that no new
+    problem needs to be built for every eliminated variable.
+    """
+
+    def __init__(self, problem: QuadraticProgram) -> None:
+        """
+        Args:
+            problem: The QUBO, i.e. a problem with only binary variables and no constraints.
+
+        Raises:
+            QiskitOptimizationError: If the problem is not a QUBO.
+        """
+        if problem.get_num_vars() > problem.get_num_binary_vars() or \
+                problem.linear_constraints or problem.quadratic_constraints:
+            raise QiskitOptimizationError('The converted problem must be a QUBO, i.e. it must '
+                                          'contain only binary variables and no constraints.')
+        quadratic, linear, constant = problem.objective.to_arrays()
+        quadratic = quadratic.toarray()
+        self._name = problem.name
+        self._names = [variable.name for variable in problem.variables]
+        self._sense = problem.objective.sense
+        self._constant = constant
+        self._linear = linear
+        self._diagonal = np.diag(quadratic).copy()
+        np.fill_diagonal(quadratic, 0)
+        self._coupling = quadratic + quadratic.T
+        self._active = np.ones(len(self._names), dtype=bool)
+
+    @property
+    def num_vars(self) -> int:
+        """Returns the number of variables which are not eliminated."""
+        return int(np.count_nonzero(self._active))
+
+    def substitute(self, i: int, j: int, sign: int) -> None:
+        """Substitutes ``x_i = x_j`` if ``sign`` is 1 and ``x_i = 1 - x_j`` if it is -1.
+
+        Args:
+            i: The index of the variable to eliminate, among the remaining variables.
+            j: The index of the substituting variable, among the remaining variables.
+            sign: The sign of the correlation of the variables, either 1 or -1.
+        """
+        i, j = np.flatnonzero(self._active)[[i, j]]
+        row = self._coupling[i].copy()
+        weight = row[j]
+        row[j] = 0
+        if sign == 1:
+            # c_i x_i + d_i x_i^2 + w_ij x_i x_j + sum_k w_ik x_i x_k
+            #     = c_i x_j + (d_i + w_ij) x_j^2 + sum_k w_ik x_j x_k
+            self._linear[j] += self._linear[i]
+            self._diagonal[j] += self._diagonal[i] + weight
+            self._coupling[j] += row
+            self._coupling[:, j] += row
+        else:
+            # c_i x_i + d_i x_i^2 + w_ij x_i x_j + sum_k w_ik x_i x_k
+            #     = c_i + d_i + (w_ij - c_i - 2 d_i) x_j + (d_i - w_ij) x_j^2
+            #       + sum_k w_ik x_k - sum_k w_ik x_j x_k
+            self._constant += self._linear[i] + self._diagonal[i]
+            self._linear[j] += weight - self._linear[i] - 2 * self._diagonal[i]
+            self._diagonal[j] += self._diagonal[i] - weight
+            self._linear += row
+            self._coupling[j] -= row
+            self._coupling[:, j] -= row
+            # remove coefficients which are too small
+            self._linear[np.abs(self._linear) <= 1e-10] = 0
+
+        self._linear[i] = 0
+        self._diagonal[i] = 0
+        self._coupling[i] = 0
+        self._coupling[:, i] = 0
+        self._active[i] = False
+
+    def to_quadratic_program(self) -> QuadraticProgram:
+        """Returns the QUBO of the remaining variables."""
+        index = np.flatnonzero(self._active)
+        problem = QuadraticProgram(self._name)
+        for k in index:
+            problem.binary_var(name=self._names[k])
+        quadratic = np.triu(self._coupling[np.ix_(index, index)]) + np.diag(self._diagonal[index])
+        if self._sense == QuadraticObjective.Sense.MINIMIZE:
+            problem.minimize(self._constant, self._linear[index], quadratic)
+        else:
+            problem.maximize(self._constant, self._linear[index], quadratic)
+        return problem
+
+
 class RecursiveMinimumEigenOptimizer(OptimizationAlgorithm):
     """A meta-algorithm that applies a recursive optimization.
 
@@ -126,7 +216,8 @@ class RecursiveMinimumEigenOptimizer(OptimizationAlgorithm):
                  penalty: Optional[float] = None,
                  history: Optional[IntermediateResult] = IntermediateResult.LAST_ITERATION,
                  converters: Optional[Union[QuadraticProgramConverter,
-                                            List[QuadraticProgramConverter]]] = None) -> None:
+                                            List[QuadraticProgramConverter]]] = None,
+                 warm_start: bool = False) -> None:
         """ Initializes the recursive minimum eigen optimizer.
 
         This initializer takes a ``MinimumEigenOptimizer``, the parameters to specify until when to
@@ -146,6 +237,9 @@ class RecursiveMinimumEigenOptimizer(OptimizationAlgorithm):
             converters: The converters to use for converting a problem into a different form.
                 By default, when None is specified, an internally created instance of
                 :class:`~qiskit.optimization.converters.QuadraticProgramToQubo` will be used.
+            warm_start: If True and the minimum eigen solver is
+                :class:`~qiskit.aqua.algorithms.QAOA`, every iteration starts from the optimal
+                parameters of the previous iteration.
 
         Raises:
             QiskitOptimizationError: In case of invalid parameters (num_min_vars < 1).
@@ -162,6 +256,7 @@ class RecursiveMinimumEigenOptimizer(OptimizationAlgorithm):
             self._min_num_vars_optimizer = MinimumEigenOptimizer(NumPyMinimumEigensolver())
         self._penalty = penalty
         self._history = history
+        self._warm_start = warm_start
 
         self._converters = self._prepare_converters(converters, penalty)
 
@@ -192,66 +287,53 @@ class RecursiveMinimumEigenOptimizer(OptimizationAlgorithm):
 
         Raises:
             QiskitOptimizationError: Incompatible problem.
-            QiskitOptimizationError: Infeasible due to variable substitution
+            QiskitOptimizationError: If the converted problem is not a QUBO.
         """
         self._verify_compatibility(problem)
 
         # convert problem to QUBO, this implicitly checks if the problem is compatible
         problem_ = self._convert(problem, self._converters)
-        problem_ref = deepcopy(problem_)
+        problem_ref = problem_
 
         # run recursive optimization until the resulting problem is small enough
         replacements = {}   # type: Dict[str, Tuple[str, int]]
         min_eigen_results = []        # type: List[MinimumEigenOptimizationResult]
-        while problem_.get_num_vars() > self._min_num_vars:
-
-            # solve current problem with optimizer
-            res = self._min_eigen_optimizer.solve(problem_)   # type: MinimumEigenOptimizationResult
-            if self._history == IntermediateResult.ALL_ITERATIONS:
-                min_eigen_results.append(res)
-
-            # analyze results to get strongest correlation
-            correlations = res.get_correlations()
-            i, j = self._find_strongest_correlation(correlations)
-
-            x_i = problem_.variables[i].name
-            x_j = problem_.variables[j].name
-            if correlations[i, j] > 0:
-                # set x_i = x_j
-                problem_ = problem_.substitute_variables(variables={i: (j, 1)})
-                if problem_.status == QuadraticProgram.Status.INFEASIBLE:
-                    raise QiskitOptimizationError('Infeasible due to variable substitution')
-                replacements[x_i] = (x_j, 1)
-            else:
-                # set x_i = 1 - x_j, this is done in two steps:
-                # 1. set x_i = 1 + x_i
-                # 2. set x_i = -x_j
-
-                # 1a. get additional offset
-                constant = problem_.objective.constant
-                constant += problem_.objective.linear[i]
-                constant += problem_.objective.quadratic[i, i]
-                problem_.objective.constant = constant
-
-                # 1b. get additional linear part
-                for k in range(problem_.get_num_vars()):
-                    coeff = problem_.objective.linear[k]
-                    if k == i:
-                        coeff += 2*problem_.objective.quadratic[i, k]
-                    else:
-                        coeff += problem_.objective.quadratic[i, k]
-
-                    # set new coefficient if not too small
-                    if np.abs(coeff) > 1e-10:
-                        problem_.objective.linear[k] = coeff
-                    else:
-                        problem_.objective.linear[k] = 0
-
-                # 2. replace x_i by -x_j
-                problem_ = problem_.substitute_variables(variables={i: (j, -1)})
-                if problem_.status == QuadraticProgram.Status.INFEASIBLE:
-                    raise QiskitOptimizationError('Infeasible due to variable substitution')
-                replacements[x_i] = (x_j, -1)
+        qubo = _IncrementalQubo(problem_)
+        solver = self._min_eigen_optimizer.min_eigen_solver
+        warm_start = self._warm_start and isinstance(solver, QAOA)
+        initial_point = solver.initial_point if warm_start else None
+        try:
+            while qubo.num_vars > self._min_num_vars:
+
+                # solve current problem with optimizer
+                problem_ = qubo.to_quadratic_program()
+                res = self._min_eigen_optimizer.solve(problem_)
+                if self._history == IntermediateResult.ALL_ITERATIONS:
+                    min_eigen_results.append(res)
+
+                # the number of QAOA parameters does not depend on the number of variables,
+                # hence the optimal parameters are a good starting point for the next iteration
+                if warm_start and res.min_eigen_solver_result is not None:
+                    solver.initial_point = res.min_eigen_solver_result.optimal_point
+
+                # analyze results to get strongest correlation
+                correlations = res.get_correlations()
+                i, j = self._find_strongest_correlation(correlations)
+
+                x_i = problem_.variables[i].name
+                x_j = problem_.variables[j].name
+                if correlations[i, j] > 0:
+                    # set x_i = x_j
+                    qubo.substitute(i, j, 1)
+                    replacements[x_i] = (x_j, 1)
+                else:
+                    # set x_i = 1 - x_j
+                    qubo.substitute(i, j, -1)
+                    replacements[x_i] = (x_j, -1)
+        finally:
+            if warm_start:
+                solver.initial_point = initial_point
+        problem_ = qubo.to_quadratic_program()
 
         # solve remaining problem
         result = self._min_num_vars_optimizer.solve(problem_)
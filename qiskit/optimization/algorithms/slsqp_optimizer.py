@@ -12,16 +12,14 @@
 
 """The SLSQP optimizer wrapped to be used within Qiskit's optimization module."""
 import logging
-from typing import List, cast, Tuple, Any, Union, Optional
+from typing import List, Tuple, Any, Union, Optional
 
 import numpy as np
 from scipy.optimize import fmin_slsqp
 
-from .multistart_optimizer import MultiStartOptimizer
+from .multistart_optimizer import MultiStartOptimizer, _ProblemArrays
 from .optimization_algorithm import OptimizationResultStatus, OptimizationResult
-from ..exceptions import QiskitOptimizationError
 from ..problems import Variable
-from ..problems.constraint import Constraint
 from ..problems.quadratic_program import QuadraticProgram
 
 logger = logging.getLogger(__name__)
@@ -99,7 +97,8 @@ class SlsqpOptimizer(MultiStartOptimizer):
 
     # pylint: disable=redefined-builtin
     def __init__(self, iter: int = 100, acc: float = 1.0E-6, iprint: int = 0, trials: int = 1,
-                 clip: float = 100., full_output: bool = False) -> None:
+                 clip: float = 100., full_output: bool = False,
+                 num_processes: Optional[int] = 1) -> None:
         """Initializes the SlsqpOptimizer.
 
         This initializer takes the algorithmic parameters of SLSQP and stores them for later use
@@ -125,9 +124,11 @@ class SlsqpOptimizer(MultiStartOptimizer):
                 with the ``-clip`` or ``clip`` values correspondingly for the initial guesses.
             full_output: If ``False``, return only the minimizer of func (default).
                 Otherwise, output final objective function and summary information.
+            num_processes: The number of processes running trials in parallel. All local CPUs
+                are used if None.
         """
 
-        super().__init__(trials, clip)
+        super().__init__(trials, clip, num_processes)
         self._iter = iter
         self._acc = acc
         self._iprint = iprint
@@ -169,54 +170,11 @@ class SlsqpOptimizer(MultiStartOptimizer):
         """
         self._verify_compatibility(problem)
 
-        # construct quadratic objective function
-        def _objective(x):
-            return problem.objective.sense.value * problem.objective.evaluate(x)
-
-        def _objective_gradient(x):
-            return problem.objective.sense.value * problem.objective.evaluate_gradient(x)
-
-        # initialize constraints and bounds
-        slsqp_bounds = []
-        slsqp_eq_constraints = []
-        slsqp_ineq_constraints = []
-
-        # add lower/upper bound constraints
-        for variable in problem.variables:
-            lowerbound = variable.lowerbound
-            upperbound = variable.upperbound
-            slsqp_bounds.append((lowerbound, upperbound))
-
-        # pylint: disable=no-member
-        # add linear and quadratic constraints
-        for constraint in cast(List[Constraint], problem.linear_constraints) + \
-                cast(List[Constraint], problem.quadratic_constraints):
-            rhs = constraint.rhs
-            sense = constraint.sense
-
-            if sense == Constraint.Sense.EQ:
-                slsqp_eq_constraints += [lambda x, rhs=rhs, c=constraint: rhs - c.evaluate(x)]
-            elif sense == Constraint.Sense.LE:
-                slsqp_ineq_constraints += [lambda x, rhs=rhs, c=constraint: rhs - c.evaluate(x)]
-            elif sense == Constraint.Sense.GE:
-                slsqp_ineq_constraints += [lambda x, rhs=rhs, c=constraint: c.evaluate(x) - rhs]
-            else:
-                raise QiskitOptimizationError('Unsupported constraint type!')
-
-        # actual minimization function to be called by multi_start_solve
-        def _minimize(x_0: np.array) -> Tuple[np.array, Any]:
-            output = fmin_slsqp(_objective, x_0, eqcons=slsqp_eq_constraints,
-                                ieqcons=slsqp_ineq_constraints, bounds=slsqp_bounds,
-                                fprime=_objective_gradient, iter=self._iter, acc=self._acc,
-                                iprint=self._iprint, full_output=self._full_output)
-            if self._full_output:
-                x, *rest = output
-            else:
-                x, rest = output, None
-            return np.asarray(x), rest
+        minimize = _SlsqpMinimize(_ProblemArrays(problem), iter=self._iter, acc=self._acc,
+                                  iprint=self._iprint)
 
         # actual optimization goes here
-        result = self.multi_start_solve(_minimize, problem)
+        result = self.multi_start_solve(minimize, problem, _slsqp_converged)
 
         if self._full_output:
             return SlsqpOptimizationResult(x=result.x, fval=result.fval, variables=result.variables,
@@ -226,3 +184,32 @@ class SlsqpOptimizer(MultiStartOptimizer):
         else:
             return SlsqpOptimizationResult(x=result.x, fval=result.fval, variables=result.variables,
                                            status=self._get_feasibility_status(problem, result.x))
+
+
+class _SlsqpMinimize:
+    """The minimization function of a trial, which can be passed to other processes. The
+    constraints of each kind are evaluated at once along with their Jacobians."""
+
+    def __init__(self, problem: _ProblemArrays, **kwargs: Any) -> None:
+        self._problem = problem
+        self._kwargs = kwargs
+        self._bounds = list(zip(problem.lowerbound, problem.upperbound))
+
+    def __call__(self, x_0: np.ndarray) -> Tuple[np.ndarray, Any]:
+        constraints = {}
+        if self._problem.num_equalities > 0:
+            constraints.update(f_eqcons=self._problem.equalities,
+                               fprime_eqcons=self._problem.equalities_jacobian)
+        if self._problem.num_inequalities > 0:
+            constraints.update(f_ieqcons=self._problem.inequalities,
+                               fprime_ieqcons=self._problem.inequalities_jacobian)
+        # the full output tells whether the optimization has converged
+        x, *rest = fmin_slsqp(self._problem.objective, x_0, bounds=self._bounds,
+                              fprime=self._problem.gradient, full_output=True, **constraints,
+                              **self._kwargs)
+        return np.asarray(x), rest
+
+
+def _slsqp_converged(rest: List[Any]) -> bool:
+    """Whether the exit mode in the full output of ``fmin_slsqp`` is a successful one."""
+    return rest[2] == 0
@@ -18,9 +18,8 @@ Deal with Gset format. See https://web.stanford.edu/~yyye/yyye/Gset/
 import logging
 
 import numpy as np
-from qiskit.quantum_info import Pauli
 
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -62,53 +61,23 @@ def get_operator(weight_matrix, K):  # pylint: disable=invalid-name
     """
     # pylint: disable=invalid-name
     num_nodes = len(weight_matrix)
-    pauli_list = []
-    shift = 0
+    edges = np.tril(weight_matrix, k=-1) != 0
 
     Y = K - 0.5 * num_nodes  # Y = K - sum_{v}{1 / 2}
 
     A = 1000
     # Ha part:
-    shift += A * Y * Y
-
-    for i in range(num_nodes):
-        for j in range(num_nodes):
-            if i != j:
-                xp = np.zeros(num_nodes, dtype=np.bool)
-                zp = np.zeros(num_nodes, dtype=np.bool)
-                zp[i] = True
-                zp[j] = True
-                pauli_list.append([A * 0.25, Pauli(zp, xp)])
-            else:
-                shift += A * 0.25
-    for i in range(num_nodes):
-        xp = np.zeros(num_nodes, dtype=np.bool)
-        zp = np.zeros(num_nodes, dtype=np.bool)
-        zp[i] = True
-        pauli_list.append([-A * Y, Pauli(zp, xp)])
-
-    shift += 0.5 * K * (K - 1)
-
-    for i in range(num_nodes):
-        for j in range(i):
-            if weight_matrix[i, j] != 0:
-                xp = np.zeros(num_nodes, dtype=np.bool)
-                zp = np.zeros(num_nodes, dtype=np.bool)
-                zp[i] = True
-                zp[j] = True
-                pauli_list.append([-0.25, Pauli(zp, xp)])
-
-                zp2 = np.zeros(num_nodes, dtype=np.bool)
-                zp2[i] = True
-                pauli_list.append([-0.25, Pauli(zp2, xp)])
-
-                zp3 = np.zeros(num_nodes, dtype=np.bool)
-                zp3[j] = True
-                pauli_list.append([-0.25, Pauli(zp3, xp)])
-
-                shift += -0.25
-
-    return WeightedPauliOperator(paulis=pauli_list), shift
+    linear = -A * Y * np.ones(num_nodes)
+    quadratic = A * 0.25 * np.ones((num_nodes, num_nodes))
+    shift = A * Y * Y
+
+    # Hb part:
+    linear -= 0.25 * (edges.sum(axis=0) + edges.sum(axis=1))
+    quadratic -= 0.25 * edges
+    shift += 0.5 * K * (K - 1) - 0.25 * edges.sum()
+
+    qubit_op, constant = ising_to_operator(linear, quadratic)
+    return qubit_op, shift + constant
 
 
 def satisfy_or_not(x, w, K):  # pylint: disable=invalid-name
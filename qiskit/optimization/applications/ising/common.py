@@ -15,9 +15,11 @@
 from collections import OrderedDict
 
 import numpy as np
+from scipy.sparse import coo_matrix, triu
 
+from qiskit.quantum_info import Pauli
 from qiskit.aqua import aqua_globals
-from qiskit.aqua.operators import StateFn
+from qiskit.aqua.operators import StateFn, WeightedPauliOperator
 
 
 def random_graph(n, weight_range=10, edge_prob=0.3, negative_weight=True,
@@ -168,3 +170,46 @@ def sample_most_likely(state_vector):
             x[i] = k % 2
             k >>= 1
         return x
+
+
+def ising_to_operator(linear, quadratic=None):
+    """Build the operator sum_i h_i Z_i + sum_{i,j} J_ij Z_i Z_j from the coefficient arrays.
+
+    The coefficients of J_ij and J_ji are merged into a single Z_i Z_j term, and since
+    Z_i Z_i is the identity, the diagonal of J is returned as a constant instead.
+    The operator lists the linear terms first and then the quadratic terms, ordered by
+    the larger and then the smaller qubit index. Terms with zero coefficient are dropped.
+
+    Args:
+        linear (numpy.ndarray): the coefficients h of the linear terms.
+        quadratic (Union(numpy.ndarray, scipy.sparse.spmatrix, None)): the coefficients J
+            of the quadratic terms.
+
+    Returns:
+        tuple(WeightedPauliOperator, float): the operator and the constant from the diagonal
+            of the quadratic terms.
+    """
+    linear = np.asarray(linear, dtype=float)
+    num_qubits = len(linear)
+    linear_indices = np.flatnonzero(linear)
+    rows = cols = np.zeros(0, dtype=int)
+    values = np.zeros(0)
+    constant = 0.0
+    if quadratic is not None:
+        quadratic = coo_matrix(quadratic, shape=(num_qubits, num_qubits), dtype=float)
+        constant = quadratic.diagonal().sum()
+        # the sum with the transpose merges J_ij and J_ji (and duplicate entries)
+        upper = triu(quadratic + quadratic.T, k=1, format='coo')
+        upper.eliminate_zeros()
+        order = np.lexsort((upper.row, upper.col))
+        rows, cols, values = upper.row[order], upper.col[order], upper.data[order]
+
+    num_linear = len(linear_indices)
+    z_masks = np.zeros((num_linear + len(values), num_qubits), dtype=bool)
+    z_masks[np.arange(num_linear), linear_indices] = True
+    z_masks[np.arange(num_linear, len(z_masks)), rows] = True
+    z_masks[np.arange(num_linear, len(z_masks)), cols] = True
+    x_mask = np.zeros(num_qubits, dtype=bool)
+    weights = np.concatenate((linear[linear_indices], values))
+    pauli_list = [[weight, Pauli(z_mask, x_mask)] for weight, z_mask in zip(weights, z_masks)]
+    return WeightedPauliOperator(paulis=pauli_list), constant
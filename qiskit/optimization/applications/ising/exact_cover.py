@@ -15,9 +15,9 @@
 import logging
 
 import numpy as np
+from scipy.sparse import coo_matrix
 
-from qiskit.quantum_info import Pauli
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -42,40 +42,18 @@ def get_operator(list_of_subsets):
     # pylint: disable=invalid-name
     n = len(list_of_subsets)
 
-    U = []
-    for sub in list_of_subsets:
-        U.extend(sub)
-    U = np.unique(U)  # U is the universe
-
-    shift = 0
-    pauli_list = []
-
-    for e in U:
-        # pylint: disable=simplifiable-if-expression
-        cond = [True if e in sub else False for sub in list_of_subsets]
-        indices_has_e = np.arange(n)[cond]
-        num_has_e = len(indices_has_e)
-        Y = 1 - 0.5 * num_has_e
-        shift += Y * Y
-
-        for i in indices_has_e:
-            for j in indices_has_e:
-                if i != j:
-                    w_p = np.zeros(n)
-                    v_p = np.zeros(n)
-                    v_p[i] = 1
-                    v_p[j] = 1
-                    pauli_list.append([0.25, Pauli(v_p, w_p)])
-                else:
-                    shift += 0.25
-
-        for i in indices_has_e:
-            w_p = np.zeros(n)
-            v_p = np.zeros(n)
-            v_p[i] = 1
-            pauli_list.append([-Y, Pauli(v_p, w_p)])
-
-    return WeightedPauliOperator(paulis=pauli_list), shift
+    # the incidence matrix of the elements of the universe U and the subsets
+    U = {}
+    rows, cols = [], []
+    for i, sub in enumerate(list_of_subsets):
+        for e in set(sub):
+            rows.append(U.setdefault(e, len(U)))
+            cols.append(i)
+    incidence = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(U), n)).tocsr()
+
+    Y = 1 - 0.5 * np.asarray(incidence.sum(axis=1)).ravel()
+    qubit_op, constant = ising_to_operator(-(incidence.T @ Y), 0.25 * (incidence.T @ incidence))
+    return qubit_op, np.dot(Y, Y) + constant
 
 
 def get_solution(x):
@@ -19,8 +19,7 @@ import logging
 
 import numpy as np
 
-from qiskit.quantum_info import Pauli
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -46,30 +45,10 @@ def get_operator(weight_matrix):
         float: a constant shift for the obj function.
     """
     num_nodes = len(weight_matrix)
-    pauli_list = []
-    shift = 0
-
-    for i in range(num_nodes):
-        for j in range(i):
-            if weight_matrix[i, j] != 0:
-                x_p = np.zeros(num_nodes, dtype=np.bool)
-                z_p = np.zeros(num_nodes, dtype=np.bool)
-                z_p[i] = True
-                z_p[j] = True
-                pauli_list.append([-0.5, Pauli(z_p, x_p)])
-                shift += 0.5
-
-    for i in range(num_nodes):
-        for j in range(num_nodes):
-            if i != j:
-                x_p = np.zeros(num_nodes, dtype=np.bool)
-                z_p = np.zeros(num_nodes, dtype=np.bool)
-                z_p[i] = True
-                z_p[j] = True
-                pauli_list.append([1, Pauli(z_p, x_p)])
-            else:
-                shift += 1
-    return WeightedPauliOperator(paulis=pauli_list), shift
+    edges = np.tril(weight_matrix, k=-1) != 0
+    quadratic = np.ones((num_nodes, num_nodes)) - 0.5 * edges
+    qubit_op, constant = ising_to_operator(np.zeros(num_nodes), quadratic)
+    return qubit_op, 0.5 * edges.sum() + constant
 
 
 def objective_value(x, w):
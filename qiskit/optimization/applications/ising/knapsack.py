@@ -32,6 +32,8 @@ import numpy as np
 from qiskit.quantum_info import Pauli
 from qiskit.aqua.operators import WeightedPauliOperator
 
+from .common import ising_to_operator
+
 
 logger = logging.getLogger(__name__)
 
@@ -93,89 +95,30 @@ def get_operator(values, weights, max_weight):
     y_size = int(math.log(max_weight, 2)) + 1 if max_weight > 0 else 1
     n = len(values)
     num_values = n + y_size
-    pauli_list = []
-    shift = 0
 
     # pylint: disable=invalid-name
     M = 10 * np.sum(values)
 
-    # term for sum(x_i*w_i)**2
-    for i in range(n):
-        for j in range(n):
-            coefficient = -1 * 0.25 * weights[i] * weights[j] * M
-            pauli_op = _get_pauli_op(num_values, [j])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
-
-            pauli_op = _get_pauli_op(num_values, [i])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
-
-            coefficient = -1 * coefficient
-            pauli_op = _get_pauli_op(num_values, [i, j])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
-
-    # term for sum(2**j*y_j)**2
-    for i in range(y_size):
-        for j in range(y_size):
-            coefficient = -1 * 0.25 * (2 ** i) * (2 ** j) * M
-
-            pauli_op = _get_pauli_op(num_values, [n + j])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
-
-            pauli_op = _get_pauli_op(num_values, [n + i])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
-
-            coefficient = -1 * coefficient
-            pauli_op = _get_pauli_op(num_values, [n + i, n + j])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
-
-    # term for -2*W_max*sum(x_i*w_i)
-    for i in range(n):
-        coefficient = max_weight * weights[i] * M
-
-        pauli_op = _get_pauli_op(num_values, [i])
-        pauli_list.append([coefficient, pauli_op])
-        shift -= coefficient
-
-    # term for -2*W_max*sum(2**j*y_j)
-    for j in range(y_size):
-        coefficient = max_weight * (2 ** j) * M
-
-        pauli_op = _get_pauli_op(num_values, [n + j])
-        pauli_list.append([coefficient, pauli_op])
-        shift -= coefficient
-
-    for i in range(n):
-        for j in range(y_size):
-            coefficient = -1 * 0.5 * weights[i] * (2 ** j) * M
-
-            pauli_op = _get_pauli_op(num_values, [n + j])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
-
-            pauli_op = _get_pauli_op(num_values, [i])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
-
-            coefficient = -1 * coefficient
-            pauli_op = _get_pauli_op(num_values, [i, n + j])
-            pauli_list.append([coefficient, pauli_op])
-            shift -= coefficient
+    # the weights of the x_i followed by the weights 2**j of the slack bits y_j
+    a = np.concatenate((np.asarray(weights, dtype=float), 2. ** np.arange(y_size)))
 
-    # term for sum(x_i*v_i)
-    for i in range(n):
-        coefficient = 0.5 * values[i]
+    # term for (sum(x_i*w_i) + sum(2**j*y_j))**2
+    linear = -0.5 * M * np.sum(a) * a
+    quadratic = 0.25 * M * np.outer(a, a)
+    shift = 0.25 * M * np.sum(a) ** 2
 
-        pauli_op = _get_pauli_op(num_values, [i])
-        pauli_list.append([coefficient, pauli_op])
-        shift -= coefficient
+    # term for -2*W_max*(sum(x_i*w_i) + sum(2**j*y_j))
+    linear += max_weight * M * a
+    shift -= max_weight * M * np.sum(a)
+
+    # term for sum(x_i*v_i)
+    linear[:n] += 0.5 * np.asarray(values, dtype=float)
+    shift -= 0.5 * np.sum(values)
 
-    return WeightedPauliOperator(paulis=pauli_list), shift
+    qubit_op, constant = ising_to_operator(linear, quadratic)
+    # the squares of the Z_i are kept in the operator as identity
+    qubit_op += WeightedPauliOperator(paulis=[[constant, _get_pauli_op(num_values, [])]])
+    return qubit_op, shift
 
 
 def get_solution(x, values):
@@ -22,8 +22,7 @@ import logging
 
 import numpy as np
 
-from qiskit.quantum_info import Pauli
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -39,19 +38,10 @@ def get_operator(weight_matrix):
         float: a constant shift for the obj function.
 
     """
-    num_nodes = weight_matrix.shape[0]
-    pauli_list = []
-    shift = 0
-    for i in range(num_nodes):
-        for j in range(i):
-            if weight_matrix[i, j] != 0:
-                x_p = np.zeros(num_nodes, dtype=np.bool)
-                z_p = np.zeros(num_nodes, dtype=np.bool)
-                z_p[i] = True
-                z_p[j] = True
-                pauli_list.append([0.5 * weight_matrix[i, j], Pauli(z_p, x_p)])
-                shift -= 0.5 * weight_matrix[i, j]
-    return WeightedPauliOperator(paulis=pauli_list), shift
+    weight_matrix = np.asarray(weight_matrix, dtype=float)
+    quadratic = 0.5 * np.tril(weight_matrix, k=-1)
+    qubit_op, _ = ising_to_operator(np.zeros(len(weight_matrix)), quadratic)
+    return qubit_op, -quadratic.sum()
 
 
 def max_cut_value(x, w):
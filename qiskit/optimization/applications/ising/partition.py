@@ -18,9 +18,8 @@ into a Hamiltonian given as a Pauli list.
 import logging
 
 import numpy as np
-from qiskit.quantum_info import Pauli
 
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -39,18 +38,10 @@ def get_operator(values):
         constant shift for the obj function.
 
     """
-    n = len(values)
     # The Hamiltonian is:
     # \sum_{i,j=1,\dots,n} ij z_iz_j + \sum_{i=1,\dots,n} i^2
-    pauli_list = []
-    for i in range(n):
-        for j in range(i):
-            x_p = np.zeros(n, dtype=np.bool)
-            z_p = np.zeros(n, dtype=np.bool)
-            z_p[i] = True
-            z_p[j] = True
-            pauli_list.append([2. * values[i] * values[j], Pauli(z_p, x_p)])
-    return WeightedPauliOperator(paulis=pauli_list), sum(values * values)
+    values = np.asarray(values)
+    return ising_to_operator(np.zeros(len(values)), np.outer(values, values))
 
 
 def partition_value(x, number_list):
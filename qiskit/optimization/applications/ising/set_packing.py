@@ -15,9 +15,9 @@
 import logging
 
 import numpy as np
-from qiskit.quantum_info import Pauli
+from scipy.sparse import coo_matrix
 
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -47,37 +47,22 @@ def get_operator(list_of_subsets):
                                         a constant shift for the obj function.
     """
     # pylint: disable=invalid-name
-    shift = 0
-    pauli_list = []
     A = 10
     n = len(list_of_subsets)
-    for i in range(n):
-        for j in range(i):
-            if set(list_of_subsets[i]) & set(list_of_subsets[j]):
-                wp = np.zeros(n)
-                vp = np.zeros(n)
-                vp[i] = 1
-                vp[j] = 1
-                pauli_list.append([A * 0.25, Pauli(vp, wp)])
-
-                vp2 = np.zeros(n)
-                vp2[i] = 1
-                pauli_list.append([A * 0.25, Pauli(vp2, wp)])
-
-                vp3 = np.zeros(n)
-                vp3[j] = 1
-                pauli_list.append([A * 0.25, Pauli(vp3, wp)])
-
-                shift += A * 0.25
-
-    for i in range(n):
-        wp = np.zeros(n)
-        vp = np.zeros(n)
-        vp[i] = 1
-        pauli_list.append([-0.5, Pauli(vp, wp)])
-        shift += -0.5
 
-    return WeightedPauliOperator(paulis=pauli_list), shift
+    # the subsets overlap if they share an element
+    elements = {}
+    rows, cols = [], []
+    for i, sub in enumerate(list_of_subsets):
+        for e in set(sub):
+            rows.append(i)
+            cols.append(elements.setdefault(e, len(elements)))
+    incidence = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, len(elements))).tocsr()
+    overlaps = np.tril((incidence @ incidence.T).toarray(), k=-1) != 0
+
+    linear = A * 0.25 * (overlaps.sum(axis=0) + overlaps.sum(axis=1)) - 0.5
+    qubit_op, _ = ising_to_operator(linear, A * 0.25 * overlaps)
+    return qubit_op, A * 0.25 * overlaps.sum() - 0.5 * n
 
 
 def get_solution(x):
@@ -21,9 +21,8 @@ graph is represented by an adjacency matrix.
 import logging
 
 import numpy as np
-from qiskit.quantum_info import Pauli
 
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -40,24 +39,9 @@ def get_operator(w):
 
     """
     num_nodes = len(w)
-    pauli_list = []
-    shift = 0
-    for i in range(num_nodes):
-        for j in range(i + 1, num_nodes):
-            if w[i, j] != 0:
-                x_p = np.zeros(num_nodes, dtype=np.bool)
-                z_p = np.zeros(num_nodes, dtype=np.bool)
-                z_p[i] = True
-                z_p[j] = True
-                pauli_list.append([1.0, Pauli(z_p, x_p)])
-                shift += 1
-    for i in range(num_nodes):
-        degree = np.sum(w[i, :])
-        x_p = np.zeros(num_nodes, dtype=np.bool)
-        z_p = np.zeros(num_nodes, dtype=np.bool)
-        z_p[i] = True
-        pauli_list.append([degree - 1 / 2, Pauli(z_p, x_p)])
-    return WeightedPauliOperator(paulis=pauli_list), shift - num_nodes / 2
+    edges = np.triu(w, k=1) != 0
+    qubit_op, _ = ising_to_operator(np.sum(w, axis=1) - 1 / 2, edges)
+    return qubit_op, edges.sum() - num_nodes / 2
 
 
 def stable_set_value(x, w):
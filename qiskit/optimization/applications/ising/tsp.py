@@ -23,10 +23,10 @@ import logging
 from collections import namedtuple
 
 import numpy as np
-from qiskit.quantum_info import Pauli
+from scipy import sparse
 
 from qiskit.aqua import aqua_globals
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -137,74 +137,29 @@ def get_operator(ins, penalty=1e5):
     """
     num_nodes = ins.dim
     num_qubits = num_nodes ** 2
-    zero = np.zeros(num_qubits, dtype=np.bool)
-    pauli_list = []
-    shift = 0
-    for i in range(num_nodes):
-        for j in range(num_nodes):
-            if i == j:
-                continue
-            for p__ in range(num_nodes):
-                q = (p__ + 1) % num_nodes
-                shift += ins.w[i, j] / 4
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[i * num_nodes + p__] = True
-                pauli_list.append([-ins.w[i, j] / 4, Pauli(z_p, zero)])
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[j * num_nodes + q] = True
-                pauli_list.append([-ins.w[i, j] / 4, Pauli(z_p, zero)])
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[i * num_nodes + p__] = True
-                z_p[j * num_nodes + q] = True
-                pauli_list.append([ins.w[i, j] / 4, Pauli(z_p, zero)])
-
-    for i in range(num_nodes):
-        for p__ in range(num_nodes):
-            z_p = np.zeros(num_qubits, dtype=np.bool)
-            z_p[i * num_nodes + p__] = True
-            pauli_list.append([penalty, Pauli(z_p, zero)])
-            shift += -penalty
-
-    for p__ in range(num_nodes):
-        for i in range(num_nodes):
-            for j in range(i):
-                shift += penalty / 2
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[i * num_nodes + p__] = True
-                pauli_list.append([-penalty / 2, Pauli(z_p, zero)])
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[j * num_nodes + p__] = True
-                pauli_list.append([-penalty / 2, Pauli(z_p, zero)])
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[i * num_nodes + p__] = True
-                z_p[j * num_nodes + p__] = True
-                pauli_list.append([penalty / 2, Pauli(z_p, zero)])
-
-    for i in range(num_nodes):
-        for p__ in range(num_nodes):
-            for q in range(p__):
-                shift += penalty / 2
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[i * num_nodes + p__] = True
-                pauli_list.append([-penalty / 2, Pauli(z_p, zero)])
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[i * num_nodes + q] = True
-                pauli_list.append([-penalty / 2, Pauli(z_p, zero)])
-
-                z_p = np.zeros(num_qubits, dtype=np.bool)
-                z_p[i * num_nodes + p__] = True
-                z_p[i * num_nodes + q] = True
-                pauli_list.append([penalty / 2, Pauli(z_p, zero)])
+    # the qubit i * num_nodes + p indicates that city i is visited at step p
+    weights = np.array(ins.w, dtype=float)
+    np.fill_diagonal(weights, 0)
+    identity = sparse.identity(num_nodes)
+    lower = sparse.tril(np.ones((num_nodes, num_nodes)), k=-1)
+    next_step = sparse.coo_matrix((np.ones(num_nodes), (np.arange(num_nodes),
+                                                        (np.arange(num_nodes) + 1) % num_nodes)),
+                                  shape=(num_nodes, num_nodes))
+
+    # distance between city i at step p and city j at step p + 1
+    linear = np.outer(weights.sum(axis=1) + weights.sum(axis=0), -np.ones(num_nodes) / 4)
+    quadratic = sparse.kron(weights / 4, next_step)
+    shift = num_nodes * weights.sum() / 4
+
+    # penalty for every city not visited exactly once and every step not used exactly once,
+    # the pairs of cities at the same step and of steps of the same city
+    linear += penalty - penalty * (num_nodes - 1)
+    quadratic += penalty / 2 * (sparse.kron(lower, identity) + sparse.kron(identity, lower))
+    shift += -penalty * num_qubits + penalty * num_nodes ** 2 * (num_nodes - 1) / 2
     shift += 2 * penalty * num_nodes
-    return WeightedPauliOperator(paulis=pauli_list), shift
+
+    qubit_op, constant = ising_to_operator(linear.ravel(), quadratic)
+    return qubit_op, shift + constant
 
 
 def tsp_value(z, w):
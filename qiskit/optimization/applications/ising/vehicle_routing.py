@@ -23,6 +23,8 @@ from qiskit.quantum_info import Pauli
 from qiskit.aqua.algorithms import MinimumEigensolverResult
 from qiskit.aqua.operators import WeightedPauliOperator
 
+from .common import ising_to_operator
+
 # pylint: disable=invalid-name
 
 
@@ -129,29 +131,10 @@ def get_operator(instance: np.ndarray, n: int, K: int) -> WeightedPauliOperator:
     g_z = (-g__ / 2 - np.dot(i_v, Q / 4) - np.dot(Q / 4, i_v))
     c_z = (c + np.dot(g__ / 2, i_v) + np.dot(i_v, np.dot(Q / 4, i_v)))
 
-    c_z = c_z + np.trace(q_z)
-    q_z = q_z - np.diag(np.diag(q_z))
-
     # Getting the Hamiltonian in the form of a list of Pauli terms
-
-    pauli_list = []
-    for i in range(N):
-        if g_z[i] != 0:
-            w_p = np.zeros(N)
-            v_p = np.zeros(N)
-            v_p[i] = 1
-            pauli_list.append((g_z[i], Pauli(v_p, w_p)))
-    for i in range(N):
-        for j in range(i):
-            if q_z[i, j] != 0:
-                w_p = np.zeros(N)
-                v_p = np.zeros(N)
-                v_p[i] = 1
-                v_p[j] = 1
-                pauli_list.append((2 * q_z[i, j], Pauli(v_p, w_p)))
-
-    pauli_list.append((c_z, Pauli(np.zeros(N), np.zeros(N))))
-    return WeightedPauliOperator(paulis=pauli_list)
+    qubit_op, constant = ising_to_operator(g_z, q_z)
+    qubit_op += WeightedPauliOperator(paulis=[[c_z + constant, Pauli(np.zeros(N), np.zeros(N))]])
+    return qubit_op
 
 
 def get_vehiclerouting_solution(instance: np.ndarray,
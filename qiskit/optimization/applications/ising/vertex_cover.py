@@ -18,9 +18,8 @@ Deal with Gset format. See https://web.stanford.edu/~yyye/yyye/Gset/
 import logging
 
 import numpy as np
-from qiskit.quantum_info import Pauli
 
-from qiskit.aqua.operators import WeightedPauliOperator
+from .common import ising_to_operator
 
 logger = logging.getLogger(__name__)
 
@@ -49,36 +48,12 @@ def get_operator(weight_matrix):
 
     """
     n = len(weight_matrix)
-    pauli_list = []
-    shift = 0
     a__ = 5
+    edges = np.tril(weight_matrix, k=-1) != 0
 
-    for i in range(n):
-        for j in range(i):
-            if weight_matrix[i, j] != 0:
-                w_p = np.zeros(n)
-                v_p = np.zeros(n)
-                v_p[i] = 1
-                v_p[j] = 1
-                pauli_list.append([a__ * 0.25, Pauli(v_p, w_p)])
-
-                v_p2 = np.zeros(n)
-                v_p2[i] = 1
-                pauli_list.append([-a__ * 0.25, Pauli(v_p2, w_p)])
-
-                v_p3 = np.zeros(n)
-                v_p3[j] = 1
-                pauli_list.append([-a__ * 0.25, Pauli(v_p3, w_p)])
-
-                shift += a__ * 0.25
-
-    for i in range(n):
-        w_p = np.zeros(n)
-        v_p = np.zeros(n)
-        v_p[i] = 1
-        pauli_list.append([0.5, Pauli(v_p, w_p)])
-        shift += 0.5
-    return WeightedPauliOperator(paulis=pauli_list), shift
+    linear = 0.5 - a__ * 0.25 * (edges.sum(axis=0) + edges.sum(axis=1))
+    qubit_op, _ = ising_to_operator(linear, a__ * 0.25 * edges)
+    return qubit_op, a__ * 0.25 * edges.sum() + 0.5 * n
 
 
 def check_full_edge_coverage(x, w):
@@ -41,6 +41,7 @@ Converters
    IntegerToBinary
    LinearEqualityToPenalty
    QuadraticProgramToQubo
+   QuboPresolver
 
 """
 
@@ -51,6 +52,7 @@ from .quadratic_program_to_qubo import QuadraticProgramToQubo
 from .quadratic_program_to_ising import QuadraticProgramToIsing
 from .ising_to_quadratic_program import IsingToQuadraticProgram
 from .quadratic_program_converter import QuadraticProgramConverter
+from .qubo_presolver import QuboPresolver
 
 __all__ = [
     "InequalityToEquality",
@@ -60,4 +62,5 @@ __all__ = [
     "QuadraticProgramConverter",
     "QuadraticProgramToIsing",
     "QuadraticProgramToQubo",
+    "QuboPresolver",
 ]
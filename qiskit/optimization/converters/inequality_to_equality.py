@@ -12,9 +12,13 @@
 """The inequality to equality converter."""
 
 import copy
+import itertools
 import logging
 import math
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy.sparse import coo_matrix, hstack
 
 import qiskit.optimization.algorithms  # pylint: disable=unused-import
 from .quadratic_program_converter import QuadraticProgramConverter
@@ -92,253 +96,205 @@ class InequalityToEquality(QuadraticProgramConverter):
                     "Unsupported variable type {}".format(x.vartype))
 
         # Copy the objective function
-        constant = self._src.objective.constant
-        linear = self._src.objective.linear.to_dict(use_name=True)
-        quadratic = self._src.objective.quadratic.to_dict(use_name=True)
+        quadratic, linear, constant = self._src.objective.to_arrays()
         if self._src.objective.sense == QuadraticObjective.Sense.MINIMIZE:
             self._dst.minimize(constant, linear, quadratic)
         else:
             self._dst.maximize(constant, linear, quadratic)
 
         # For linear constraints
-        for l_constraint in self._src.linear_constraints:
-            linear = l_constraint.linear.to_dict(use_name=True)
-            if l_constraint.sense == Constraint.Sense.EQ:
-                self._dst.linear_constraint(
-                    linear, l_constraint.sense, l_constraint.rhs, l_constraint.name
-                )
-            elif (
-                    l_constraint.sense == Constraint.Sense.LE
-                    or l_constraint.sense == Constraint.Sense.GE
-            ):
-                if mode == 'integer':
-                    self._add_integer_slack_var_linear_constraint(
-                        linear, l_constraint.sense, l_constraint.rhs, l_constraint.name
-                    )
-                elif mode == 'continuous':
-                    self._add_continuous_slack_var_linear_constraint(
-                        linear, l_constraint.sense, l_constraint.rhs, l_constraint.name
-                    )
-                elif mode == 'auto':
-                    self._add_auto_slack_var_linear_constraint(
-                        linear, l_constraint.sense, l_constraint.rhs, l_constraint.name
-                    )
-                else:
-                    raise QiskitOptimizationError(
-                        'Unsupported mode is selected: {}'.format(mode))
-            else:
-                raise QiskitOptimizationError(
-                    'Type of sense in {} is not supported'.format(
-                        l_constraint.name)
-                )
+        self._add_linear_constraints(mode)
 
         # For quadratic constraints
-        for q_constraint in self._src.quadratic_constraints:
-            linear = q_constraint.linear.to_dict(use_name=True)
-            quadratic = q_constraint.quadratic.to_dict(use_name=True)
-            if q_constraint.sense == Constraint.Sense.EQ:
-                self._dst.quadratic_constraint(
-                    linear, quadratic, q_constraint.sense, q_constraint.rhs, q_constraint.name
-                )
-            elif (
-                    q_constraint.sense == Constraint.Sense.LE
-                    or q_constraint.sense == Constraint.Sense.GE
-            ):
-                if mode == 'integer':
-                    self._add_integer_slack_var_quadratic_constraint(
-                        linear, quadratic, q_constraint.sense, q_constraint.rhs, q_constraint.name,
-                    )
-                elif mode == 'continuous':
-                    self._add_continuous_slack_var_quadratic_constraint(
-                        linear, quadratic, q_constraint.sense, q_constraint.rhs, q_constraint.name,
-                    )
-                elif mode == 'auto':
-                    self._add_auto_slack_var_quadratic_constraint(
-                        linear, quadratic, q_constraint.sense, q_constraint.rhs, q_constraint.name,
-                    )
-                else:
-                    raise QiskitOptimizationError(
-                        'Unsupported mode is selected: {}'.format(mode))
-            else:
-                raise QiskitOptimizationError(
-                    'Type of sense in {} is not supported'.format(
-                        q_constraint.name)
-                )
+        self._add_quadratic_constraints(mode)
 
         return self._dst
 
-    def _add_integer_slack_var_linear_constraint(self, linear, sense, rhs, name):
-        # If a coefficient that is not integer exist, raise error
-        if self._contains_any_float_value(linear.values()):
-            raise QiskitOptimizationError(
-                '"{0}" contains float coefficients. '
-                'We can not use an integer slack variable for "{0}"'.format(name))
-
-        # If rhs is float number, round up/down to the nearest integer.
-        new_rhs = rhs
-        if sense == Constraint.Sense.LE:
-            new_rhs = math.floor(rhs)
-        if sense == Constraint.Sense.GE:
-            new_rhs = math.ceil(rhs)
+    def _add_linear_constraints(self, mode: str) -> None:
+        """Adds the linear constraints to the converted problem.
 
-        # Add a new integer variable.
-        slack_name = name + self._delimiter + 'int_slack'
+        The bounds of the left-hand sides and of the slack variables are computed for all
+        constraints at once from the stacked constraint matrix. The slack variables are added
+        in batches, and the constraints are added at once as the constraint matrix extended by
+        the columns of the slack variables.
 
-        lhs_lb, lhs_ub = self._calc_linear_bounds(linear)
-
-        var_added = False
-
-        if sense == Constraint.Sense.LE:
-            var_ub = new_rhs - lhs_lb
-            if var_ub > 0:
-                sign = 1
-                self._dst.integer_var(
-                    name=slack_name, lowerbound=0, upperbound=var_ub)
-                var_added = True
-        elif sense == Constraint.Sense.GE:
-            var_ub = lhs_ub - new_rhs
-            if var_ub > 0:
-                sign = -1
-                self._dst.integer_var(
-                    name=slack_name, lowerbound=0, upperbound=var_ub)
-                var_added = True
-        else:
-            raise QiskitOptimizationError(
-                'The type of Sense in {} is not supported'.format(name))
+        Args:
+            mode: The type of the slack variables.
 
-        # Add a new equality constraint.
-        new_linear = copy.deepcopy(linear)
-        if var_added:
-            new_linear[slack_name] = sign
-        self._dst.linear_constraint(new_linear, "==", new_rhs, name)
+        Raises:
+            QiskitOptimizationError: If a constraint with float coefficients requires an integer
+                slack variable.
+            QiskitOptimizationError: If an unsupported mode is selected.
+            QiskitOptimizationError: If an unsupported sense is specified.
+        """
+        constraints = self._src.linear_constraints
+        matrix, _ = self._linear_constraints_to_arrays(self._src)
+
+        # the bounds of the left-hand sides, sum_j min/max(lb_j * a_ij, ub_j * a_ij)
+        lowerbounds = np.array([x.lowerbound for x in self._src.variables], dtype=float)
+        upperbounds = np.array([x.upperbound for x in self._src.variables], dtype=float)
+        positive = matrix.maximum(0)
+        negative = matrix.minimum(0)
+        lhs_lb = positive @ lowerbounds + negative @ upperbounds
+        lhs_ub = positive @ upperbounds + negative @ lowerbounds
+
+        # constraints containing a coefficient that is not integer
+        non_integer = matrix.copy()
+        non_integer.data = (non_integer.data != np.round(non_integer.data)).astype(float)
+        has_float = non_integer @ np.ones(matrix.shape[1]) > 0
+
+        new_rhs_list = []  # type: List[float]
+        # the index of the constraint, the type, the upper bound and the sign of every slack
+        slacks = []  # type: List[Tuple[int, str, float, int]]
+        for k, constraint in enumerate(constraints):
+            sense = constraint.sense
+            name = constraint.name
+            new_rhs = constraint.rhs
+            slack_type = None
+            if sense == Constraint.Sense.EQ:
+                pass
+            elif sense in (Constraint.Sense.LE, Constraint.Sense.GE):
+                if mode == 'integer' or (mode == 'auto' and not has_float[k]):
+                    # If a coefficient that is not integer exist, raise error
+                    if has_float[k]:
+                        raise QiskitOptimizationError(
+                            '"{0}" contains float coefficients. '
+                            'We can not use an integer slack variable for "{0}"'.format(name))
+                    # If rhs is float number, round up/down to the nearest integer.
+                    if sense == Constraint.Sense.LE:
+                        new_rhs = math.floor(new_rhs)
+                    else:
+                        new_rhs = math.ceil(new_rhs)
+                    slack_type = 'int'
+                elif mode in ('continuous', 'auto'):
+                    slack_type = 'continuous'
+                else:
+                    raise QiskitOptimizationError(
+                        'Unsupported mode is selected: {}'.format(mode))
+            else:
+                raise QiskitOptimizationError(
+                    'Type of sense in {} is not supported'.format(name)
+                )
 
-    def _add_continuous_slack_var_linear_constraint(self, linear, sense, rhs, name):
-        slack_name = name + self._delimiter + 'continuous_slack'
+            new_rhs_list.append(new_rhs)
+            if slack_type is not None:
+                if sense == Constraint.Sense.LE:
+                    var_ub, sign = float(new_rhs - lhs_lb[k]), 1
+                else:
+                    var_ub, sign = float(lhs_ub[k] - new_rhs), -1
+                if var_ub > 0:
+                    slacks.append((k, slack_type, var_ub, sign))
 
-        lhs_lb, lhs_ub = self._calc_linear_bounds(linear)
+        self._add_slack_variables([(constraints[k].name, slack_type, var_ub)
+                                   for k, slack_type, var_ub, _ in slacks])
 
-        var_added = False
-        if sense == Constraint.Sense.LE:
-            var_ub = rhs - lhs_lb
-            if var_ub > 0:
-                sign = 1
-                self._dst.continuous_var(
-                    name=slack_name, lowerbound=0, upperbound=var_ub)
-                var_added = True
-        elif sense == Constraint.Sense.GE:
-            var_ub = lhs_ub - rhs
-            if var_ub > 0:
-                sign = -1
-                self._dst.continuous_var(
-                    name=slack_name, lowerbound=0, upperbound=var_ub)
-                var_added = True
-        else:
-            raise QiskitOptimizationError(
-                'The type of Sense in {} is not supported'.format(name))
-
-        # Add a new equality constraint.
-        new_linear = copy.deepcopy(linear)
-        if var_added:
-            new_linear[slack_name] = sign
-        self._dst.linear_constraint(new_linear, "==", rhs, name)
-
-    def _add_auto_slack_var_linear_constraint(self, linear, sense, rhs, name):
-        # If a coefficient that is not integer exist, use a continuous slack variable
-        if self._contains_any_float_value(list(linear.values())):
-            self._add_continuous_slack_var_linear_constraint(
-                linear, sense, rhs, name)
-        # Else use an integer slack variable
-        else:
-            self._add_integer_slack_var_linear_constraint(
-                linear, sense, rhs, name)
+        # add the constraints with their slack columns at once
+        slack_matrix = coo_matrix(([sign for _, _, _, sign in slacks],
+                                   ([k for k, _, _, _ in slacks], np.arange(len(slacks)))),
+                                  shape=(len(constraints), len(slacks)))
+        self._dst.linear_constraints_from_matrix(
+            hstack([matrix, slack_matrix]), '==', new_rhs_list,
+            [constraint.name for constraint in constraints])
 
-    def _add_integer_slack_var_quadratic_constraint(self, linear, quadratic, sense, rhs, name):
-        # If a coefficient that is not integer exist, raise an error
-        if (self._contains_any_float_value(list(linear.values()))
-                or self._contains_any_float_value(list(quadratic.values()))):
-            raise QiskitOptimizationError(
-                '"{0}" contains float coefficients. '
-                'We can not use an integer slack variable for "{0}"'.format(name))
+    def _add_quadratic_constraints(self, mode: str) -> None:
+        """Adds the quadratic constraints to the converted problem.
 
-        # If rhs is float number, round up/down to the nearest integer.
-        new_rhs = rhs
-        if sense == Constraint.Sense.LE:
-            new_rhs = math.floor(rhs)
-        if sense == Constraint.Sense.GE:
-            new_rhs = math.ceil(rhs)
+        The slack variables of all constraints are determined first and added in batches
+        before the constraints.
 
-        # Add a new integer variable.
-        slack_name = name + self._delimiter + 'int_slack'
+        Args:
+            mode: The type of the slack variables.
 
-        lhs_lb, lhs_ub = self._calc_quadratic_bounds(linear, quadratic)
+        Raises:
+            QiskitOptimizationError: If a constraint with float coefficients requires an integer
+                slack variable.
+            QiskitOptimizationError: If an unsupported mode is selected.
+            QiskitOptimizationError: If an unsupported sense is specified.
+        """
+        # the linear and quadratic parts, the right-hand side and the slack type, upper bound
+        # and sign of every constraint
+        specs = []  # type: List[Tuple[Dict, Dict, float, Optional[str], float, int]]
+        for q_constraint in self._src.quadratic_constraints:
+            linear = q_constraint.linear.to_dict(use_name=True)
+            quadratic = q_constraint.quadratic.to_dict(use_name=True)
+            sense = q_constraint.sense
+            name = q_constraint.name
+            rhs = q_constraint.rhs
+            if sense == Constraint.Sense.EQ:
+                specs.append((linear, quadratic, rhs, None, 0, 0))
+                continue
+            if sense not in (Constraint.Sense.LE, Constraint.Sense.GE):
+                raise QiskitOptimizationError(
+                    'Type of sense in {} is not supported'.format(name))
 
-        var_added = False
+            has_float = (self._contains_any_float_value(list(linear.values()))
+                         or self._contains_any_float_value(list(quadratic.values())))
+            if mode == 'integer' or (mode == 'auto' and not has_float):
+                # If a coefficient that is not integer exist, raise an error
+                if has_float:
+                    raise QiskitOptimizationError(
+                        '"{0}" contains float coefficients. '
+                        'We can not use an integer slack variable for "{0}"'.format(name))
+                # If rhs is float number, round up/down to the nearest integer.
+                if sense == Constraint.Sense.LE:
+                    rhs = math.floor(rhs)
+                else:
+                    rhs = math.ceil(rhs)
+                slack_type = 'int'
+            elif mode in ('continuous', 'auto'):
+                slack_type = 'continuous'
+            else:
+                raise QiskitOptimizationError(
+                    'Unsupported mode is selected: {}'.format(mode))
 
-        if sense == Constraint.Sense.LE:
-            var_ub = new_rhs - lhs_lb
-            if var_ub > 0:
-                sign = 1
-                self._dst.integer_var(
-                    name=slack_name, lowerbound=0, upperbound=var_ub)
-                var_added = True
-        elif sense == Constraint.Sense.GE:
-            var_ub = lhs_ub - new_rhs
+            lhs_lb, lhs_ub = self._calc_quadratic_bounds(linear, quadratic)
+            if sense == Constraint.Sense.LE:
+                var_ub, sign = rhs - lhs_lb, 1
+            else:
+                var_ub, sign = lhs_ub - rhs, -1
             if var_ub > 0:
-                sign = -1
-                self._dst.integer_var(
-                    name=slack_name, lowerbound=0, upperbound=var_ub)
-                var_added = True
-        else:
-            raise QiskitOptimizationError(
-                'The type of Sense in {} is not supported'.format(name))
+                specs.append((linear, quadratic, rhs, slack_type, var_ub, sign))
+            else:
+                specs.append((linear, quadratic, rhs, None, 0, 0))
 
-        # Add a new equality constraint.
-        new_linear = copy.deepcopy(linear)
-        if var_added:
-            new_linear[slack_name] = sign
-        self._dst.quadratic_constraint(
-            new_linear, quadratic, "==", new_rhs, name)
+        slack_names = iter(self._add_slack_variables(
+            [(q_constraint.name, slack_type, var_ub)
+             for q_constraint, (_, _, _, slack_type, var_ub, _)
+             in zip(self._src.quadratic_constraints, specs) if slack_type is not None]))
 
-    def _add_continuous_slack_var_quadratic_constraint(self, linear, quadratic, sense, rhs, name):
-        # Add a new continuous variable.
-        slack_name = name + self._delimiter + 'continuous_slack'
+        # Add the new equality constraints.
+        for q_constraint, (linear, quadratic, rhs, slack_type, _, sign) \
+                in zip(self._src.quadratic_constraints, specs):
+            if slack_type is not None:
+                linear[next(slack_names)] = sign
+            self._dst.quadratic_constraint(linear, quadratic, "==", rhs, q_constraint.name)
 
-        lhs_lb, lhs_ub = self._calc_quadratic_bounds(linear, quadratic)
+    def _add_slack_variables(self, slacks: List[Tuple[str, str, float]]) -> List[str]:
+        """Adds slack variables with the list API, in one call per run of slack variables of
+        the same type.
 
-        var_added = False
+        Args:
+            slacks: The name of the constraint, the type and the upper bound of every slack
+                variable.
 
-        if sense == Constraint.Sense.LE:
-            var_ub = rhs - lhs_lb
-            if var_ub > 0:
-                sign = 1
-                self._dst.continuous_var(
-                    name=slack_name, lowerbound=0, upperbound=var_ub)
-                var_added = True
-        elif sense == Constraint.Sense.GE:
-            var_ub = lhs_ub - rhs
-            if var_ub > 0:
-                sign = -1
-                self._dst.continuous_var(
-                    name=slack_name, lowerbound=0, upperbound=lhs_ub - rhs)
-                var_added = True
-        else:
-            raise QiskitOptimizationError(
-                'The type of Sense in {} is not supported'.format(name))
-
-        # Add a new equality constraint.
-        new_linear = copy.deepcopy(linear)
-        if var_added:
-            new_linear[slack_name] = sign
-        self._dst.quadratic_constraint(new_linear, quadratic, "==", rhs, name)
-
-    def _add_auto_slack_var_quadratic_constraint(self, linear, quadratic, sense, rhs, name):
-        # If a coefficient that is not integer exist, use a continuous slack variable
-        if (self._contains_any_float_value(list(linear.values()))
-                or self._contains_any_float_value(list(quadratic.values()))):
-            self._add_continuous_slack_var_quadratic_constraint(linear, quadratic, sense, rhs, name)
-        # Else use an integer slack variable
-        else:
-            self._add_integer_slack_var_quadratic_constraint(linear, quadratic, sense, rhs, name)
+        Returns:
+            The names of the slack variables.
+        """
+        names = []  # type: List[str]
+        for slack_type, run in itertools.groupby(slacks, key=lambda slack: slack[1]):
+            run = list(run)
+            keys = [name for name, _, _ in run]
+            key_format = '{}' + self._delimiter + slack_type + '_slack'
+            if slack_type == 'int':
+                variables = self._dst.integer_var_list(keys, lowerbound=0, name='',
+                                                       key_format=key_format)
+            else:
+                variables = self._dst.continuous_var_list(keys, lowerbound=0, name='',
+                                                          key_format=key_format)
+            for variable, (_, _, var_ub) in zip(variables, run):
+                variable.upperbound = var_ub
+            names.extend(variable.name for variable in variables)
+        return names
 
     def _calc_linear_bounds(self, linear):
         lhs_lb, lhs_ub = 0, 0
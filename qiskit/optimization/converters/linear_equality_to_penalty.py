@@ -15,7 +15,9 @@
 import copy
 import logging
 from math import fsum
-from typing import Optional, cast, Union, Tuple, Dict
+from typing import Optional, Union, Dict
+
+import numpy as np
 
 import qiskit.optimization.algorithms  # pylint: disable=unused-import
 from ..exceptions import QiskitOptimizationError
@@ -76,43 +78,23 @@ class LinearEqualityToPenalty(QuadraticProgramConverter):
                 raise QiskitOptimizationError('Unsupported vartype: {}'.format(x.vartype))
 
         # get original objective terms
-        offset = self._src.objective.constant
-        linear = self._src.objective.linear.to_dict()
-        quadratic = self._src.objective.quadratic.to_dict()
+        quadratic, linear, offset = self._src.objective.to_arrays()
         sense = self._src.objective.sense.value
 
+        if any(constraint.sense != Constraint.Sense.EQ
+               for constraint in self._src.linear_constraints):
+            raise QiskitOptimizationError(
+                'An inequality constraint exists. '
+                'The method supports only equality constraints.'
+            )
+
         # convert linear constraints into penalty terms
-        for constraint in self._src.linear_constraints:
-
-            if constraint.sense != Constraint.Sense.EQ:
-                raise QiskitOptimizationError(
-                    'An inequality constraint exists. '
-                    'The method supports only equality constraints.'
-                )
-
-            constant = constraint.rhs
-            row = constraint.linear.to_dict()
-
-            # constant parts of penalty*(Constant-func)**2: penalty*(Constant**2)
-            offset += sense * penalty * constant ** 2
-
-            # linear parts of penalty*(Constant-func)**2: penalty*(-2*Constant*func)
-            for j, coef in row.items():
-                # if j already exists in the linear terms dic, add a penalty term
-                # into existing value else create new key and value in the linear_term dict
-                linear[j] = linear.get(j, 0.0) + sense * penalty * -2 * coef * constant
-
-            # quadratic parts of penalty*(Constant-func)**2: penalty*(func**2)
-            for j, coef_1 in row.items():
-                for k, coef_2 in row.items():
-                    # if j and k already exist in the quadratic terms dict,
-                    # add a penalty term into existing value
-                    # else create new key and value in the quadratic term dict
-
-                    # according to implementation of quadratic terms in OptimizationModel,
-                    # don't need to multiply by 2, since loops run over (x, y) and (y, x).
-                    tup = cast(Union[Tuple[int, int], Tuple[str, str]], (j, k))
-                    quadratic[tup] = quadratic.get(tup, 0.0) + sense * penalty * coef_1 * coef_2
+        # penalty * (b - A x)^2 = penalty * (x^T A^T A x - 2 b^T A x + b^T b)
+        matrix, rhs = self._linear_constraints_to_arrays(self._src)
+        weight = sense * penalty
+        offset += weight * fsum(rhs ** 2)
+        linear = linear - 2 * weight * (matrix.T @ rhs)
+        quadratic = quadratic + weight * (matrix.T @ matrix)
 
         if self._src.objective.sense == QuadraticObjective.Sense.MINIMIZE:
             self._dst.minimize(offset, linear, quadratic)
@@ -134,11 +116,9 @@ class LinearEqualityToPenalty(QuadraticProgramConverter):
 
         # Check coefficients of constraints.
         # If a constraint has a float coefficient, return the default value for the penalty factor.
-        terms = []
-        for constraint in self._src.linear_constraints:
-            terms.append(constraint.rhs)
-            terms.extend(coef for coef in constraint.linear.to_dict().values())
-        if any(isinstance(term, float) and not term.is_integer() for term in terms):
+        matrix, rhs = self._linear_constraints_to_arrays(self._src)
+        terms = np.concatenate((rhs, matrix.data))
+        if np.any(terms != np.round(terms)):
             logger.warning(
                 'Warning: Using %f for the penalty coefficient because '
                 'a float coefficient exists in constraints. \n'
@@ -150,13 +130,8 @@ class LinearEqualityToPenalty(QuadraticProgramConverter):
 
         # (upper bound - lower bound) can be calculate as the sum of absolute value of coefficients
         # Firstly, add 1 to guarantee that infeasible answers will be greater than upper bound.
-        penalties = [1.0]
-        # add linear terms of the object function.
-        penalties.extend(abs(coef) for coef in self._src.objective.linear.to_dict().values())
-        # add quadratic terms of the object function.
-        penalties.extend(abs(coef) for coef in self._src.objective.quadratic.to_dict().values())
-
-        return fsum(penalties)
+        quadratic, linear, _ = self._src.objective.to_arrays()
+        return fsum(np.concatenate(([1.0], np.abs(linear), np.abs(quadratic.data))))
 
     def interpret(self, result: 'qiskit.optimization.algorithms.OptimizationResult') \
             -> 'qiskit.optimization.algorithms.OptimizationResult':  # type: ignore
@@ -15,6 +15,10 @@
 import warnings
 
 from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
 
 import qiskit.optimization.algorithms  # pylint: disable=unused-import
 from ..problems.quadratic_program import QuadraticProgram
@@ -39,6 +43,26 @@ class QuadraticProgramConverter(ABC):
 
         raise NotImplementedError
 
+    @staticmethod
+    def _linear_constraints_to_arrays(problem: QuadraticProgram) -> Tuple[csr_matrix, np.ndarray]:
+        """Stacks the left-hand sides of the linear constraints of a problem into a matrix with
+        one row per constraint, and the right-hand sides into a vector."""
+        rows = []  # type: List[np.ndarray]
+        cols = []  # type: List[np.ndarray]
+        data = []  # type: List[np.ndarray]
+        for k, constraint in enumerate(problem.linear_constraints):
+            coefficients = constraint.linear.coefficients.tocoo()
+            rows.append(np.full(coefficients.nnz, k))
+            cols.append(coefficients.col)
+            data.append(coefficients.data)
+        shape = (problem.get_num_linear_constraints(), problem.get_num_vars())
+        matrix = coo_matrix((np.concatenate(data) if data else np.zeros(0),
+                             (np.concatenate(rows) if rows else np.zeros(0, dtype=int),
+                              np.concatenate(cols) if cols else np.zeros(0, dtype=int))),
+                            shape=shape).tocsr()
+        rhs = np.array([constraint.rhs for constraint in problem.linear_constraints], dtype=float)
+        return matrix, rhs
+
     def encode(self, problem: QuadraticProgram) -> QuadraticProgram:  # type: ignore
         """DEPRECATED Encode a QuadraticProgram into another form
         and keep the information required to decode the result.
@@ -0,0 +1,337 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A converter that reduces a QUBO classically before it is solved."""
+
+import copy
+import logging
+import pickle
+from typing import List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix, triu
+from scipy.sparse.csgraph import connected_components
+from qiskit.tools import parallel_map
+
+import qiskit.optimization.algorithms  # pylint: disable=unused-import
+from ..exceptions import QiskitOptimizationError
+from ..problems.quadratic_program import QuadraticProgram
+from .quadratic_program_converter import QuadraticProgramConverter
+
+logger = logging.getLogger(__name__)
+
+
+class QuboPresolver(QuadraticProgramConverter):
+    r"""Reduce a QUBO by fixing and merging variables and split it into independent parts.
+
+    The objective is written as :math:`c + \sum_i l_i x_i + \sum_{i<j} J_{ij} x_i x_j` to be
+    minimized. The change of the objective when setting :math:`x_i` from 0 to 1 lies in
+    :math:`[l_i + \sum_j \min(J_{ij}, 0), l_i + \sum_j \max(J_{ij}, 0)]` for any assignment of the
+    other variables. If this interval is non-negative (non-positive) there is an optimal solution
+    with :math:`x_i = 0` (:math:`x_i = 1`), which in particular fixes all isolated variables.
+    Two variables coupled by :math:`J_{ij} < 0` with
+    :math:`J_{ij} + \max(h_i, h_j) \leq 0`, where :math:`h_i` is the upper end of the interval
+    of variable :math:`i`, never prefer different values and are merged. The rules are applied
+    to all variables at once, repeatedly until nothing changes, and the remaining variables are
+    split into the connected components of the coupling graph, which can be solved independently.
+
+    Examples:
+        >>> from qiskit.aqua.algorithms import NumPyMinimumEigensolver
+        >>> from qiskit.optimization.problems import QuadraticProgram
+        >>> from qiskit.optimization.algorithms import MinimumEigenOptimizer
+        >>> from qiskit.optimization.converters import QuboPresolver
+        >>> problem = QuadraticProgram()
+        >>> # define a QUBO
+        >>> presolver = QuboPresolver()
+        >>> reduced = presolver.convert(problem)
+        >>> # solve the reduced problem, or all of its components in parallel
+        >>> optimizer = MinimumEigenOptimizer(NumPyMinimumEigensolver())
+        >>> result = presolver.interpret(presolver.solve_components(optimizer))
+    """
+
+    def __init__(self) -> None:
+        self._src = None  # type: Optional[QuadraticProgram]
+        self._dst = None  # type: Optional[QuadraticProgram]
+        # index of the variable of the converted problem that each variable is equal to,
+        # or -1 if the variable is fixed to the value in self._values
+        self._mapping = np.zeros(0, dtype=int)
+        self._values = np.zeros(0)
+        self._components = []  # type: List[np.ndarray]
+
+    def convert(self, problem: QuadraticProgram) -> QuadraticProgram:
+        """Reduce a QUBO by fixing and merging variables.
+
+        Args:
+            problem: The QUBO to be reduced, i.e., a problem with only binary variables and
+                without constraints.
+
+        Returns:
+            The reduced QUBO whose variables are named after a variable of the original problem
+            they are equal to.
+
+        Raises:
+            QiskitOptimizationError: In case of an incompatible problem.
+        """
+        msg = self.get_compatibility_msg(problem)
+        if len(msg) > 0:
+            raise QiskitOptimizationError('Incompatible problem: {}'.format(msg))
+
+        self._src = copy.deepcopy(problem)
+        sense = problem.objective.sense.value
+        quadratic, linear, constant = problem.objective.to_arrays()
+
+        # minimize c + l^T x + 1/2 x^T J x with a symmetric J with zero diagonal
+        couplings = sense * (quadratic + quadratic.T).tocsr()
+        linear = sense * linear + couplings.diagonal() / 2
+        couplings = _off_diagonal(couplings)
+        constant *= sense
+
+        num_vars = problem.get_num_vars()
+        mapping = np.arange(num_vars)
+        values = np.zeros(num_vars)
+        while True:
+            upper = linear + np.asarray(couplings.maximum(0).sum(axis=1)).ravel()
+            lower = linear + np.asarray(couplings.minimum(0).sum(axis=1)).ravel()
+            fix_zero = lower >= 0
+            fix_one = (upper <= 0) & ~fix_zero
+            if np.any(fix_zero | fix_one):
+                constant += np.sum(linear[fix_one]) + couplings[fix_one][:, fix_one].sum() / 2
+                keep = ~(fix_zero | fix_one)
+                linear = linear[keep] + np.asarray(couplings[keep][:, fix_one].sum(axis=1)).ravel()
+                couplings = couplings[keep][:, keep]
+                free = np.flatnonzero(mapping >= 0)
+                indices = mapping[free]
+                values[free] = fix_one[indices]
+                mapping[free] = np.where(keep, np.cumsum(keep) - 1, -1)[indices]
+                continue
+
+            pairs = self._merge_candidates(couplings, upper)
+            if len(pairs) == 0:
+                break
+            targets = np.arange(len(linear))
+            targets[pairs[:, 1]] = pairs[:, 0]
+            keep = targets == np.arange(len(linear))
+            targets = (np.cumsum(keep) - 1)[targets]
+            projection = csr_matrix((np.ones(len(targets)), (np.arange(len(targets)), targets)),
+                                    shape=(len(targets), np.count_nonzero(keep)))
+            linear = projection.T @ linear
+            couplings = (projection.T @ couplings @ projection).tocsr()
+            linear += couplings.diagonal() / 2
+            couplings = _off_diagonal(couplings)
+            free = np.flatnonzero(mapping >= 0)
+            mapping[free] = targets[mapping[free]]
+
+        self._mapping = mapping
+        self._values = values
+        logger.debug('Fixed %d and merged %d of %d variables.', np.count_nonzero(mapping < 0),
+                     np.count_nonzero(mapping >= 0) - len(linear), num_vars)
+
+        # name the variables after the first variable they represent
+        names = [''] * len(linear)
+        for i in reversed(np.flatnonzero(mapping >= 0).tolist()):
+            names[mapping[i]] = self._src.variables[i].name
+        self._dst = QuadraticProgram(name=problem.name)
+        self._dst.binary_var_list(names, name='')
+        self._set_objective(self._dst, sense, constant, linear, couplings)
+
+        self._components = []
+        if len(linear) > 0:
+            _, labels = connected_components(couplings, directed=False)
+            order = np.argsort(labels, kind='stable')
+            self._components = np.split(order, np.cumsum(np.bincount(labels))[:-1])
+        return self._dst
+
+    @staticmethod
+    def _merge_candidates(couplings: csr_matrix, upper: np.ndarray) -> np.ndarray:
+        """Returns disjoint pairs of variables which can be merged, strongest couplings first."""
+        strong = triu(couplings, k=1).tocoo()
+        mask = (strong.data < 0) & (strong.data + np.maximum(upper[strong.row],
+                                                             upper[strong.col]) <= 0)
+        order = np.argsort(strong.data[mask], kind='stable')
+        rows = strong.row[mask][order].tolist()
+        cols = strong.col[mask][order].tolist()
+        # the rules hold independently for disjoint pairs only
+        used = set()
+        pairs = []  # type: List[Tuple[int, int]]
+        for i, j in zip(rows, cols):
+            if i not in used and j not in used:
+                used.update((i, j))
+                pairs.append((i, j))
+        return np.array(pairs, dtype=int).reshape(-1, 2)
+
+    @staticmethod
+    def _set_objective(problem: QuadraticProgram, sense: int, constant: float,
+                       linear: np.ndarray, couplings: csr_matrix) -> None:
+        """Sets the objective from the minimization form used during the reduction."""
+        quadratic = triu(couplings, k=1)
+        if sense == 1:
+            problem.minimize(constant, linear, quadratic)
+        else:
+            problem.maximize(-constant, -linear, -quadratic)
+
+    @property
+    def components(self) -> List[QuadraticProgram]:
+        """Returns the independent parts of the converted problem.
+
+        Every variable of the converted problem belongs to exactly one component, and the
+        objective of the converted problem is its constant plus the sum of the objectives of the
+        components.
+
+        Returns:
+            A QUBO for each connected component of the converted problem.
+        """
+        if self._dst is None:
+            return []
+        quadratic, linear, _ = self._dst.objective.to_arrays()
+        quadratic = quadratic.tocsr()
+        components = []
+        for indices in self._components:
+            component = QuadraticProgram(name=self._dst.name)
+            component.binary_var_list([self._dst.variables[i].name for i in indices], name='')
+            if self._dst.objective.sense.value == 1:
+                component.minimize(0, linear[indices], quadratic[indices][:, indices])
+            else:
+                component.maximize(0, linear[indices], quadratic[indices][:, indices])
+            components.append(component)
+        return components
+
+    def solve_components(self, optimizer: 'qiskit.optimization.algorithms.OptimizationAlgorithm',
+                         num_processes: Optional[int] = None) \
+            -> 'qiskit.optimization.algorithms.OptimizationResult':  # type: ignore
+        """Solve the components of the converted problem independently and assemble the result.
+
+        Args:
+            optimizer: The optimizer used for every component. It is copied to the worker
+                processes if the components are solved in parallel, and the components are
+                solved one after the other if the optimizer can not be copied.
+            num_processes: The number of processes solving components in parallel. All local
+                CPUs are used if None, and the components are solved one after the other if 1.
+
+        Returns:
+            The result of the converted problem, which can be passed to :meth:`interpret`.
+
+        Raises:
+            QiskitOptimizationError: If no problem has been converted yet.
+
+        Note:
+            The raw results of the returned result are the results of the components, without
+            the raw results of the optimizer.
+        """
+        # pylint: disable=cyclic-import
+        from ..algorithms.optimization_algorithm import OptimizationResult, OptimizationResultStatus
+
+        if self._dst is None:
+            raise QiskitOptimizationError('A problem has to be converted first.')
+
+        components = self.components
+        if num_processes != 1 and len(components) > 1:
+            try:
+                pickle.dumps(optimizer)
+            except (pickle.PicklingError, AttributeError, TypeError) as ex:
+                logger.warning('The components are solved sequentially, since the optimizer '
+                               'can not be passed to other processes: %s', ex)
+                num_processes = 1
+        if num_processes is None:
+            results = parallel_map(_solve_component, components, task_args=(optimizer,))
+        else:
+            results = parallel_map(_solve_component, components, task_args=(optimizer,),
+                                   num_processes=num_processes)
+
+        x = np.zeros(self._dst.get_num_vars())
+        for indices, result in zip(self._components, results):
+            x[indices] = result.x
+        if all(result.status == OptimizationResultStatus.SUCCESS for result in results):
+            status = OptimizationResultStatus.SUCCESS
+        else:
+            status = OptimizationResultStatus.FAILURE
+        return OptimizationResult(x=x, fval=self._dst.objective.evaluate(x),
+                                  variables=self._dst.variables, status=status,
+                                  raw_results=results)
+
+    def interpret(self, result: 'qiskit.optimization.algorithms.OptimizationResult') \
+            -> 'qiskit.optimization.algorithms.OptimizationResult':  # type: ignore
+        """Convert the result of the reduced problem back to that of the original problem.
+
+        Args:
+            result: The result of the reduced problem.
+
+        Returns:
+            The result of the original problem.
+
+        Raises:
+            QiskitOptimizationError: if the number of variables in the result differs from
+                                     that of the reduced problem.
+        """
+        # pylint: disable=cyclic-import
+        from ..algorithms.optimization_algorithm import OptimizationResult
+
+        if len(result.x) != self._dst.get_num_vars():
+            raise QiskitOptimizationError(
+                'The number of variables in the passed result differs from '
+                'that of the reduced problem.'
+            )
+        x = self._values.copy()
+        free = self._mapping >= 0
+        x[free] = np.asarray(result.x, dtype=float)[self._mapping[free]]
+        return OptimizationResult(x=x, fval=self._src.objective.evaluate(x),
+                                  variables=self._src.variables, status=result.status,
+                                  raw_results=result.raw_results)
+
+    @staticmethod
+    def get_compatibility_msg(problem: QuadraticProgram) -> str:
+        """Checks whether a given problem can be reduced by this converter.
+
+        Args:
+            problem: The optimization problem to check compatibility.
+
+        Returns:
+            A message describing the incompatibility.
+        """
+        msg = ''
+        if problem.get_num_binary_vars() != problem.get_num_vars():
+            msg += 'Only binary variables are supported. '
+        if problem.get_num_linear_constraints() > 0 or \
+                problem.get_num_quadratic_constraints() > 0:
+            msg += 'Constraints are not supported. '
+        return msg
+
+    def is_compatible(self, problem: QuadraticProgram) -> bool:
+        """Checks whether a given problem can be reduced by this converter.
+
+        Args:
+            problem: The optimization problem to check compatibility.
+
+        Returns:
+            Returns True if the problem is compatible, False otherwise.
+        """
+        return len(self.get_compatibility_msg(problem)) == 0
+
+
+def _off_diagonal(matrix: csr_matrix) -> csr_matrix:
+    """Returns the matrix without its diagonal and explicit zeros."""
+    matrix = matrix.tocoo()
+    mask = (matrix.row != matrix.col) & (matrix.data != 0)
+    return csr_matrix((matrix.data[mask], (matrix.row[mask], matrix.col[mask])),
+                      shape=matrix.shape)
+
+
+def _solve_component(problem: QuadraticProgram,
+                     optimizer: 'qiskit.optimization.algorithms.OptimizationAlgorithm') \
+        -> 'qiskit.optimization.algorithms.OptimizationResult':  # type: ignore
+    """Solves one component, defined on module level to be usable in worker processes. Only the
+    solution is returned, since the raw results of an optimizer can not always be pickled."""
+    # pylint: disable=cyclic-import
+    from ..algorithms.optimization_algorithm import OptimizationResult
+
+    result = optimizer.solve(problem)
+    return OptimizationResult(x=result.x, fval=result.fval, variables=result.variables,
+                              status=result.status)
@@ -29,7 +29,8 @@ class LinearConstraint(Constraint):
 
     def __init__(self,
                  quadratic_program: Any, name: str,
-                 linear: Union[ndarray, spmatrix, List[float], Dict[Union[str, int], float]],
+                 linear: Union[ndarray, spmatrix, List[float], Dict[Union[str, int], float],
+                               LinearExpression],
                  sense: ConstraintSense,
                  rhs: float
                  ) -> None:
@@ -37,12 +38,16 @@ class LinearConstraint(Constraint):
         Args:
             quadratic_program: The parent quadratic program.
             name: The name of the constraint.
-            linear: The coefficients specifying the linear constraint.
+            linear: The coefficients specifying the linear constraint, or the linear expression
+                itself.
             sense: The sense of the constraint.
             rhs: The right-hand-side of the constraint.
         """
         super().__init__(quadratic_program, name, sense, rhs)
-        self._linear = LinearExpression(quadratic_program, linear)
+        if isinstance(linear, LinearExpression):
+            self._linear = linear
+        else:
+            self._linear = LinearExpression(quadratic_program, linear)
 
     @property
     def linear(self) -> LinearExpression:
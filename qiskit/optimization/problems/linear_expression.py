@@ -12,10 +12,12 @@
 
 """Linear expression interface."""
 
-from typing import List, Union, Dict, Any
+import copy
+from typing import List, Union, Dict, Any, Optional, Tuple
 
+import numpy as np
 from numpy import ndarray
-from scipy.sparse import spmatrix, dok_matrix
+from scipy.sparse import spmatrix, coo_matrix, csr_matrix, dok_matrix
 
 from .quadratic_program_element import QuadraticProgramElement
 from ..exceptions import QiskitOptimizationError
@@ -39,8 +41,42 @@ class LinearExpression(QuadraticProgramElement):
 
         """
         super().__init__(quadratic_program)
+        self._matrix_row = None  # type: Optional[Tuple[csr_matrix, int]]
         self.coefficients = coefficients
 
+    @classmethod
+    def _from_matrix_row(cls, quadratic_program: Any, matrix: csr_matrix,
+                         row: int) -> 'LinearExpression':
+        """Creates a linear expression given by a row of a shared CSR matrix.
+
+        The row is only converted to a dok_matrix when the coefficients are accessed. The matrix
+        must not be modified afterwards.
+
+        Args:
+            quadratic_program: The parent QuadraticProgram.
+            matrix: The shared matrix in canonical CSR format.
+            row: The index of the row holding the coefficients.
+
+        Returns:
+            The linear expression.
+        """
+        expression = cls.__new__(cls)
+        QuadraticProgramElement.__init__(expression, quadratic_program)
+        expression._coefficients = None
+        expression._matrix_row = (matrix, row)
+        return expression
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        # copying a dok_matrix element by element is slow, copy it via the coordinate format
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        result._quadratic_program = copy.deepcopy(self._quadratic_program, memo)
+        # a shared matrix is never modified, so the copy can keep referring to it
+        result._matrix_row = self._matrix_row
+        result._coefficients = None if self._coefficients is None \
+            else self._coefficients.tocoo().todok()
+        return result
+
     def __getitem__(self, i: Union[int, str]) -> float:
         """Returns the i-th coefficient where i can be a variable name or index.
 
@@ -57,7 +93,7 @@ class LinearExpression(QuadraticProgramElement):
     def __setitem__(self, i: Union[int, str], value: float) -> None:
         if isinstance(i, str):
             i = self.quadratic_program.variables_index[i]
-        self._coefficients[0, i] = value
+        self.coefficients[0, i] = value
 
     def _coeffs_to_dok_matrix(self,
                               coefficients: Union[ndarray, spmatrix,
@@ -74,18 +110,23 @@ class LinearExpression(QuadraticProgramElement):
         Raises:
             QiskitOptimizationError: if coefficients are given in unsupported format.
         """
+        # the conversion via the coordinate format is much faster than the dok_matrix constructor
         if isinstance(coefficients, list) or \
                 isinstance(coefficients, ndarray) and len(coefficients.shape) == 1:
-            coefficients = dok_matrix([coefficients])
+            coefficients = coo_matrix([coefficients]).todok()
         elif isinstance(coefficients, spmatrix):
-            coefficients = dok_matrix(coefficients)
+            coefficients = coo_matrix(coefficients).todok()
         elif isinstance(coefficients, dict):
-            coeffs = dok_matrix((1, self.quadratic_program.get_num_vars()))
+            # later entries overwrite earlier ones referring to the same variable
+            values = {}  # type: Dict[int, float]
             for index, value in coefficients.items():
                 if isinstance(index, str):
                     index = self.quadratic_program.variables_index[index]
-                coeffs[0, index] = value
-            coefficients = coeffs
+                values[index] = value
+            coeffs = coo_matrix((list(values.values()), ([0] * len(values), list(values.keys()))),
+                                shape=(1, self.quadratic_program.get_num_vars()), dtype=float)
+            coeffs.eliminate_zeros()
+            coefficients = coeffs.todok()
         else:
             raise QiskitOptimizationError("Unsupported format for coefficients.")
         return coefficients
@@ -97,6 +138,13 @@ class LinearExpression(QuadraticProgramElement):
         Returns:
             The coefficients of the linear expression.
         """
+        if self._coefficients is None:
+            matrix, row = self._matrix_row
+            start, stop = matrix.indptr[row], matrix.indptr[row + 1]
+            self._coefficients = coo_matrix(
+                (matrix.data[start:stop], ([0] * (stop - start), matrix.indices[start:stop])),
+                shape=(1, matrix.shape[1])).todok()
+            self._matrix_row = None
         return self._coefficients
 
     @coefficients.setter
@@ -110,6 +158,7 @@ class LinearExpression(QuadraticProgramElement):
             coefficients: The coefficients of the linear expression.
         """
         self._coefficients = self._coeffs_to_dok_matrix(coefficients)
+        self._matrix_row = None
 
     def to_array(self) -> ndarray:
         """Returns the coefficients of the linear expression as array.
@@ -117,6 +166,12 @@ class LinearExpression(QuadraticProgramElement):
         Returns:
             An array with the coefficients corresponding to the linear expression.
         """
+        if self._coefficients is None:
+            matrix, row = self._matrix_row
+            start, stop = matrix.indptr[row], matrix.indptr[row + 1]
+            array = np.zeros(matrix.shape[1])
+            array[matrix.indices[start:stop]] = matrix.data[start:stop]
+            return array
         return self._coefficients.toarray()[0]
 
     def to_dict(self, use_name: bool = False) -> Dict[Union[int, str], float]:
@@ -131,9 +186,19 @@ class LinearExpression(QuadraticProgramElement):
         """
         if use_name:
             return {self.quadratic_program.variables[k].name: v
-                    for (_, k), v in self._coefficients.items()}
+                    for (_, k), v in self.coefficients.items()}
         else:
-            return {k: v for (_, k), v in self._coefficients.items()}
+            return {k: v for (_, k), v in self.coefficients.items()}
+
+    def _sorted_items(self) -> List[Tuple[int, float]]:
+        """Returns the (index, coefficient) pairs sorted by the index of the variable, read
+        directly from a shared matrix row if the coefficients have not been converted yet."""
+        if self._coefficients is None:
+            matrix, row = self._matrix_row
+            start, stop = matrix.indptr[row], matrix.indptr[row + 1]
+            return list(zip(matrix.indices[start:stop].tolist(),
+                            matrix.data[start:stop].tolist()))
+        return sorted((k, v) for (_, k), v in self._coefficients.items())
 
     def evaluate(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> float:
         """Evaluate the linear expression for given variables.
@@ -153,6 +218,17 @@ class LinearExpression(QuadraticProgramElement):
         # return the result
         return val
 
+    def evaluate_batch(self, x: ndarray) -> ndarray:
+        """Evaluate the linear expression for a batch of variable assignments.
+
+        Args:
+            x: The values of the variables, one assignment per row.
+
+        Returns:
+            The values of the linear expression, one per row of ``x``.
+        """
+        return np.asarray(x, dtype=float) @ self.to_array()
+
     # pylint: disable=unused-argument
     def evaluate_gradient(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> ndarray:
         """Evaluate the gradient of the linear expression for given variables.
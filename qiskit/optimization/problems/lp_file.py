@@ -0,0 +1,590 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Reader and writer of quadratic programs in the CPLEX LP file format.
+
+The reader tokenizes the file line by line and collects the linear constraints directly into the
+coordinate format of a sparse matrix, such that neither CPLEX nor a docplex model is needed. The
+writer produces the same layout as docplex.
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from scipy.sparse import coo_matrix
+
+from .constraint import ConstraintSense
+from .quadratic_objective import ObjSense
+from .variable import VarType
+from ..exceptions import QiskitOptimizationError
+from ..infinity import INFINITY
+
+_NAME_CHARS = "A-Za-z0-9_!\"#$%&()/,.;?@`'{}|~"
+
+_TOKEN = re.compile(r"""\s*(?:
+    (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    |(?P<arrow><->|->)
+    |(?P<sense><=|=<|>=|=>|<|>|=)
+    |(?P<div>\]\s*/)
+    |(?P<op>[-+*^:\[\]])
+    |(?P<name>[A-Za-z_!"#$%&()/,;?@`'{{}}|~][{}]*)
+    |(?P<invalid>\S)
+    )""".format(_NAME_CHARS), re.VERBOSE)
+
+_SECTION = re.compile(r"""\s*(?P<section>
+    minimi[sz]e|minimum|min|maximi[sz]e|maximum|max
+    |subject\s+to|such\s+that|s\.t\.|st
+    |bounds?|binary|binaries|bin|generals?|gen
+    |semi-continuous|semis?|sos[12]?|pwl|lazy\s+constraints|user\s+cuts|end
+    )(?![{}])""".format(_NAME_CHARS), re.IGNORECASE | re.VERBOSE)
+
+_SECTIONS = {'minimize': 'min', 'minimise': 'min', 'minimum': 'min', 'min': 'min',
+             'maximize': 'max', 'maximise': 'max', 'maximum': 'max', 'max': 'max',
+             'subject to': 'st', 'such that': 'st', 's.t.': 'st', 'st': 'st',
+             'bound': 'bounds', 'bounds': 'bounds',
+             'binary': 'binary', 'binaries': 'binary', 'bin': 'binary',
+             'general': 'general', 'generals': 'general', 'gen': 'general',
+             'end': 'end'}
+
+_SENSES = {'<=': ConstraintSense.LE, '=<': ConstraintSense.LE, '<': ConstraintSense.LE,
+           '>=': ConstraintSense.GE, '=>': ConstraintSense.GE, '>': ConstraintSense.GE,
+           '=': ConstraintSense.EQ}
+
+_INFINITY_NAMES = ('inf', 'infinity')
+
+_PROBLEM_NAME = '\\Problem name:'
+
+_SYMBOLIC_INFINITY = ('+inf', '-inf')
+
+Token = Tuple[str, str]
+QuadraticConstraintData = Tuple[Optional[str], Dict[int, float], Dict[Tuple[int, int], float],
+                                ConstraintSense, float]
+
+
+def _tokenize(lines: Iterable[str]) -> Iterator[List[Token]]:
+    """Yields the (kind, value) tokens of the lines of an LP file, one list per line, where a
+    section keyword at the start of a line is a ('section', normalized keyword) token."""
+    for line in lines:
+        line = line.split('\\', 1)[0]
+        tokens = []  # type: List[Token]
+        pos = 0
+        match = _SECTION.match(line)
+        if match:
+            keyword = ' '.join(match.group('section').lower().split())
+            if keyword not in _SECTIONS:
+                raise QiskitOptimizationError('Unsupported LP section: {}'.format(keyword))
+            tokens.append(('section', _SECTIONS[keyword]))
+            pos = match.end()
+        for match in _TOKEN.finditer(line, pos):
+            kind = match.lastgroup
+            if kind == 'invalid':
+                raise QiskitOptimizationError(
+                    'Invalid LP syntax: {}'.format(line[match.start():].strip()))
+            tokens.append((kind, match.group(kind)))
+        if tokens:
+            yield tokens
+
+
+class _TokenStream:
+    """A stream of tokens with lookahead, which reads the lines as needed."""
+
+    def __init__(self, lines: Iterator[List[Token]]) -> None:
+        self._lines = lines
+        self._buffer = []  # type: List[Token]
+        self._pos = 0
+
+    def peek(self, k: int = 0) -> Optional[Token]:
+        """Returns the k-th next token without consuming it, None at the end of the file."""
+        index = self._pos + k
+        if index < len(self._buffer):
+            return self._buffer[index]
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        while len(self._buffer) <= k:
+            tokens = next(self._lines, None)
+            if tokens is None:
+                return None
+            self._buffer.extend(tokens)
+        return self._buffer[k]
+
+    def pop(self) -> Token:
+        """Consumes the next token."""
+        token = self.peek()
+        if token is None:
+            raise QiskitOptimizationError('Unexpected end of LP file')
+        self._pos += 1
+        return token
+
+    def expect(self, kind: str, value: Optional[str] = None) -> str:
+        """Consumes the next token, which must be of the given kind (and value)."""
+        token = self.pop()
+        if token[0] != kind or (value is not None and token[1] != value):
+            raise QiskitOptimizationError(
+                'Invalid LP syntax: expected {} but found {}'.format(value or kind, token[1]))
+        return token[1]
+
+    def at_statement_end(self) -> bool:
+        """Whether the stream is at the end of the file or at a section keyword."""
+        token = self.peek()
+        return token is None or token[0] == 'section'
+
+    def has_label(self) -> bool:
+        """Whether the next tokens are a label ``name:``."""
+        token = self.peek()
+        return token is not None and token[0] == 'name' and self.peek(1) == ('op', ':')
+
+
+class LPFileReader:
+    """Parses an LP file into the data of a quadratic program.
+
+    Variables are numbered in the order of their first appearance, as CPLEX does.
+    """
+
+    def __init__(self) -> None:
+        self.name = ''
+        self.var_names = []  # type: List[str]
+        self._var_index = {}  # type: Dict[str, int]
+        self.lowerbounds = {}  # type: Dict[int, float]
+        self.upperbounds = {}  # type: Dict[int, float]
+        self.vartypes = {}  # type: Dict[int, VarType]
+
+        self.sense = ObjSense.MINIMIZE
+        self.constant = 0.0
+        self.linear = {}  # type: Dict[int, float]
+        self.quadratic = {}  # type: Dict[Tuple[int, int], float]
+
+        self.rows = []  # type: List[int]
+        self.cols = []  # type: List[int]
+        self.values = []  # type: List[float]
+        self.senses = []  # type: List[ConstraintSense]
+        self.rhs = []  # type: List[float]
+        self.constraint_names = []  # type: List[Optional[str]]
+
+        # (name, linear, quadratic, sense, rhs) of the quadratic constraints
+        self.quadratic_constraints = []  # type: List[QuadraticConstraintData]
+
+    def _index(self, name: str) -> int:
+        index = self._var_index.get(name)
+        if index is None:
+            index = self._var_index[name] = len(self.var_names)
+            self.var_names.append(name)
+        return index
+
+    def read(self, file: TextIO) -> None:
+        """Parses an LP file.
+
+        Args:
+            file: The open LP file, or any iterable of its lines.
+
+        Raises:
+            QiskitOptimizationError: if the file is not valid or uses unsupported features.
+        """
+        lines = iter(file)
+        header = []  # type: List[str]
+        for line in lines:
+            header.append(line)
+            if line.startswith(_PROBLEM_NAME):
+                self.name = line[len(_PROBLEM_NAME):].strip()
+            if not line.startswith('\\'):
+                break
+
+        stream = _TokenStream(_tokenize(_chain(header, lines)))
+        section = None
+        while True:
+            token = stream.peek()
+            if token is None:
+                break
+            if token[0] == 'section':
+                section = stream.pop()[1]
+                if section == 'end':
+                    break
+                if section in ('min', 'max'):
+                    self.sense = ObjSense.MINIMIZE if section == 'min' else ObjSense.MAXIMIZE
+                    self._parse_objective(stream)
+            elif section == 'st':
+                self._parse_constraint(stream)
+            elif section == 'bounds':
+                self._parse_bound(stream)
+            elif section in ('binary', 'general'):
+                vartype = VarType.BINARY if section == 'binary' else VarType.INTEGER
+                self.vartypes[self._index(stream.expect('name'))] = vartype
+            else:
+                raise QiskitOptimizationError('Invalid LP syntax: {}'.format(token[1]))
+
+        # like CPLEX, unnamed rows are numbered from 1 once all explicit names are known
+        self.constraint_names = _default_names(self.constraint_names, 'c')
+        quadratic_names = _default_names([data[0] for data in self.quadratic_constraints], 'qc')
+        self.quadratic_constraints = [(name,) + data[1:] for name, data
+                                      in zip(quadratic_names, self.quadratic_constraints)]
+
+    def _parse_objective(self, stream: _TokenStream) -> None:
+        if stream.has_label():
+            stream.pop()
+            stream.pop()
+        self.constant += self._parse_expression(stream, self.linear, self.quadratic)
+        if not stream.at_statement_end():
+            raise QiskitOptimizationError(
+                'Invalid LP syntax in the objective: {}'.format(stream.peek()[1]))
+
+    def _parse_constraint(self, stream: _TokenStream) -> None:
+        name = None
+        if stream.has_label():
+            name = stream.pop()[1]
+            stream.pop()
+        linear = {}  # type: Dict[int, float]
+        quadratic = {}  # type: Dict[Tuple[int, int], float]
+        constant = self._parse_expression(stream, linear, quadratic)
+        sense = _SENSES[stream.expect('sense')]
+        rhs = self._parse_value(stream) - constant
+        token = stream.peek()
+        if token is not None and token[0] in ('arrow', 'sense'):
+            raise QiskitOptimizationError(
+                'Unsupported constraint in LP file: {}'.format(name or token[1]))
+        if quadratic:
+            self.quadratic_constraints.append((name, linear, quadratic, sense, rhs))
+        else:
+            row = len(self.constraint_names)
+            self.rows.extend([row] * len(linear))
+            self.cols.extend(linear.keys())
+            self.values.extend(linear.values())
+            self.senses.append(sense)
+            self.rhs.append(rhs)
+            self.constraint_names.append(name)
+
+    def _parse_bound(self, stream: _TokenStream) -> None:
+        if stream.peek()[0] == 'name' and stream.peek(1) is not None and \
+                stream.peek(1)[0] == 'name' and stream.peek(1)[1].lower() == 'free':
+            index = self._index(stream.pop()[1])
+            stream.pop()
+            self.lowerbounds[index] = -INFINITY
+            self.upperbounds[index] = INFINITY
+            return
+
+        token = stream.peek()
+        if token[0] == 'name' and token[1].lower() not in _INFINITY_NAMES:
+            index = self._index(stream.pop()[1])
+            sense = _SENSES[stream.expect('sense')]
+            self._set_bound(index, sense, self._parse_value(stream))
+            return
+
+        value = self._parse_value(stream)
+        sense = _SENSES[stream.expect('sense')]
+        index = self._index(stream.expect('name'))
+        # value <= x is a lower bound and value >= x an upper bound
+        flipped = {ConstraintSense.LE: ConstraintSense.GE,
+                   ConstraintSense.GE: ConstraintSense.LE}.get(sense, sense)
+        self._set_bound(index, flipped, value)
+        token = stream.peek()
+        if token is not None and token[0] == 'sense':
+            sense = _SENSES[stream.pop()[1]]
+            self._set_bound(index, sense, self._parse_value(stream))
+
+    def _set_bound(self, index: int, sense: ConstraintSense, value: float) -> None:
+        if sense != ConstraintSense.GE:
+            self.upperbounds[index] = value
+        if sense != ConstraintSense.LE:
+            self.lowerbounds[index] = value
+
+    @staticmethod
+    def _parse_value(stream: _TokenStream) -> float:
+        """Parses a signed number, which may be infinite."""
+        sign = 1.0
+        while stream.peek() in (('op', '+'), ('op', '-')):
+            if stream.pop()[1] == '-':
+                sign = -sign
+        kind, value = stream.pop()
+        if kind == 'name' and value.lower() in _INFINITY_NAMES:
+            return sign * INFINITY
+        if kind != 'number':
+            raise QiskitOptimizationError(
+                'Invalid LP syntax: expected a number but found {}'.format(value))
+        return max(-INFINITY, min(INFINITY, sign * float(value)))
+
+    def _parse_expression(self, stream: _TokenStream, linear: Dict[int, float],
+                          quadratic: Dict[Tuple[int, int], float],
+                          in_brackets: bool = False) -> float:
+        """Parses a sum of terms ``[coeff] [*] [x [^ 2 | * y]]`` and bracketed quadratic terms
+        into the given coefficients and returns its constant. Inside of brackets only quadratic
+        terms are allowed and the parsing stops at the closing bracket."""
+        constant = 0.0
+        sign = 1.0
+        coeff = None  # type: Optional[float]
+        term = None  # type: Any
+        while True:
+            token = stream.peek()
+            kind = None if token is None else token[0]
+            if kind == 'name' and term is None and stream.peek(1) != ('op', ':'):
+                stream.pop()
+                term = self._index(token[1])
+                continue
+            if kind == 'number' and coeff is None and term is None:
+                stream.pop()
+                coeff = float(token[1])
+                continue
+            if token == ('op', '*') and (coeff is not None or term is not None):
+                stream.pop()
+                if term is not None:
+                    term = (term, self._index(stream.expect('name')))
+                continue
+            if token == ('op', '^') and isinstance(term, int):
+                stream.pop()
+                if stream.expect('number') != '2':
+                    raise QiskitOptimizationError('Invalid LP syntax: only squares are supported')
+                term = (term, term)
+                continue
+
+            # the current term is complete
+            if term is not None or coeff is not None:
+                value = sign * (1.0 if coeff is None else coeff)
+                if term is None:
+                    constant += value
+                elif isinstance(term, tuple):
+                    quadratic[term] = quadratic.get(term, 0.0) + value
+                elif in_brackets:
+                    raise QiskitOptimizationError(
+                        'Invalid LP syntax: linear term inside of brackets')
+                else:
+                    linear[term] = linear.get(term, 0.0) + value
+                sign, coeff, term = 1.0, None, None
+
+            if token in (('op', '+'), ('op', '-')):
+                stream.pop()
+                if token[1] == '-':
+                    sign = -sign
+            elif token == ('op', '[') and not in_brackets:
+                stream.pop()
+                terms = {}  # type: Dict[Tuple[int, int], float]
+                self._parse_expression(stream, linear, terms, in_brackets=True)
+                divisor = 1.0
+                if stream.pop()[0] == 'div':
+                    divisor = float(stream.expect('number'))
+                for key, value in terms.items():
+                    quadratic[key] = quadratic.get(key, 0.0) + sign * value / divisor
+                sign = 1.0
+            elif in_brackets and (token == ('op', ']') or kind == 'div'):
+                return constant
+            elif not in_brackets and kind in (None, 'section', 'sense', 'name'):
+                # the end of the file, section or left-hand side, or the label of a statement
+                return constant
+            else:
+                raise QiskitOptimizationError('Invalid LP syntax: {}'.format(token[1]))
+
+    def constraint_matrix(self) -> coo_matrix:
+        """Returns the coefficients of the linear constraints as sparse matrix."""
+        return coo_matrix((self.values, (self.rows, self.cols)),
+                          shape=(len(self.constraint_names), len(self.var_names)))
+
+
+def _chain(first: List[str], rest: Iterator[str]) -> Iterator[str]:
+    yield from first
+    yield from rest
+
+
+def _default_names(names: List[Optional[str]], prefix: str) -> List[str]:
+    """Replaces the missing names by ``prefix + (index + 1)``, or the next larger number for
+    which the name is not taken yet."""
+    taken = set(name for name in names if name)
+    result = []
+    for i, name in enumerate(names):
+        if not name:
+            k = i + 1
+            while '{}{}'.format(prefix, k) in taken:
+                k += 1
+            name = '{}{}'.format(prefix, k)
+            taken.add(name)
+        result.append(name)
+    return result
+
+
+def _lp_name(name: str, prefix: str, index: int) -> str:
+    """Returns an LP compatible name like docplex, i.e. with blanks and special characters
+    replaced, or the default name ``prefix + (index + 1)``."""
+    if name:
+        name = name.translate(_LP_TRANSLATION)
+        if _LP_NAME.fullmatch(name):
+            return name[:255]
+        if name[0] in 'eE' and _LP_NAME.fullmatch('_' + name):
+            return '_' + name
+    return '{}{}'.format(prefix, index + 1)
+
+
+_LP_TRANSLATION = str.maketrans(" -+/\\<>", "_mp____")
+_LP_NAME = re.compile(r"[a-df-zA-DF-Z!#$%&()/,;?@_`'{}|\"][a-zA-Z0-9!#$%&()/.,;?@_`'{}|\"]*")
+
+
+def _number(value: float, infinity: Tuple[str, str] = ('1e+20', '-1e+20')) -> str:
+    """Formats a number like docplex, which writes infinite bounds as ``+inf`` and ``-inf`` but
+    infinite coefficients as ``1e+20`` and ``-1e+20``."""
+    if value >= INFINITY:
+        return infinity[0]
+    if value <= -INFINITY:
+        return infinity[1]
+    value = float(value)
+    if value.is_integer():
+        return '%d' % value
+    return '%.12f' % value
+
+
+class _LineWrapper:
+    """Writes tokens separated by blanks and wraps lines longer than 80 characters."""
+
+    def __init__(self, out: TextIO, indent: str) -> None:
+        self._out = out
+        self._indent = indent
+        self._line = ''
+        self._wrote = False
+
+    def begin_line(self, indent: str, start: str = '') -> None:
+        """Starts a new line with the given text, continued lines are indented by the given
+        string."""
+        self._indent = indent
+        self._line = start
+        self._wrote = False
+
+    def write(self, token: str, separator: bool = True) -> None:
+        """Writes a token, separated by a blank from the previous one."""
+        if len(self._line) + len(token) >= 80:
+            self._out.write(self._line + '\n')
+            self._line = self._indent + token
+        elif separator and self._wrote:
+            self._line += ' ' + token
+        else:
+            self._line += token
+        self._wrote = True
+
+    def flush(self) -> None:
+        """Terminates the current line."""
+        self._out.write(self._line + '\n')
+        self._line = ''
+        self._wrote = False
+
+
+def _write_linear(wrapper: _LineWrapper, names: List[str], terms: Iterable[Tuple[int, float]],
+                  force_plus: bool = False) -> int:
+    count = 0
+    for i, coeff in terms:
+        if coeff < 0:
+            token = '-'
+            coeff = -coeff
+        elif count > 0 or force_plus:
+            token = '+'
+        else:
+            token = ''
+        if coeff != 1:
+            token += (' ' if token else '') + _number(coeff)
+        if token:
+            token += ' '
+        wrapper.write(token + names[i])
+        count += 1
+    return count
+
+
+def _write_quadratic(wrapper: _LineWrapper, names: List[str],
+                     terms: Iterable[Tuple[Tuple[int, int], float]], factor: float) -> int:
+    count = 0
+    for (i, j), coeff in terms:
+        if count == 0:
+            wrapper.write('[')
+        if coeff < 0:
+            token = '- '
+            coeff = -coeff
+        else:
+            token = '+ ' if count > 0 else ''
+        if factor * coeff != 1:
+            token += _number(factor * coeff) + ' '
+        token += '{}^2'.format(names[i]) if i == j else '{}*{}'.format(names[i], names[j])
+        wrapper.write(token)
+        count += 1
+    if count:
+        wrapper.write(']/2' if factor == 2 else ']')
+    return count
+
+
+def write_lp(problem: Any, out: TextIO) -> None:
+    """Writes a quadratic program in the LP format, with the same layout as docplex.
+
+    Args:
+        problem: The quadratic program.
+        out: The text stream to write to.
+    """
+    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    names = [_lp_name(x.name, 'x', i) for i, x in enumerate(problem.variables)]
+    out.write('\\ This file has been generated by Qiskit\n')
+    out.write('\\ ENCODING=ISO-8859-1\n')
+    model_name = problem.name.encode('ascii', 'backslashreplace').decode('ascii')
+    out.write('\\Problem name: {}\n\n'.format(model_name.replace('\\', '_') or 'CPLEX'))
+
+    objective = problem.objective
+    out.write('Minimize\n' if objective.sense == ObjSense.MINIMIZE else 'Maximize\n')
+    wrapper = _LineWrapper(out, ' ' * 6)
+    wrapper.write(' obj:')
+    printed = _write_linear(wrapper, names, objective.linear._sorted_items())
+    quadratic = sorted(objective.quadratic.to_dict().items())
+    if quadratic:
+        if printed:
+            wrapper.write('+')
+        printed += _write_quadratic(wrapper, names, quadratic, 2)
+    if objective.constant:
+        if printed and objective.constant > 0:
+            wrapper.write('+')
+        wrapper.write(_number(objective.constant, _SYMBOLIC_INFINITY))
+    wrapper.flush()
+
+    out.write('Subject To\n')
+    sense_symbols = {ConstraintSense.EQ: ' = ', ConstraintSense.LE: ' <= ',
+                     ConstraintSense.GE: ' >= '}
+    for prefix, constraints in (('c', problem.linear_constraints),
+                                ('qc', problem.quadratic_constraints)):
+        for k, constraint in enumerate(constraints):
+            linear = constraint.linear._sorted_items()
+            quadratic = sorted(constraint.quadratic.to_dict().items()) \
+                if prefix == 'qc' else []
+            if constraint.rhs == 0 and not linear and not quadratic:
+                continue
+            label = ' {}:'.format(_lp_name(constraint.name, prefix, k))
+            wrapper.begin_line(' ' * (1 + len(label)))
+            wrapper.write(label)
+            num_quadratic = _write_quadratic(wrapper, names, quadratic, 1)
+            _write_linear(wrapper, names, linear, force_plus=num_quadratic > 0)
+            wrapper.write(sense_symbols[constraint.sense], separator=False)
+            wrapper.write(_number(constraint.rhs), separator=False)
+            wrapper.flush()
+
+    out.write('\nBounds\n')
+    indent = ' ' * 5
+    for name, x in zip(names, problem.variables):
+        lowerbound = _number(x.lowerbound, _SYMBOLIC_INFINITY)
+        upperbound = _number(x.upperbound, _SYMBOLIC_INFINITY)
+        if x.vartype == VarType.BINARY:
+            out.write(' {} <= {} <= {}\n'.format(_number(x.lowerbound), name,
+                                                 _number(x.upperbound)))
+        elif x.lowerbound <= -INFINITY and x.upperbound >= INFINITY:
+            out.write(' {} {} Free\n'.format(indent, name))
+        elif x.upperbound >= INFINITY:
+            if x.lowerbound:
+                out.write(' {} <= {}\n'.format(lowerbound, name))
+        elif x.lowerbound == 0:
+            out.write(' {} {} <= {}\n'.format(indent, name, upperbound))
+        elif x.lowerbound == x.upperbound:
+            out.write(' {} {} = {}\n'.format(indent, name, lowerbound))
+        else:
+            out.write(' {} <= {} <= {}\n'.format(lowerbound, name, upperbound))
+
+    for header, vartype in (('Binaries', VarType.BINARY), ('Generals', VarType.INTEGER)):
+        block = [name for name, x in zip(names, problem.variables) if x.vartype == vartype]
+        if block:
+            out.write('\n{}\n'.format(header))
+            wrapper.begin_line(' ', ' ')
+            for name in block:
+                wrapper.write(name)
+            wrapper.flush()
+    out.write('End\n')
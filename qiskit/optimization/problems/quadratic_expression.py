@@ -12,11 +12,12 @@
 
 """Quadratic expression interface."""
 
+import copy
 from typing import List, Union, Dict, Tuple, Any
 
 import numpy as np
 from numpy import ndarray
-from scipy.sparse import spmatrix, dok_matrix, tril, triu
+from scipy.sparse import spmatrix, coo_matrix, dok_matrix, triu
 
 from .quadratic_program_element import QuadraticProgramElement
 from ..exceptions import QiskitOptimizationError
@@ -43,6 +44,14 @@ class QuadraticExpression(QuadraticProgramElement):
         super().__init__(quadratic_program)
         self.coefficients = coefficients
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        # copying a dok_matrix element by element is slow, copy it via the coordinate format
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        result._quadratic_program = copy.deepcopy(self._quadratic_program, memo)
+        result._coefficients = self._coefficients.tocoo().todok()
+        return result
+
     def __getitem__(self, key: Tuple[Union[int, str], Union[int, str]]) -> float:
         """Returns the coefficient where i, j can be a variable names or indices.
 
@@ -89,27 +98,34 @@ class QuadraticExpression(QuadraticProgramElement):
             QiskitOptimizationError: if coefficients are given in unsupported format.
         """
         if isinstance(coefficients, (list, ndarray, spmatrix)):
-            coefficients = dok_matrix(coefficients)
+            coefficients = coo_matrix(coefficients)
         elif isinstance(coefficients, dict):
             n = self.quadratic_program.get_num_vars()
-            coeffs = dok_matrix((n, n))
+            coeffs = {}  # type: Dict[Tuple[int, int], float]
             for (i, j), value in coefficients.items():
                 if isinstance(i, str):
                     i = self.quadratic_program.variables_index[i]
                 if isinstance(j, str):
                     j = self.quadratic_program.variables_index[j]
                 coeffs[i, j] = value
-            coefficients = coeffs
+            rows = np.fromiter((i for i, _ in coeffs), dtype=int, count=len(coeffs))
+            cols = np.fromiter((j for _, j in coeffs), dtype=int, count=len(coeffs))
+            values = np.fromiter(coeffs.values(), dtype=float, count=len(coeffs))
+            coefficients = coo_matrix((values, (rows, cols)), shape=(n, n))
         else:
             raise QiskitOptimizationError(
                 "Unsupported format for coefficients: {}".format(coefficients))
         return self._triangle_matrix(coefficients)
 
     @staticmethod
-    def _triangle_matrix(mat: dok_matrix) -> dok_matrix:
-        lower = tril(mat, -1, format='dok')
-        # `todok` is necessary because subtraction results in other format
-        return (mat + lower.transpose() - lower).todok()
+    def _triangle_matrix(mat: spmatrix) -> dok_matrix:
+        # sum up the values at symmetric positions in the upper triangle, working on the
+        # coordinate format since arithmetic on dok matrices is slow
+        mat = mat.tocoo()
+        upper = coo_matrix((mat.data, (np.minimum(mat.row, mat.col),
+                                       np.maximum(mat.row, mat.col))), shape=mat.shape).tocsr()
+        upper.eliminate_zeros()
+        return upper.todok()
 
     @staticmethod
     def _symmetric_matrix(mat: dok_matrix) -> dok_matrix:
@@ -187,6 +203,20 @@ class QuadraticExpression(QuadraticProgramElement):
         # return the result
         return val
 
+    def evaluate_batch(self, x: ndarray) -> ndarray:
+        """Evaluate the quadratic expression for a batch of variable assignments.
+
+        Args:
+            x: The values of the variables, one assignment per row.
+
+        Returns:
+            The values of the quadratic expression, one per row of ``x``.
+        """
+        x = np.asarray(x, dtype=float)
+
+        # compute x * Q * x for all rows with a single sparse product
+        return np.sum((self.coefficients.tocsr().transpose() @ x.T).T * x, axis=1)
+
     def evaluate_gradient(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> ndarray:
         """Evaluate the gradient of the quadratic expression for given variables.
 
@@ -15,8 +15,9 @@
 from enum import Enum
 from typing import Union, List, Dict, Tuple, Any
 
+import numpy as np
 from numpy import ndarray
-from scipy.sparse import spmatrix
+from scipy.sparse import spmatrix, coo_matrix, csr_matrix
 
 from .linear_constraint import LinearExpression
 from .quadratic_expression import QuadraticExpression
@@ -139,6 +140,31 @@ class QuadraticObjective(QuadraticProgramElement):
         """
         self._sense = sense
 
+    def to_arrays(self) -> Tuple[csr_matrix, ndarray, float]:
+        """Returns the objective as arrays ``(quadratic, linear, constant)``, such that the
+        objective is ``x @ quadratic @ x + linear @ x + constant``.
+
+        The coefficients are read directly from the sparse representation. Coefficients at
+        symmetric positions are summed up in the upper triangle of ``quadratic``.
+
+        Returns:
+            The upper triangular quadratic coefficients as CSR matrix, the linear coefficients as
+            dense array, and the constant.
+        """
+        num_vars = self.quadratic_program.get_num_vars()
+
+        linear = np.zeros(num_vars)
+        lin_coo = self.linear.coefficients.tocoo()
+        np.add.at(linear, lin_coo.col, lin_coo.data)
+
+        quad_coo = self.quadratic.coefficients.tocoo()
+        rows = np.minimum(quad_coo.row, quad_coo.col)
+        cols = np.maximum(quad_coo.row, quad_coo.col)
+        # duplicate entries are summed up by the conversion to CSR
+        quadratic = coo_matrix((quad_coo.data, (rows, cols)), shape=(num_vars, num_vars)).tocsr()
+
+        return quadratic, linear, self.constant
+
     def evaluate(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> float:
         """Evaluate the quadratic objective for given variable values.
 
@@ -150,6 +176,17 @@ class QuadraticObjective(QuadraticProgramElement):
         """
         return self.constant + self.linear.evaluate(x) + self.quadratic.evaluate(x)
 
+    def evaluate_batch(self, x: ndarray) -> ndarray:
+        """Evaluate the quadratic objective for a batch of variable assignments.
+
+        Args:
+            x: The values of the variables, one assignment per row.
+
+        Returns:
+            The values of the quadratic objective, one per row of ``x``.
+        """
+        return self.constant + self.linear.evaluate_batch(x) + self.quadratic.evaluate_batch(x)
+
     def evaluate_gradient(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> ndarray:
         """Evaluate the gradient of the quadratic objective for given variable values.
 
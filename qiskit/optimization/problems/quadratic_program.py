@@ -12,30 +12,32 @@
 
 """Quadratic Program."""
 
-from typing import cast, List, Union, Dict, Optional, Tuple
+from typing import cast, List, Union, Dict, Optional, Sequence, Tuple
+import io
 import logging
+import numbers
+import os
 from collections import defaultdict
 from enum import Enum
 from math import fsum, isclose
 import warnings
 import numpy as np
 from numpy import (ndarray, zeros, bool as nbool)
-from scipy.sparse import spmatrix
+from scipy.sparse import spmatrix, coo_matrix, csr_matrix, diags
 
 from docplex.mp.constr import (LinearConstraint as DocplexLinearConstraint,
                                QuadraticConstraint as DocplexQuadraticConstraint,
                                NotEqualConstraint)
 from docplex.mp.linear import Var
 from docplex.mp.model import Model
-from docplex.mp.model_reader import ModelReader
 from docplex.mp.quad import QuadExpr
 
-from qiskit.aqua import MissingOptionalLibraryError
 from qiskit.aqua.operators import I, OperatorBase, PauliOp, WeightedPauliOperator, SummedOp, ListOp
 from qiskit.quantum_info import Pauli
 from .constraint import Constraint, ConstraintSense
 from .linear_constraint import LinearConstraint
 from .linear_expression import LinearExpression
+from .lp_file import LPFileReader, write_lp
 from .quadratic_constraint import QuadraticConstraint
 from .quadratic_expression import QuadraticExpression
 from .quadratic_objective import QuadraticObjective
@@ -230,6 +232,192 @@ class QuadraticProgram:
         """
         return self._add_variable(lowerbound, upperbound, Variable.Type.INTEGER, name)
 
+    def _add_variables(self,
+                       keys: Union[int, Sequence],
+                       lowerbound: Union[float, int],
+                       upperbound: Union[float, int],
+                       vartype: VarType,
+                       name: Optional[str],
+                       key_format: str) -> List[Variable]:
+        """Adds several variables of the same type and bounds at once. The names are checked
+        against the existing names in one pass and the index is updated in bulk.
+
+        Args:
+            keys: The number of variables or a sequence of keys, one per variable.
+            lowerbound: The lowerbound of the variables.
+            upperbound: The upperbound of the variables.
+            vartype: The type of the variables.
+            name: The common prefix of the variable names. The names are generated as
+                ``x0, x1, ...`` like for a single variable if None.
+            key_format: The format used to append a key to the prefix.
+
+        Returns:
+            The added variables.
+
+        Raises:
+            QiskitOptimizationError: if a variable name is already taken or the keys do not
+                result in distinct names.
+            QiskitOptimizationError: if lowerbound is greater than upperbound.
+        """
+        if isinstance(keys, numbers.Integral):
+            keys = range(keys)
+        if lowerbound > upperbound:
+            raise QiskitOptimizationError("Lowerbound is greater than upperbound!")
+        if name is None:
+            names = []
+            k = self.get_num_vars()
+            for _ in keys:
+                while 'x{}'.format(k) in self._variables_index:
+                    k += 1
+                names.append('x{}'.format(k))
+                k += 1
+        else:
+            names = [name + key_format.format(key) for key in keys]
+            if len(set(names)) < len(names):
+                raise QiskitOptimizationError(
+                    "Variable names are not unique for the keys: {}".format(keys))
+            taken = [n for n in names if n in self._variables_index]
+            if taken:
+                raise QiskitOptimizationError("Variable name already exists: {}".format(taken[0]))
+        offset = len(self._variables)
+        variables = [Variable(self, n, lowerbound, upperbound, vartype) for n in names]
+        self._variables_index.update(zip(names, range(offset, offset + len(names))))
+        self._variables.extend(variables)
+        return variables
+
+    def continuous_var_list(self, keys: Union[int, Sequence],
+                            lowerbound: Union[float, int] = 0,
+                            upperbound: Union[float, int] = INFINITY,
+                            name: Optional[str] = None,
+                            key_format: str = '{}') -> List[Variable]:
+        """Adds continuous variables to the quadratic program.
+
+        Args:
+            keys: The number of variables or a sequence of keys, one per variable.
+            lowerbound: The lowerbound of the variables.
+            upperbound: The upperbound of the variables.
+            name: The common prefix of the variable names, the names are ``name + key_format``
+                formatted with the key. Default names ``x0, x1, ...`` are used if None.
+            key_format: The format used to append a key to the prefix.
+
+        Returns:
+            The list of added variables.
+
+        Raises:
+            QiskitOptimizationError: if a variable name is already occupied.
+        """
+        return self._add_variables(keys, lowerbound, upperbound, Variable.Type.CONTINUOUS, name,
+                                   key_format)
+
+    def continuous_var_dict(self, keys: Union[int, Sequence],
+                            lowerbound: Union[float, int] = 0,
+                            upperbound: Union[float, int] = INFINITY,
+                            name: Optional[str] = None,
+                            key_format: str = '{}') -> Dict[str, Variable]:
+        """Adds continuous variables to the quadratic program.
+
+        Args:
+            keys: The number of variables or a sequence of keys, one per variable.
+            lowerbound: The lowerbound of the variables.
+            upperbound: The upperbound of the variables.
+            name: The common prefix of the variable names, the names are ``name + key_format``
+                formatted with the key. Default names ``x0, x1, ...`` are used if None.
+            key_format: The format used to append a key to the prefix.
+
+        Returns:
+            A dictionary mapping the names to the added variables.
+
+        Raises:
+            QiskitOptimizationError: if a variable name is already occupied.
+        """
+        return {variable.name: variable for variable in self.continuous_var_list(
+            keys, lowerbound, upperbound, name, key_format)}
+
+    def binary_var_list(self, keys: Union[int, Sequence], name: Optional[str] = None,
+                        key_format: str = '{}') -> List[Variable]:
+        """Adds binary variables to the quadratic program.
+
+        Args:
+            keys: The number of variables or a sequence of keys, one per variable.
+            name: The common prefix of the variable names, the names are ``name + key_format``
+                formatted with the key. Default names ``x0, x1, ...`` are used if None.
+            key_format: The format used to append a key to the prefix.
+
+        Returns:
+            The list of added variables.
+
+        Raises:
+            QiskitOptimizationError: if a variable name is already occupied.
+        """
+        return self._add_variables(keys, 0, 1, Variable.Type.BINARY, name, key_format)
+
+    def binary_var_dict(self, keys: Union[int, Sequence], name: Optional[str] = None,
+                        key_format: str = '{}') -> Dict[str, Variable]:
+        """Adds binary variables to the quadratic program.
+
+        Args:
+            keys: The number of variables or a sequence of keys, one per variable.
+            name: The common prefix of the variable names, the names are ``name + key_format``
+                formatted with the key. Default names ``x0, x1, ...`` are used if None.
+            key_format: The format used to append a key to the prefix.
+
+        Returns:
+            A dictionary mapping the names to the added variables.
+
+        Raises:
+            QiskitOptimizationError: if a variable name is already occupied.
+        """
+        return {variable.name: variable
+                for variable in self.binary_var_list(keys, name, key_format)}
+
+    def integer_var_list(self, keys: Union[int, Sequence],
+                         lowerbound: Union[float, int] = 0,
+                         upperbound: Union[float, int] = INFINITY,
+                         name: Optional[str] = None,
+                         key_format: str = '{}') -> List[Variable]:
+        """Adds integer variables to the quadratic program.
+
+        Args:
+            keys: The number of variables or a sequence of keys, one per variable.
+            lowerbound: The lowerbound of the variables.
+            upperbound: The upperbound of the variables.
+            name: The common prefix of the variable names, the names are ``name + key_format``
+                formatted with the key. Default names ``x0, x1, ...`` are used if None.
+            key_format: The format used to append a key to the prefix.
+
+        Returns:
+            The list of added variables.
+
+        Raises:
+            QiskitOptimizationError: if a variable name is already occupied.
+        """
+        return self._add_variables(keys, lowerbound, upperbound, Variable.Type.INTEGER, name,
+                                   key_format)
+
+    def integer_var_dict(self, keys: Union[int, Sequence],
+                         lowerbound: Union[float, int] = 0,
+                         upperbound: Union[float, int] = INFINITY,
+                         name: Optional[str] = None,
+                         key_format: str = '{}') -> Dict[str, Variable]:
+        """Adds integer variables to the quadratic program.
+
+        Args:
+            keys: The number of variables or a sequence of keys, one per variable.
+            lowerbound: The lowerbound of the variables.
+            upperbound: The upperbound of the variables.
+            name: The common prefix of the variable names, the names are ``name + key_format``
+                formatted with the key. Default names ``x0, x1, ...`` are used if None.
+            key_format: The format used to append a key to the prefix.
+
+        Returns:
+            A dictionary mapping the names to the added variables.
+
+        Raises:
+            QiskitOptimizationError: if a variable name is already occupied.
+        """
+        return {variable.name: variable for variable in self.integer_var_list(
+            keys, lowerbound, upperbound, name, key_format)}
+
     def get_variable(self, i: Union[int, str]) -> Variable:
         """Returns a variable for a given name or index.
 
@@ -340,6 +528,81 @@ class QuadraticProgram:
         self.linear_constraints.append(constraint)
         return constraint
 
+    def linear_constraints_from_matrix(self,
+                                       matrix: Union[ndarray, spmatrix, List[List[float]]],
+                                       senses: Union[str, ConstraintSense,
+                                                     Sequence[Union[str, ConstraintSense]]] = '<=',
+                                       rhs: Union[float, Sequence[float], ndarray] = 0.0,
+                                       names: Optional[Sequence[Optional[str]]] = None
+                                       ) -> List[LinearConstraint]:
+        """Adds the linear constraints ``matrix * x senses rhs`` to the quadratic program.
+
+        The rows of the matrix are stored in one shared sparse matrix and are only converted to
+        the coefficients of the individual constraints when these are accessed.
+
+        Args:
+            matrix: The (m x n) coefficient matrix, where n is the number of variables.
+            senses: The sense of all constraints or a sequence of m senses, see
+                :meth:`linear_constraint` for the supported values.
+            rhs: The right-hand side of all constraints or a sequence of m values.
+            names: The names of the constraints. Default names ``c0, c1, ...`` are used if None,
+                and for the entries that are None.
+
+        Returns:
+            The added constraints.
+
+        Raises:
+            QiskitOptimizationError: if the number of columns does not match the number of
+                variables, the number of senses, right-hand sides or names does not match the
+                number of rows, a sense is not valid, or a constraint name already exists.
+        """
+        matrix = csr_matrix(matrix, dtype=float)
+        matrix.sum_duplicates()
+        matrix.eliminate_zeros()
+        num_rows, num_cols = matrix.shape
+        if num_cols != self.get_num_vars():
+            raise QiskitOptimizationError(
+                "The matrix has {} columns, but the problem has {} variables".format(
+                    num_cols, self.get_num_vars()))
+
+        if isinstance(senses, (str, ConstraintSense)):
+            senses = [Constraint.Sense.convert(senses)] * num_rows
+        else:
+            senses = [Constraint.Sense.convert(sense) for sense in senses]
+        rhs = np.broadcast_to(np.asarray(rhs, dtype=float), (num_rows,)) \
+            if np.ndim(rhs) == 0 else np.asarray(rhs, dtype=float)
+        if names is None:
+            names = [None] * num_rows
+        if not len(senses) == len(rhs) == len(names) == num_rows:
+            raise QiskitOptimizationError(
+                "The numbers of senses, right-hand sides and names must match the number of "
+                "rows: {}, {}, {} != {}".format(len(senses), len(rhs), len(names), num_rows))
+
+        index = self._linear_constraints_index
+        offset = len(self._linear_constraints)
+        new_names = []  # type: List[str]
+        new_index = {}  # type: Dict[str, int]
+        for i, name in enumerate(names):
+            if name:
+                if name in index or name in new_index:
+                    raise QiskitOptimizationError(
+                        "Linear constraint's name already exists: {}".format(name))
+            else:
+                k = offset + i
+                while 'c{}'.format(k) in index or 'c{}'.format(k) in new_index:
+                    k += 1
+                name = 'c{}'.format(k)
+            new_index[name] = offset + i
+            new_names.append(name)
+
+        constraints = [LinearConstraint(self, name,
+                                        LinearExpression._from_matrix_row(self, matrix, i),
+                                        sense, float(value))
+                       for i, (name, sense, value) in enumerate(zip(new_names, senses, rhs))]
+        index.update(new_index)
+        self._linear_constraints.extend(constraints)
+        return constraints
+
     def get_linear_constraint(self, i: Union[int, str]) -> LinearConstraint:
         """Returns a linear constraint for a given name or index.
 
@@ -602,7 +865,14 @@ class QuadraticProgram:
         else:
             self.maximize(constant, linear, quadratic)
 
-        # get linear constraints
+        # get linear constraints, collected into one sparse matrix and added at once
+        var_index = {x: i for i, x in enumerate(model.iter_variables())}
+        rows = []  # type: List[int]
+        cols = []  # type: List[int]
+        values = []  # type: List[float]
+        senses = []  # type: List[str]
+        rhs_values = []  # type: List[float]
+        names = []  # type: List[Optional[str]]
         for constraint in model.iter_constraints():
             if isinstance(constraint, DocplexQuadraticConstraint):
                 # ignore quadratic constraints here and process them later
@@ -614,7 +884,6 @@ class QuadraticProgram:
                 # but it cannot be handled by Aqua optimization.
                 raise QiskitOptimizationError(
                     'Unsupported constraint: {}'.format(constraint))
-            name = constraint.name
             sense = constraint.sense
 
             rhs = 0
@@ -623,20 +892,27 @@ class QuadraticProgram:
             if not isinstance(constraint.rhs, Var):
                 rhs += constraint.rhs.constant
 
-            lhs = {}
-            for x in constraint.iter_net_linear_coefs():
-                lhs[var_names[x[0]]] = x[1]
-
             if sense == sense.EQ:
-                self.linear_constraint(lhs, '==', rhs, name)
+                senses.append('==')
             elif sense == sense.GE:
-                self.linear_constraint(lhs, '>=', rhs, name)
+                senses.append('>=')
             elif sense == sense.LE:
-                self.linear_constraint(lhs, '<=', rhs, name)
+                senses.append('<=')
             else:
                 raise QiskitOptimizationError(
                     "Unsupported constraint sense: {}".format(constraint))
 
+            for x, coef in constraint.iter_net_linear_coefs():
+                rows.append(len(names))
+                cols.append(var_index[x])
+                values.append(coef)
+            rhs_values.append(rhs)
+            names.append(constraint.name)
+
+        if names:
+            matrix = coo_matrix((values, (rows, cols)), shape=(len(names), self.get_num_vars()))
+            self.linear_constraints_from_matrix(matrix, senses, rhs_values, names)
+
         # get quadratic constraints
         for constraint in model.iter_quadratic_constraints():
             name = constraint.name
@@ -773,7 +1049,9 @@ class QuadraticProgram:
         Returns:
             A string representing the quadratic program.
         """
-        return self.to_docplex().export_as_lp_string()
+        out = io.StringIO()
+        write_lp(self, out)
+        return out.getvalue()
 
     def pprint_as_string(self) -> str:
         """DEPRECATED Returns the quadratic program as a string in Docplex's pretty print format.
@@ -802,41 +1080,48 @@ class QuadraticProgram:
     def read_from_lp_file(self, filename: str) -> None:
         """Loads the quadratic program from a LP file.
 
+        The file is parsed line by line, directly into the sparse representation of the
+        constraints, and does not require CPLEX or docplex. Variables are numbered in the order of
+        their first appearance in the file. Semi-continuous variables, SOS, piecewise linear,
+        indicator, lazy and user cut constraints are not supported.
+
         Args:
             filename: The filename of the file to be loaded.
 
         Raises:
             FileNotFoundError: If the file does not exist.
-            MissingOptionalLibraryError: If CPLEX is not installed.
-
-        Note:
-            This method requires CPLEX to be installed and present in ``PYTHONPATH``.
+            QiskitOptimizationError: If the file is not valid or uses unsupported features.
         """
-        try:
-            import cplex  # pylint: disable=unused-import
-        except ImportError as ex:
-            raise MissingOptionalLibraryError(
-                libname='CPLEX',
-                name='QuadraticProgram.read_from_lp_file',
-                pip_install='pip install qiskit-aqua[cplex]') from ex
-
-        def _parse_problem_name(filename: str) -> str:
-            # Because docplex model reader uses the base name as model name,
-            # we parse the model name in the LP file manually.
-            # https://ibmdecisionoptimization.github.io/docplex-doc/mp/docplex.mp.model_reader.html
-            prefix = '\\Problem name:'
-            model_name = ''
-            with open(filename) as file:
-                for line in file:
-                    if line.startswith(prefix):
-                        model_name = line[len(prefix):].strip()
-                    if not line.startswith('\\'):
-                        break
-            return model_name
-
-        model_reader = ModelReader()
-        model = model_reader.read(filename, model_name=_parse_problem_name(filename))
-        self.from_docplex(model)
+        reader = LPFileReader()
+        with open(filename) as file:
+            reader.read(file)
+
+        self.clear()
+        self.name = reader.name
+        for i, name in enumerate(reader.var_names):
+            vartype = reader.vartypes.get(i, VarType.CONTINUOUS)
+            if vartype == VarType.BINARY:
+                self.binary_var(name)
+            else:
+                self._add_variable(reader.lowerbounds.get(i, 0),
+                                   reader.upperbounds.get(i, INFINITY), vartype, name)
+
+        num_vars = len(reader.var_names)
+        linear = np.zeros(num_vars)
+        linear[list(reader.linear.keys())] = list(reader.linear.values())
+        rows, cols = zip(*reader.quadratic) if reader.quadratic else ((), ())
+        quadratic = coo_matrix((list(reader.quadratic.values()), (rows, cols)),
+                               shape=(num_vars, num_vars))
+        if reader.sense == QuadraticObjective.Sense.MINIMIZE:
+            self.minimize(reader.constant, linear, quadratic)
+        else:
+            self.maximize(reader.constant, linear, quadratic)
+
+        if reader.constraint_names:
+            self.linear_constraints_from_matrix(reader.constraint_matrix(), reader.senses,
+                                                reader.rhs, reader.constraint_names)
+        for name, linear, quadratic, sense, rhs in reader.quadratic_constraints:
+            self.quadratic_constraint(linear, quadratic, sense, rhs, name)
 
     def write_to_lp_file(self, filename: str) -> None:
         """Writes the quadratic program to an LP file.
@@ -848,9 +1133,16 @@ class QuadraticProgram:
 
         Raises:
             OSError: If this cannot open a file.
-            DOcplexException: If filename is an empty string
+            QiskitOptimizationError: If filename is an empty string
         """
-        self.to_docplex().export_as_lp(filename)
+        if not filename:
+            raise QiskitOptimizationError('The filename of the LP file must not be empty')
+        if os.path.isdir(filename):
+            filename = os.path.join(filename, (self.name or 'CPLEX').replace(' ', '_'))
+        if not filename.endswith('.lp'):
+            filename += '.lp'
+        with open(filename, 'w') as file:
+            write_lp(self, file)
 
     def substitute_variables(
             self, constants: Optional[Dict[Union[str, int], float]] = None,
@@ -887,6 +1179,48 @@ class QuadraticProgram:
             qubit_op: The qubit operator for the problem
             offset: The constant value in the Ising Hamiltonian.
 
+        Raises:
+            QiskitOptimizationError: If a variable type is not binary.
+            QiskitOptimizationError: If constraints exist in the problem.
+        """
+        linear_ising, coupling, offset = self.to_ising_arrays()
+        num_nodes = self.get_num_vars()
+
+        # create all Pauli terms in one pass, the single Z terms first and then the ZZ terms.
+        # The coefficients are already merged, hence no reduction of the sum is necessary,
+        # and terms with zero coefficients are skipped.
+        coupling = coupling.tocoo()
+        linear_index = np.flatnonzero(linear_ising)
+        num_linear = len(linear_index)
+        num_terms = num_linear + coupling.nnz
+        if num_terms == 0:
+            return I ^ num_nodes, offset
+
+        z_masks = zeros((num_terms, num_nodes), dtype=nbool)
+        z_masks[np.arange(num_linear), linear_index] = True
+        z_masks[np.arange(num_linear, num_terms), coupling.row] = True
+        z_masks[np.arange(num_linear, num_terms), coupling.col] = True
+        x_mask = zeros(num_nodes, dtype=nbool)
+        coeffs = np.concatenate((linear_ising[linear_index], coupling.data)).tolist()
+        oplist = [PauliOp(Pauli(z_mask, x_mask), coeff=coeff)
+                  for z_mask, coeff in zip(z_masks, coeffs)]
+
+        qubit_op = oplist[0] if num_terms == 1 else SummedOp(oplist)
+        return qubit_op, offset
+
+    def to_ising_arrays(self) -> Tuple[np.ndarray, csr_matrix, float]:
+        r"""Return the Ising Hamiltonian of this problem as arrays.
+
+        The binary variables are mapped to spins by :math:`x_i = (1 - Z_i) / 2`, which gives the
+        Hamiltonian :math:`H = \sum_i h_i Z_i + \sum_{i < j} J_{ij} Z_i Z_j + offset`.
+        Unlike :meth:`to_ising`, no Pauli operators are created, so this is suitable for large
+        problems that are processed classically.
+
+        Returns:
+            h: The coefficients of the single Z terms.
+            J: The coefficients of the ZZ terms as strictly upper triangular CSR matrix.
+            offset: The constant value in the Ising Hamiltonian.
+
         Raises:
             QiskitOptimizationError: If a variable type is not binary.
             QiskitOptimizationError: If constraints exist in the problem.
@@ -911,71 +1245,33 @@ class QuadraticProgram:
                                           'constraints, and then, it converters equality '
                                           'constraints to penalty terms of the object function.')
 
-        # initialize Hamiltonian.
         num_nodes = self.get_num_vars()
-        pauli_list = []
-        offset = 0
-        zero = zeros(num_nodes, dtype=nbool)
+        quadratic, linear, constant = self.objective.to_arrays()
+        quadratic = quadratic.tocoo()
 
         # set a sign corresponding to a maximized or minimized problem.
         # sign == 1 is for minimized problem. sign == -1 is for maximized problem.
         sense = self.objective.sense.value
 
-        # convert a constant part of the object function into Hamiltonian.
-        offset += self.objective.constant * sense
-
-        # convert linear parts of the object function into Hamiltonian.
-        for idx, coef in self.objective.linear.to_dict().items():
-            z_p = zeros(num_nodes, dtype=nbool)
-            weight = coef * sense / 2
-            z_p[idx] = True
-
-            pauli_list.append([-weight, Pauli(z_p, zero)])
-            offset += weight
-
-        # convert quadratic parts of the object function into Hamiltonian.
-        # first merge coefficients (i, j) and (j, i)
-        coeffs = {}  # type: Dict
-        for (i, j), coeff in self.objective.quadratic.to_dict().items():
-            if j < i:  # type: ignore
-                coeffs[(j, i)] = coeffs.get((j, i), 0.0) + coeff
-            else:
-                coeffs[(i, j)] = coeffs.get((i, j), 0.0) + coeff
-
-        # create Pauli terms
-        for (i, j), coeff in coeffs.items():
-
-            weight = coeff * sense / 4
-
-            if i == j:
-                offset += weight
-            else:
-                z_p = zeros(num_nodes, dtype=nbool)
-                z_p[i] = True
-                z_p[j] = True
-                pauli_list.append([weight, Pauli(z_p, zero)])
-
-            z_p = zeros(num_nodes, dtype=nbool)
-            z_p[i] = True
-            pauli_list.append([-weight, Pauli(z_p, zero)])
-
-            z_p = zeros(num_nodes, dtype=nbool)
-            z_p[j] = True
-            pauli_list.append([-weight, Pauli(z_p, zero)])
+        # x_i = (1 - Z_i) / 2, which also holds for x_i^2 = x_i
+        on_diagonal = quadratic.row == quadratic.col
+        linear_weights = linear * (sense / 2)
+        np.add.at(linear_weights, quadratic.row[on_diagonal],
+                  quadratic.data[on_diagonal] * (sense / 2))
 
-            offset += weight
+        # x_i * x_j = (1 - Z_i - Z_j + Z_i * Z_j) / 4
+        off_diagonal = ~on_diagonal
+        rows, cols = quadratic.row[off_diagonal], quadratic.col[off_diagonal]
+        weights = quadratic.data[off_diagonal] * (sense / 4)
+        coupling = coo_matrix((weights, (rows, cols)), shape=(num_nodes, num_nodes)).tocsr()
+        coupling.eliminate_zeros()
 
-        # Remove paulis whose coefficients are zeros.
-        qubit_op = sum(PauliOp(pauli, coeff=coeff) for coeff, pauli in pauli_list)
+        linear_ising = -linear_weights
+        np.subtract.at(linear_ising, rows, weights)
+        np.subtract.at(linear_ising, cols, weights)
+        offset = fsum(np.concatenate(([constant * sense], linear_weights, weights)))
 
-        # qubit_op could be the integer 0, in this case return an identity operator of
-        # appropriate size
-        if isinstance(qubit_op, OperatorBase):
-            qubit_op = qubit_op.reduce()
-        else:
-            qubit_op = I ^ num_nodes
-
-        return qubit_op, offset
+        return linear_ising, coupling, offset
 
     def from_ising(self,
                    qubit_op: Union[OperatorBase, WeightedPauliOperator],
@@ -1006,90 +1302,79 @@ class QuadraticProgram:
                 'operator in the ListOp separately.'
             )
 
+        num_qubits = qubit_op.num_qubits
+
         # add binary variables
-        for i in range(qubit_op.num_qubits):
+        for i in range(num_qubits):
             self.binary_var(name='x_{0}'.format(i))
 
-        # Create a QUBO matrix
-        # The Qubo matrix is an upper triangular matrix.
-        # Diagonal elements in the QUBO matrix are for linear terms of the qubit operator.
-        # The other elements in the QUBO matrix are for quadratic terms of the qubit operator.
-        qubo_matrix = zeros((qubit_op.num_qubits, qubit_op.num_qubits))
-
-        if not isinstance(qubit_op, SummedOp):
-            oplist = [qubit_op.to_pauli_op()]
-        else:
-            oplist = qubit_op.to_pauli_op().oplist
-
-        for pauli_op in oplist:
-            pauli = pauli_op.primitive
-            coeff = pauli_op.coeff
-            # Count the number of Pauli Zs in a Pauli term
-            lst_z = pauli.z.tolist()
-            z_index = [i for i, z in enumerate(lst_z) if z is True]
-            num_z = len(z_index)
-
-            # Add its weight of the Pauli term to the corresponding element of QUBO matrix
-            if num_z == 1:
-                qubo_matrix[z_index[0], z_index[0]] = coeff.real
-            elif num_z == 2:
-                qubo_matrix[z_index[0], z_index[1]] = coeff.real
-            else:
+        # collect the Z- and X-masks and the coefficients of all Pauli terms
+        paulis = []  # type: List[Pauli]
+        coeffs = []  # type: List[complex]
+        self._collect_paulis(qubit_op, 1.0, paulis, coeffs)
+        z_masks = np.array([pauli.z for pauli in paulis], dtype=nbool).reshape(-1, num_qubits)
+        x_masks = np.array([pauli.x for pauli in paulis], dtype=nbool).reshape(-1, num_qubits)
+        weights = np.real(np.array(coeffs, dtype=complex))
+
+        # only single Z and ZZ terms can be mapped to a quadratic program
+        num_z = z_masks.sum(axis=1)
+        invalid_z = (num_z < 1) | (num_z > 2)
+        invalid_x = x_masks.any(axis=1)
+        invalid = np.flatnonzero(invalid_z | invalid_x)
+        if len(invalid) > 0:
+            pauli = paulis[invalid[0]]
+            if invalid_z[invalid[0]]:
                 raise QiskitOptimizationError(
                     'There are more than 2 Pauli Zs in the Pauli term {}'.format(pauli.z)
                 )
-
-            # If there are Pauli Xs in the Pauli term, raise an error
-            lst_x = pauli.x.tolist()
-            x_index = [i for i, x in enumerate(lst_x) if x is True]
-            if len(x_index) > 0:
-                raise QiskitOptimizationError('Pauli Xs exist in the Pauli {}'.format(pauli.x))
-
-        # Initialize dicts for linear terms and quadratic terms
-        linear_terms = {}
-        quadratic_terms = {}
-
-        # For quadratic pauli terms of operator
-        # x_i * x_ j = (1 - Z_i - Z_j + Z_i * Z_j)/4
-        for i, row in enumerate(qubo_matrix):
-            for j, weight in enumerate(row):
-                # Focus on the upper triangular matrix
-                if j <= i:
-                    continue
-                # Add a quadratic term to the object function of `QuadraticProgram`
-                # The coefficient of the quadratic term in `QuadraticProgram` is
-                # 4 * weight of the pauli
-                coef = weight * 4
-                quadratic_terms[i, j] = coef
-                # Sub the weight of the quadratic pauli term from the QUBO matrix
-                qubo_matrix[i, j] -= weight
-                # Sub the weight of the linear pauli term from the QUBO matrix
-                qubo_matrix[i, i] += weight
-                qubo_matrix[j, j] += weight
-                # Sub the weight from offset
-                offset -= weight
-
-        # After processing quadratic pauli terms, only linear paulis are left
-        # x_i = (1 - Z_i)/2
-        for i in range(qubit_op.num_qubits):
-            weight = qubo_matrix[i, i]
-            # Add a linear term to the object function of `QuadraticProgram`
-            # The coefficient of the linear term in `QuadraticProgram` is
-            # 2 * weight of the pauli
-            coef = weight * 2
-            if linear:
-                # If the linear option is True, add it into linear_terms
-                linear_terms[i] = -coef
-            else:
-                # Else, add it into quadratic_terms as a diagonal element.
-                quadratic_terms[i, i] = -coef
-            # Sub the weight of the linear pauli term from the QUBO matrix
-            qubo_matrix[i, i] -= weight
-            offset += weight
+            raise QiskitOptimizationError('Pauli Xs exist in the Pauli {}'.format(pauli.x))
+
+        # x_i = (1 - Z_i)/2, hence Z_i = 1 - 2 * x_i
+        single = num_z == 1
+        linear_weights = zeros(num_qubits)
+        np.add.at(linear_weights, z_masks[single].argmax(axis=1), weights[single])
+
+        # x_i * x_ j = (1 - Z_i - Z_j + Z_i * Z_j)/4, hence
+        # Z_i * Z_j = 4 * x_i * x_j - (1 - Z_i) - (1 - Z_j) + 1
+        pairs = np.nonzero(z_masks[num_z == 2])[1].reshape(-1, 2)
+        pair_weights = weights[num_z == 2]
+        np.add.at(linear_weights, pairs[:, 0], pair_weights)
+        np.add.at(linear_weights, pairs[:, 1], pair_weights)
+        offset = fsum(np.concatenate(([offset], linear_weights, -pair_weights)))
+
+        quadratic_terms = coo_matrix((4 * pair_weights, (pairs[:, 0], pairs[:, 1])),
+                                     shape=(num_qubits, num_qubits))
+        if linear:
+            # If the linear option is True, add the linear terms into linear_terms
+            linear_terms = -2 * linear_weights
+        else:
+            # Else, add them into quadratic_terms as diagonal elements.
+            linear_terms = None
+            quadratic_terms = quadratic_terms + diags(-2 * linear_weights)
 
         # Set the objective function
         self.minimize(constant=offset, linear=linear_terms, quadratic=quadratic_terms)
-        offset -= offset
+
+    @staticmethod
+    def _collect_paulis(operator: OperatorBase, coeff: complex, paulis: List[Pauli],
+                        coeffs: List[complex]) -> None:
+        """Collects the Pauli terms of a (nested) sum without reducing the sum.
+
+        Raises:
+            QiskitOptimizationError: If the operator can not be converted to a sum of Paulis.
+        """
+        if isinstance(operator, PauliOp):
+            paulis.append(operator.primitive)
+            coeffs.append(coeff * operator.coeff)
+        elif isinstance(operator, SummedOp):
+            for op in operator.oplist:
+                QuadraticProgram._collect_paulis(op, coeff * operator.coeff, paulis, coeffs)
+        else:
+            pauli_op = operator.to_pauli_op()
+            if not isinstance(pauli_op, (PauliOp, SummedOp)):
+                raise QiskitOptimizationError(
+                    'The operator can not be converted to a sum of Paulis: {}'.format(operator))
+            QuadraticProgram._collect_paulis(pauli_op, coeff, paulis, coeffs)
 
     def get_feasibility_info(self, x: Union[List[float], np.ndarray]) \
             -> Tuple[bool, List[Variable], List[Constraint]]:
@@ -15,12 +15,15 @@
 import unittest
 from test.aqua import QiskitAquaTestCase
 import numpy as np
+from scipy.optimize import brute, minimize_scalar
 from ddt import ddt, idata, data, unpack
 from qiskit import QuantumRegister, QuantumCircuit, BasicAer
 from qiskit.circuit.library import QFT, GroverOperator
 from qiskit.aqua import QuantumInstance
 from qiskit.aqua.algorithms import (AmplitudeEstimation, MaximumLikelihoodAmplitudeEstimation,
                                     IterativeAmplitudeEstimation)
+from qiskit.aqua.algorithms.amplitude_estimators.ae_likelihood import (
+    mlae_loglikelihood, mlae_mle, mlae_likelihood_ratio_confint)
 
 from qiskit.quantum_info import Operator
 
@@ -135,6 +138,19 @@ class TestBernoulli(QiskitAquaTestCase):
             self.assertAlmostEqual(value, getattr(result, key), places=3,
                                    msg="estimate `{}` failed".format(key))
 
+    @data(0, 1, 3)
+    def test_iqae_speculative_powers(self, num_speculative_powers):
+        """Test IQAE executing the likely powers of the next rounds in advance."""
+        prob = 0.8
+        qae = IterativeAmplitudeEstimation(0.01, 0.05, state_preparation=BernoulliStateIn(prob),
+                                           grover_operator=BernoulliGrover(prob),
+                                           num_speculative_powers=num_speculative_powers)
+        result = qae.run(self._qasm(100))
+
+        self.assertLessEqual(result.actual_epsilon, 0.01)
+        self.assertTrue(result.confidence_interval[0] <= prob <= result.confidence_interval[1])
+        self.assertGreaterEqual(result.num_oracle_queries, 100 * sum(result.powers))
+
     @data(True, False)
     def test_qae_circuit(self, efficient_circuit):
         """Test circuits resulting from canonical amplitude estimation.
@@ -222,6 +238,31 @@ class TestBernoulli(QiskitAquaTestCase):
             actual_circuit = qae.construct_circuit(k, measurement=False)
             self.assertEqual(Operator(circuit), Operator(actual_circuit))
 
+    def test_mlae_likelihood(self):
+        """Test the vectorized MLAE likelihood, its maximum and the likelihood ratio bounds."""
+        schedule = [0, 1, 2, 4]
+        one_hits, all_hits = [21, 86, 44, 2], [100, 100, 100, 100]
+
+        def loglikelihood(theta):
+            return _mlae_loglikelihood(theta, schedule, one_hits, all_hits)
+
+        thetas = np.linspace(0.1, 1.4, 7)
+        np.testing.assert_array_almost_equal(
+            mlae_loglikelihood(thetas, schedule, one_hits, all_hits),
+            [loglikelihood(theta) for theta in thetas])
+
+        theta_mle = mlae_mle(schedule, one_hits, all_hits, nevals=1000)
+        for shift in [-1e-4, 1e-4]:
+            self.assertGreater(loglikelihood(theta_mle), loglikelihood(theta_mle + shift))
+
+        lower, upper = mlae_likelihood_ratio_confint(schedule, one_hits, all_hits, theta_mle,
+                                                     alpha=0.05, nevals=1000)
+        self.assertLess(lower, theta_mle)
+        self.assertGreater(upper, theta_mle)
+        for bound in [lower, upper]:
+            self.assertAlmostEqual(loglikelihood(theta_mle) - loglikelihood(bound), 1.920729,
+                                   places=4)
+
     @data(True, False)
     def test_mlae_circuits(self, efficient_circuit):
         """ Test the circuits constructed for MLAE """
@@ -391,9 +432,9 @@ class TestSineIntegral(QiskitAquaTestCase):
           'observed_fisher': [0.24845622030041542, 0.30009008633019013]}
          ],
         [MaximumLikelihoodAmplitudeEstimation(3), 'estimation',
-         {'likelihood_ratio': [0.25987941798909114, 0.27985361366769945],
-          'fisher': [0.2584889015125656, 0.2797018754936686],
-          'observed_fisher': [0.2659279996107888, 0.2722627773954454]}],
+         {'likelihood_ratio': [0.25985369427835137, 0.27986732475921816],
+          'fisher': [0.25848375438340787, 0.27969659856282125],
+          'observed_fisher': [0.26592283961900515, 0.272257513327224]}],
     ])
     @unpack
     def test_confidence_intervals(self, qae, key, expect):
@@ -420,6 +461,37 @@ class TestSineIntegral(QiskitAquaTestCase):
             self.assertEqual(confint, expected_confint)
             self.assertTrue(confint[0] <= getattr(result, key) <= confint[1])
 
+    def test_mlae_mle_accuracy(self):
+        """Test the MLAE estimate is the maximum of the likelihood of the measured counts.
+
+        The expected MLAE results with the qasm simulator are based on this estimate, which is
+        closer to the maximum than the one of the previous grid search refined by fmin.
+        """
+        qae = MaximumLikelihoodAmplitudeEstimation(3, state_preparation=SineIntegral(3))
+        result = qae.run(self._qasm(100))
+        schedule = [0, 1, 2, 4]
+        one_hits = [counts.get('1', 0) for counts in result.circuit_results]
+        all_hits = [sum(counts.values()) for counts in result.circuit_results]
+
+        def negative_loglikelihood(theta):
+            return -_mlae_loglikelihood(theta, schedule, one_hits, all_hits)
+
+        # the maximum on a fine grid, refined to machine precision
+        eps = 1e-15
+        grid = np.linspace(eps, np.pi / 2 - eps, 1000001)
+        index = np.argmin(negative_loglikelihood(grid))
+        theta_max = minimize_scalar(negative_loglikelihood, method='bounded',
+                                    bounds=(grid[index - 1], grid[index + 1]),
+                                    options={'xatol': 1e-12}).x
+        self.assertAlmostEqual(result.theta, theta_max, places=8)
+
+        # the previous search, with the default number of evaluations for 3 oracle circuits
+        theta_brute = brute(lambda theta: negative_loglikelihood(theta[0]),
+                            [(eps, np.pi / 2 - eps)], Ns=12566)[0]
+        self.assertGreater(abs(theta_brute - theta_max), 100 * abs(result.theta - theta_max))
+        self.assertLess(negative_loglikelihood(result.theta),
+                        negative_loglikelihood(theta_brute))
+
     def test_iqae_confidence_intervals(self):
         """End-to-end test for the IQAE confidence interval."""
         n = 3
@@ -441,5 +513,13 @@ class TestSineIntegral(QiskitAquaTestCase):
         self.assertTrue(confint[0] <= result.estimation <= confint[1])
 
 
+def _mlae_loglikelihood(theta, schedule, one_hits, all_hits):
+    """The MLAE log-likelihood of the angle(s) theta, summed term by term."""
+    angles = np.multiply.outer(theta, 2 * np.asarray(schedule) + 1)
+    one_hits, all_hits = np.asarray(one_hits), np.asarray(all_hits)
+    return np.sum(np.log(np.sin(angles) ** 2) * one_hits +
+                  np.log(np.cos(angles) ** 2) * (all_hits - one_hits), axis=-1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -477,9 +477,9 @@ class TestSineIntegral(QiskitAquaTestCase):
           'observed_fisher': [0.24845622030041542, 0.30009008633019013]}
          ],
         [MaximumLikelihoodAmplitudeEstimation(3), 'estimation',
-         {'likelihood_ratio': [0.25987941798909114, 0.27985361366769945],
-          'fisher': [0.2584889015125656, 0.2797018754936686],
-          'observed_fisher': [0.2659279996107888, 0.2722627773954454]}],
+         {'likelihood_ratio': [0.25985369427835137, 0.27986732475921816],
+          'fisher': [0.25848375438340787, 0.27969659856282125],
+          'observed_fisher': [0.26592283961900515, 0.272257513327224]}],
     ])
     @unpack
     def test_confidence_intervals(self, qae, key, expect):
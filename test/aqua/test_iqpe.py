@@ -66,8 +66,11 @@ class TestIQPE(QiskitAquaTestCase):
             'QUBIT_OP_H2_WITH_2_QUBIT_REDUCTION': qubit_op_h2_with_2_qubit_reduction.to_opflow()
         }
 
+    # the reference eigenvalue of QUBIT_OP_SIMPLE is its smallest one, 1 - sqrt(3), which needs
+    # more iterations than the largest one, 1 + sqrt(3), that NumPyMinimumEigensolver used to
+    # return for single qubit operators, see TestNumPyEigensolver.test_ce_all_eigenvalues
     @idata([
-        ['QUBIT_OP_SIMPLE', 'qasm_simulator', 1, 5],
+        ['QUBIT_OP_SIMPLE', 'qasm_simulator', 1, 9],
         ['QUBIT_OP_ZZ', 'statevector_simulator', 1, 1],
         ['QUBIT_OP_H2_WITH_2_QUBIT_REDUCTION', 'statevector_simulator', 1, 6],
     ])
@@ -13,11 +13,16 @@
 """ Test NumPy Eigen solver """
 
 import unittest
+from unittest import mock
 from test.aqua import QiskitAquaTestCase
 import numpy as np
+from scipy.sparse.linalg import eigsh, lobpcg
 from qiskit.aqua import AquaError
 from qiskit.aqua.algorithms import NumPyEigensolver
-from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.algorithms.eigen_solvers._pauli_sum_linear_operator import \
+    PauliSumLinearOperator
+from qiskit.aqua.operators import WeightedPauliOperator, MatrixOp, SummedOp, PauliOp, X, Y, Z, I
+from qiskit.quantum_info import Pauli
 
 
 class TestNumPyEigensolver(QiskitAquaTestCase):
@@ -72,6 +77,105 @@ class TestNumPyEigensolver(QiskitAquaTestCase):
         self.assertEqual(len(result.eigenstates), 2)
         np.testing.assert_array_almost_equal(result.eigenvalues.real, [-0.88272215, -0.22491125])
 
+    def test_ce_matrix_free(self):
+        """ Test the matrix-free solver on a sum of Paulis against the matrix """
+        labels = ['XYZII', 'IIZZX', 'YYIIZ', 'ZIIIZ', 'IXXXI', 'IIIYY', 'ZZZZZ', 'XIIIX']
+        coeffs = [0.3, -1.2, 0.7, 0.25, -0.4, 1.1, -0.8, 0.5]
+        pauli_sum = SummedOp([PauliOp(Pauli.from_label(label), coeff)
+                              for label, coeff in zip(labels, coeffs)])
+        matrix = pauli_sum.to_matrix()
+        with self.subTest('pauli sum'):
+            result = NumPyEigensolver(pauli_sum, k=3).run()
+            np.testing.assert_array_almost_equal(result.eigenvalues.real,
+                                                 np.linalg.eigvalsh(matrix)[:3])
+        with self.subTest('matrix'):
+            result = NumPyEigensolver(MatrixOp(matrix), k=3).run()
+            np.testing.assert_array_almost_equal(result.eigenvalues.real,
+                                                 np.linalg.eigvalsh(matrix)[:3])
+        with self.subTest('aux operators'):
+            result = NumPyEigensolver(pauli_sum, k=1, aux_operators=[pauli_sum]).run()
+            self.assertAlmostEqual(result.aux_operator_eigenvalues[0][0][0],
+                                   result.eigenvalues[0].real)
+
+    def test_ce_lobpcg(self):
+        """ Test the LOBPCG solver used for large operators """
+        operator = SummedOp([PauliOp(Pauli.from_label(label), coeff) for label, coeff in
+                             [('ZZIIII', -1.0), ('IZZIII', -1.0), ('IIZZII', -1.0),
+                              ('IIIZZI', -1.0), ('IIIIZZ', -1.0), ('XIIIII', -0.5),
+                              ('IIXIII', -0.5), ('IIIIXI', -0.5), ('IYYIII', 0.3)]])
+        algo = NumPyEigensolver(operator, k=2)
+        lin_op = PauliSumLinearOperator.from_operator(operator)
+        eigenvalues, _ = algo._lobpcg(lin_op)
+        np.testing.assert_array_almost_equal(eigenvalues,
+                                             np.linalg.eigvalsh(operator.to_matrix())[:2])
+
+    def test_ce_diagonal(self):
+        """ Test a diagonal sum of Paulis is solved by sorting its diagonal """
+        operator = (Z ^ Z ^ I) + 0.5 * (I ^ Z ^ Z) - 0.25 * (Z ^ I ^ I)
+        result = NumPyEigensolver(operator, k=3).run()
+        diagonal = np.diag(operator.to_matrix()).real
+        np.testing.assert_array_almost_equal(result.eigenvalues, np.sort(diagonal)[:3])
+        for eigenvalue, eigenstate in zip(result.eigenvalues, result.eigenstates):
+            self.assertAlmostEqual(diagonal[np.argmax(np.abs(eigenstate.primitive.data))],
+                                   eigenvalue)
+
+    def test_ce_all_eigenvalues(self):
+        """ Test the smallest eigenvalue is returned if all eigenvalues are computed """
+        # numpy.linalg.eig returns the eigenvalues of this operator in the order
+        # 1 + sqrt(3), 1 - sqrt(3), so the largest one was returned for k=1
+        for operator in [X + Y + Z + I, MatrixOp(X.to_matrix() + Y.to_matrix() +
+                                                 Z.to_matrix() + I.to_matrix())]:
+            with self.subTest(operator=operator):
+                result = NumPyEigensolver(operator, k=1).run()
+                self.assertAlmostEqual(result.eigenvalues[0], 1 - np.sqrt(3))
+
+    def test_ce_warm_start(self):
+        """ Test warm starting from the previous eigenstate """
+        operator = SummedOp([PauliOp(Pauli.from_label(pauli.to_label() + 'XI'), coeff)
+                             for coeff, pauli in self.qubit_op.paulis])
+        algo = NumPyEigensolver(operator, k=2, warm_start=True)
+        self.assertTrue(algo.warm_start)
+        with mock.patch('scipy.sparse.linalg.eigsh', wraps=eigsh) as eigsh_mock:
+            first = algo.run()
+            second = algo.run()
+        np.testing.assert_array_almost_equal(first.eigenvalues, second.eigenvalues)
+        # the second run starts from the first eigenstate of the first one
+        self.assertIsNone(eigsh_mock.call_args_list[0][1]['v0'])
+        np.testing.assert_array_equal(eigsh_mock.call_args_list[1][1]['v0'],
+                                      np.real(first.eigenstates[0].primitive.data))
+
+        algo.warm_start = False
+        with mock.patch('scipy.sparse.linalg.eigsh', wraps=eigsh) as eigsh_mock:
+            algo.run()
+        self.assertIsNone(eigsh_mock.call_args[1]['v0'])
+
+    def test_ce_warm_start_lobpcg(self):
+        """ Test warm starting LOBPCG from the previous eigenstate """
+        operator = SummedOp([PauliOp(Pauli.from_label(label), coeff) for label, coeff in
+                             [('ZZIIII', -1.0), ('IZZIII', -1.0), ('IIZZII', -1.0),
+                              ('IIIZZI', -1.0), ('IIIIZZ', -1.0), ('XIIIII', -0.5),
+                              ('IIXIII', -0.5), ('IIIIXI', -0.5)]])
+        algo = NumPyEigensolver(operator, k=2, warm_start=True)
+        initial_blocks = []
+
+        def record_lobpcg(lin_op, initial, **kwargs):
+            # LOBPCG works on the initial block in place
+            initial_blocks.append(np.copy(initial))
+            return lobpcg(lin_op, initial, **kwargs)
+
+        with mock.patch('qiskit.aqua.algorithms.eigen_solvers.numpy_eigen_solver.'
+                        '_LOBPCG_MIN_DIM', 16), \
+                mock.patch('scipy.sparse.linalg.lobpcg', side_effect=record_lobpcg):
+            first = algo.run()
+            second = algo.run()
+        self.assertEqual(len(initial_blocks), 2)
+        np.testing.assert_array_almost_equal(first.eigenvalues, second.eigenvalues)
+        np.testing.assert_array_almost_equal(first.eigenvalues,
+                                             np.linalg.eigvalsh(operator.to_matrix())[:2])
+        # the first vector of the initial block is the first eigenstate of the first run
+        np.testing.assert_array_equal(initial_blocks[1][:, 0],
+                                      np.real(first.eigenstates[0].primitive.data))
+
 
 if __name__ == '__main__':
     unittest.main()
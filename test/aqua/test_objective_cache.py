@@ -0,0 +1,145 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Objective Cache """
+
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+from scipy.optimize import rosen
+import numpy as np
+from qiskit import BasicAer
+from qiskit.circuit.library import TwoLocal
+
+from qiskit.aqua import QuantumInstance, aqua_globals
+from qiskit.aqua.operators import X, Z, I
+from qiskit.aqua.components.optimizers import POWELL, ObjectiveCache
+from qiskit.aqua.algorithms import VQE
+
+
+class TestObjectiveCache(QiskitAquaTestCase):
+    """ Test Objective Cache """
+
+    def setUp(self):
+        super().setUp()
+        aqua_globals.random_seed = 52
+        self.calls = []
+
+    def _objective(self, x):
+        points = np.reshape(x, (-1, 2))
+        self.calls.append(len(points))
+        values = (points[:, 0] - 1) ** 2 + 3 * (points[:, 1] - 2) ** 2 \
+            + points[:, 0] * points[:, 1]
+        return values if len(values) > 1 else values[0]
+
+    def test_exact(self):
+        """ exact and grouped lookup test """
+        cache = ObjectiveCache()
+        objective = cache.wrap(self._objective, 2)
+        self.assertEqual(objective([0.0, 1.0]), self._objective([0.0, 1.0]))
+        self.calls.clear()
+
+        values = objective([0.0, 1.0, 2.0, 3.0, 0.0, 1.0])
+        np.testing.assert_array_equal(values, [4.0, 10.0, 4.0])
+        # only the new point is evaluated
+        self.assertListEqual(self.calls, [1])
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 2)
+
+        # a new optimization starts with an empty cache
+        objective = cache.wrap(self._objective, 2)
+        objective([0.0, 1.0])
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+
+    def test_atol_and_max_size(self):
+        """ near lookup and bounded size test """
+        cache = ObjectiveCache(max_size=2, atol=1e-6)
+        objective = cache.wrap(self._objective, 2)
+        objective([0.0, 1.0])
+        self.assertEqual(objective([1e-7, 1.0]), self._objective([0.0, 1.0]))
+        self.assertEqual(cache.hits, 1)
+
+        objective([2.0, 3.0])
+        objective([4.0, 5.0])
+        self.assertEqual(len(cache), 2)
+        # the oldest evaluation was discarded
+        objective([0.0, 1.0])
+        self.assertEqual(cache.misses, 4)
+
+    def test_many_evaluations(self):
+        """ growing and bounded cache with many evaluations test """
+        points = aqua_globals.random.uniform(-1, 1, (50, 2))
+        for max_size in [None, 20]:
+            cache = ObjectiveCache(max_size=max_size, atol=1e-9)
+            objective = cache.wrap(self._objective, 2)
+            for point in points:
+                objective(point)
+            self.assertEqual(len(cache), 50 if max_size is None else 20)
+            # the last points are cached, with their values
+            for point in points[::-1]:
+                self.assertEqual(objective(point), self._objective(point))
+            self.assertEqual(cache.hits, 50 if max_size is None else 20)
+
+    def test_surrogate(self):
+        """ quadratic surrogate test """
+        cache = ObjectiveCache(surrogate_radius=0.5, surrogate_tolerance=1e-8)
+        objective = cache.wrap(self._objective, 2)
+        # a quadratic model of two variables has six coefficients
+        objective(aqua_globals.random.uniform(-0.1, 0.1, 2 * 6))
+        objective([5.0, 5.0])
+        self.assertEqual(cache.surrogate_hits, 0)
+        objective(aqua_globals.random.uniform(-0.1, 0.1, 2))
+        self.assertAlmostEqual(objective([0.0, 0.0]), self._objective([0.0, 0.0]))
+        self.assertEqual(cache.surrogate_hits, 1)
+
+        # a function which is not quadratic is not modelled
+        objective = cache.wrap(rosen, 2)
+        objective(aqua_globals.random.uniform(-0.1, 0.1, 2 * 10))
+        objective([0.0, 0.0])
+        self.assertEqual(cache.surrogate_hits, 0)
+
+    def test_optimizer(self):
+        """ optimizer with repeated evaluations test """
+        x_0 = [1.3, 0.7, 0.8]
+        ref = POWELL(maxfev=500).optimize(3, rosen, initial_point=x_0)
+        cache = ObjectiveCache()
+        res = POWELL(maxfev=500).optimize(3, cache.wrap(rosen, 3), initial_point=x_0)
+        np.testing.assert_array_equal(res[0], ref[0])
+        self.assertGreater(cache.hits, 0)
+        self.assertEqual(cache.hits + cache.misses, res[2])
+
+    def test_vqe(self):
+        """ vqe with a cache test """
+        operator = -1.052373245772859 * (I ^ I) \
+            + 0.39793742484318045 * (I ^ Z) \
+            - 0.39793742484318045 * (Z ^ I) \
+            - 0.01128010425623538 * (Z ^ Z) \
+            + 0.18093119978423156 * (X ^ X)
+        wavefunction = TwoLocal(rotation_blocks='ry', entanglement_blocks='cz')
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        ref = VQE(operator, wavefunction, POWELL(maxfev=300),
+                  quantum_instance=quantum_instance).run()
+        self.assertIsNone(ref.cache_hits)
+
+        aqua_globals.random_seed = 52
+        vqe = VQE(operator, wavefunction, POWELL(maxfev=300), quantum_instance=quantum_instance)
+        vqe.objective_cache = ObjectiveCache()
+        result = vqe.run()
+        np.testing.assert_array_equal(result.optimal_point, ref.optimal_point)
+        self.assertGreater(result.cache_hits, 0)
+        self.assertEqual(result.surrogate_hits, 0)
+        self.assertEqual(result.cost_function_evals + result.cache_hits,
+                         ref.cost_function_evals)
+
+
+if __name__ == '__main__':
+    unittest.main()
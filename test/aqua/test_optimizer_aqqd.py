@@ -13,6 +13,7 @@
 """ Test of AQGD optimizer """
 
 from test.aqua import QiskitAquaTestCase
+import numpy as np
 from qiskit import BasicAer
 
 from qiskit.circuit.library import RealAmplitudes
@@ -59,6 +60,51 @@ class TestOptimizerAQGD(QiskitAquaTestCase):
         result = VQE(self.qubit_op, RealAmplitudes(), aqgd).run(q_instance)
         self.assertAlmostEqual(result.eigenvalue.real, -1.857, places=3)
 
+    def test_coordinates(self):
+        """ test AQGD optimizer with a random subset of derivatives per iteration. """
+        q_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                                     seed_simulator=aqua_globals.random_seed,
+                                     seed_transpiler=aqua_globals.random_seed)
+
+        aqgd = AQGD(maxiter=2000, momentum=0.0, num_coordinates=2)
+        result = VQE(self.qubit_op, RealAmplitudes(), aqgd).run(q_instance)
+        self.assertAlmostEqual(result.eigenvalue.real, -1.857, places=3)
+        # each iteration evaluates the point and two derivatives
+        self.assertEqual(result.optimizer_evals % 5, 0)
+
+    def test_generator_eigenvalues(self):
+        """ test AQGD optimizer with gates whose generators have other eigenvalues. """
+        weights = np.array([1.0, 2.0, 3.0])
+        # the parameters are the angles of rotations exp(-i theta X), exp(-i theta X / 2)
+        # and exp(-i theta X / 4)
+        scales = np.array([2.0, 1.0, 0.5])
+        points = []
+
+        def objective(x):
+            points.append((x, np.copy(x)))
+            values = np.sum(weights * np.cos(np.reshape(x, (-1, 3)) * scales), axis=1)
+            return values if len(values) > 1 else values[0]
+
+        # a single step without momentum moves the parameters by the analytic gradient
+        x_0 = np.array([0.1, 0.2, 0.3])
+        aqgd = AQGD(maxiter=1, eta=1.0, momentum=0.0, generator_eigenvalues=[1.0, 0.5, 0.25])
+        x_1, _, nfev = aqgd.optimize(3, objective, initial_point=x_0)
+        self.assertEqual(nfev, 7)
+        np.testing.assert_array_almost_equal(x_0 - x_1, -weights * np.sin(x_0 * scales) * scales)
+
+        # the optimization reaches the minimum
+        aqgd = AQGD(maxiter=2000, eta=0.1, momentum=0.0, generator_eigenvalues=[1.0, 0.5, 0.25])
+        _, value, _ = aqgd.optimize(3, objective, initial_point=x_0)
+        self.assertAlmostEqual(value, -np.sum(weights), places=4)
+
+        # the points passed to the objective function are not changed afterwards
+        for point, copy in points:
+            np.testing.assert_array_equal(point, copy)
+
+        self.assertRaises(AquaError, AQGD(generator_eigenvalues=[1.0]).optimize, 3,
+                          objective, initial_point=x_0)
+
     def test_raises_exception(self):
         """ tests that AQGD raises an exception when incorrect values are passed. """
         self.assertRaises(AquaError, AQGD, maxiter=[1000], eta=[1.0, 0.5], momentum=[0.0, 0.5])
+        self.assertRaises(AquaError, AQGD, generator_eigenvalues=[0.5, 0.0])
@@ -0,0 +1,189 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Optimizer Checkpoint """
+
+import os
+import tempfile
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+from scipy.optimize import rosen, rosen_der
+import numpy as np
+from qiskit import BasicAer
+from qiskit.circuit.library import TwoLocal
+
+from qiskit.aqua import QuantumInstance, aqua_globals
+from qiskit.aqua.operators import X, Z, I
+from qiskit.aqua.components.optimizers import SPSA, L_BFGS_B, OptimizerCheckpoint
+from qiskit.aqua.algorithms import VQE
+
+
+class _Interrupt(Exception):
+    """Interrupts an optimization."""
+
+
+class TestOptimizerCheckpoint(QiskitAquaTestCase):
+    """ Test Optimizer Checkpoint """
+
+    def setUp(self):
+        super().setUp()
+        aqua_globals.random_seed = 52
+        self.x_0 = [1.3, 0.7, 0.8, 1.9, 1.2]
+        self._directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self._directory.name, 'snapshot')
+
+    def tearDown(self):
+        super().tearDown()
+        self._directory.cleanup()
+
+    def _interrupted(self, num_evals, function=rosen):
+        """Returns a function which is interrupted after a number of calls, and the counts."""
+        counts = [0]
+
+        def objective(x):
+            if counts[0] == num_evals:
+                raise _Interrupt()
+            counts[0] += 1
+            return function(x)
+
+        return objective, counts
+
+    def test_resume_spsa(self):
+        """ resume a stochastic optimizer test """
+        ref = SPSA(maxiter=50).optimize(5, rosen, initial_point=self.x_0)
+        aqua_globals.random_seed = 52
+
+        checkpoint = OptimizerCheckpoint(self.path, interval=7)
+        objective, _ = self._interrupted(40)
+        with self.assertRaises(_Interrupt):
+            checkpoint.optimize(SPSA(maxiter=50), 5, objective, initial_point=self.x_0)
+        self.assertTrue(os.path.exists(self.path))
+
+        # the recorded initial point and random state are restored
+        aqua_globals.random_seed = 1
+        objective, counts = self._interrupted(-1)
+        res = checkpoint.optimize(SPSA(maxiter=50), 5, objective, initial_point=[0.0] * 5)
+        np.testing.assert_array_equal(res[0], ref[0])
+        self.assertEqual(res[1], ref[1])
+        self.assertEqual(checkpoint.num_replayed_evals, 40)
+        # the calibration, the iterations and the final evaluation
+        self.assertEqual(counts[0], 2 * 10 + 2 * 50 + 1 - 40)
+
+    def test_resume_random_objective(self):
+        """ resume an objective using the random number generator test """
+        def objective(x):
+            return rosen(x) + 1e-3 * aqua_globals.random.normal()
+
+        ref = SPSA(maxiter=50).optimize(5, objective, initial_point=self.x_0)
+        aqua_globals.random_seed = 52
+
+        checkpoint = OptimizerCheckpoint(self.path, interval=7)
+        interrupted, _ = self._interrupted(40, objective)
+        with self.assertRaises(_Interrupt):
+            checkpoint.optimize(SPSA(maxiter=50), 5, interrupted, initial_point=self.x_0)
+
+        # an interruption while writing leaves a truncated last chunk
+        size = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as file:
+            file.truncate(size - 10)
+
+        aqua_globals.random_seed = 1
+        with self.assertLogs('qiskit.aqua.components.optimizers.optimizer_checkpoint',
+                             level='WARNING'):
+            res = checkpoint.optimize(SPSA(maxiter=50), 5, objective, initial_point=self.x_0)
+        np.testing.assert_array_equal(res[0], ref[0])
+        self.assertEqual(res[1], ref[1])
+        self.assertLess(checkpoint.num_replayed_evals, 40)
+
+    def test_resume_gradient(self):
+        """ resume an optimizer with a gradient test """
+        ref = L_BFGS_B(maxfun=1000).optimize(5, rosen, rosen_der, initial_point=self.x_0)
+
+        checkpoint = OptimizerCheckpoint(self.path)
+        objective, _ = self._interrupted(10)
+        with self.assertRaises(_Interrupt):
+            checkpoint.optimize(L_BFGS_B(maxfun=1000), 5, objective, rosen_der, None, self.x_0)
+
+        objective, counts = self._interrupted(-1)
+        res = checkpoint.optimize(L_BFGS_B(maxfun=1000), 5, objective, rosen_der, None,
+                                  self.x_0)
+        np.testing.assert_array_equal(res[0], ref[0])
+        self.assertEqual(res[2], ref[2])
+        self.assertEqual(counts[0], ref[2] - 10)
+
+        # a finished optimization is answered from the snapshot
+        objective, counts = self._interrupted(-1)
+        res = checkpoint.optimize(L_BFGS_B(maxfun=1000), 5, objective, rosen_der, None,
+                                  self.x_0)
+        np.testing.assert_array_equal(res[0], ref[0])
+        self.assertEqual(counts[0], 0)
+
+    def test_diverged(self):
+        """ resume with a different optimizer test """
+        checkpoint = OptimizerCheckpoint(self.path)
+        objective, _ = self._interrupted(30)
+        with self.assertRaises(_Interrupt):
+            checkpoint.optimize(SPSA(maxiter=50), 5, objective, initial_point=self.x_0)
+
+        aqua_globals.random_seed = 52
+        ref = SPSA(maxiter=50, c1=0.2).optimize(5, rosen, initial_point=self.x_0)
+        with self.assertLogs('qiskit.aqua.components.optimizers.optimizer_checkpoint',
+                             level='WARNING'):
+            res = checkpoint.optimize(SPSA(maxiter=50, c1=0.2), 5, rosen,
+                                      initial_point=self.x_0)
+        np.testing.assert_array_equal(res[0], ref[0])
+
+        # the snapshot is not resumed
+        objective, counts = self._interrupted(-1)
+        OptimizerCheckpoint(self.path, resume=False).optimize(SPSA(maxiter=10), 5, objective,
+                                                              initial_point=self.x_0)
+        self.assertEqual(counts[0], 2 * 2 + 2 * 10 + 1)
+
+    def test_vqe_resume(self):
+        """ resume a vqe test """
+        operator = -1.052373245772859 * (I ^ I) \
+            + 0.39793742484318045 * (I ^ Z) \
+            - 0.39793742484318045 * (Z ^ I) \
+            - 0.01128010425623538 * (Z ^ Z) \
+            + 0.18093119978423156 * (X ^ X)
+        wavefunction = TwoLocal(rotation_blocks='ry', entanglement_blocks='cz')
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        ref = VQE(operator, wavefunction, SPSA(maxiter=20),
+                  quantum_instance=quantum_instance).run()
+
+        def interrupt(eval_count, *_):
+            if eval_count == 30:
+                raise _Interrupt()
+
+        aqua_globals.random_seed = 52
+        checkpoint = OptimizerCheckpoint(self.path)
+        vqe = VQE(operator, wavefunction, SPSA(maxiter=20), callback=interrupt,
+                  quantum_instance=quantum_instance)
+        vqe.checkpoint = checkpoint
+        with self.assertRaises(_Interrupt):
+            vqe.run()
+
+        counts = []
+        vqe = VQE(operator, wavefunction, SPSA(maxiter=20),
+                  callback=lambda eval_count, *_: counts.append(eval_count),
+                  quantum_instance=quantum_instance)
+        vqe.checkpoint = checkpoint
+        result = vqe.run()
+        np.testing.assert_array_equal(result.optimal_point, ref.optimal_point)
+        self.assertEqual(result.cost_function_evals, ref.cost_function_evals)
+        # only the remaining evaluations are reported, the interrupted one is repeated
+        self.assertEqual(counts[0], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
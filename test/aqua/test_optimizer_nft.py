@@ -13,6 +13,9 @@
 """ Test of NFT optimizer """
 
 from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+
 from qiskit import BasicAer
 from qiskit.circuit.library import RealAmplitudes
 
@@ -49,3 +52,34 @@ class TestOptimizerNFT(QiskitAquaTestCase):
                                          seed_simulator=aqua_globals.random_seed,
                                          seed_transpiler=aqua_globals.random_seed))
         self.assertAlmostEqual(result.eigenvalue.real, -1.857275, places=6)
+
+    def test_nft_grouped(self):
+        """ Test NFT optimizer with grouped evaluations """
+        result = VQE(self.qubit_op,
+                     RealAmplitudes(),
+                     NFT(),
+                     max_evals_grouped=3).run(
+                         QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                                         seed_simulator=aqua_globals.random_seed,
+                                         seed_transpiler=aqua_globals.random_seed))
+        self.assertAlmostEqual(result.eigenvalue.real, -1.857275, places=6)
+
+    def test_nft_block(self):
+        """ Test NFT optimizer updating blocks of parameters """
+        calls = []
+        shifts = np.array([0.1, 0.2, 0.3, 0.4])
+
+        def objective(x):
+            points = np.reshape(x, (-1, 4))
+            calls.append(len(points))
+            values = np.sum(np.cos(points + shifts) * [1, 2, 3, 4], axis=1)
+            return values if len(values) > 1 else values[0]
+
+        optimizer = NFT(maxiter=2, block_size=2)
+        optimizer.set_max_evals_grouped(5)
+        x_opt, value, nfev = optimizer.optimize(4, objective, initial_point=np.zeros(4))
+        # the objective is a sum of sinusoids, so each parameter is set to its minimum
+        np.testing.assert_array_almost_equal(x_opt, np.pi - shifts)
+        self.assertAlmostEqual(value, -10)
+        self.assertEqual(nfev, 10)
+        self.assertListEqual(calls, [5, 5, 1])
@@ -13,14 +13,16 @@
 """ Test Optimizers """
 
 import unittest
+from unittest import mock
 from test.aqua import QiskitAquaTestCase
 
-from scipy.optimize import rosen
+from scipy.optimize import rosen, rosen_der
 import numpy as np
 
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.components.optimizers import (ADAM, CG, COBYLA, L_BFGS_B, P_BFGS, NELDER_MEAD,
-                                               POWELL, SLSQP, SPSA, TNC, GSLS)
+                                               POWELL, SLSQP, SPSA, TNC, GSLS,
+                                               MultiStartExecutor, Optimizer)
 
 
 class TestOptimizers(QiskitAquaTestCase):
@@ -36,12 +38,41 @@ class TestOptimizers(QiskitAquaTestCase):
         np.testing.assert_array_almost_equal(res[0], [1.0] * len(x_0), decimal=2)
         return res
 
+    def test_gradient_num_diff(self):
+        """ numeric gradient test """
+        objective = _BatchObjective(5, lambda x: rosen(x.T))
+        x_0 = np.array([1.3, 0.7, 0.8, 1.9, 1.2])
+        for method, decimal, num_evals in [('forward', -1, 6), ('central', 2, 10),
+                                           ('richardson', 6, 20)]:
+            with self.subTest(method=method):
+                objective.calls.clear()
+                grad = Optimizer.gradient_num_diff(x_0, objective, 1e-3, 20, method)
+                np.testing.assert_array_almost_equal(grad, rosen_der(x_0), decimal=decimal)
+                # all points are evaluated in one call
+                self.assertListEqual(objective.calls, [num_evals])
+
+        grad = Optimizer.gradient_num_diff(x_0, objective, 1e-3, 1, 'richardson', indices=[1, 3])
+        np.testing.assert_array_almost_equal(grad, rosen_der(x_0) * [0, 1, 0, 1, 0], decimal=6)
+
     def test_adam(self):
         """ adam test """
         optimizer = ADAM(maxiter=10000, tol=1e-06)
         res = self._optimize(optimizer)
         self.assertLessEqual(res[2], 10000)
 
+    def test_adam_step(self):
+        """ adam single step test """
+        for amsgrad in [False, True]:
+            optimizer = ADAM(maxiter=5, lr=0.01, amsgrad=amsgrad)
+            x_opt, _, _ = optimizer.optimize(5, rosen, gradient_function=rosen_der,
+                                             initial_point=[1.3, 0.7, 0.8, 1.9, 1.2])
+            # the same iterations, one step at a time
+            optimizer.reset()
+            params = np.array([1.3, 0.7, 0.8, 1.9, 1.2])
+            for _ in range(5):
+                optimizer.step(params, rosen_der(params))
+            np.testing.assert_array_almost_equal(params, x_opt)
+
     def test_cg(self):
         """ cg test """
         optimizer = CG(maxiter=1000, tol=1e-06)
@@ -66,6 +97,63 @@ class TestOptimizers(QiskitAquaTestCase):
         res = self._optimize(optimizer)
         self.assertLessEqual(res[2], 10000)
 
+    def test_p_bfgs_executor(self):
+        """ parallel l_bfgs_b with a shared multi-start executor test """
+        x_0 = [1.3, 0.7, 0.8, 1.9, 1.2]
+        with MultiStartExecutor(num_processes=2) as executor:
+            optimizer = P_BFGS(maxfun=1000, executor=executor)
+            for _ in range(2):
+                res = self._optimize(optimizer)
+                # the initial point and two random points are optimized
+                self.assertGreater(res[2], L_BFGS_B(maxfun=1000).optimize(5, rosen,
+                                                                          initial_point=x_0)[2])
+
+            # the first optimal value below the target cancels the other runs
+            key = executor.register(L_BFGS_B(maxfun=1000), len(x_0), rosen)
+            results = list(executor.run(key, [x_0] * 4, target_value=1.0))
+            self.assertLessEqual(len(results), 3)
+            self.assertLessEqual(results[0][1][1], 1.0)
+
+    def test_p_bfgs_objective_changes(self):
+        """ parallel l_bfgs_b with a changed or unpicklable objective test """
+        x_0 = [1.3, 0.7, 0.8, 1.9, 1.2]
+        objective = _OffsetRosen()
+        with MultiStartExecutor(num_processes=2) as executor:
+            optimizer = P_BFGS(maxfun=1000, executor=executor)
+            for offset in [0.0, 10.0]:
+                # the processes optimize the current state of the objective
+                objective.offset = offset
+                res = optimizer.optimize(len(x_0), objective, initial_point=x_0)
+                self.assertAlmostEqual(res[1], offset, places=4)
+
+            # an objective which can not be pickled runs in forked processes
+            with self.assertLogs('qiskit.aqua.components.optimizers.p_bfgs', level='WARNING'):
+                res = optimizer.optimize(len(x_0), lambda x: rosen(x) + 1.0,
+                                         initial_point=x_0)
+            self.assertAlmostEqual(res[1], 1.0, places=4)
+            self.assertGreater(res[2], L_BFGS_B(maxfun=1000).optimize(5, rosen,
+                                                                      initial_point=x_0)[2])
+
+    def test_p_bfgs_no_fork_on_macos(self):
+        """ parallel l_bfgs_b with an unpicklable objective on macOS test """
+        x_0 = [1.3, 0.7, 0.8, 1.9, 1.2]
+        calls = []
+
+        def objective(x):
+            calls.append(x)
+            return rosen(x) + 1.0
+
+        with MultiStartExecutor(num_processes=2) as executor:
+            optimizer = P_BFGS(maxfun=1000, executor=executor)
+            with mock.patch('platform.system', return_value='Darwin'), \
+                    mock.patch('multiprocessing.get_context') as get_context, \
+                    self.assertLogs('qiskit.aqua.components.optimizers.p_bfgs', level='WARNING'):
+                res = optimizer.optimize(len(x_0), objective, initial_point=x_0)
+            # only the initial point is optimized, in the current process
+            get_context.assert_not_called()
+            self.assertEqual(res[2], len(calls))
+            self.assertAlmostEqual(res[1], 1.0, places=4)
+
     def test_nelder_mead(self):
         """ nelder mead test """
         optimizer = NELDER_MEAD(maxfev=10000, tol=1e-06)
@@ -91,6 +179,21 @@ class TestOptimizers(QiskitAquaTestCase):
         res = self._optimize(optimizer)
         self.assertLessEqual(res[2], 100000)
 
+    def test_spsa_batched(self):
+        """ spsa with several perturbations per step and second order test """
+        for second_order in [False, True]:
+            objective = _BatchObjective(3, lambda x: np.sum((x - 0.5) ** 2 * [1, 2, 3], axis=1))
+            optimizer = SPSA(maxiter=100, resamplings=3, second_order=second_order)
+            optimizer.set_max_evals_grouped(100)
+            x_opt, _, _ = optimizer.optimize(3, objective, initial_point=[1.0, 0.0, 1.0])
+            np.testing.assert_array_almost_equal(x_opt, [0.5] * 3, decimal=2)
+            # the calibration and each iteration are evaluated in a single call
+            points = 4 if second_order else 2
+            self.assertListEqual(objective.calls, [20 * points] + [3 * points] * 100 + [1])
+
+        with self.assertRaises(ValueError):
+            SPSA(second_order=True, regularization=0.0)
+
     def test_tnc(self):
         """ tnc test """
         optimizer = TNC(maxiter=1000, tol=1e-06)
@@ -108,6 +211,80 @@ class TestOptimizers(QiskitAquaTestCase):
         self.assertLessEqual(x_value, 0.01)
         self.assertLessEqual(n_evals, 10000)
 
+    def test_gsls_grouped(self):
+        """ gsls with grouped evaluations and bounds test """
+        x_0 = [1.3, 0.7, 0.8, 1.9, 1.2]
+        results = []
+        for max_evals_grouped in [1, 1000]:
+            aqua_globals.random_seed = 52
+            objective = _BatchObjective(5, lambda x: rosen(x.T))
+            optimizer = GSLS(sample_size_factor=4, maxiter=20)
+            optimizer.set_max_evals_grouped(max_evals_grouped)
+            results.append(optimizer.optimize(len(x_0), objective, initial_point=x_0))
+        # the sample set of every iteration, and the initial point, are evaluated at once
+        self.assertListEqual(objective.calls, [21, 1] + [20, 1] * 19)
+        np.testing.assert_array_equal(results[0][0], results[1][0])
+        self.assertEqual(results[0][2], results[1][2])
+
+        # a point at the corner of the bounds
+        optimizer = GSLS(sampling_radius=0.1)
+        directions, points = optimizer.sample_set(5, np.ones(5), np.ones(5), np.full(5, 2.0), 10)
+        self.assertEqual(points.shape, (10, 5))
+        np.testing.assert_array_almost_equal(np.linalg.norm(directions, axis=1), np.ones(10))
+        self.assertTrue(np.all(points >= 1.0))
+
+        # a point near the bounds is sampled by rejection, without flipping the directions
+        optimizer = _RecordingGSLS(sampling_radius=0.1)
+        for _ in range(20):
+            optimizer.directions.clear()
+            directions, points = optimizer.sample_set(5, np.full(5, 1.02), np.ones(5),
+                                                      np.full(5, 2.0), 20)
+            self.assertEqual(points.shape, (20, 5))
+            self.assertTrue(np.all(points >= 1.0))
+            sampled = np.vstack(optimizer.directions)
+            self.assertLessEqual(len(sampled), 51 * 20)
+            for direction in directions:
+                self.assertTrue(np.any(np.all(sampled == direction, axis=1)))
+
+
+class _BatchObjective:
+    """ An objective function of a batch of points, one per row, which records the number of
+    points of every call """
+
+    def __init__(self, num_vars, function):
+        self.num_vars = num_vars
+        self.function = function
+        self.calls = []
+
+    def __call__(self, x):
+        points = np.reshape(x, (-1, self.num_vars))
+        self.calls.append(len(points))
+        values = self.function(points)
+        return values if len(values) > 1 else values[0]
+
+
+class _RecordingGSLS(GSLS):
+    """ GSLS recording the directions drawn on the sphere """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.directions = []
+
+    def sample_points(self, n, x, num_points):
+        points, directions = super().sample_points(n, x, num_points)
+        self.directions.append(np.copy(directions))
+        return points, directions
+
+
+class _OffsetRosen:
+    """ The Rosenbrock function with an offset, which can be pickled """
+
+    def __init__(self):
+        self.offset = 0.0
+
+    def __call__(self, x):
+        return rosen(x) + self.offset
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,6 +15,7 @@
 from test.aqua import QiskitAquaTestCase
 
 import unittest
+import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import RealAmplitudes
 from qiskit.aqua.components.uncertainty_models import (UniformDistribution,
@@ -104,6 +105,15 @@ class TestQGAN(QiskitAquaTestCase):
         trained_qasm = self.qgan.run(self.qi_qasm)
         self.assertAlmostEqual(trained_qasm['rel_entr'], trained_statevector['rel_entr'], delta=0.1)
 
+    def test_qgan_training_batched_sampling(self):
+        """Test QGAN training with the generated samples of an epoch drawn in one execution."""
+        self.qgan.set_generator(generator_circuit=self.generator_circuit)
+        self.qgan.batched_sampling = True
+        trained_statevector = self.qgan.run(self.qi_statevector)
+        trained_qasm = self.qgan.run(self.qi_qasm)
+        self.assertAlmostEqual(trained_qasm['rel_entr'], trained_statevector['rel_entr'], delta=0.1)
+        self.assertEqual(len(self.qgan.rel_entr), 2 * self.qgan._num_epochs)
+
     def test_qgan_training_run_algo_torch(self):
         """Test QGAN training using a PyTorch discriminator."""
         try:
@@ -160,6 +170,33 @@ class TestQGAN(QiskitAquaTestCase):
                                                  seed_transpiler=aqua_globals.random_seed))
         self.assertAlmostEqual(trained_qasm['rel_entr'], trained_statevector['rel_entr'], delta=0.1)
 
+    def test_qgan_training_numpy_float32(self):
+        """Test QGAN training using a single precision NumPy discriminator."""
+        discriminator = NumPyDiscriminator(n_features=1, dtype=np.float32)
+        self.qgan.set_discriminator(discriminator)
+        self.qgan.set_generator(generator_circuit=self.generator_circuit)
+        trained_statevector = self.qgan.run(self.qi_statevector)
+        trained_qasm = self.qgan.run(self.qi_qasm)
+        self.assertEqual(discriminator.discriminator_net.parameters.dtype, np.float32)
+        self.assertAlmostEqual(trained_qasm['rel_entr'], trained_statevector['rel_entr'], delta=0.1)
+
+    def test_numpy_discriminator_gradient(self):
+        """Test the fused loss and gradient of the NumPy discriminator."""
+        net = NumPyDiscriminator(n_features=2).discriminator_net
+        batches = [aqua_globals.random.random((10, 2)), aqua_globals.random.random((4, 2))]
+        weights = [np.ones(10) / 10, np.ones(4) / 4]
+        params = net.parameters.copy()
+        losses, gradient = net.loss_and_gradient(batches, [1, 0], weights)
+        gradient = gradient.copy()
+
+        self.assertAlmostEqual(losses[0], -np.dot(np.log(net.forward(batches[0])[0]), weights[0]))
+
+        epsilon = 1e-6
+        for i in aqua_globals.random.choice(len(params), 10, replace=False):
+            net.parameters = params + epsilon * (np.arange(len(params)) == i)
+            shifted, _ = net.loss_and_gradient(batches, [1, 0], weights, compute_gradient=False)
+            self.assertAlmostEqual((sum(shifted) - sum(losses)) / epsilon, gradient[i], places=4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -116,7 +116,7 @@ class TestEuropeanCallOption(QiskitFinanceTestCase):
         ['statevector', MaximumLikelihoodAmplitudeEstimation(5),
          {'estimation': 0.16330976193204114}],
         ['qasm', MaximumLikelihoodAmplitudeEstimation(3),
-         {'estimation': 0.09784548904622023}],
+         {'estimation': 0.09800594286860893}],
     ])
     @unpack
     def test_expected_value(self, simulator, a_e, expect):
@@ -62,6 +62,23 @@ class TestPortfolio(QiskitFinanceTestCase):
         np.testing.assert_array_equal(selection, [0, 1, 1, 0])
         self.assertAlmostEqual(value, -0.00679917)
 
+    def test_portfolio_quadratic_program(self):
+        """ portfolio quadratic program test """
+        diagonal = self.qubit_op.to_opflow().to_matrix().diagonal().real + self.offset
+        for penalty in [None, self.penalty]:
+            problem = portfolio.get_quadratic_program(
+                self.muu, self.sigma, self.risk, self.budget, penalty)
+            self.assertEqual(problem.get_num_binary_vars(), 4)
+            self.assertEqual(problem.get_num_linear_constraints(), 1 if penalty is None else 0)
+            for index in range(2 ** 4):
+                # qubit i is bit i of the basis state
+                x = np.array([(index >> i) & 1 for i in range(4)])
+                value = portfolio.portfolio_value(
+                    x, self.muu, self.sigma, self.risk, self.budget, penalty or 0)
+                self.assertAlmostEqual(problem.objective.evaluate(x), value)
+                if penalty is not None:
+                    self.assertAlmostEqual(diagonal[index], value)
+
     def test_portfolio_qaoa(self):
         """ portfolio test with QAOA """
         qaoa = QAOA(self.qubit_op, COBYLA(maxiter=500))
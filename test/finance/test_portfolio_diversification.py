@@ -26,7 +26,8 @@ from qiskit.aqua.algorithms import NumPyMinimumEigensolver
 from qiskit.finance.applications.ising.portfolio_diversification import \
     (get_portfoliodiversification_solution,
      get_operator,
-     get_portfoliodiversification_value)
+     get_portfoliodiversification_value,
+     get_quadratic_program)
 
 logger = logging.getLogger(__name__)
 
@@ -230,6 +231,19 @@ class TestPortfolioDiversification(QiskitFinanceTestCase):
                                                           quantum_solution)
         np.testing.assert_approx_equal(ground_level, 1.8)
 
+    def test_quadratic_program(self):
+        """ quadratic program test """
+        problem = get_quadratic_program(self.instance, self.n, self.q)
+        self.assertEqual(problem.get_num_binary_vars(), self.n ** 2 + self.n)
+        self.assertEqual(problem.get_num_linear_constraints(), 0)
+        diagonal = self.qubit_op.to_opflow().to_matrix().diagonal().real
+        for index in range(2 ** (self.n ** 2 + self.n)):
+            # qubit i is bit i of the basis state
+            x = np.array([(index >> i) & 1 for i in range(self.n ** 2 + self.n)])
+            value = get_portfoliodiversification_value(self.instance, self.n, self.q, x)
+            self.assertAlmostEqual(problem.objective.evaluate(x), value)
+            self.assertAlmostEqual(diagonal[index], value)
+
     def test_portfolio_diversification(self):
         """ portfolio diversification test """
         # Something of an integration test
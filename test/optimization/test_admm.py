@@ -15,7 +15,9 @@ from test.optimization import QiskitOptimizationTestCase
 
 import numpy as np
 from docplex.mp.model import Model
-from qiskit.optimization.algorithms import CobylaOptimizer
+from qiskit.aqua.algorithms import NumPyMinimumEigensolver
+from qiskit.optimization.algorithms import (CobylaOptimizer, MinimumEigenOptimizer,
+                                            OptimizationAlgorithm)
 from qiskit.optimization.algorithms.admm_optimizer import ADMMOptimizer, ADMMParameters, \
     ADMMOptimizationResult, ADMMState
 from qiskit.optimization.problems import QuadraticProgram
@@ -345,3 +347,58 @@ class TestADMMOptimizer(QiskitOptimizationTestCase):
         params = ADMMParameters(maxiter=12)
         optimizer.parameters = params
         self.assertEqual(optimizer.parameters.maxiter, 12)
+
+    def test_admm_reuses_subproblems(self):
+        """Tests that the sub-problems are created once and only their coefficients change"""
+        mdl = Model('ex6')
+
+        # pylint:disable=invalid-name
+        v = mdl.binary_var(name='v')
+        w = mdl.binary_var(name='w')
+        t = mdl.binary_var(name='t')
+        u = mdl.continuous_var(name='u')
+
+        mdl.minimize(v + w + t + 5 * (u - 2) ** 2)
+        mdl.add_constraint(v + 2 * w + t + u <= 3, "cons1")
+        mdl.add_constraint(v + w + t >= 1, "cons2")
+        mdl.add_constraint(v + w == 1, "cons3")
+
+        op = QuadraticProgram()
+        op.from_docplex(mdl)
+
+        qubo_optimizer = _RecordingOptimizer(MinimumEigenOptimizer(NumPyMinimumEigensolver()))
+        continuous_optimizer = _RecordingOptimizer(CobylaOptimizer())
+        admm_params = ADMMParameters(rho_initial=1001, beta=1000, factor_c=900, maxiter=3)
+        solver = ADMMOptimizer(qubo_optimizer=qubo_optimizer,
+                               continuous_optimizer=continuous_optimizer, params=admm_params)
+        solution = solver.solve(op)
+
+        # the same programs are solved in every iteration, with updated coefficients
+        for optimizer in [qubo_optimizer, continuous_optimizer]:
+            self.assertEqual(len(optimizer.problems), 3)
+            self.assertEqual(len({id(problem) for problem, _, _ in optimizer.problems}), 1)
+        op1 = qubo_optimizer.problems[0][0]
+        self.assertEqual([var.name for var in op1.variables], ['v', 'w', 't'])
+        self.assertEqual(continuous_optimizer.problems[0][0].get_num_linear_constraints(), 2)
+        linears = [linear for _, linear, _ in qubo_optimizer.problems]
+        self.assertFalse(np.allclose(linears[0], linears[1]))
+        # the binary variables are relaxed with a diagonal term rho / 2 in step 2
+        np.testing.assert_array_almost_equal(continuous_optimizer.problems[0][2].diagonal(),
+                                             [1001 / 2] * 3 + [5])
+        self.assertAlmostEqual(solution.fval, op.objective.evaluate(solution.x))
+
+
+class _RecordingOptimizer(OptimizationAlgorithm):
+    """Records the problems passed to an optimizer with their objective coefficients."""
+
+    def __init__(self, optimizer):
+        self.optimizer = optimizer
+        self.problems = []
+
+    def get_compatibility_msg(self, problem):
+        return self.optimizer.get_compatibility_msg(problem)
+
+    def solve(self, problem):
+        self.problems.append((problem, problem.objective.linear.to_array(),
+                              problem.objective.quadratic.to_array()))
+        return self.optimizer.solve(problem)
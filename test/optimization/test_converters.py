@@ -28,7 +28,7 @@ from qiskit.optimization.algorithms.admm_optimizer import ADMMParameters
 from qiskit.optimization.algorithms.optimization_algorithm import OptimizationResultStatus
 from qiskit.optimization.converters import (InequalityToEquality, IntegerToBinary,
                                             LinearEqualityToPenalty, QuadraticProgramToIsing,
-                                            IsingToQuadraticProgram)
+                                            IsingToQuadraticProgram, QuboPresolver)
 from qiskit.optimization.problems import Constraint, Variable
 
 logger = logging.getLogger(__name__)
@@ -344,6 +344,21 @@ class TestConverters(QiskitOptimizationTestCase):
         self.assertListEqual(result.variable_names, ['x0', 'x1', 'x2'])
         self.assertDictEqual(result.variables_dict, {'x0': 0, 'x1': 1, 'x2': -1})
 
+    def test_penalize_objective(self):
+        """ Test the objective of PenalizeLinearEqualityConstraints by evaluation """
+        op = QuadraticProgram()
+        for i in range(3):
+            op.integer_var(name='x{}'.format(i), lowerbound=-3, upperbound=3)
+        op.linear_constraint({'x0': 1.5, 'x1': -2}, Constraint.Sense.EQ, 0.5, 'c0')
+        op.linear_constraint({'x0': 1, 'x1': 1, 'x2': 3}, Constraint.Sense.EQ, 2, 'c1')
+        op.maximize(constant=3, linear={'x0': 1}, quadratic={('x1', 'x2'): 2, ('x0', 'x0'): 1})
+        op2 = LinearEqualityToPenalty(penalty=7).convert(op)
+        for x in [[0, 0, 0], [1, -2, 3], [-3, 2, 1]]:
+            penalty = sum((constraint.rhs - constraint.evaluate(x)) ** 2
+                          for constraint in op.linear_constraints)
+            self.assertAlmostEqual(op2.objective.evaluate(x),
+                                   op.objective.evaluate(x) - 7 * penalty)
+
     def test_integer_to_binary(self):
         """ Test integer to binary """
         op = QuadraticProgram()
@@ -405,6 +420,59 @@ class TestConverters(QiskitOptimizationTestCase):
         self.assertEqual(qubitop, QUBIT_OP_MAXIMIZE_SAMPLE)
         self.assertEqual(offset, OFFSET_MAXIMIZE_SAMPLE)
 
+    def test_optimizationproblem_to_ising_arrays(self):
+        """ Test optimization problem to Ising coefficients as arrays """
+        op = QuadraticProgram()
+        for i in range(4):
+            op.binary_var(name='x{}'.format(i))
+        op.maximize(constant=1.0, linear=[1, -2, 0, 3],
+                    quadratic={('x0', 'x1'): 2, ('x2', 'x1'): -1, ('x3', 'x3'): 4})
+        linear_ising, coupling, offset = op.to_ising_arrays()
+        qubitop, offset_op = op.to_ising()
+        self.assertAlmostEqual(offset, offset_op)
+
+        # the Hamiltonian is diagonal, compare it with the arrays for all basis states
+        diagonal = np.real(np.diag(qubitop.to_matrix()))
+        coupling = coupling.toarray()
+        np.testing.assert_array_equal(np.tril(coupling), np.zeros((4, 4)))
+        for index, value in enumerate(diagonal):
+            spins = 1 - 2 * np.array([(index >> i) & 1 for i in range(4)])
+            self.assertAlmostEqual(linear_ising @ spins + spins @ coupling @ spins, value)
+            # the maximization problem is minimized with flipped sign
+            x = (1 - spins) / 2
+            self.assertAlmostEqual(value + offset, -op.objective.evaluate(x))
+
+    def test_optimizationproblem_to_ising_zero_terms(self):
+        """ Test terms with cancelling coefficients are dropped in the Ising Hamiltonian """
+        op = QuadraticProgram()
+        for i in range(3):
+            op.binary_var(name='x{}'.format(i))
+        # the linear and the quadratic contribution of x0 to its Z term cancel out
+        op.minimize(linear={'x0': -1}, quadratic={('x0', 'x1'): 2, ('x0', 'x2'): 1,
+                                                  ('x2', 'x0'): -1})
+        linear_ising, coupling, _ = op.to_ising_arrays()
+        np.testing.assert_array_equal(linear_ising, [0, -0.5, 0])
+        self.assertEqual(coupling.nnz, 1)
+        qubitop, _ = op.to_ising()
+        self.assertSetEqual({(pauli.primitive.to_label(), pauli.coeff) for pauli in qubitop},
+                            {('IZI', -0.5), ('IZZ', 0.5)})
+
+    def test_ising_roundtrip(self):
+        """ Test converting a quadratic program to an Ising Hamiltonian and back """
+        op = QuadraticProgram()
+        for i in range(5):
+            op.binary_var(name='x{}'.format(i))
+        quadratic = np.arange(25).reshape(5, 5) % 7 - 3
+        op.minimize(constant=2, linear=[1, 0, -1, 2, 0], quadratic=quadratic)
+        qubitop, offset = op.to_ising()
+        for linear in [True, False]:
+            with self.subTest(linear=linear):
+                op2 = QuadraticProgram()
+                op2.from_ising(qubitop, offset, linear=linear)
+                for index in range(2 ** 5):
+                    x = np.array([(index >> i) & 1 for i in range(5)])
+                    self.assertAlmostEqual(op2.objective.evaluate(x), op.objective.evaluate(x))
+
     def test_ising_to_quadraticprogram_linear(self):
         """ Test optimization problem to operators with linear=True"""
         op = QUBIT_OP_MAXIMIZE_SAMPLE
@@ -723,6 +791,44 @@ class TestConverters(QiskitOptimizationTestCase):
             self.assertDictEqual(cst.quadratic.to_dict(),
                                  cst2.quadratic.to_dict())
 
+    def test_qubo_presolver(self):
+        """Test the reduction and the decomposition of a QUBO"""
+        mod = QuadraticProgram()
+        mod.binary_var_list(9)
+        mod.minimize(linear=[-1, -1, -1, -1, -1, -1, 1, 1, 2],
+                     quadratic={('x0', 'x1'): 2, ('x1', 'x2'): 2, ('x0', 'x2'): 2,
+                                ('x3', 'x4'): 2, ('x4', 'x5'): 2, ('x3', 'x5'): 2,
+                                ('x6', 'x7'): -3})
+        presolver = QuboPresolver()
+        reduced = presolver.convert(mod)
+        # x6 and x7 are merged and then fixed to 1, the isolated x8 is fixed to 0
+        self.assertListEqual([var.name for var in reduced.variables],
+                             ['x0', 'x1', 'x2', 'x3', 'x4', 'x5'])
+        self.assertAlmostEqual(reduced.objective.constant, -1)
+        components = presolver.components
+        self.assertListEqual([[var.name for var in comp.variables] for comp in components],
+                             [['x0', 'x1', 'x2'], ['x3', 'x4', 'x5']])
+
+        for num_processes in [2, 1]:
+            optimizer = MinimumEigenOptimizer(NumPyMinimumEigensolver())
+            result = presolver.interpret(presolver.solve_components(optimizer, num_processes))
+            self.assertEqual(result.status, OptimizationResultStatus.SUCCESS)
+            self.assertAlmostEqual(result.fval, -3)
+            self.assertAlmostEqual(result.fval, optimizer.solve(mod).fval)
+            self.assertListEqual(result.x[6:].tolist(), [1, 1, 0])
+            self.assertEqual(sum(result.x[:3]), 1)
+            self.assertEqual(sum(result.x[3:6]), 1)
+
+        # the sense is kept and incompatible problems are rejected
+        mod.maximize(linear=[1, 0, 0, 0, 0, 0, 0, 0, -1], quadratic={('x0', 'x1'): 1})
+        reduced = presolver.convert(mod)
+        self.assertEqual(reduced.get_num_vars(), 0)
+        self.assertAlmostEqual(presolver.interpret(OptimizationResult(
+            x=[], fval=0, variables=[], status=OptimizationResultStatus.SUCCESS)).fval, 2)
+        mod.integer_var(0, 2)
+        with self.assertRaises(QiskitOptimizationError):
+            presolver.convert(mod)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -17,7 +17,7 @@ from test.optimization import QiskitOptimizationTestCase
 from docplex.mp.model import Model
 import numpy as np
 
-from qiskit import Aer
+from qiskit import BasicAer
 from qiskit.aqua import aqua_globals, QuantumInstance
 from qiskit.aqua.algorithms import NumPyMinimumEigensolver
 
@@ -32,6 +32,11 @@ class TestGroverOptimizer(QiskitOptimizationTestCase):
 
     def setUp(self):
         super().setUp()
+        try:
+            from qiskit import Aer  # pylint: disable=import-outside-toplevel
+        except Exception as ex:  # pylint: disable=broad-except
+            self.skipTest("Aer doesn't appear to be installed. Error: '{}'".format(str(ex)))
+            return
         aqua_globals.random_seed = 1
         self.q_instance = QuantumInstance(Aer.get_backend('statevector_simulator'),
                                           seed_simulator=921, seed_transpiler=200)
@@ -121,6 +126,26 @@ class TestGroverOptimizer(QiskitOptimizationTestCase):
         results = gmf.solve(op)
         self.validate_results(op, results)
 
+    def test_qubo_gas_int_paper_example_qasm(self):
+        """Test the example from https://arxiv.org/abs/1912.04088 with a shot-based simulator."""
+
+        # Input.
+        model = Model()
+        x_0 = model.binary_var(name='x0')
+        x_1 = model.binary_var(name='x1')
+        x_2 = model.binary_var(name='x2')
+        model.minimize(-x_0+2*x_1-3*x_2-2*x_0*x_2-1*x_1*x_2)
+        op = QuadraticProgram()
+        op.from_docplex(model)
+
+        # Get the optimum key and value.
+        n_iter = 10
+        q_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=1024,
+                                     seed_simulator=921, seed_transpiler=200)
+        gmf = GroverOptimizer(6, num_iterations=n_iter, quantum_instance=q_instance)
+        results = gmf.solve(op)
+        self.validate_results(op, results)
+
     def test_converter_list(self):
         """Test converters list"""
         # Input.
@@ -16,6 +16,7 @@ import unittest
 from os import path
 from test.optimization.optimization_test_case import QiskitOptimizationTestCase
 from ddt import ddt, data
+import numpy as np
 
 from qiskit import BasicAer
 from qiskit.aqua import MissingOptionalLibraryError
@@ -114,6 +115,32 @@ class TestMinEigenOptimizer(QiskitOptimizationTestCase):
             MinimumEigenOptimizer(min_eigen_solver,
                                   converters=invalid)
 
+    def test_samples_and_correlations(self):
+        """Test the samples and correlations computed from the eigenstate"""
+        op = QuadraticProgram()
+        for i in range(3):
+            op.binary_var('x{}'.format(i))
+        op.minimize(linear=[1, -2, 1], quadratic={('x0', 'x1'): 3, ('x1', 'x2'): -2})
+        qaoa = QAOA(optimizer=COBYLA(maxiter=20),
+                    quantum_instance=BasicAer.get_backend('statevector_simulator'))
+        result = MinimumEigenOptimizer(qaoa).solve(op)
+
+        probabilities = np.abs(result.min_eigen_solver_result.eigenstate) ** 2
+        self.assertAlmostEqual(sum(sample[2] for sample in result.samples), 1.0)
+        for bitstr, value, probability in result.samples:
+            # the i-th character of the bitstring is the i-th variable
+            x = [int(bit) for bit in bitstr]
+            self.assertAlmostEqual(value, op.objective.evaluate(x))
+            self.assertAlmostEqual(probability, probabilities[int(bitstr[::-1], 2)])
+
+        correlations = np.zeros((3, 3))
+        for bitstr, _, probability in result.samples:
+            for i in range(3):
+                for j in range(i):
+                    correlations[i, j] += probability if bitstr[i] == bitstr[j] \
+                        else -probability
+        np.testing.assert_array_almost_equal(result.get_correlations(), correlations)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -124,6 +124,23 @@ class TestQuadraticExpression(QiskitOptimizationTestCase):
         for values in [values_list, values_array, values_dict_int, values_dict_str]:
             self.assertEqual(quadratic.evaluate(values), 900)
 
+    def test_evaluate_batch(self):
+        """ test evaluate batch. """
+
+        quadratic_program = QuadraticProgram()
+        for _ in range(5):
+            quadratic_program.continuous_var()
+
+        coefficients_list = [[0 for _ in range(5)] for _ in range(5)]
+        for i, v in enumerate(coefficients_list):
+            for j, _ in enumerate(v):
+                coefficients_list[min(i, j)][max(i, j)] += i * j
+        quadratic = QuadraticExpression(quadratic_program, coefficients_list)
+
+        values = np.array([range(5), np.ones(5), np.zeros(5), [0, 1, 0, 1, 1]])
+        np.testing.assert_array_almost_equal(quadratic.evaluate_batch(values),
+                                             [quadratic.evaluate(x) for x in values])
+
     def test_evaluate_gradient(self):
         """ test evaluate gradient. """
 
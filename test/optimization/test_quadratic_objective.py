@@ -97,6 +97,30 @@ class TestQuadraticObjective(QiskitOptimizationTestCase):
         quadratic_program.objective.sense = quadratic_program.objective.Sense.MINIMIZE
         self.assertEqual(quadratic_program.objective.sense, QuadraticObjective.Sense.MINIMIZE)
 
+    def test_to_arrays(self):
+        """ test to_arrays. """
+
+        quadratic_program = QuadraticProgram()
+        for _ in range(4):
+            quadratic_program.binary_var()
+        quadratic_program.minimize(constant=1.5, linear={1: 2.0, 3: -1.0},
+                                   quadratic={(0, 1): 1.0, (1, 0): 2.0, (2, 2): -3.0})
+
+        quadratic, linear, constant = quadratic_program.objective.to_arrays()
+
+        self.assertEqual(constant, 1.5)
+        np.testing.assert_array_equal(linear, [0.0, 2.0, 0.0, -1.0])
+        self.assertEqual(quadratic.format, 'csr')
+        self.assertEqual(quadratic.shape, (4, 4))
+        expected = np.zeros((4, 4))
+        expected[0, 1] = 3.0
+        expected[2, 2] = -3.0
+        np.testing.assert_array_equal(quadratic.toarray(), expected)
+
+        x = np.array([1, 1, 1, 0])
+        self.assertAlmostEqual(x @ quadratic @ x + linear @ x + constant,
+                               quadratic_program.objective.evaluate(x))
+
 
 if __name__ == '__main__':
     unittest.main()
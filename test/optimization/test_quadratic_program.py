@@ -17,9 +17,9 @@ import tempfile
 from os import path
 from test.optimization.optimization_test_case import QiskitOptimizationTestCase
 
-from docplex.mp.model import Model, DOcplexException
+import numpy as np
+from docplex.mp.model import Model
 
-from qiskit.aqua import MissingOptionalLibraryError
 from qiskit.optimization import QuadraticProgram, QiskitOptimizationError, INFINITY
 from qiskit.optimization.problems import Variable, Constraint, QuadraticObjective
 
@@ -248,6 +248,60 @@ class TestQuadraticProgram(QiskitOptimizationTestCase):
         with self.assertRaises(QiskitOptimizationError):
             q_p.linear_constraint(sense='=>')
 
+    def test_bulk_variables_and_constraints(self):
+        """ test bulk construction of variables and linear constraints """
+        q_p = QuadraticProgram()
+        q_p.binary_var('x1')
+        x_list = q_p.binary_var_list(3)
+        self.assertListEqual([x.name for x in x_list], ['x2', 'x3', 'x4'])
+        y_dict = q_p.integer_var_dict(['a', 'b'], -1, 5, name='y_', key_format='{}')
+        self.assertListEqual(list(y_dict), ['y_a', 'y_b'])
+        z_list = q_p.continuous_var_list(2, upperbound=2.5, name='z', key_format='[{}]')
+        self.assertListEqual([z.name for z in z_list], ['z[0]', 'z[1]'])
+        self.assertEqual(q_p.get_num_vars(), 8)
+        # a NumPy integer is a number of variables
+        w_list = QuadraticProgram().continuous_var_list(np.int64(2), name='w')
+        self.assertListEqual([w.name for w in w_list], ['w0', 'w1'])
+        self.assertEqual(q_p.get_num_binary_vars(), 4)
+        self.assertEqual(q_p.variables_index['y_b'], 5)
+        self.assertEqual(q_p.get_variable('z[1]').upperbound, 2.5)
+        self.assertEqual(q_p.get_variable('y_a').lowerbound, -1)
+        with self.assertRaises(QiskitOptimizationError):
+            q_p.binary_var_list(['1', '2'], name='x')
+        with self.assertRaises(QiskitOptimizationError):
+            q_p.binary_var_list([1, '1'], name='w')
+        self.assertEqual(q_p.get_num_vars(), 8)
+
+        q_p.linear_constraint({'x1': 1}, '<=', 1, name='c1')
+        matrix = [[1, 0, 2, 0, 0, 0, 0, 0],
+                  [0, 0, 0, 0, 1, -1, 0, 0],
+                  [0, 0, 0, 0, 0, 0, 0, 3]]
+        constraints = q_p.linear_constraints_from_matrix(matrix, ['<=', '==', 'G'], [1, 0, 2],
+                                                         names=[None, 'eq', None])
+        self.assertListEqual([c.name for c in constraints], ['c2', 'eq', 'c3'])
+        self.assertListEqual([c.sense for c in constraints],
+                             [Constraint.Sense.LE, Constraint.Sense.EQ, Constraint.Sense.GE])
+        self.assertListEqual([c.rhs for c in constraints], [1, 0, 2])
+        self.assertEqual(q_p.linear_constraints_index['c3'], 3)
+        for constraint, row in zip(constraints, matrix):
+            self.assertListEqual(constraint.linear.to_array().tolist(), row)
+        self.assertDictEqual(constraints[1].linear.to_dict(use_name=True), {'y_a': 1, 'y_b': -1})
+        constraints[2].linear['x2'] = 4
+        self.assertDictEqual(constraints[2].linear.to_dict(), {1: 4, 7: 3})
+        self.assertDictEqual(constraints[0].linear.to_dict(), {0: 1, 2: 2})
+        self.assertTrue(q_p.is_feasible([1, 0, 0, 0, 1, 1, 0, 1]))
+        self.assertFalse(q_p.is_feasible([1, 0, 1, 0, 1, 1, 0, 1]))
+
+        constraints = q_p.linear_constraints_from_matrix([[0] * 7 + [1]] * 2, '>=', 0.5)
+        self.assertListEqual([c.name for c in constraints], ['c4', 'c5'])
+        with self.assertRaises(QiskitOptimizationError):
+            q_p.linear_constraints_from_matrix([[1] * 7], '<=', 1)
+        with self.assertRaises(QiskitOptimizationError):
+            q_p.linear_constraints_from_matrix([[1] * 8], '<=', 1, names=['eq'])
+        with self.assertRaises(QiskitOptimizationError):
+            q_p.linear_constraints_from_matrix([[1] * 8], ['<=', '<='], 1)
+        self.assertEqual(q_p.get_num_linear_constraints(), 6)
+
     def test_quadratic_constraints_handling(self):
         """test quadratic constraints handling"""
         q_p = QuadraticProgram()
@@ -389,79 +443,169 @@ class TestQuadraticProgram(QiskitOptimizationTestCase):
 
     def test_read_from_lp_file(self):
         """test read lp file"""
-        try:
+        q_p = QuadraticProgram()
+        with self.assertRaises(FileNotFoundError):
+            q_p.read_from_lp_file('')
+        with self.assertRaises(FileNotFoundError):
+            q_p.read_from_lp_file('no_file.txt')
+        lp_file = self.get_resource_path(path.join('resources', 'test_quadratic_program.lp'))
+        q_p.read_from_lp_file(lp_file)
+        self.assertEqual(q_p.name, 'my problem')
+        self.assertEqual(q_p.get_num_vars(), 3)
+        self.assertEqual(q_p.get_num_binary_vars(), 1)
+        self.assertEqual(q_p.get_num_integer_vars(), 1)
+        self.assertEqual(q_p.get_num_continuous_vars(), 1)
+        self.assertEqual(q_p.get_num_linear_constraints(), 3)
+        self.assertEqual(q_p.get_num_quadratic_constraints(), 3)
+
+        self.assertEqual(q_p.variables[0].name, 'x')
+        self.assertEqual(q_p.variables[0].vartype, Variable.Type.BINARY)
+        self.assertEqual(q_p.variables[0].lowerbound, 0)
+        self.assertEqual(q_p.variables[0].upperbound, 1)
+        self.assertEqual(q_p.variables[1].name, 'y')
+        self.assertEqual(q_p.variables[1].vartype, Variable.Type.INTEGER)
+        self.assertEqual(q_p.variables[1].lowerbound, -1)
+        self.assertEqual(q_p.variables[1].upperbound, 5)
+        self.assertEqual(q_p.variables[2].name, 'z')
+        self.assertEqual(q_p.variables[2].vartype, Variable.Type.CONTINUOUS)
+        self.assertEqual(q_p.variables[2].lowerbound, -1)
+        self.assertEqual(q_p.variables[2].upperbound, 5)
+
+        self.assertEqual(q_p.objective.sense, QuadraticObjective.Sense.MINIMIZE)
+        self.assertEqual(q_p.objective.constant, 1)
+        self.assertDictEqual(q_p.objective.linear.to_dict(use_name=True),
+                             {'x': 1, 'y': -1, 'z': 10})
+        self.assertDictEqual(q_p.objective.quadratic.to_dict(use_name=True),
+                             {('x', 'x'): 0.5, ('y', 'z'): -1})
+
+        cst = q_p.linear_constraints
+        self.assertEqual(cst[0].name, 'lin_eq')
+        self.assertDictEqual(cst[0].linear.to_dict(use_name=True), {'x': 1, 'y': 2})
+        self.assertEqual(cst[0].sense, Constraint.Sense.EQ)
+        self.assertEqual(cst[0].rhs, 1)
+        self.assertEqual(cst[1].name, 'lin_leq')
+        self.assertDictEqual(cst[1].linear.to_dict(use_name=True), {'x': 1, 'y': 2})
+        self.assertEqual(cst[1].sense, Constraint.Sense.LE)
+        self.assertEqual(cst[1].rhs, 1)
+        self.assertEqual(cst[2].name, 'lin_geq')
+        self.assertDictEqual(cst[2].linear.to_dict(use_name=True), {'x': 1, 'y': 2})
+        self.assertEqual(cst[2].sense, Constraint.Sense.GE)
+        self.assertEqual(cst[2].rhs, 1)
+
+        cst = q_p.quadratic_constraints
+        self.assertEqual(cst[0].name, 'quad_eq')
+        self.assertDictEqual(cst[0].linear.to_dict(use_name=True), {'x': 1, 'y': 1})
+        self.assertDictEqual(cst[0].quadratic.to_dict(use_name=True),
+                             {('x', 'x'): 1, ('y', 'z'): -1, ('z', 'z'): 2})
+        self.assertEqual(cst[0].sense, Constraint.Sense.EQ)
+        self.assertEqual(cst[0].rhs, 1)
+        self.assertEqual(cst[1].name, 'quad_leq')
+        self.assertDictEqual(cst[1].linear.to_dict(use_name=True), {'x': 1, 'y': 1})
+        self.assertDictEqual(cst[1].quadratic.to_dict(use_name=True),
+                             {('x', 'x'): 1, ('y', 'z'): -1, ('z', 'z'): 2})
+        self.assertEqual(cst[1].sense, Constraint.Sense.LE)
+        self.assertEqual(cst[1].rhs, 1)
+        self.assertEqual(cst[2].name, 'quad_geq')
+        self.assertDictEqual(cst[2].linear.to_dict(use_name=True), {'x': 1, 'y': 1})
+        self.assertDictEqual(cst[2].quadratic.to_dict(use_name=True),
+                             {('x', 'x'): 1, ('y', 'z'): -1, ('z', 'z'): 2})
+        self.assertEqual(cst[2].sense, Constraint.Sense.GE)
+        self.assertEqual(cst[2].rhs, 1)
+
+    def test_read_lp_syntax(self):
+        """test reading LP files without the layout of docplex"""
+        content = ("\\ written by hand\n"
+                   "maximize\n"
+                   " 3x + 2 y - z \\ comment\n"
+                   "  + [ 4 x * y + x ^ 2 ] / 2 - 7\n"
+                   "st\n"
+                   " x + y <= 4 c2: x - y >= -3\n"
+                   " -z + 2 x = 1\n"
+                   " lim: 2 x + 3 y + [ x^2 - z*y ] =< 10\n"
+                   "bounds\n"
+                   " x free\n"
+                   " -5 <= y\n"
+                   " z <= 3\n"
+                   " y <= 8\n"
+                   " w = 2\n"
+                   "general\n"
+                   " y\n"
+                   "binary\n"
+                   " b\n"
+                   "end\n")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = path.join(temp_dir, 'syntax.lp')
+            with open(filename, 'w') as file:
+                file.write(content)
+            q_p = QuadraticProgram()
+            q_p.read_from_lp_file(filename)
+
+        self.assertEqual(q_p.name, '')
+        self.assertListEqual([x.name for x in q_p.variables], ['x', 'y', 'z', 'w', 'b'])
+        self.assertListEqual([x.vartype for x in q_p.variables],
+                             [Variable.Type.CONTINUOUS, Variable.Type.INTEGER,
+                              Variable.Type.CONTINUOUS, Variable.Type.CONTINUOUS,
+                              Variable.Type.BINARY])
+        self.assertListEqual([(x.lowerbound, x.upperbound) for x in q_p.variables],
+                             [(-INFINITY, INFINITY), (-5, 8), (0, 3), (2, 2), (0, 1)])
+        self.assertEqual(q_p.objective.sense, QuadraticObjective.Sense.MAXIMIZE)
+        self.assertEqual(q_p.objective.constant, -7)
+        self.assertDictEqual(q_p.objective.linear.to_dict(use_name=True),
+                             {'x': 3, 'y': 2, 'z': -1})
+        self.assertDictEqual(q_p.objective.quadratic.to_dict(use_name=True),
+                             {('x', 'x'): 0.5, ('x', 'y'): 2})
+
+        cst = q_p.linear_constraints
+        self.assertListEqual([c.name for c in cst], ['c1', 'c2', 'c3'])
+        self.assertListEqual([c.linear.to_dict(use_name=True) for c in cst],
+                             [{'x': 1, 'y': 1}, {'x': 1, 'y': -1}, {'x': 2, 'z': -1}])
+        self.assertListEqual([c.sense for c in cst],
+                             [Constraint.Sense.LE, Constraint.Sense.GE, Constraint.Sense.EQ])
+        self.assertListEqual([c.rhs for c in cst], [4, -3, 1])
+        cst = q_p.get_quadratic_constraint('lim')
+        self.assertDictEqual(cst.linear.to_dict(use_name=True), {'x': 2, 'y': 3})
+        self.assertDictEqual(cst.quadratic.to_dict(use_name=True),
+                             {('x', 'x'): 1, ('y', 'z'): -1})
+        self.assertEqual(cst.sense, Constraint.Sense.LE)
+        self.assertEqual(cst.rhs, 10)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = path.join(temp_dir, 'sos.lp')
+            with open(filename, 'w') as file:
+                file.write("minimize\n x + y\nst\n c: x + y >= 1\nsos\n s1: S1 :: x:1 y:2\nend\n")
+            with self.assertRaises(QiskitOptimizationError):
+                q_p.read_from_lp_file(filename)
+
+    def test_read_lp_default_names(self):
+        """test reading LP files with named and unnamed rows, and writing them back"""
+        content = ("minimize\n"
+                   " x + y\n"
+                   "st\n"
+                   " x + y >= 1\n"
+                   " x - y <= 3\n"
+                   " c1: x + 2 y <= 5\n"
+                   " [ x^2 ] <= 4\n"
+                   " qc2: x + [ y^2 ] <= 9\n"
+                   "end\n")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = path.join(temp_dir, 'names.lp')
+            with open(filename, 'w') as file:
+                file.write(content)
             q_p = QuadraticProgram()
-            with self.assertRaises(FileNotFoundError):
-                q_p.read_from_lp_file('')
-            with self.assertRaises(FileNotFoundError):
-                q_p.read_from_lp_file('no_file.txt')
-            lp_file = self.get_resource_path(path.join('resources', 'test_quadratic_program.lp'))
-            q_p.read_from_lp_file(lp_file)
-            self.assertEqual(q_p.name, 'my problem')
-            self.assertEqual(q_p.get_num_vars(), 3)
-            self.assertEqual(q_p.get_num_binary_vars(), 1)
-            self.assertEqual(q_p.get_num_integer_vars(), 1)
-            self.assertEqual(q_p.get_num_continuous_vars(), 1)
-            self.assertEqual(q_p.get_num_linear_constraints(), 3)
-            self.assertEqual(q_p.get_num_quadratic_constraints(), 3)
-
-            self.assertEqual(q_p.variables[0].name, 'x')
-            self.assertEqual(q_p.variables[0].vartype, Variable.Type.BINARY)
-            self.assertEqual(q_p.variables[0].lowerbound, 0)
-            self.assertEqual(q_p.variables[0].upperbound, 1)
-            self.assertEqual(q_p.variables[1].name, 'y')
-            self.assertEqual(q_p.variables[1].vartype, Variable.Type.INTEGER)
-            self.assertEqual(q_p.variables[1].lowerbound, -1)
-            self.assertEqual(q_p.variables[1].upperbound, 5)
-            self.assertEqual(q_p.variables[2].name, 'z')
-            self.assertEqual(q_p.variables[2].vartype, Variable.Type.CONTINUOUS)
-            self.assertEqual(q_p.variables[2].lowerbound, -1)
-            self.assertEqual(q_p.variables[2].upperbound, 5)
-
-            self.assertEqual(q_p.objective.sense, QuadraticObjective.Sense.MINIMIZE)
-            self.assertEqual(q_p.objective.constant, 1)
-            self.assertDictEqual(q_p.objective.linear.to_dict(use_name=True),
-                                 {'x': 1, 'y': -1, 'z': 10})
-            self.assertDictEqual(q_p.objective.quadratic.to_dict(use_name=True),
-                                 {('x', 'x'): 0.5, ('y', 'z'): -1})
-
-            cst = q_p.linear_constraints
-            self.assertEqual(cst[0].name, 'lin_eq')
-            self.assertDictEqual(cst[0].linear.to_dict(use_name=True), {'x': 1, 'y': 2})
-            self.assertEqual(cst[0].sense, Constraint.Sense.EQ)
-            self.assertEqual(cst[0].rhs, 1)
-            self.assertEqual(cst[1].name, 'lin_leq')
-            self.assertDictEqual(cst[1].linear.to_dict(use_name=True), {'x': 1, 'y': 2})
-            self.assertEqual(cst[1].sense, Constraint.Sense.LE)
-            self.assertEqual(cst[1].rhs, 1)
-            self.assertEqual(cst[2].name, 'lin_geq')
-            self.assertDictEqual(cst[2].linear.to_dict(use_name=True), {'x': 1, 'y': 2})
-            self.assertEqual(cst[2].sense, Constraint.Sense.GE)
-            self.assertEqual(cst[2].rhs, 1)
-
-            cst = q_p.quadratic_constraints
-            self.assertEqual(cst[0].name, 'quad_eq')
-            self.assertDictEqual(cst[0].linear.to_dict(use_name=True), {'x': 1, 'y': 1})
-            self.assertDictEqual(cst[0].quadratic.to_dict(use_name=True),
-                                 {('x', 'x'): 1, ('y', 'z'): -1, ('z', 'z'): 2})
-            self.assertEqual(cst[0].sense, Constraint.Sense.EQ)
-            self.assertEqual(cst[0].rhs, 1)
-            self.assertEqual(cst[1].name, 'quad_leq')
-            self.assertDictEqual(cst[1].linear.to_dict(use_name=True), {'x': 1, 'y': 1})
-            self.assertDictEqual(cst[1].quadratic.to_dict(use_name=True),
-                                 {('x', 'x'): 1, ('y', 'z'): -1, ('z', 'z'): 2})
-            self.assertEqual(cst[1].sense, Constraint.Sense.LE)
-            self.assertEqual(cst[1].rhs, 1)
-            self.assertEqual(cst[2].name, 'quad_geq')
-            self.assertDictEqual(cst[2].linear.to_dict(use_name=True), {'x': 1, 'y': 1})
-            self.assertDictEqual(cst[2].quadratic.to_dict(use_name=True),
-                                 {('x', 'x'): 1, ('y', 'z'): -1, ('z', 'z'): 2})
-            self.assertEqual(cst[2].sense, Constraint.Sense.GE)
-            self.assertEqual(cst[2].rhs, 1)
-        except MissingOptionalLibraryError as ex:
-            self.skipTest(str(ex))
-        except RuntimeError as ex:
-            self.fail(str(ex))
+            q_p.read_from_lp_file(filename)
+
+            # the rows are numbered from 1, skipping the explicit names
+            self.assertListEqual([c.name for c in q_p.linear_constraints], ['c2', 'c3', 'c1'])
+            self.assertListEqual([c.rhs for c in q_p.linear_constraints], [1, 3, 5])
+            self.assertListEqual([c.name for c in q_p.quadratic_constraints], ['qc1', 'qc2'])
+
+            filename = path.join(temp_dir, 'written.lp')
+            q_p.write_to_lp_file(filename)
+            q_p2 = QuadraticProgram()
+            q_p2.read_from_lp_file(filename)
+            self.assertEqual(q_p2.export_as_lp_string(), q_p.export_as_lp_string())
+            self.assertListEqual([c.name for c in q_p2.linear_constraints], ['c2', 'c3', 'c1'])
+            self.assertListEqual([c.name for c in q_p2.quadratic_constraints], ['qc1', 'qc2'])
 
     def test_write_to_lp_file(self):
         """test write problem"""
@@ -502,7 +646,7 @@ class TestQuadraticProgram(QiskitOptimizationTestCase):
         with self.assertRaises(OSError):
             q_p.write_to_lp_file('/cannot/write/this/file.lp')
 
-        with self.assertRaises(DOcplexException):
+        with self.assertRaises(QiskitOptimizationError):
             q_p.write_to_lp_file('')
 
     def test_docplex(self):
@@ -526,7 +670,9 @@ class TestQuadraticProgram(QiskitOptimizationTestCase):
         mod.minimize(1 + x + 2 * y - x * y + 2 * z * z)
         mod.add(2 * x - z == 1, 'c0')
         mod.add(2 * x - z + 3 * y * z == 1, 'q0')
-        self.assertEqual(q_p.export_as_lp_string(), mod.export_as_lp_string())
+        # the LP format of docplex, up to the signature in the first line
+        self.assertListEqual(q_p.export_as_lp_string().splitlines()[1:],
+                             mod.export_as_lp_string().splitlines()[1:])
 
         with self.assertRaises(QiskitOptimizationError):
             mod = Model()
@@ -18,8 +18,10 @@ from os import path
 from test.optimization.optimization_test_case import QiskitOptimizationTestCase
 from qiskit.optimization.algorithms.recursive_minimum_eigen_optimizer import IntermediateResult
 
+from qiskit import BasicAer
 from qiskit.aqua import MissingOptionalLibraryError
-from qiskit.aqua.algorithms import NumPyMinimumEigensolver
+from qiskit.aqua.algorithms import NumPyMinimumEigensolver, QAOA
+from qiskit.aqua.components.optimizers import COBYLA
 
 from qiskit.optimization.algorithms import (MinimumEigenOptimizer, CplexOptimizer,
                                             RecursiveMinimumEigenOptimizer)
@@ -150,6 +152,34 @@ class TestRecursiveMinEigenOptimizer(QiskitOptimizationTestCase):
                                            min_num_vars=2,
                                            converters=invalid)
 
+    def test_recursive_warm_start(self):
+        """Test the recursive optimizer with a warm started QAOA."""
+        problem = QuadraticProgram()
+        for i in range(5):
+            problem.binary_var('x{}'.format(i))
+        # a ring of anti-ferromagnetic couplings with an odd number of nodes
+        problem.maximize(linear=[2, 2, 2, 2, 2],
+                         quadratic={('x0', 'x1'): -2, ('x1', 'x2'): -2, ('x2', 'x3'): -2,
+                                    ('x3', 'x4'): -2, ('x0', 'x4'): -2})
+
+        initial_point = [0.1, 0.2]
+        qaoa = QAOA(optimizer=COBYLA(maxiter=50), initial_point=initial_point,
+                    quantum_instance=BasicAer.get_backend('statevector_simulator'))
+        recursive_min_eigen_optimizer = \
+            RecursiveMinimumEigenOptimizer(MinimumEigenOptimizer(qaoa), min_num_vars=2,
+                                           history=IntermediateResult.ALL_ITERATIONS,
+                                           warm_start=True)
+        result = recursive_min_eigen_optimizer.solve(problem)
+
+        self.assertEqual(result.fval, 4)
+        self.assertEqual(len(result.replacements), 3)
+        self.assertEqual(len(result.history[0]), 3)
+        # the initial point of the solver is restored after the recursion
+        self.assertListEqual(qaoa.initial_point, initial_point)
+        # the recursion exactly preserves the objective
+        x = dict(zip(result.variable_names, result.x))
+        self.assertAlmostEqual(problem.objective.evaluate(x), result.fval)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -174,13 +174,62 @@ class TestSlsqpOptimizer(QiskitOptimizationTestCase):
         slsqp = SlsqpOptimizer(trials=trials, clip=clip)
         self.assertEqual(trials, slsqp.trials)
         self.assertAlmostEqual(clip, slsqp.clip)
+        self.assertEqual(1, slsqp.num_processes)
 
         trials = 6
         clip = 300.
         slsqp.trials = trials
         slsqp.clip = clip
+        slsqp.num_processes = None
         self.assertEqual(trials, slsqp.trials)
         self.assertAlmostEqual(clip, slsqp.clip)
+        self.assertIsNone(slsqp.num_processes)
+
+    def test_multistart_early_stop(self):
+        """Tests that the trials stop at the first feasible solution of a convex problem."""
+        problem = QuadraticProgram()
+        problem.continuous_var(lowerbound=-1, upperbound=1, name='x')
+        problem.continuous_var(lowerbound=-1, upperbound=1, name='y')
+        problem.linear_constraint(linear=[1, 1], sense='<=', rhs=1)
+
+        slsqp = SlsqpOptimizer(trials=4)
+        starts = []
+
+        def minimize(x_0):
+            starts.append(x_0)
+            # the raw result tells whether the local optimizer has converged
+            return np.zeros(2), success
+
+        # the trials of the non-convex maximization are all run, as well as those of a local
+        # optimizer which does not converge or does not report its convergence
+        for sense, success, converged, num_trials in [('minimize', True, bool, 1),
+                                                      ('maximize', True, bool, 4),
+                                                      ('minimize', False, bool, 4),
+                                                      ('minimize', True, None, 4)]:
+            getattr(problem, sense)(quadratic={('x', 'x'): 1, ('y', 'y'): 1})
+            starts.clear()
+            result = slsqp.multi_start_solve(minimize, problem, converged)
+            self.assertEqual(len(starts), num_trials)
+            np.testing.assert_array_equal(starts[0], [0, 0])
+            self.assertAlmostEqual(result.fval, 0)
+
+    def test_slsqp_parallel_trials(self):
+        """Tests that trials run in parallel processes give the same result."""
+        problem = QuadraticProgram()
+        problem.continuous_var_list(4, lowerbound=-1, upperbound=1)
+        problem.linear_constraint(linear=[1, 1, 1, 1], sense='<=', rhs=1)
+        problem.quadratic_constraint(quadratic={('x0', 'x0'): 1, ('x1', 'x1'): 1},
+                                     sense='<=', rhs=1)
+        problem.maximize(linear=[1, 2, 0, 0], quadratic={('x0', 'x1'): -1, ('x2', 'x2'): 1,
+                                                         ('x3', 'x3'): 2})
+
+        results = []
+        for num_processes in [1, 2]:
+            np.random.seed(42)
+            slsqp = SlsqpOptimizer(trials=6, num_processes=num_processes)
+            results.append(slsqp.solve(problem))
+        np.testing.assert_array_almost_equal(results[0].x, results[1].x)
+        self.assertAlmostEqual(results[0].fval, results[1].fval)
 
 
 if __name__ == '__main__':
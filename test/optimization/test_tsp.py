@@ -50,6 +50,17 @@ class TestTSP(QiskitOptimizationTestCase):
         infeasible = [1, 0, 0, 1, 1, 0, 0, 0, 0]
         self.assertListEqual(tsp.get_tsp_solution(infeasible), [[0, 1], 1, []])
 
+    def test_tsp_operator_energy(self):
+        """ Test the energy of tours and penalized assignments """
+        diagonal = np.real(np.diag(self.qubit_op.to_opflow().to_matrix())) + self.offset
+        powers = 2 ** np.arange(self.num_nodes ** 2)
+        for order in ([0, 1, 2], [2, 0, 1], [1, 0, 2]):
+            x = np.zeros((self.num_nodes, self.num_nodes), dtype=int)
+            x[order, np.arange(self.num_nodes)] = 1
+            self.assertAlmostEqual(diagonal[np.dot(x.ravel(), powers)],
+                                   tsp.tsp_value(order, self.ins.w))
+        self.assertGreater(diagonal[0], 1e4)
+
 
 if __name__ == '__main__':
     unittest.main()